@@ -0,0 +1,105 @@
+"""
+Benchmark: cruce con el periodo anterior en ReportService._construir_estado_resultados.
+
+Construye datos contables con catálogos del tamaño del PUC (miles de
+subcuentas por sección, con el ~10% de códigos nuevos o desaparecidos entre
+periodos) y compara el cruce por índice de código contra la búsqueda lineal
+anterior (next(...) por cada línea, O(n²) por sección). Verifica que ambos
+produzcan las mismas líneas.
+
+Uso:
+    python benchmarks/bench_estado_resultados_comparativo.py
+    python benchmarks/bench_estado_resultados_comparativo.py --sizes 500 2000 8000
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import Mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.application.services.report_service import ReportService  # noqa: E402
+from src.domain.entities.estado_resultados import EstadoResultados, PeriodoComparacion  # noqa: E402
+
+# Sección de datos contables -> (prefijo PUC, método de EstadoResultados)
+SECCIONES = {
+    'ingresos': ('41', 'agregar_ingreso'),
+    'costos': ('61', 'agregar_costo_ventas'),
+    'gastos_admin': ('51', 'agregar_gasto_administracion'),
+    'gastos_ventas': ('52', 'agregar_gasto_ventas'),
+    'otros_ingresos': ('42', 'agregar_otro_ingreso'),
+    'otros_gastos': ('5295', 'agregar_otro_gasto'),
+    'gastos_financieros': ('53', 'agregar_gasto_financiero'),
+    'impuestos': ('54', 'agregar_impuesto'),
+}
+
+
+def build_datos(n_cuentas: int, seed: int) -> dict:
+    """Datos contables con n_cuentas subcuentas por sección, en orden aleatorio."""
+    rng = random.Random(seed)
+    datos = {}
+    for seccion, (prefijo, _) in SECCIONES.items():
+        codigos = [f"{prefijo}{i:06d}" for i in rng.sample(range(int(n_cuentas * 1.1)), n_cuentas)]
+        datos[seccion] = [
+            {'codigo': codigo, 'descripcion': f"Subcuenta {codigo}", 'valor': Decimal(rng.randint(1, 10**9)) / 100}
+            for codigo in codigos
+        ]
+    return datos
+
+
+def legacy_construir(periodo_actual, periodo_anterior, datos_actual, datos_anterior) -> EstadoResultados:
+    """Cruce anterior: búsqueda lineal en el periodo anterior por cada línea actual."""
+    estado = EstadoResultados(periodo_actual, periodo_anterior)
+    for seccion, (_, metodo) in SECCIONES.items():
+        for item in datos_actual.get(seccion, []):
+            valor_anterior = None
+            if datos_anterior:
+                item_anterior = next((x for x in datos_anterior.get(seccion, [])
+                                      if x['codigo'] == item['codigo']), None)
+                if item_anterior:
+                    valor_anterior = item_anterior['valor']
+            getattr(estado, metodo)(item['codigo'], item['descripcion'], item['valor'], valor_anterior)
+    return estado
+
+
+def lineas(estado: EstadoResultados) -> list:
+    """Todas las líneas del estado para comparar resultados."""
+    secciones = (estado._ingresos, estado._costos_ventas, estado._gastos_administracion, estado._gastos_ventas,
+                 estado._otros_ingresos, estado._otros_gastos, estado._gastos_financieros, estado._impuestos)
+    return [(l.codigo, l.valor_actual, l.valor_anterior) for seccion in secciones for l in seccion]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 2000, 5000],
+                        help='Subcuentas por sección')
+    args = parser.parse_args()
+
+    service = ReportService(Mock(), Mock(), Mock())
+    periodo_actual = PeriodoComparacion(datetime(2024, 1, 1), datetime(2024, 12, 31), "2024")
+    periodo_anterior = PeriodoComparacion(datetime(2023, 1, 1), datetime(2023, 12, 31), "2023")
+
+    print(f"{'subcuentas/sección':>18} {'anterior (s)':>13} {'índice (s)':>11} {'speedup':>8}")
+    for n_cuentas in args.sizes:
+        datos_actual = build_datos(n_cuentas, seed=1)
+        datos_anterior = build_datos(n_cuentas, seed=2)
+
+        start = time.perf_counter()
+        esperado = legacy_construir(periodo_actual, periodo_anterior, datos_actual, datos_anterior)
+        legacy_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        estado = service._construir_estado_resultados(periodo_actual, periodo_anterior, datos_actual, datos_anterior)
+        current_s = time.perf_counter() - start
+
+        assert lineas(estado) == lineas(esperado)
+        print(f"{n_cuentas:>18} {legacy_s:>13.3f} {current_s:>11.4f} {legacy_s / current_s:>7.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: exportación de facturas a Excel (hojas Encabezados y Detalle).
+
+Compara pandas.to_excel sobre un libro openpyxl normal (todas las celdas en
+memoria hasta guardar) contra write_dataframes_to_excel en modo write-only
+(filas serializadas por lotes a medida que se escriben). Mide tiempo y pico
+de memoria con tracemalloc, y verifica que ambos archivos se lean igual.
+
+Uso:
+    python benchmarks/bench_excel_export.py
+    python benchmarks/bench_excel_export.py --lines 200000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.infrastructure.utils.excel_writer import write_dataframes_to_excel  # noqa: E402
+
+
+def build_frames(n_lines: int, seed: int = 7) -> dict:
+    """Encabezados y detalle con ~4 líneas por factura."""
+    rng = np.random.default_rng(seed)
+    n_invoices = max(1, n_lines // 4)
+    factura_ids = np.array([f"FV-{i:07d}" for i in range(n_invoices)], dtype=object)
+
+    encabezados = pd.DataFrame({
+        'factura_id': factura_ids,
+        'fecha': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 365, n_invoices), unit='D'),
+        'cliente_nombre': [f"Cliente {i % 500}" for i in range(n_invoices)],
+        'cliente_nit': [str(900000000 + i % 500) for i in range(n_invoices)],
+        'total': rng.uniform(1e4, 1e7, n_invoices).round(2),
+        'estado': 'open',
+    })
+    cantidad = rng.integers(1, 20, n_lines)
+    precio = rng.uniform(100, 1e5, n_lines).round(2)
+    detalle = pd.DataFrame({
+        'factura_id': factura_ids[rng.integers(0, n_invoices, n_lines)],
+        'producto_codigo': [f"P{i % 2000:05d}" for i in range(n_lines)],
+        'producto_nombre': [f"Producto {i % 2000}" for i in range(n_lines)],
+        'cantidad': cantidad,
+        'precio_unitario': precio,
+        'subtotal': cantidad * precio,
+    })
+    return {'Encabezados': encabezados, 'Detalle': detalle}
+
+
+def legacy_export(path: str, frames: dict) -> None:
+    """Exportación anterior: pd.ExcelWriter con openpyxl en modo normal."""
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        for sheet_name, df in frames.items():
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+
+
+def measure(func, *args) -> tuple:
+    """(segundos, pico de memoria en MB) de una llamada."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--lines', type=int, nargs='+', default=[10000, 50000],
+                        help='Líneas de detalle a exportar')
+    args = parser.parse_args()
+
+    print(f"{'líneas':>8} {'anterior (s)':>13} {'streaming (s)':>14} {'pico ant. (MB)':>15} {'pico str. (MB)':>15}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_lines in args.lines:
+            frames = build_frames(n_lines)
+            legacy_path = os.path.join(tmp, f"legacy_{n_lines}.xlsx")
+            stream_path = os.path.join(tmp, f"stream_{n_lines}.xlsx")
+
+            legacy_s, legacy_mb = measure(legacy_export, legacy_path, frames)
+            stream_s, stream_mb = measure(write_dataframes_to_excel, stream_path, frames)
+
+            for sheet_name in frames:
+                pd.testing.assert_frame_equal(
+                    pd.read_excel(stream_path, sheet_name=sheet_name),
+                    pd.read_excel(legacy_path, sheet_name=sheet_name)
+                )
+            print(f"{n_lines:>8} {legacy_s:>13.2f} {stream_s:>14.2f} {legacy_mb:>15.1f} {stream_mb:>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark: conversión DataFrame -> Invoice en FreeGUISiigoAdapter.
+
+Mide _dataframes_to_invoices con DataFrames sintéticos de encabezados y
+detalle (6 items por factura) hasta 50k facturas / 300k items y reporta el
+costo por factura, que debe mantenerse aproximadamente constante (escalado
+lineal).
+
+Uso:
+    python benchmarks/bench_invoice_conversion.py
+    python benchmarks/bench_invoice_conversion.py --sizes 1000 5000 --legacy
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.infrastructure.adapters.free_gui_siigo_adapter import FreeGUISiigoAdapter  # noqa: E402
+
+ITEMS_PER_INVOICE = 6
+
+
+def build_frames(n_invoices: int):
+    """Encabezados y detalle con la forma que produce _process_siigo_invoices."""
+    rng = np.random.default_rng(42)
+    ids = [f"inv-{i:07d}" for i in range(n_invoices)]
+    days = pd.to_datetime('2024-01-01') + pd.to_timedelta(rng.integers(0, 365, n_invoices), unit='D')
+
+    encabezados = pd.DataFrame({
+        'factura_id': ids,
+        'fecha': days.strftime('%Y-%m-%d'),
+        'cliente_nombre': [f"Cliente {i % 2000}" for i in range(n_invoices)],
+        'cliente_nit': [str(900000000 + i % 2000) for i in range(n_invoices)],
+        'total': rng.uniform(1000, 5_000_000, n_invoices).round(2),
+    })
+
+    n_items = n_invoices * ITEMS_PER_INVOICE
+    detalle = pd.DataFrame({
+        'factura_id': np.repeat(ids, ITEMS_PER_INVOICE),
+        'producto_codigo': [f"P{i % 500}" for i in range(n_items)],
+        'producto_nombre': [f"Producto {i % 500}" for i in range(n_items)],
+        'cantidad': rng.integers(1, 20, n_items).astype(float),
+        'precio_unitario': rng.uniform(100, 100_000, n_items).round(2),
+    })
+    # Orden aleatorio del detalle, como en descargas concurrentes reales
+    detalle = detalle.sample(frac=1.0, random_state=7).reset_index(drop=True)
+    return encabezados, detalle
+
+
+def legacy_convert(encabezados: pd.DataFrame, detalle: pd.DataFrame) -> int:
+    """Recorrido anterior: iterrows + filtro del detalle por cada factura."""
+    count = 0
+    for _, row in encabezados.iterrows():
+        factura_items = detalle[detalle['factura_id'] == row['factura_id']]
+        for _ in factura_items.iterrows():
+            pass
+        count += 1
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[5000, 10000, 25000, 50000])
+    parser.add_argument('--legacy', action='store_true',
+                        help='Medir también el recorrido iterrows anterior (lento, usar tamaños pequeños)')
+    args = parser.parse_args()
+
+    adapter = FreeGUISiigoAdapter(Mock())
+
+    print(f"{'facturas':>10} {'items':>10} {'segundos':>10} {'µs/factura':>12}" +
+          (f" {'legacy s':>10}" if args.legacy else ""))
+    for size in args.sizes:
+        encabezados, detalle = build_frames(size)
+        adapter._invoice_index.clear()
+
+        start = time.perf_counter()
+        invoices = adapter._dataframes_to_invoices(encabezados, detalle)
+        elapsed = time.perf_counter() - start
+
+        assert len(invoices) == size
+        assert sum(len(inv.items) for inv in invoices) == len(detalle)
+
+        line = f"{size:>10} {len(detalle):>10} {elapsed:>10.2f} {elapsed / size * 1e6:>12.1f}"
+        if args.legacy:
+            start = time.perf_counter()
+            legacy_convert(encabezados, detalle)
+            line += f" {time.perf_counter() - start:>10.2f}"
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
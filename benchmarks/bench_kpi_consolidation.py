@@ -0,0 +1,102 @@
+"""
+Benchmark: consolidación de ventas por cliente en KPICalculationServiceImpl.
+
+Compara consolidar_ventas_por_cliente (un groupby con agregaciones nombradas)
+contra el recorrido anterior (dos groupby + merge + iterrows) y mide el acceso
+repetido a cliente_top/obtener_top_clientes sobre KPIsVentas, con 100k
+facturas repartidas entre 20k clientes.
+
+Uso:
+    python benchmarks/bench_kpi_consolidation.py
+    python benchmarks/bench_kpi_consolidation.py --invoices 200000 --clients 50000
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.domain.entities.kpis import VentaPorCliente  # noqa: E402
+from src.domain.services.kpi_service import KPICalculationServiceImpl  # noqa: E402
+
+
+def build_frame(n_invoices: int, n_clients: int) -> pd.DataFrame:
+    """Facturas sintéticas con las columnas que usa el cálculo de KPIs."""
+    rng = np.random.default_rng(42)
+    clientes = rng.integers(0, n_clients, n_invoices)
+    return pd.DataFrame({
+        'cliente_nit': (900000000 + clientes).astype(str),
+        'cliente_nombre': [f"Cliente {c}" for c in clientes],
+        'total': rng.uniform(1000, 5_000_000, n_invoices).round(2),
+    })
+
+
+def legacy_consolidate(facturas_df: pd.DataFrame) -> list:
+    """Recorrido anterior: dos groupby, merge e iterrows."""
+    consolidacion = facturas_df.groupby('cliente_nit').agg({
+        'total': 'sum',
+        'cliente_nombre': 'first'
+    }).reset_index()
+    facturas_por_cliente = facturas_df.groupby('cliente_nit').size().reset_index(name='numero_facturas')
+    consolidacion = consolidacion.merge(facturas_por_cliente, on='cliente_nit')
+    consolidacion.columns = ['nit', 'total_ventas', 'nombre', 'numero_facturas']
+    consolidacion['ticket_promedio'] = (consolidacion['total_ventas'] / consolidacion['numero_facturas']).round(2)
+
+    ventas = []
+    for _, row in consolidacion.iterrows():
+        ventas.append(VentaPorCliente(
+            nit=str(row['nit']),
+            nombre=str(row['nombre']),
+            total_ventas=Decimal(str(row['total_ventas'])),
+            numero_facturas=int(row['numero_facturas']),
+            ticket_promedio=Decimal(str(row['ticket_promedio']))
+        ))
+    ventas.sort(key=lambda x: x.total_ventas, reverse=True)
+    return ventas
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--invoices', type=int, default=100_000)
+    parser.add_argument('--clients', type=int, default=20_000)
+    parser.add_argument('--accesses', type=int, default=100,
+                        help='Accesos a cliente_top/obtener_top_clientes medidos sobre KPIsVentas')
+    args = parser.parse_args()
+
+    service = KPICalculationServiceImpl()
+    facturas_df = build_frame(args.invoices, args.clients)
+
+    legacy, legacy_s = timed(legacy_consolidate, facturas_df)
+    current, current_s = timed(service.consolidar_ventas_por_cliente, facturas_df)
+
+    assert [(v.nit, v.total_ventas, v.numero_facturas) for v in current] == \
+           [(v.nit, v.total_ventas, v.numero_facturas) for v in legacy]
+
+    kpis = service.calcular_kpis_ventas(facturas_df, datetime(2024, 1, 1), datetime(2024, 12, 31))
+    start = time.perf_counter()
+    for _ in range(args.accesses):
+        kpis.cliente_top
+        kpis.obtener_top_clientes(5)
+    access_s = time.perf_counter() - start
+
+    print(f"{args.invoices} facturas, {len(current)} clientes")
+    print(f"{'consolidación anterior':<32} {legacy_s:>8.3f} s")
+    print(f"{'consolidar_ventas_por_cliente':<32} {current_s:>8.3f} s")
+    print(f"{f'{args.accesses}x cliente_top + top 5':<32} {access_s:>8.3f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark: costo de importación al arrancar la GUI (python -X importtime).
+
+Compara los módulos que el arranque anterior importaba antes de crear la
+ventana (servicios con pandas/openpyxl, adaptador Siigo, addons y todos los
+widgets de las tabs) contra los que importa ahora (dataconta.py con el
+factory diferido y TabsWidget sin las tabs pesadas). Cada lado se importa en
+un proceso nuevo con -X importtime; se reporta el tiempo total de import y
+los módulos más costosos, y se verifica que el arranque nuevo no cargue
+pandas ni openpyxl.
+
+Sin PySide6 instalado solo se comparan los módulos que no dependen de Qt.
+
+Uso:
+    python benchmarks/bench_startup_imports.py
+    python benchmarks/bench_startup_imports.py --repeat 5 --top 15
+"""
+
+import argparse
+import importlib.util
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Importaciones del arranque anterior: dataconta.py + application_factory + TabsWidget
+LEGACY_CORE = [
+    'src.application.services.kpi_service',
+    'src.application.services.export_service',
+    'src.domain.services.kpi_service',
+    'src.infrastructure.adapters.free_gui_siigo_adapter',
+    'src.infrastructure.adapters.sqlite_invoice_store',
+    'src.infrastructure.adapters.file_storage_adapter',
+    'src.infrastructure.adapters.logger_adapter',
+    'src.infrastructure.utils.structured_log',
+]
+LEGACY_QT = [
+    'PySide6.QtWidgets',
+    'src.infrastructure.factories.addon_factory',
+    'src.presentation.controllers.free_gui_controller',
+    'src.presentation.widgets.dashboard_widget',
+    'src.presentation.widgets.export_widget',
+    'src.presentation.widgets.query_widget',
+    'src.presentation.widgets.exportar_widget',
+    'src.presentation.widgets.reportes_widget',
+    'src.presentation.widgets.ayuda_widget',
+    'src.presentation.widgets.upgrade_widget',
+    'src.presentation.widgets.demo_handler_widget',
+    'src.presentation.widgets.loading_widget',
+]
+
+# Importaciones del arranque nuevo
+LAZY_CORE = [
+    'src.infrastructure.factories.application_factory',
+    'src.infrastructure.utils.structured_log',
+]
+LAZY_QT = ['dataconta']
+
+HEAVY_MODULES = ('pandas', 'openpyxl', 'matplotlib')
+
+
+def import_profile(modules: List[str]) -> Tuple[float, Dict[str, int], List[str]]:
+    """
+    Importar los módulos en un proceso nuevo con -X importtime.
+
+    Returns:
+        (segundos de pared, microsegundos acumulados por módulo de primer nivel,
+         módulos pesados cargados)
+    """
+    code = (f"import sys; import {', '.join(modules)}; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True)
+    wall_s = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    top_level = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len('import time:'):].split('|'))
+        # Los módulos de primer nivel no tienen sangría en la columna del nombre
+        if not line.rsplit('|', 1)[1].startswith('  '):
+            top_level[name] = int(cumulative)
+    heavy = [m for m in result.stdout.strip().split(',') if m]
+    return wall_s, top_level, heavy
+
+
+def measure(modules: List[str], repeat: int) -> Tuple[float, float, Dict[str, int], List[str]]:
+    """Mediana de pared y de import total sobre varias corridas, con el perfil de la última."""
+    walls, totals = [], []
+    for _ in range(repeat):
+        wall_s, top_level, heavy = import_profile(modules)
+        walls.append(wall_s)
+        totals.append(sum(top_level.values()) / 1e6)
+    return statistics.median(walls), statistics.median(totals), top_level, heavy
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=3, help='Corridas por escenario')
+    parser.add_argument('--top', type=int, default=10, help='Módulos más costosos a listar')
+    args = parser.parse_args()
+
+    legacy, lazy = list(LEGACY_CORE), list(LAZY_CORE)
+    if importlib.util.find_spec('PySide6') is not None:
+        legacy += LEGACY_QT
+        lazy += LAZY_QT
+    else:
+        print("⚠️ PySide6 no instalado: se comparan solo los módulos sin Qt\n")
+
+    results = {}
+    for label, modules in (('anterior', legacy), ('diferido', lazy)):
+        results[label] = measure(modules, args.repeat)
+
+    print(f"{'arranque':>9} {'import (s)':>11} {'proceso (s)':>12}  módulos pesados")
+    for label, (wall_s, total_s, _, heavy) in results.items():
+        print(f"{label:>9} {total_s:>11.3f} {wall_s:>12.3f}  {', '.join(heavy) or '-'}")
+
+    for label, (_, _, top_level, _) in results.items():
+        print(f"\nMódulos de primer nivel más costosos ({label}):")
+        for name, cumulative in sorted(top_level.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"  {cumulative / 1000:>9.1f} ms  {name}")
+
+    assert not set(results['diferido'][3]) & {'pandas', 'openpyxl'}, \
+        "El arranque diferido no debe importar pandas ni openpyxl"
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: costo de registrar mensajes con SimpleTxtLogger.
+
+Compara la escritura anterior (abrir, anexar y cerrar el log diario y el de
+sesión en cada mensaje) contra SimpleTxtLogger con BufferedLogWriter, que
+encola las líneas y las escribe por lotes en segundo plano. Mide el tiempo
+del hilo que registra los mensajes, que es el que paga la descarga, y
+verifica que ambos logs diarios terminen con las mismas líneas.
+
+Uso:
+    python benchmarks/bench_txt_logger.py
+    python benchmarks/bench_txt_logger.py --messages 50000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.infrastructure.adapters.simple_txt_logger_adapter import SimpleTxtLogger  # noqa: E402
+
+
+class LegacyTxtLogger:
+    """Escritura anterior: un open/append/close por archivo y mensaje."""
+
+    def __init__(self, log_directory: Path):
+        self._daily = log_directory / f"dataconta_free_{datetime.now().strftime('%Y-%m-%d')}.txt"
+        self._session = log_directory / f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+
+    def info(self, message: str, context: dict = None):
+        with open(self._daily, 'a', encoding='utf-8') as f:
+            f.write(f"[{datetime.now().strftime('%H:%M:%S')}] [INFO] {message}\n")
+        entry = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [INFO] {message}"
+        if context:
+            entry += " | " + " | ".join(f"{k}={v}" for k, v in context.items() if v is not None)
+        with open(self._session, 'a', encoding='utf-8') as f:
+            f.write(entry + "\n")
+
+
+def log_messages(logger, n_messages: int) -> float:
+    """Segundos para registrar n mensajes tipo descarga por página."""
+    start = time.perf_counter()
+    for i in range(n_messages):
+        logger.info(f"📄 Página {i // 100 + 1}: factura FV-{i:07d} procesada", {'page': i // 100 + 1})
+    return time.perf_counter() - start
+
+
+def daily_lines(log_directory: Path) -> list:
+    """Mensajes del log diario sin la marca de hora ni el encabezado de sesión."""
+    lines = []
+    for path in log_directory.glob("dataconta_free_*.txt"):
+        lines += [line.split('] ', 2)[-1] for line in path.read_text(encoding='utf-8').splitlines()
+                  if 'Página' in line]
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--messages', type=int, nargs='+', default=[5000, 20000],
+                        help='Mensajes a registrar')
+    args = parser.parse_args()
+
+    print(f"{'mensajes':>9} {'anterior (s)':>13} {'buffer (s)':>11} {'buffer+flush (s)':>17}")
+    for n_messages in args.messages:
+        with tempfile.TemporaryDirectory() as legacy_dir, tempfile.TemporaryDirectory() as buffered_dir:
+            legacy_s = log_messages(LegacyTxtLogger(Path(legacy_dir)), n_messages)
+
+            logger = SimpleTxtLogger(None, buffered_dir)
+            buffered_s = log_messages(logger, n_messages)
+            start = time.perf_counter()
+            logger.shutdown()
+            total_s = buffered_s + time.perf_counter() - start
+
+            assert daily_lines(Path(buffered_dir)) == daily_lines(Path(legacy_dir))
+            print(f"{n_messages:>9} {legacy_s:>13.2f} {buffered_s:>11.2f} {total_s:>17.2f}")
+
+
+if __name__ == '__main__':
+    main()
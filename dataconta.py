@@ -15,7 +15,7 @@ from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
     QFrame, QHBoxLayout, QLabel, QMessageBox, QGraphicsDropShadowEffect
 )
-from PySide6.QtCore import Qt, QPoint
+from PySide6.QtCore import Qt, QPoint, QTimer
 from PySide6.QtGui import QFont, QColor
 
 # ==================== Imports - Tema Material (Opcional) ====================
@@ -26,21 +26,13 @@ except Exception:  # pragma: no cover - fallback si no está instalado
     apply_stylesheet = None
 
 # ==================== Imports - Arquitectura Hexagonal ====================
+# Servicios y adaptadores con pandas/openpyxl los construye el factory en su
+# primer uso; las tabs pesadas las importa TabsWidget al abrirlas
 from src.presentation.controllers.free_gui_controller import FreeGUIController
-from src.application.services.kpi_service import KPIService
-from src.application.services.export_service import ExportService
-from src.infrastructure.adapters.free_gui_siigo_adapter import FreeGUISiigoAdapter
-from src.infrastructure.adapters.file_storage_adapter import FileStorageAdapter
-from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+from src.infrastructure.utils.structured_log import configure_structured_log
 from src.infrastructure.factories.application_factory import DataContaApplicationFactory
 
-# ==================== Imports - Sistema de Addons ====================
-from src.infrastructure.factories.addon_factory import AddonFactory
-
 # ==================== Imports - Widgets Especializados (NO monolíticos) ====================
-from src.presentation.widgets.dashboard_widget import DashboardWidget
-from src.presentation.widgets.export_widget import ExportWidget
-from src.presentation.widgets.query_widget import QueryWidget
 from src.presentation.widgets.tabs_widget import TabsWidget
 from src.presentation.widgets.demo_handler_widget import DemoHandlerWidget
 from src.presentation.widgets.loading_widget import LoadingMixin
@@ -82,7 +74,6 @@ class DataContaMainWindow(QMainWindow, LoadingMixin):
         self.init_ui()
         self.setup_window()
         self.connect_signals()
-        self._load_initial_data()
     
     # ---------- Configuración de Ventana ----------
     def setup_window(self):
@@ -178,88 +169,104 @@ class DataContaMainWindow(QMainWindow, LoadingMixin):
         """Conectar signals de los widgets con el controlador."""
         if not self.tabs_widget:
             return
-            
-        # Dashboard signals
-        dashboard_widget = self.tabs_widget.get_dashboard_widget()
-        if dashboard_widget:
-            print("🔗 Conectando señales de dashboard...")
-            dashboard_widget.refresh_kpis_requested.connect(
-                self.controller.refresh_kpis
-            )
-            print("✅ Señal refresh_kpis_requested conectada")
-            
-            # Comentado: Ahora el widget maneja directamente la funcionalidad TOP clientes
-            # dashboard_widget.show_top_clients_requested.connect(
-            #     self.demo_handler.show_top_clients_demo
-            # )
-            dashboard_widget.pro_upgrade_requested.connect(
-                self.demo_handler.show_pro_upgrade_demo
-            )
-            
-            # Conectar señal de controlador de vuelta al dashboard
-            print("🔗 Conectando señal kpis_calculated...")
-            self.controller.kpis_calculated.connect(
-                lambda kpi_data: self._handle_kpis_update(dashboard_widget, kpi_data)
-            )
-            print("✅ Señal kpis_calculated conectada con manejo inteligente")
-        else:
-            print("❌ dashboard_widget es None - no se pueden conectar señales")
+        
+        # Tabs diferidas (Dashboard, Exportar, Reportes): se conectan al construirse
+        self.tabs_widget.tab_widget_created.connect(self._connect_tab_widget)
+        for key, widget in (("dashboard", self.tabs_widget.get_dashboard_widget()),
+                            ("query", self.tabs_widget.get_query_widget()),
+                            ("exportar", self.tabs_widget.get_exportar_widget()),
+                            ("reportes", self.tabs_widget.get_reportes_widget())):
+            if widget:
+                self._connect_tab_widget(key, widget)
         
         # Export widget eliminado - funcionalidad movida a ExportarWidget
         # Las exportaciones ahora se manejan desde el tab "Exportar"
         
-        # Query signals
-        query_widget = self.tabs_widget.get_query_widget()
-        if query_widget:
-            query_widget.search_invoices_requested.connect(
-                self._handle_invoice_search
-            )
-            query_widget.clear_filters_requested.connect(
-                self._handle_clear_filters
-            )
-            # Signal para carga de estados
-            query_widget.load_statuses_requested.connect(
-                self._handle_load_statuses
-            )
-        
-        # Exportar widget signals (formerly Siigo API)
-        exportar_widget = self.tabs_widget.get_exportar_widget()
-        if exportar_widget:
-            exportar_widget.export_siigo_csv_requested.connect(
-                self._handle_siigo_csv_export
-            )
-            exportar_widget.export_siigo_excel_requested.connect(
-                self._handle_siigo_excel_export
-            )
-        
-        # Reportes widget signals
-        reportes_widget = self.tabs_widget.get_reportes_widget()
-        if reportes_widget:
-            print("🔗 Conectando señales de reportes...")
-            
-            # Conectar señal de Estado de Resultados Excel
-            if hasattr(reportes_widget, 'estado_resultados_excel_requested'):
-                reportes_widget.estado_resultados_excel_requested.connect(
-                    self.controller.handle_estado_resultados_excel_request
-                )
-                print("✅ Señal estado_resultados_excel_requested conectada")
-            
-            # Conectar señal de éxito/error del controlador al widget
-            self.controller.estado_resultados_generated.connect(
-                lambda file_path, summary: reportes_widget.show_success_message(file_path)
-            )
-        else:
-            print("❌ reportes_widget es None - no se pueden conectar señales")
-            exportar_widget.test_connection_requested.connect(
-                self.demo_handler.show_siigo_connection_demo
-            )
-        
         # LogWidget removido - logs ahora disponibles en tab Ayuda modal
         
         # Initialize logging with welcome message
         self.log_message("🆓 DataConta FREE iniciado - Arquitectura NO Monolítica")
         self.log_message("📊 Componentes especializados cargados correctamente")
     
+    def _connect_tab_widget(self, key: str, widget: QWidget):
+        """Conectar las señales de un widget de tab recién construido."""
+        connectors = {
+            "dashboard": self._connect_dashboard_signals,
+            "query": self._connect_query_signals,
+            "exportar": self._connect_exportar_signals,
+            "reportes": self._connect_reportes_signals,
+        }
+        if key in connectors:
+            connectors[key](widget)
+    
+    def _connect_dashboard_signals(self, dashboard_widget):
+        """Dashboard signals."""
+        print("🔗 Conectando señales de dashboard...")
+        dashboard_widget.refresh_kpis_requested.connect(
+            self.controller.refresh_kpis
+        )
+        print("✅ Señal refresh_kpis_requested conectada")
+        
+        # Comentado: Ahora el widget maneja directamente la funcionalidad TOP clientes
+        # dashboard_widget.show_top_clients_requested.connect(
+        #     self.demo_handler.show_top_clients_demo
+        # )
+        dashboard_widget.pro_upgrade_requested.connect(
+            self.demo_handler.show_pro_upgrade_demo
+        )
+        
+        # Conectar señal de controlador de vuelta al dashboard
+        print("🔗 Conectando señal kpis_calculated...")
+        self.controller.kpis_calculated.connect(
+            lambda kpi_data: self._handle_kpis_update(dashboard_widget, kpi_data)
+        )
+        print("✅ Señal kpis_calculated conectada con manejo inteligente")
+        
+        # Con la señal ya conectada, cargar los KPIs guardados (carga silenciosa)
+        self.controller.auto_load_existing_kpis()
+    
+    def _connect_query_signals(self, query_widget):
+        """Query signals."""
+        query_widget.search_invoices_requested.connect(
+            self._handle_invoice_search
+        )
+        query_widget.clear_filters_requested.connect(
+            self._handle_clear_filters
+        )
+        # Signal para carga de estados
+        query_widget.load_statuses_requested.connect(
+            self._handle_load_statuses
+        )
+    
+    def _connect_exportar_signals(self, exportar_widget):
+        """Exportar widget signals (formerly Siigo API)."""
+        exportar_widget.export_siigo_csv_requested.connect(
+            self._handle_siigo_csv_export
+        )
+        exportar_widget.export_siigo_excel_requested.connect(
+            self._handle_siigo_excel_export
+        )
+        exportar_widget.test_connection_requested.connect(
+            self.demo_handler.show_siigo_connection_demo
+        )
+        exportar_widget.set_export_service(self.controller.get_export_service())
+    
+    def _connect_reportes_signals(self, reportes_widget):
+        """Reportes widget signals."""
+        print("🔗 Conectando señales de reportes...")
+        
+        # Conectar señal de Estado de Resultados Excel
+        if hasattr(reportes_widget, 'estado_resultados_excel_requested'):
+            reportes_widget.estado_resultados_excel_requested.connect(
+                self.controller.handle_estado_resultados_excel_request
+            )
+            print("✅ Señal estado_resultados_excel_requested conectada")
+        
+        # Conectar señal de éxito/error del controlador al widget
+        self.controller.estado_resultados_generated.connect(
+            lambda file_path, summary: reportes_widget.show_success_message(file_path)
+        )
+    
     # ---------- Métodos de Actualización de UI ----------
     def _handle_kpis_update(self, dashboard_widget, kpi_data: Dict[str, Any]):
         """Manejar actualización de KPIs con contexto automático vs manual."""
@@ -457,6 +464,17 @@ class DataContaMainWindow(QMainWindow, LoadingMixin):
         card.setGraphicsEffect(shadow)
         return card
     
+    def start_deferred_loading(self):
+        """
+        Programar el trabajo pesado de arranque para después de mostrar la ventana.
+        
+        Construye la tab visible (Dashboard), autentica el repositorio Siigo y
+        carga los datos iniciales de la consulta desde el event loop.
+        """
+        QTimer.singleShot(0, self.tabs_widget.build_current_tab)
+        QTimer.singleShot(0, self.controller.initialize_repository)
+        QTimer.singleShot(0, self._load_initial_data)
+    
     def _load_initial_data(self):
         """Cargar datos iniciales después de conectar señales."""
         try:
@@ -497,58 +515,6 @@ def create_dataconta_app() -> DataContaMainWindow:
         # Fallback logging en caso de error
         print(f"❌ Error creando aplicación: {e}")
         raise
-    siigo_adapter = FreeGUISiigoAdapter(logger=logger)
-    file_storage = FileStorageAdapter(output_directory="./outputs", logger=logger)
-    
-    # Crear servicios de aplicación
-    kpi_service = KPIService(
-        invoice_repository=siigo_adapter,
-        file_storage=file_storage,
-        logger=logger
-    )
-    
-    export_service = ExportService(
-        invoice_repository=siigo_adapter,
-        file_storage=file_storage,
-        logger=logger
-    )
-    
-    # Crear controlador (Application Layer)
-    controller = FreeGUIController(
-        kpi_service=kpi_service,
-        export_service=export_service,
-        invoice_repository=siigo_adapter,
-        logger=logger,
-        file_storage=file_storage
-    )
-    
-    # Crear GUI NO monolítica (Presentation Layer)
-    main_window = DataContaMainWindow(controller)
-    
-    # ==================== NUEVO: INTEGRAR ADDONS CON UI ====================
-    # Vincular sistema de addons con la interfaz (si está disponible)
-    if addon_system:
-        try:
-            # Agregar referencia del addon system a la ventana principal
-            main_window.addon_system = addon_system
-            logger.info("🎛️  Sistema de addons vinculado con interfaz")
-            
-        except Exception as e:
-            logger.warning(f"⚠️  Error integrando addons con UI: {e}")
-    
-    logger.info("✅ DataConta NO Monolítico creado exitosamente")
-    
-    # ==================== NUEVO: LOG DE ESTADÍSTICAS ====================
-    if addon_system:
-        active_addons = addon_system.get_active_addons()
-        if active_addons:
-            stats = {
-                'total_addons': len(active_addons),
-                'addon_names': [addon.get_name() for addon in active_addons]
-            }
-            logger.info(f"📊 Estadísticas de addons: {stats}")
-    
-    return main_window
 
 
 # ==================== Main Application Entry Point ====================
@@ -575,6 +541,9 @@ def main():
         print("  🔌 • Sistema de Addons: Extensibilidad de comunidad")
         print("=" * 70)
         
+        # Log estructurado JSONL con spans por operación (logs/dataconta_events_*.jsonl)
+        configure_structured_log("logs")
+        
         # Crear aplicación NO monolítica
         main_window = create_dataconta_app()
         main_window.show()
@@ -587,6 +556,9 @@ def main():
         # Pequeña pausa para que la ventana principal se renderice completamente
         app.processEvents()
         
+        # Dashboard, autenticación Siigo y datos iniciales, ya con la ventana visible
+        main_window.start_deferred_loading()
+        
         # Auto-abrir configurador de Siigo si es necesario
         if SiigoConfigDialog.needs_configuration():
             print("⚙️ Configuración de Siigo API requerida - abriendo configurador...")
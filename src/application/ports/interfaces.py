@@ -6,7 +6,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
-from src.domain.entities.invoice import Invoice, InvoiceFilter, License, APICredentials
+from src.domain.entities.invoice import Invoice, InvoiceFilter, InvoicePage, License, APICredentials
 from src.domain.entities.financial_reports import (
     EstadoResultados, BalanceGeneral, CuentaContable, 
     PeriodoFiscal, InformeFinancieroResumen
@@ -26,6 +26,22 @@ class InvoiceRepository(ABC):
         """Get a specific invoice by ID."""
         pass
 
+    def get_invoices_page(self, filters: InvoiceFilter) -> InvoicePage:
+        """
+        Retrieve only the page selected by ``filters.page``/``filters.page_size``.
+
+        Default implementation slices the full result of ``get_invoices``;
+        API-backed repositories override it to request a single page.
+        """
+        invoices = self.get_invoices(filters)
+        start = (max(filters.page, 1) - 1) * filters.page_size
+        return InvoicePage(
+            invoices=invoices[start:start + filters.page_size],
+            page=filters.page,
+            page_size=filters.page_size,
+            total_results=len(invoices)
+        )
+
 
 class LicenseValidator(ABC):
     """Port for license validation."""
@@ -41,6 +57,30 @@ class LicenseValidator(ABC):
         pass
 
 
+class LicenseCache(ABC):
+    """Port for caching validated licenses between operations and sessions."""
+
+    @abstractmethod
+    def get(self, license_key: str, include_grace: bool = False) -> Optional[License]:
+        """
+        Return the cached license for the key while its cache entry is fresh.
+
+        With ``include_grace`` an expired entry is still returned during the
+        grace period (used when the license server cannot be reached).
+        """
+        pass
+
+    @abstractmethod
+    def put(self, license_info: License) -> None:
+        """Cache a successfully validated license."""
+        pass
+
+    @abstractmethod
+    def invalidate(self, license_key: str) -> None:
+        """Drop any cached entry for the key."""
+        pass
+
+
 class FileStorage(ABC):
     """Port for file storage operations."""
     
@@ -60,6 +100,40 @@ class FileStorage(ABC):
         pass
 
 
+class InvoiceStore(ABC):
+    """Port for the local persistent copy of Siigo invoices."""
+
+    @abstractmethod
+    def upsert_invoices(self, invoices: List[Dict[str, Any]]) -> int:
+        """Insert or update raw invoices keyed by id; return the number written."""
+        pass
+
+    @abstractmethod
+    def query_invoices(self,
+                       fecha_inicio: Optional[str] = None,
+                       fecha_fin: Optional[str] = None,
+                       customer_id: Optional[str] = None,
+                       identification: Optional[str] = None,
+                       status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return raw invoices created within the date range (YYYY-MM-DD) matching the filters."""
+        pass
+
+    @abstractmethod
+    def get_invoice(self, invoice_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored raw invoice with the given id, if any."""
+        pass
+
+    @abstractmethod
+    def get_watermark(self) -> Optional[str]:
+        """Latest metadata.last_updated already synchronized, or None before the first sync."""
+        pass
+
+    @abstractmethod
+    def set_watermark(self, watermark: str) -> None:
+        """Persist the synchronization watermark."""
+        pass
+
+
 class APIClient(ABC):
     """Port for API client operations."""
     
@@ -3,17 +3,21 @@ DataConta - Business Intelligence Export Service
 Service for generating star schema CSV files for Power BI consumption.
 """
 
-from typing import List, Dict, Any, Set, Optional
+from typing import List, Dict, Any, Set, Optional, Iterable, Tuple
 from datetime import datetime
 from decimal import Decimal
+from concurrent.futures import ProcessPoolExecutor
 
 from src.application.ports.interfaces import Logger
 from src.domain.entities.invoice import (
-    FactInvoice, DimClient, DimSeller, DimProduct, DimPayment, DimDate
+    FactInvoice, FactInvoiceHeader, FactInvoiceLine, FactInvoicePayment,
+    DimClient, DimSeller, DimProduct, DimPayment, DimDate
 )
 from src.domain.services.license_manager import LicenseManager
 from src.infrastructure.utils.observation_extractor import ObservationExtractor
-from src.infrastructure.utils.csv_writer import CSVWriter
+from src.infrastructure.utils.csv_writer import CSVWriter, CSVStreamWriter
+from src.infrastructure.utils.parquet_writer import ParquetWriter
+from src.infrastructure.utils.structured_log import add_records, traced
 
 
 class BIExportService:
@@ -24,14 +28,91 @@ class BIExportService:
     payments, dates) optimized for Power BI consumption.
     
     Now includes license validation for BI export operations.
+    
+    Two modes are available: process_invoices_for_bi + export_to_csv_files keeps
+    the whole schema in memory, while export_invoices_streaming writes each row
+    as soon as it is produced and only keeps dimension keys for deduplication.
+    
+    Fact layouts: "cartesian" (default, one fact_invoices row per item x payment
+    pair, kept for compatibility) or "split" (fact_invoice_headers,
+    fact_invoice_lines and fact_invoice_payments, without repeated totals).
     """
     
-    def __init__(self, logger: Logger, license_manager: Optional[LicenseManager] = None):
+    FACT_LAYOUT_CARTESIAN = "cartesian"
+    FACT_LAYOUT_SPLIT = "split"
+    FACT_TABLES = {
+        FACT_LAYOUT_CARTESIAN: {
+            "facts": ("fact_invoices.csv", FactInvoice),
+        },
+        FACT_LAYOUT_SPLIT: {
+            "invoice_headers": ("fact_invoice_headers.csv", FactInvoiceHeader),
+            "invoice_lines": ("fact_invoice_lines.csv", FactInvoiceLine),
+            "invoice_payments": ("fact_invoice_payments.csv", FactInvoicePayment),
+        },
+    }
+    DIMENSION_FILES = {
+        "clients": ("dim_clients.csv", DimClient),
+        "sellers": ("dim_sellers.csv", DimSeller),
+        "products": ("dim_products.csv", DimProduct),
+        "payments": ("dim_payments.csv", DimPayment),
+        "dates": ("dim_dates.csv", DimDate),
+    }
+    
+    # Native column types for the Parquet export (see ParquetWriter)
+    PARQUET_COLUMNS = {
+        "facts": {
+            "factura_id": "string", "fecha": "date", "cliente_id": "string", "vendedor_id": "string",
+            "producto_codigo": "string", "producto_cantidad": "float", "producto_precio": "float",
+            "producto_descuento": "float", "producto_total": "float", "pago_id": "string",
+            "subtotal": "float", "descuento_total": "float", "impuestos": "float", "total": "float",
+            "estado": "category", "observaciones": "string"
+        },
+        "invoice_headers": {
+            "factura_id": "string", "fecha": "date", "cliente_id": "string", "vendedor_id": "string",
+            "subtotal": "float", "descuento_total": "float", "impuestos": "float", "total": "float",
+            "estado": "category", "observaciones": "string"
+        },
+        "invoice_lines": {
+            "factura_id": "string", "fecha": "date", "cliente_id": "string", "vendedor_id": "string",
+            "producto_codigo": "string", "producto_cantidad": "float", "producto_precio": "float",
+            "producto_descuento": "float", "producto_total": "float"
+        },
+        "invoice_payments": {
+            "factura_id": "string", "fecha": "date", "cliente_id": "string", "pago_id": "string",
+            "valor": "float"
+        },
+        "clients": {
+            "cliente_id": "string", "identificacion": "string", "nombre": "string", "email": "string",
+            "tipo_cliente": "category", "regimen": "category"
+        },
+        "sellers": {"vendedor_id": "string", "nombre": "string", "zona": "category"},
+        "products": {
+            "producto_codigo": "string", "descripcion": "string", "categoria": "category",
+            "precio_estandar": "float"
+        },
+        "payments": {"pago_id": "string", "nombre": "string", "categoria": "category"},
+        "dates": {
+            "fecha": "date", "año": "int", "mes": "int", "dia": "int", "trimestre": "int",
+            "nombre_mes": "category", "nombre_dia": "category"
+        },
+    }
+    
+    def __init__(
+        self,
+        logger: Logger,
+        license_manager: Optional[LicenseManager] = None,
+        fact_layout: str = FACT_LAYOUT_CARTESIAN
+    ):
         """Initialize the BI export service."""
+        if fact_layout not in self.FACT_TABLES:
+            raise ValueError(f"Unknown BI fact layout: {fact_layout}")
+        
         self._logger = logger
+        self._fact_layout = fact_layout
         self._license_manager = license_manager
         self._observation_extractor = ObservationExtractor(logger)
         self._csv_writer = CSVWriter(logger)
+        self._parquet_writer = ParquetWriter(logger)
         
         # Collections for dimension deduplication
         self._clients: Dict[str, DimClient] = {}
@@ -39,14 +120,59 @@ class BIExportService:
         self._products: Dict[str, DimProduct] = {}
         self._payments: Dict[str, DimPayment] = {}
         self._dates: Dict[str, DimDate] = {}
-        self._facts: List[FactInvoice] = []
+        self._fact_rows: Dict[str, List[Any]] = {
+            name: [] for tables in self.FACT_TABLES.values() for name in tables
+        }
+        self._facts: List[FactInvoice] = self._fact_rows["facts"]
+        self._dimensions: Dict[str, Dict[str, Any]] = {
+            "clients": self._clients,
+            "sellers": self._sellers,
+            "products": self._products,
+            "payments": self._payments,
+            "dates": self._dates,
+        }
+        
+        # Streaming state: open writers and the keys already written per dimension
+        self._stream_writers: Optional[Dict[str, CSVStreamWriter]] = None
+        self._fact_writers: Dict[str, CSVStreamWriter] = {}
+        self._dimension_keys: Dict[str, Set[str]] = {name: set() for name in self.DIMENSION_FILES}
+        self._fact_counts: Dict[str, int] = {name: 0 for name in self._fact_rows}
+        self._streamed = False
     
-    def process_invoices_for_bi(self, invoices_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    @property
+    def fact_layout(self) -> str:
+        """Fact table layout used by this service."""
+        return self._fact_layout
+    
+    def set_fact_layout(self, fact_layout: str):
+        """Select the fact table layout for the next processing run."""
+        if fact_layout not in self.FACT_TABLES:
+            raise ValueError(f"Unknown BI fact layout: {fact_layout}")
+        self._fact_layout = fact_layout
+    
+    @property
+    def _layout_tables(self) -> Dict[str, tuple]:
+        """Fact tables (name -> (filename, entity)) of the configured layout."""
+        return self.FACT_TABLES[self._fact_layout]
+    
+    @traced('bi.process_invoices')
+    def process_invoices_for_bi(
+        self,
+        invoices_data: List[Dict[str, Any]],
+        max_workers: int = 1,
+        chunk_size: int = 500
+    ) -> Dict[str, Any]:
         """
         Process invoices and generate star schema data.
         
+        With max_workers > 1 the invoices are split into chunks processed in a
+        process pool. Partial results are merged in chunk order, keeping the first
+        occurrence of each dimension key, so the output matches a sequential run.
+        
         Args:
             invoices_data: List of invoice dictionaries
+            max_workers: Number of worker processes (1 = in this process)
+            chunk_size: Invoices per worker task
             
         Returns:
             Dictionary with processing results and statistics
@@ -69,45 +195,221 @@ class BIExportService:
             # Clear previous data
             self._clear_collections()
             
-            # Process each invoice
+            if max_workers > 1 and len(invoices_data) > chunk_size:
+                processed_count, error_count = self._process_invoices_parallel(invoices_data, max_workers, chunk_size)
+            else:
+                processed_count, error_count = self._process_invoices(invoices_data)
+            
+            stats = self._build_processing_stats(processed_count, error_count)
+            
+            self._logger.info(f"BI processing completed: {stats}")
+            return stats
+            
+        except Exception as e:
+            self._logger.error(f"Error in BI export processing: {e}")
+            raise
+    
+    @traced('bi.export_streaming')
+    def export_invoices_streaming(self, invoices_data: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Process invoices and write the star schema CSV files incrementally.
+        
+        The invoices are consumed one by one (e.g. page by page from the API), so
+        the total count does not need to be known in advance. Fact rows are written
+        immediately and dimension rows the first time their key appears; the BI
+        license limit is enforced against the running count.
+        
+        Args:
+            invoices_data: Iterable of invoice dictionaries
+            
+        Returns:
+            Processing statistics plus "files_created" (filename -> success)
+        """
+        try:
+            max_bi_invoices = None
+            if self._license_manager:
+                if not self._license_manager.can_export_bi():
+                    raise ValueError(f"BI export not available for license {self._license_manager.get_license_display_name()}")
+                max_bi_invoices = self._license_manager.get_max_invoices_for_bi()
+                self._logger.info(f"Starting streaming BI export (License: {self._license_manager.get_license_display_name()})")
+            else:
+                self._logger.info("Starting streaming BI export")
+            
+            self._clear_collections()
+            self._streamed = True
+            
             processed_count = 0
             error_count = 0
+            limit_reached = False
             
-            for invoice_data in invoices_data:
-                try:
-                    self._process_single_invoice(invoice_data)
-                    processed_count += 1
-                except Exception as e:
-                    self._logger.error(f"Error processing invoice {invoice_data.get('id', 'unknown')}: {e}")
-                    error_count += 1
-            
-            # Generate statistics
-            stats = {
-                "processed_invoices": processed_count,
-                "error_invoices": error_count,
-                "total_facts": len(self._facts),
-                "unique_clients": len(self._clients),
-                "unique_sellers": len(self._sellers),
-                "unique_products": len(self._products),
-                "unique_payments": len(self._payments),
-                "unique_dates": len(self._dates)
-            }
+            self._open_stream_writers()
+            try:
+                for invoice_data in invoices_data:
+                    if max_bi_invoices is not None and processed_count + error_count >= max_bi_invoices:
+                        limit_reached = True
+                        self._logger.warning(f"BI export limit reached ({max_bi_invoices} invoices); remaining invoices were not exported")
+                        break
+                    
+                    try:
+                        self._process_single_invoice(invoice_data)
+                        processed_count += 1
+                    except Exception as e:
+                        self._logger.error(f"Error processing invoice {invoice_data.get('id', 'unknown')}: {e}")
+                        error_count += 1
+            finally:
+                files_created = self._close_stream_writers()
             
-            # Add license information if available
-            if self._license_manager:
-                stats["license_info"] = {
-                    "type": self._license_manager.get_license_display_name(),
-                    "can_export_bi": self._license_manager.can_export_bi(),
-                    "max_bi_invoices": self._license_manager.get_max_invoices_for_bi()
-                }
+            stats = self._build_processing_stats(processed_count, error_count)
+            stats["limit_reached"] = limit_reached
+            stats["files_created"] = files_created
             
-            self._logger.info(f"BI processing completed: {stats}")
+            self._logger.info(f"Streaming BI export completed: {stats}")
             return stats
             
         except Exception as e:
-            self._logger.error(f"Error in BI export processing: {e}")
+            self._logger.error(f"Error in streaming BI export: {e}")
             raise
     
+    def _process_invoices(self, invoices_data: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """Process invoices one by one; returns (processed, errors)."""
+        processed_count = 0
+        error_count = 0
+        
+        for invoice_data in invoices_data:
+            try:
+                self._process_single_invoice(invoice_data)
+                processed_count += 1
+            except Exception as e:
+                self._logger.error(f"Error processing invoice {invoice_data.get('id', 'unknown')}: {e}")
+                error_count += 1
+        
+        return processed_count, error_count
+    
+    def _process_invoices_parallel(
+        self,
+        invoices_data: List[Dict[str, Any]],
+        max_workers: int,
+        chunk_size: int
+    ) -> Tuple[int, int]:
+        """Process invoice chunks in worker processes and merge them in order."""
+        chunks = [invoices_data[i:i + chunk_size] for i in range(0, len(invoices_data), chunk_size)]
+        self._logger.info(f"Processing {len(invoices_data)} invoices in {len(chunks)} chunks with {max_workers} worker processes")
+        
+        processed_count = 0
+        error_count = 0
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            layouts = [self._fact_layout] * len(chunks)
+            for partial in executor.map(_process_invoice_chunk, layouts, chunks):
+                for level, message in partial["messages"]:
+                    getattr(self._logger, level)(message)
+                self._merge_partial_result(partial)
+                processed_count += partial["processed"]
+                error_count += partial["errors"]
+        
+        return processed_count, error_count
+    
+    def _merge_partial_result(self, partial: Dict[str, Any]):
+        """Append a worker's facts and add the dimension keys not seen yet."""
+        for name, rows in partial["facts"].items():
+            self._fact_rows[name].extend(rows)
+            self._fact_counts[name] += len(rows)
+        
+        for name, records in partial["dimensions"].items():
+            target = self._dimensions[name]
+            for key, record in records.items():
+                if key not in target:
+                    target[key] = record
+    
+    def _build_processing_stats(self, processed_count: int, error_count: int) -> Dict[str, Any]:
+        """Statistics of the last processing run."""
+        add_records(processed_count, error_invoices=error_count)
+        stats = {
+            "processed_invoices": processed_count,
+            "error_invoices": error_count,
+            "fact_layout": self._fact_layout,
+            "total_facts": self._total_facts(),
+            "fact_rows": {self._layout_tables[name][0]: self._fact_counts[name] for name in self._layout_tables},
+            "unique_clients": self._dimension_count("clients"),
+            "unique_sellers": self._dimension_count("sellers"),
+            "unique_products": self._dimension_count("products"),
+            "unique_payments": self._dimension_count("payments"),
+            "unique_dates": self._dimension_count("dates")
+        }
+        
+        # Add license information if available
+        if self._license_manager:
+            stats["license_info"] = {
+                "type": self._license_manager.get_license_display_name(),
+                "can_export_bi": self._license_manager.can_export_bi(),
+                "max_bi_invoices": self._license_manager.get_max_invoices_for_bi()
+            }
+        
+        return stats
+    
+    def _open_stream_writers(self):
+        """Open one CSV stream per star schema table."""
+        fact_writers: Dict[str, CSVStreamWriter] = {}
+        writers: Dict[str, CSVStreamWriter] = {}
+        try:
+            for name, (filename, fact_class) in self._layout_tables.items():
+                fact_writers[name] = self._csv_writer.open_csv_stream(filename, fact_class.get_csv_headers())
+            for name, (filename, dimension_class) in self.DIMENSION_FILES.items():
+                writers[name] = self._csv_writer.open_csv_stream(filename, dimension_class.get_csv_headers())
+        except Exception:
+            for writer in list(fact_writers.values()) + list(writers.values()):
+                writer.close()
+            raise
+        self._fact_writers = fact_writers
+        self._stream_writers = writers
+    
+    def _close_stream_writers(self) -> Dict[str, bool]:
+        """Close all open CSV streams and report which files were written."""
+        results = {}
+        for writer in list(self._fact_writers.values()) + list((self._stream_writers or {}).values()):
+            try:
+                writer.close()
+                results[writer.file_path.name] = True
+            except Exception as e:
+                self._logger.error(f"Error closing BI CSV file {writer.file_path.name}: {e}")
+                results[writer.file_path.name] = False
+        self._fact_writers = {}
+        self._stream_writers = None
+        return results
+    
+    def _total_facts(self) -> int:
+        """Number of fact rows over all tables of the configured layout."""
+        return sum(self._fact_counts[name] for name in self._layout_tables)
+    
+    def _dimension_count(self, name: str) -> int:
+        """Number of distinct rows in a dimension, in either mode."""
+        if self._streamed:
+            return len(self._dimension_keys[name])
+        return len(self._dimensions[name])
+    
+    def _has_dimension(self, name: str, key: str) -> bool:
+        """Whether a dimension row with this key was already registered."""
+        if self._stream_writers is not None:
+            return key in self._dimension_keys[name]
+        return key in self._dimensions[name]
+    
+    def _add_dimension(self, name: str, key: str, record: Any):
+        """Register a new dimension row: written to its stream or kept in memory."""
+        if self._stream_writers is not None:
+            self._dimension_keys[name].add(key)
+            self._stream_writers[name].write_row(record.to_dict())
+        else:
+            self._dimensions[name][key] = record
+    
+    def _add_fact(self, fact: Any, table: str = "facts"):
+        """Register a fact row: written to its stream or kept in memory."""
+        self._fact_counts[table] += 1
+        if self._stream_writers is not None:
+            self._fact_writers[table].write_row(fact.to_dict())
+        else:
+            self._fact_rows[table].append(fact)
+    
+    @traced('bi.write_csv')
     def export_to_csv_files(self) -> Dict[str, bool]:
         """
         Export all star schema data to CSV files.
@@ -119,31 +421,17 @@ class BIExportService:
             self._logger.info("Starting CSV export for BI data")
             
             csv_data = {
-                "fact_invoices.csv": {
-                    "headers": FactInvoice.get_csv_headers(),
-                    "rows": [fact.to_dict() for fact in self._facts]
-                },
-                "dim_clients.csv": {
-                    "headers": DimClient.get_csv_headers(),
-                    "rows": [client.to_dict() for client in self._clients.values()]
-                },
-                "dim_sellers.csv": {
-                    "headers": DimSeller.get_csv_headers(),
-                    "rows": [seller.to_dict() for seller in self._sellers.values()]
-                },
-                "dim_products.csv": {
-                    "headers": DimProduct.get_csv_headers(),
-                    "rows": [product.to_dict() for product in self._products.values()]
-                },
-                "dim_payments.csv": {
-                    "headers": DimPayment.get_csv_headers(),
-                    "rows": [payment.to_dict() for payment in self._payments.values()]
-                },
-                "dim_dates.csv": {
-                    "headers": DimDate.get_csv_headers(),
-                    "rows": [date.to_dict() for date in self._dates.values()]
+                filename: {
+                    "headers": fact_class.get_csv_headers(),
+                    "rows": [fact.to_dict() for fact in self._fact_rows[name]]
                 }
+                for name, (filename, fact_class) in self._layout_tables.items()
             }
+            for name, (filename, dimension_class) in self.DIMENSION_FILES.items():
+                csv_data[filename] = {
+                    "headers": dimension_class.get_csv_headers(),
+                    "rows": [record.to_dict() for record in self._dimensions[name].values()]
+                }
             
             results = self._csv_writer.write_multiple_csvs(csv_data)
             
@@ -154,6 +442,46 @@ class BIExportService:
             self._logger.error(f"Error exporting BI CSV files: {e}")
             raise
     
+    @traced('bi.write_parquet')
+    def export_to_parquet_files(self) -> Dict[str, bool]:
+        """
+        Export all star schema data to Parquet files with native column types.
+        
+        Fact tables are written with one row group per invoice month.
+        Requires pyarrow.
+        
+        Returns:
+            Dictionary with filename as key and success status as value
+        """
+        try:
+            if not self._parquet_writer.is_available():
+                raise ValueError("Parquet export requires pyarrow (pip install pyarrow)")
+            
+            self._logger.info("Starting Parquet export for BI data")
+            
+            parquet_data = {
+                filename.replace(".csv", ".parquet"): {
+                    "columns": self.PARQUET_COLUMNS[name],
+                    "rows": [vars(fact) for fact in self._fact_rows[name]],
+                    "partition_by_month": "fecha"
+                }
+                for name, (filename, _) in self._layout_tables.items()
+            }
+            for name, (filename, _) in self.DIMENSION_FILES.items():
+                parquet_data[filename.replace(".csv", ".parquet")] = {
+                    "columns": self.PARQUET_COLUMNS[name],
+                    "rows": [vars(record) for record in self._dimensions[name].values()]
+                }
+            
+            results = self._parquet_writer.write_multiple_parquets(parquet_data)
+            
+            self._logger.info(f"Parquet export completed: {results}")
+            return results
+            
+        except Exception as e:
+            self._logger.error(f"Error exporting BI Parquet files: {e}")
+            raise
+    
     def _clear_collections(self):
         """Clear all internal collections."""
         self._clients.clear()
@@ -161,7 +489,13 @@ class BIExportService:
         self._products.clear()
         self._payments.clear()
         self._dates.clear()
-        self._facts.clear()
+        for rows in self._fact_rows.values():
+            rows.clear()
+        for keys in self._dimension_keys.values():
+            keys.clear()
+        for name in self._fact_counts:
+            self._fact_counts[name] = 0
+        self._streamed = False
     
     def _process_single_invoice(self, invoice_data: Dict[str, Any]):
         """Process a single invoice and extract all dimension and fact data."""
@@ -170,8 +504,8 @@ class BIExportService:
         status = invoice_data.get('status', 'Unknown')
         observations = invoice_data.get('observations', '')
         
-        # Process date dimension
-        self._process_date_dimension(date_str)
+        # Process date dimension (parsed once per invoice)
+        fecha = self._process_date_dimension(date_str)
         
         # Process customer dimension
         customer_data = invoice_data.get('customer', {})
@@ -190,28 +524,67 @@ class BIExportService:
         impuestos = float(totals.get('taxes', 0))
         total_factura = float(totals.get('total', 0))
         
-        # Process items and payments (Cartesian product for facts)
         items = invoice_data.get('items', [])
         payments = invoice_data.get('payments', [])
         
+        if self._fact_layout == self.FACT_LAYOUT_SPLIT:
+            self._add_fact(FactInvoiceHeader(
+                factura_id=invoice_id,
+                fecha=fecha,
+                cliente_id=customer_id,
+                vendedor_id=seller_id,
+                subtotal=subtotal,
+                descuento_total=descuento_total,
+                impuestos=impuestos,
+                total=total_factura,
+                estado=status,
+                observaciones=observations[:500]  # Truncate long observations
+            ), "invoice_headers")
+            
+            for item in items:
+                self._process_product_dimension(item)
+                self._add_fact(FactInvoiceLine(
+                    factura_id=invoice_id,
+                    fecha=fecha,
+                    cliente_id=customer_id,
+                    vendedor_id=seller_id,
+                    producto_codigo=str(item.get('code', '')),
+                    producto_cantidad=float(item.get('quantity', 0)),
+                    producto_precio=float(item.get('price', 0)),
+                    producto_descuento=float(item.get('discount', 0)),
+                    producto_total=float(item.get('total', 0))
+                ), "invoice_lines")
+            
+            for payment in payments:
+                self._process_payment_dimension(payment)
+                self._add_fact(FactInvoicePayment(
+                    factura_id=invoice_id,
+                    fecha=fecha,
+                    cliente_id=customer_id,
+                    pago_id=str(payment.get('id', '')),
+                    valor=float(payment.get('value', 0))
+                ), "invoice_payments")
+            return
+        
+        # Cartesian layout: one fact per item x payment pair
         if not items:
             items = [{"code": "NO_ITEM", "description": "Sin items", "quantity": 0, "price": 0, "discount": 0, "total": 0}]
         
         if not payments:
             payments = [{"id": "NO_PAYMENT", "name": "Sin pago", "value": 0}]
         
+        for payment in payments:
+            self._process_payment_dimension(payment)
+        
         for item in items:
             # Process product dimension
             self._process_product_dimension(item)
             
             for payment in payments:
-                # Process payment dimension
-                self._process_payment_dimension(payment)
-                
                 # Create fact record
                 fact = FactInvoice(
                     factura_id=invoice_id,
-                    fecha=DimDate.from_date_string(date_str).fecha,
+                    fecha=fecha,
                     cliente_id=customer_id,
                     vendedor_id=seller_id,
                     producto_codigo=str(item.get('code', '')),
@@ -228,13 +601,13 @@ class BIExportService:
                     observaciones=observations[:500]  # Truncate long observations
                 )
                 
-                self._facts.append(fact)
+                self._add_fact(fact)
     
     def _process_client_dimension(self, customer_data: Dict[str, Any], observations: str):
         """Process and store client dimension data."""
         cliente_id = str(customer_data.get('id', ''))
         
-        if cliente_id not in self._clients:
+        if not self._has_dimension("clients", cliente_id):
             # Extract client type and regime from observations
             tipo_cliente, regimen = self._observation_extractor.extract_client_info(observations)
             
@@ -247,26 +620,26 @@ class BIExportService:
                 regimen=regimen
             )
             
-            self._clients[cliente_id] = client
+            self._add_dimension("clients", cliente_id, client)
     
     def _process_seller_dimension(self, seller_data: Dict[str, Any]):
         """Process and store seller dimension data."""
         seller_id = str(seller_data.get('id', ''))
         
-        if seller_id not in self._sellers:
+        if not self._has_dimension("sellers", seller_id):
             seller = DimSeller(
                 vendedor_id=seller_id,
                 nombre=seller_data.get('name', ''),
                 zona="No Especificado"  # Could be enhanced with additional data
             )
             
-            self._sellers[seller_id] = seller
+            self._add_dimension("sellers", seller_id, seller)
     
     def _process_product_dimension(self, item_data: Dict[str, Any]):
         """Process and store product dimension data."""
         product_code = str(item_data.get('code', ''))
         
-        if product_code not in self._products:
+        if not self._has_dimension("products", product_code):
             description = item_data.get('description', '')
             categoria = self._observation_extractor.extract_product_category(description)
             
@@ -277,13 +650,13 @@ class BIExportService:
                 precio_estandar=float(item_data.get('price', 0))
             )
             
-            self._products[product_code] = product
+            self._add_dimension("products", product_code, product)
     
     def _process_payment_dimension(self, payment_data: Dict[str, Any]):
         """Process and store payment dimension data."""
         payment_id = str(payment_data.get('id', ''))
         
-        if payment_id not in self._payments:
+        if not self._has_dimension("payments", payment_id):
             payment_name = payment_data.get('name', '')
             categoria = self._observation_extractor.extract_payment_category(payment_name)
             
@@ -293,27 +666,30 @@ class BIExportService:
                 categoria=categoria
             )
             
-            self._payments[payment_id] = payment
+            self._add_dimension("payments", payment_id, payment)
     
-    def _process_date_dimension(self, date_str: str):
-        """Process and store date dimension data."""
+    def _process_date_dimension(self, date_str: str) -> str:
+        """Process and store date dimension data; returns the normalized date used by facts."""
         if not date_str:
-            return
+            return date_str
         
         dim_date = DimDate.from_date_string(date_str)
         
-        if dim_date.fecha not in self._dates:
-            self._dates[dim_date.fecha] = dim_date
+        if not self._has_dimension("dates", dim_date.fecha):
+            self._add_dimension("dates", dim_date.fecha, dim_date)
+        
+        return dim_date.fecha
     
     def get_export_statistics(self) -> Dict[str, Any]:
         """Get current export statistics."""
         stats = {
-            "facts_count": len(self._facts),
-            "clients_count": len(self._clients),
-            "sellers_count": len(self._sellers),
-            "products_count": len(self._products),
-            "payments_count": len(self._payments),
-            "dates_count": len(self._dates),
+            "fact_layout": self._fact_layout,
+            "facts_count": self._total_facts(),
+            "clients_count": self._dimension_count("clients"),
+            "sellers_count": self._dimension_count("sellers"),
+            "products_count": self._dimension_count("products"),
+            "payments_count": self._dimension_count("payments"),
+            "dates_count": self._dimension_count("dates"),
             "output_directory": self._csv_writer.get_output_directory()
         }
         
@@ -342,20 +718,24 @@ class BIExportService:
                 "errors": []
             }
             
-            # Check for orphaned foreign keys in facts
-            fact_client_ids = {fact.cliente_id for fact in self._facts}
-            dim_client_ids = set(self._clients.keys())
-            orphaned_clients = fact_client_ids - dim_client_ids
-            
-            if orphaned_clients:
-                validation["warnings"].append(f"Orphaned client IDs in facts: {orphaned_clients}")
+            # Check for orphaned foreign keys in facts. Streamed facts are not kept in
+            # memory, but each client row is written before any fact that references it.
+            if not self._streamed:
+                fact_client_ids = {
+                    fact.cliente_id for name in self._layout_tables for fact in self._fact_rows[name]
+                }
+                dim_client_ids = set(self._clients.keys())
+                orphaned_clients = fact_client_ids - dim_client_ids
+                
+                if orphaned_clients:
+                    validation["warnings"].append(f"Orphaned client IDs in facts: {orphaned_clients}")
             
             # Check for missing required dimensions
-            if not self._clients:
+            if not self._dimension_count("clients"):
                 validation["errors"].append("No clients dimension data")
                 validation["valid"] = False
             
-            if not self._facts:
+            if not self._total_facts():
                 validation["errors"].append("No fact data")
                 validation["valid"] = False
             
@@ -365,4 +745,38 @@ class BIExportService:
             
         except Exception as e:
             self._logger.error(f"Error validating star schema: {e}")
-            return {"valid": False, "errors": [str(e)], "warnings": []}
\ No newline at end of file
+            return {"valid": False, "errors": [str(e)], "warnings": []}
+
+
+class _ChunkLogger(Logger):
+    """Logger for worker processes: keeps warnings and errors to replay them in the parent."""
+    
+    def __init__(self):
+        self.messages: List[Tuple[str, str]] = []
+    
+    def info(self, message: str) -> None:
+        pass
+    
+    def debug(self, message: str) -> None:
+        pass
+    
+    def warning(self, message: str) -> None:
+        self.messages.append(("warning", message))
+    
+    def error(self, message: str) -> None:
+        self.messages.append(("error", message))
+
+
+def _process_invoice_chunk(fact_layout: str, invoices_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Worker process entry point: star schema fragment for a chunk of invoices."""
+    logger = _ChunkLogger()
+    service = BIExportService(logger, fact_layout=fact_layout)
+    processed_count, error_count = service._process_invoices(invoices_data)
+    
+    return {
+        "processed": processed_count,
+        "errors": error_count,
+        "messages": logger.messages,
+        "facts": {name: service._fact_rows[name] for name in service._layout_tables},
+        "dimensions": service._dimensions,
+    }
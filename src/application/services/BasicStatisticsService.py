@@ -8,6 +8,9 @@ from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
+import numpy as np
+import pandas as pd
+
 from src.domain.entities.invoice import Invoice
 from src.application.ports.interfaces import InvoiceRepository
 from src.domain.services.license_manager import LicenseManager
@@ -108,65 +111,83 @@ class BasicStatisticsService:
     
     def _calculate_statistics(self, invoices: List[Invoice]) -> Dict[str, Any]:
         """Calcular las estadísticas básicas de las facturas."""
+        return self._calculate_statistics_from_columns(self._build_invoice_columns(invoices))
+    
+    def _build_invoice_columns(self, invoices: List[Invoice]) -> Dict[str, np.ndarray]:
+        """
+        Representación columnar de las facturas en un único recorrido.
         
-        # Estadísticas básicas
-        total_invoices = len(invoices)
-        total_amount = 0.0
-        unique_customers = set()
-        unique_sellers = set()
-        total_items = 0
-        payment_methods = {}
-        monthly_distribution = {}
+        Una posición por factura para el monto (calculado una sola vez), cliente,
+        vendedor, número de items y mes como entero AAAAMM (0 sin fecha); los ids
+        de pago de todas las facturas van en su propia columna.
+        """
+        amounts = []
+        customers = []
+        sellers = []
+        item_counts = []
+        months = []
+        payment_ids = []
         
         for invoice in invoices:
-            # Calcular monto total
             if invoice.total:
-                total_amount += float(invoice.total)
+                amounts.append(float(invoice.total))
             elif invoice.items:
-                total_amount += float(invoice.calculate_total())
+                amounts.append(float(invoice.calculate_total()))
+            else:
+                amounts.append(0.0)
             
-            # Clientes únicos
-            if invoice.customer and invoice.customer.identification:
-                unique_customers.add(invoice.customer.identification)
+            customer = invoice.customer
+            customers.append(customer.identification if customer and customer.identification else None)
+            sellers.append(invoice.seller if invoice.seller else None)
+            item_counts.append(len(invoice.items) if invoice.items else 0)
+            months.append(invoice.date.year * 100 + invoice.date.month if invoice.date else 0)
             
-            # Vendedores únicos
-            if invoice.seller:
-                unique_sellers.add(invoice.seller)
-            
-            # Total de items
-            if invoice.items:
-                total_items += len(invoice.items)
-            
-            # Métodos de pago
             if invoice.payments:
-                for payment in invoice.payments:
-                    payment_id = payment.id if payment.id else "Unknown"
-                    if payment_id not in payment_methods:
-                        payment_methods[payment_id] = 0
-                    payment_methods[payment_id] += 1
-            
-            # Distribución mensual
-            if invoice.date:
-                month_key = invoice.date.strftime("%Y-%m")
-                if month_key not in monthly_distribution:
-                    monthly_distribution[month_key] = {"count": 0, "amount": 0.0}
-                monthly_distribution[month_key]["count"] += 1
-                
-                if invoice.total:
-                    monthly_distribution[month_key]["amount"] += float(invoice.total)
-                elif invoice.items:
-                    monthly_distribution[month_key]["amount"] += float(invoice.calculate_total())
+                payment_ids.extend(payment.id if payment.id else "Unknown" for payment in invoice.payments)
+        
+        return {
+            "amount": np.asarray(amounts, dtype=np.float64),
+            "customer": self._object_array(customers),
+            "seller": self._object_array(sellers),
+            "items": np.asarray(item_counts, dtype=np.int64),
+            "month": np.asarray(months, dtype=np.int64),
+            "payment_id": self._object_array(payment_ids)
+        }
+    
+    def _calculate_statistics_from_columns(self, columns: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """Calcular las estadísticas básicas con pasadas vectorizadas sobre las columnas."""
+        amounts = columns["amount"]
+        total_invoices = len(amounts)
+        total_amount = float(amounts.sum())
+        total_items = int(columns["items"].sum())
         
         # Promedios
         average_invoice_amount = total_amount / total_invoices if total_invoices > 0 else 0.0
         average_items_per_invoice = total_items / total_invoices if total_invoices > 0 else 0.0
         
+        # Métodos de pago: conteo por id, empates en el orden de primera aparición
+        payment_codes, payment_methods = pd.factorize(columns["payment_id"])
+        payment_counts = np.bincount(payment_codes, minlength=len(payment_methods))
+        top_payments = np.argsort(-payment_counts, kind="stable")[:3]
+        
+        # Distribución mensual en el orden de primera aparición del mes
+        dated = columns["month"] > 0
+        month_codes, months = pd.factorize(columns["month"][dated])
+        month_counts = np.bincount(month_codes, minlength=len(months))
+        month_amounts = np.bincount(month_codes, weights=amounts[dated], minlength=len(months))
+        monthly_distribution = {
+            f"{month // 100:04d}-{month % 100:02d}": {"count": count, "amount": amount}
+            for month, count, amount in zip(
+                months[:6].tolist(), month_counts[:6].tolist(), month_amounts[:6].tolist()
+            )
+        }
+        
         return {
             # Estadísticas principales
             "total_invoices": total_invoices,
             "total_amount": round(total_amount, 2),
-            "unique_customers": len(unique_customers),
-            "unique_sellers": len(unique_sellers),
+            "unique_customers": len(pd.unique(columns["customer"][pd.notna(columns["customer"])])),
+            "unique_sellers": len(pd.unique(columns["seller"][pd.notna(columns["seller"])])),
             "total_items": total_items,
             
             # Promedios
@@ -174,16 +195,23 @@ class BasicStatisticsService:
             "average_items_per_invoice": round(average_items_per_invoice, 2),
             
             # Distribuciones (limitadas para FREE)
-            "top_payment_methods": dict(list(sorted(payment_methods.items(), key=lambda x: x[1], reverse=True))[:3]),
-            "monthly_distribution": dict(list(monthly_distribution.items())[:6]),  # Últimos 6 meses
+            "top_payment_methods": {payment_methods[i]: int(payment_counts[i]) for i in top_payments},
+            "monthly_distribution": monthly_distribution,  # Últimos 6 meses
             
             # Rangos de valores (básicos)
             "amount_range": {
-                "min": round(min([float(inv.total) if inv.total else float(inv.calculate_total()) if inv.items else 0 for inv in invoices], default=0), 2),
-                "max": round(max([float(inv.total) if inv.total else float(inv.calculate_total()) if inv.items else 0 for inv in invoices], default=0), 2)
+                "min": round(float(amounts.min()), 2) if total_invoices else 0,
+                "max": round(float(amounts.max()), 2) if total_invoices else 0
             }
         }
     
+    @staticmethod
+    def _object_array(values: List[Any]) -> np.ndarray:
+        """Arreglo de objetos sin que NumPy intente inferir dimensiones o tipos."""
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+    
     def _get_empty_statistics(self) -> Dict[str, Any]:
         """Obtener estructura de estadísticas vacías."""
         return {
@@ -6,13 +6,18 @@ Mantiene la lógica de negocio separada de la UI según arquitectura hexagonal.
 
 import os
 import csv
-import pandas as pd
+import threading
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from dataclasses import dataclass
 
 from src.application.ports.interfaces import InvoiceRepository, FileStorage, Logger
 from src.domain.entities.invoice import InvoiceFilter
+from src.infrastructure.utils.excel_writer import ExcelStreamWriter, HEADER_STYLE, to_excel_value
+from src.infrastructure.utils.structured_log import Span, traced
+from src.infrastructure.utils.chunked_export import (
+    ChunkedExportPipeline, ChunkedExportResult, ChunkFetcher, ProgressCallback, chunked_outputs_to_excel
+)
 
 
 @dataclass
@@ -37,9 +42,76 @@ class ExportResult:
         }
 
 
+def _trace_export_result(export_span: Span, result: Any) -> None:
+    """Anotar el span de una exportación con sus registros y su resultado."""
+    if isinstance(result, ExportResult):
+        export_span.add_records(result.records_count)
+        if not result.success:
+            export_span.fail(result.error or result.message)
+    elif isinstance(result, ChunkedExportResult):
+        export_span.add_records(sum(result.rows.values()))
+        export_span.set(chunks_completed=result.chunks_completed, chunks_total=result.chunks_total,
+                        resumed=result.resumed, cancelled=result.cancelled)
+        if result.errors:
+            export_span.fail(result.errors[0])
+
+
+class ChunkedExportJob:
+    """
+    Exportación por períodos ejecutándose en un hilo de trabajo.
+    
+    ``on_finished`` y los callbacks de progreso se invocan desde el hilo de
+    trabajo: una GUI debe reenviarlos a su hilo principal (p. ej. con signals).
+    """
+    
+    def __init__(self,
+                 target: Callable[[threading.Event], ChunkedExportResult],
+                 on_finished: Optional[Callable[['ChunkedExportJob'], None]] = None):
+        self._target = target
+        self._on_finished = on_finished
+        self._cancel_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="chunked-export", daemon=True)
+        self.result: Optional[ChunkedExportResult] = None
+        self.error: Optional[Exception] = None
+    
+    def start(self) -> 'ChunkedExportJob':
+        """Iniciar la exportación en segundo plano."""
+        self._thread.start()
+        return self
+    
+    def cancel(self) -> None:
+        """Pedir la cancelación: no se descargan más períodos y queda checkpoint para reanudar."""
+        self._cancel_event.set()
+    
+    @property
+    def is_running(self) -> bool:
+        return self._thread.is_alive()
+    
+    def wait(self, timeout: Optional[float] = None) -> Optional[ChunkedExportResult]:
+        """Esperar a que termine y retornar su resultado (None si falló o no terminó)."""
+        self._thread.join(timeout)
+        return self.result
+    
+    def _run(self) -> None:
+        try:
+            self.result = self._target(self._cancel_event)
+        except Exception as e:
+            self.error = e
+        finally:
+            if self._on_finished:
+                self._on_finished(self)
+
+
 class ExportService:
     """Servicio para exportación de datos de facturas."""
     
+    # Columnas de las hojas del Excel de facturas Siigo
+    EXCEL_HEADER_COLUMNS = ['factura_id', 'fecha', 'cliente_nombre', 'cliente_nit', 'total', 'estado']
+    EXCEL_DETAIL_COLUMNS = ['factura_id', 'producto_codigo', 'producto_nombre', 'cantidad', 'precio_unitario', 'subtotal']
+    
+    # Rangos más largos se exportan por períodos mensuales
+    CHUNKED_EXPORT_THRESHOLD_DAYS = 90
+    
     def __init__(self, 
                  invoice_repository: InvoiceRepository,
                  file_storage: FileStorage,
@@ -48,6 +120,7 @@ class ExportService:
         self._file_storage = file_storage
         self._logger = logger
     
+    @traced('export.csv', on_result=_trace_export_result)
     def export_csv_real(self, limit: int, custom_filter: InvoiceFilter = None) -> ExportResult:
         """
         Exportar facturas reales a CSV con datos de Siigo API.
@@ -119,6 +192,7 @@ class ExportService:
                 error=str(e)
             )
     
+    @traced('export.csv_simple', on_result=_trace_export_result)
     def export_csv_simple_real(self) -> ExportResult:
         """Exportar CSV simple con datos reales (5 registros)."""
         try:
@@ -168,6 +242,7 @@ class ExportService:
                 error=str(e)
             )
     
+    @traced('export.siigo_csv', on_result=_trace_export_result)
     def export_siigo_invoices_to_csv(self, 
                                    fecha_inicio: Optional[str] = None,
                                    fecha_fin: Optional[str] = None,
@@ -286,6 +361,7 @@ class ExportService:
                 error=str(e)
             )
     
+    @traced('export.siigo_excel', on_result=_trace_export_result)
     def export_siigo_invoices_to_excel(self, 
                                      fecha_inicio: Optional[str] = None,
                                      fecha_fin: Optional[str] = None,
@@ -330,48 +406,46 @@ class ExportService:
                     error="Sin resultados"
                 )
             
-            # Procesar datos para Excel
-            encabezados_data = []
-            detalle_data = []
-            
-            for invoice in invoices:
-                # Encabezado
-                encabezados_data.append({
-                    'factura_id': invoice.id,
-                    'fecha': invoice.date,
-                    'cliente_nombre': invoice.customer.name if invoice.customer else 'Sin Nombre',
-                    'cliente_nit': invoice.customer.identification if invoice.customer else '',
-                    'total': invoice.total,
-                    'estado': invoice.status
-                })
-                
-                # Detalle
-                if invoice.items:
-                    for item in invoice.items:
-                        detalle_data.append({
-                            'factura_id': invoice.id,
-                            'producto_codigo': item.code,
-                            'producto_nombre': item.description,
-                            'cantidad': item.quantity,
-                            'precio_unitario': item.price,
-                            'subtotal': item.quantity * item.price
-                        })
-            
-            # Crear archivo Excel
+            # Crear archivo Excel en modo streaming: una sola pasada sobre las facturas
+            # escribe el encabezado y los items de cada una sin construir DataFrames
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"facturas_siigo_{timestamp}.xlsx"
             
             try:
-                encabezados_df = pd.DataFrame(encabezados_data)
-                detalle_df = pd.DataFrame(detalle_data)
-                
                 file_path = os.path.join("outputs", filename)
-                os.makedirs("outputs", exist_ok=True)
                 
-                with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                    encabezados_df.to_excel(writer, sheet_name='Encabezados', index=False)
-                    detalle_df.to_excel(writer, sheet_name='Detalle', index=False)
+                writer = ExcelStreamWriter(file_path)
+                writer.add_sheet('Encabezados')
+                writer.add_sheet('Detalle')
+                writer.append('Encabezados', self.EXCEL_HEADER_COLUMNS, HEADER_STYLE)
+                writer.append('Detalle', self.EXCEL_DETAIL_COLUMNS, HEADER_STYLE)
                 
+                for invoice in invoices:
+                    # Encabezado
+                    writer.append('Encabezados', [to_excel_value(value) for value in (
+                        invoice.id,
+                        invoice.date,
+                        invoice.customer.name if invoice.customer else 'Sin Nombre',
+                        invoice.customer.identification if invoice.customer else '',
+                        invoice.total,
+                        invoice.status
+                    )])
+                    
+                    # Detalle
+                    if invoice.items:
+                        writer.append_rows('Detalle', (
+                            [to_excel_value(value) for value in (
+                                invoice.id,
+                                item.code,
+                                item.description,
+                                item.quantity,
+                                item.price,
+                                item.quantity * item.price
+                            )]
+                            for item in invoice.items
+                        ))
+                
+                writer.close()
                 file_size = os.path.getsize(file_path)
                 
                 self._logger.info(f"✅ Excel generado: {filename}")
@@ -405,6 +479,133 @@ class ExportService:
                 error=str(e)
             )
     
+    @classmethod
+    def is_date_range_too_large(cls, fecha_inicio: str, fecha_fin: str) -> bool:
+        """Verificar si el rango de fechas es demasiado amplio para una sola descarga (más de 3 meses)."""
+        try:
+            start_date = datetime.strptime(fecha_inicio, "%Y-%m-%d")
+            end_date = datetime.strptime(fecha_fin, "%Y-%m-%d")
+        except (TypeError, ValueError):
+            return False
+        return (end_date - start_date).days > cls.CHUNKED_EXPORT_THRESHOLD_DAYS
+    
+    def find_chunked_checkpoint(self,
+                                fecha_inicio: str,
+                                fecha_fin: str,
+                                formato: str = 'csv',
+                                filters: Optional[Dict[str, Any]] = None,
+                                output_dir: str = "outputs") -> Optional[Dict[str, Any]]:
+        """Manifiesto de una exportación por períodos interrumpida con los mismos parámetros, si existe."""
+        pipeline = self._chunked_pipeline(None, output_dir)
+        return pipeline.find_checkpoint(self._chunked_params(fecha_inicio, fecha_fin, formato, filters))
+    
+    @traced('export.chunked', on_result=_trace_export_result)
+    def export_invoices_chunked(self,
+                                fetch_chunk: ChunkFetcher,
+                                fecha_inicio: str,
+                                fecha_fin: str,
+                                formato: str = 'csv',
+                                filters: Optional[Dict[str, Any]] = None,
+                                resume: bool = True,
+                                progress: Optional[ProgressCallback] = None,
+                                cancel_event: Optional[threading.Event] = None,
+                                output_dir: str = "outputs") -> ChunkedExportResult:
+        """
+        Exportar facturas de un rango amplio por períodos mensuales.
+        
+        Los meses se descargan en paralelo bajo rate limit y se agregan a los
+        archivos a medida que terminan, con checkpoint para reanudar (ver
+        ChunkedExportPipeline). No depende de la UI: sirve para GUI, CLI y addons.
+        
+        Args:
+            fetch_chunk: Descarga de un período -> {'encabezados': df, 'detalle': df}
+            fecha_inicio: Fecha inicio YYYY-MM-DD
+            fecha_fin: Fecha fin YYYY-MM-DD
+            formato: 'csv' (dos CSV) o 'xlsx' (un Excel con hojas Encabezados y Detalle)
+            filters: Filtros aplicados por fetch_chunk (identifican la exportación para reanudarla)
+            resume: Reanudar un checkpoint previo de la misma exportación; si es False se descarta
+            progress: Callback (completados, total, mensaje)
+            cancel_event: Evento para cancelar; lo completado queda como checkpoint
+            output_dir: Directorio de salida
+            
+        Returns:
+            ChunkedExportResult; ``output_files`` tiene 'encabezados' y 'detalle' (CSV)
+            o 'excel' (xlsx) cuando la exportación se completa
+        """
+        if formato not in ('csv', 'xlsx'):
+            raise ValueError(f"Formato de exportación no soportado: {formato}")
+        
+        pipeline = self._chunked_pipeline(fetch_chunk, output_dir)
+        params = self._chunked_params(fecha_inicio, fecha_fin, formato, filters)
+        if not resume:
+            pipeline.discard_checkpoint(params)
+        
+        self._logger.info(f"🚀 Exportación {formato.upper()} por períodos: {fecha_inicio} a {fecha_fin}")
+        
+        # Excel no admite agregar filas: los períodos se acumulan en CSV de trabajo
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if formato == 'csv':
+            output_files = {
+                'encabezados': os.path.join(output_dir, f"facturas_encabezados_siigo_{timestamp}.csv"),
+                'detalle': os.path.join(output_dir, f"facturas_detalle_siigo_{timestamp}.csv")
+            }
+        else:
+            output_files = {
+                'encabezados': os.path.join(output_dir, "checkpoints", f"facturas_siigo_{timestamp}_encabezados.csv"),
+                'detalle': os.path.join(output_dir, "checkpoints", f"facturas_siigo_{timestamp}_detalle.csv")
+            }
+        
+        result = pipeline.run(fecha_inicio, fecha_fin, output_files, params, progress, cancel_event)
+        
+        if formato == 'xlsx' and result.completed and result.rows.get('encabezados'):
+            excel_file = os.path.join(output_dir, f"facturas_siigo_{timestamp}.xlsx")
+            chunked_outputs_to_excel(result, excel_file, {'encabezados': 'Encabezados', 'detalle': 'Detalle'})
+            for work_file in result.output_files.values():
+                if os.path.exists(work_file):
+                    os.remove(work_file)
+            result.output_files = {'excel': excel_file}
+            self._logger.info(f"✅ Excel generado: {os.path.basename(excel_file)}")
+        
+        return result
+    
+    def start_chunked_export(self,
+                             fetch_chunk: ChunkFetcher,
+                             fecha_inicio: str,
+                             fecha_fin: str,
+                             formato: str = 'csv',
+                             filters: Optional[Dict[str, Any]] = None,
+                             resume: bool = True,
+                             progress: Optional[ProgressCallback] = None,
+                             on_finished: Optional[Callable[[ChunkedExportJob], None]] = None,
+                             output_dir: str = "outputs") -> ChunkedExportJob:
+        """
+        Iniciar export_invoices_chunked en un hilo de trabajo.
+        
+        Returns:
+            ChunkedExportJob para cancelar, esperar y leer el resultado
+        """
+        def target(cancel_event: threading.Event) -> ChunkedExportResult:
+            return self.export_invoices_chunked(
+                fetch_chunk, fecha_inicio, fecha_fin, formato, filters, resume,
+                progress, cancel_event, output_dir
+            )
+        
+        return ChunkedExportJob(target, on_finished).start()
+    
+    def _chunked_pipeline(self, fetch_chunk: Optional[ChunkFetcher], output_dir: str) -> ChunkedExportPipeline:
+        """Pipeline de exportación por períodos con checkpoints en <output_dir>/checkpoints."""
+        return ChunkedExportPipeline(
+            fetch_chunk,
+            checkpoint_dir=os.path.join(output_dir, "checkpoints"),
+            logger=self._logger
+        )
+    
+    @staticmethod
+    def _chunked_params(fecha_inicio: str, fecha_fin: str, formato: str,
+                        filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Parámetros que identifican una exportación por períodos (para su checkpoint)."""
+        return dict(filters or {}, formato=formato, fecha_inicio=fecha_inicio, fecha_fin=fecha_fin)
+    
     def _export_demo_data_with_filters(self, limit: int, filters: InvoiceFilter = None) -> ExportResult:
         """Generar datos demo con información de filtros aplicados."""
         try:
@@ -540,6 +741,7 @@ class ExportService:
                 error=str(e)
             )
     
+    @traced('export.json', on_result=_trace_export_result)
     def export_json_real(self, data: Dict[str, Any], filename: str) -> ExportResult:
         """
         Exportar datos a archivo JSON real.
@@ -16,6 +16,7 @@ from src.application.ports.interfaces import InvoiceRepository, FileStorage, Log
 from src.domain.entities.invoice import InvoiceFilter
 from src.domain.entities.kpis import KPIsVentas
 from src.domain.services.kpi_service import KPICalculationService, KPIAnalysisService
+from src.infrastructure.utils.structured_log import add_records, traced
 
 
 @dataclass
@@ -68,20 +69,33 @@ class KPIApplicationService:
     """
     Servicio de aplicación para KPIs.
     Orquesta operaciones sin contener lógica de negocio.
+    
+    Mantiene agregados parciales por mes y cliente (suma y conteo). En cada
+    cálculo solo se reagrupan los meses cuyas facturas cambiaron, detectados
+    por una huella del contenido de cada mes; los demás se reutilizan.
     """
     
+    MES_SIN_FECHA = 'sin_fecha'
+    COLUMNAS_HUELLA = ['factura_id', 'cliente_nit', 'cliente_nombre', 'total']
+    
     def __init__(self, 
                  invoice_repository: InvoiceRepository,
                  file_storage: FileStorage,
                  kpi_calculation_service: KPICalculationService,
                  kpi_analysis_service: KPIAnalysisService,
-                 logger: Logger):
+                 logger: Logger,
+                 partials_path: Optional[str] = None):
         self._invoice_repository = invoice_repository
         self._file_storage = file_storage
         self._kpi_calculation_service = kpi_calculation_service
         self._kpi_analysis_service = kpi_analysis_service
         self._logger = logger
+        
+        # Parciales mensuales: mes (YYYY-MM) -> {'huella': str, 'parcial': DataFrame}
+        self._partials_path = partials_path
+        self._parciales_mensuales: Dict[str, Dict[str, Any]] = self._cargar_parciales()
     
+    @traced('kpi.calculate_period')
     def calculate_kpis_for_period(self, 
                                  fecha_inicio: datetime, 
                                  fecha_fin: datetime) -> Dict[str, Any]:
@@ -100,6 +114,7 @@ class KPIApplicationService:
             
             # 1. Obtener datos del repositorio (Infrastructure)
             facturas_df = self._obtener_facturas_dataframe(fecha_inicio, fecha_fin)
+            add_records(len(facturas_df) if facturas_df is not None else 0)
             
             if facturas_df is None or len(facturas_df) == 0:
                 self._logger.warning("⚠️ No hay facturas para el período especificado")
@@ -114,9 +129,7 @@ class KPIApplicationService:
                 raise ValueError(f"Datos inválidos: {validacion['errores']}")
             
             # 3. Calcular KPIs usando servicio de dominio
-            kpis_ventas = self._kpi_calculation_service.calcular_kpis_ventas(
-                facturas_df, fecha_inicio, fecha_fin
-            )
+            kpis_ventas = self._calcular_kpis_ventas(facturas_df, fecha_inicio, fecha_fin)
             
             # 4. Generar insights (Domain)
             insights = self._kpi_analysis_service.generar_insights(kpis_ventas)
@@ -198,6 +211,97 @@ class KPIApplicationService:
             self._logger.error(f"❌ Error cargando KPIs existentes: {e}")
             return None
     
+    def _calcular_kpis_ventas(self,
+                              facturas_df: pd.DataFrame,
+                              fecha_inicio: datetime,
+                              fecha_fin: datetime) -> KPIsVentas:
+        """KPIs de ventas; con columna 'fecha' se recalculan solo los meses modificados."""
+        if 'fecha' not in facturas_df.columns or not hasattr(self._kpi_calculation_service, 'calcular_kpis_desde_parciales'):
+            return self._kpi_calculation_service.calcular_kpis_ventas(facturas_df, fecha_inicio, fecha_fin)
+        
+        parciales = self._actualizar_parciales_mensuales(facturas_df)
+        return self._kpi_calculation_service.calcular_kpis_desde_parciales(parciales, fecha_inicio, fecha_fin)
+    
+    def _actualizar_parciales_mensuales(self, facturas_df: pd.DataFrame) -> List[pd.DataFrame]:
+        """
+        Reagrupar solo los meses cuya huella cambió y devolver los parciales del período.
+        
+        La huella de un mes es el número de facturas y la suma (módulo 2^64) del
+        hash de cada fila sobre las columnas que alimentan el parcial: id de
+        factura, NIT y nombre del cliente y total. Es independiente del orden;
+        una factura nueva, eliminada, con otro total o reasignada a otro cliente
+        invalida su mes.
+        """
+        fechas = pd.to_datetime(facturas_df['fecha'], errors='coerce')
+        claves = (fechas.dt.year * 100 + fechas.dt.month).fillna(-1).astype('int64')
+        etiquetas = {clave: f"{clave // 100:04d}-{clave % 100:02d}" if clave >= 0 else self.MES_SIN_FECHA
+                     for clave in claves.unique()}
+        meses = claves.map(etiquetas)
+        
+        columnas = [c for c in self.COLUMNAS_HUELLA if c in facturas_df.columns]
+        hashes = pd.util.hash_pandas_object(facturas_df[columnas], index=False).values
+        firmas = pd.DataFrame({'n': 1, 'hash': hashes}).groupby(claves.values).sum()
+        huellas = {
+            etiquetas[clave]: f"{n}:{int(suma)}"
+            for clave, n, suma in zip(firmas.index, firmas['n'], firmas['hash'])
+        }
+        
+        recalcular = [mes for mes, huella in huellas.items()
+                      if self._parciales_mensuales.get(mes, {}).get('huella') != huella]
+        
+        if recalcular:
+            seleccion = meses.isin(recalcular).values
+            for mes, grupo in facturas_df[seleccion].groupby(meses[seleccion].values):
+                self._parciales_mensuales[mes] = {
+                    'huella': huellas[mes],
+                    'parcial': self._kpi_calculation_service.agregar_ventas_por_cliente(grupo)
+                }
+            self._guardar_parciales()
+        
+        self._logger.info(f"📊 Parciales KPI: {len(recalcular)} de {len(huellas)} meses recalculados")
+        return [self._parciales_mensuales[mes]['parcial'] for mes in sorted(huellas)]
+    
+    def _cargar_parciales(self) -> Dict[str, Dict[str, Any]]:
+        """Cargar parciales mensuales persistidos, si hay archivo configurado."""
+        if not self._partials_path or not os.path.exists(self._partials_path):
+            return {}
+        
+        try:
+            with open(self._partials_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            return {
+                mes: {
+                    'huella': entrada['huella'],
+                    'parcial': pd.DataFrame(entrada['clientes'],
+                                            columns=['cliente_nit', 'cliente_nombre', 'total', 'numero_facturas'])
+                }
+                for mes, entrada in data.get('meses', {}).items()
+            }
+        except Exception as e:
+            self._logger.warning(f"⚠️ No se pudieron cargar parciales KPI: {e}")
+            return {}
+    
+    def _guardar_parciales(self) -> None:
+        """Persistir parciales mensuales (sin archivo configurado solo viven en memoria)."""
+        if not self._partials_path:
+            return
+        
+        try:
+            data = {'meses': {}}
+            for mes, entrada in self._parciales_mensuales.items():
+                parcial = entrada['parcial']
+                data['meses'][mes] = {
+                    'huella': entrada['huella'],
+                    'clientes': parcial.astype(object).where(parcial.notna(), None).values.tolist()
+                }
+            
+            os.makedirs(os.path.dirname(os.path.abspath(self._partials_path)), exist_ok=True)
+            with open(self._partials_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, default=str)
+        except Exception as e:
+            self._logger.error(f"❌ Error guardando parciales KPI: {e}")
+    
     def _obtener_facturas_dataframe(self, fecha_inicio: datetime, fecha_fin: datetime) -> Optional[pd.DataFrame]:
         """
         Obtener facturas como DataFrame desde el repositorio.
@@ -285,6 +389,7 @@ class KPIService(KPIApplicationService):
             logger=logger
         )
     
+    @traced('kpi.calculate_real')
     def calculate_real_kpis(self, invoices_data: Optional[List[Any]] = None) -> KPIData:
         """Método para compatibilidad hacia atrás."""
         try:
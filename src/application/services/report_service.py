@@ -7,9 +7,7 @@ Responsabilidad única: Generar reportes contables con datos de Siigo API
 
 import os
 import pandas as pd
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.styles import Font, Alignment, PatternFill, Border, Side, NamedStyle
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 from decimal import Decimal
@@ -22,6 +20,7 @@ from src.domain.exceptions.estado_resultados_exceptions import (
     handle_siigo_connection_error, handle_data_processing_error, 
     handle_excel_generation_error, validate_date_range, validate_calculation_inputs
 )
+from src.infrastructure.utils.excel_writer import ExcelStreamWriter
 
 
 class ReportService:
@@ -41,6 +40,8 @@ class ReportService:
     - NIIF para PYMES aplicables en Colombia
     """
     
+    HOJA_ESTADO_RESULTADOS = "Estado de Resultados"
+    
     def __init__(self, invoice_repository: InvoiceRepository, logger: Logger, file_storage: FileStorage):
         self._invoice_repository = invoice_repository
         self._logger = logger
@@ -355,7 +356,13 @@ class ReportService:
             return self._generar_datos_simulados()
     
     async def _obtener_facturas_periodo(self, fecha_inicio: datetime, fecha_fin: datetime) -> List[Dict]:
-        """Obtener facturas del periodo desde Siigo API."""
+        """
+        Obtener facturas del periodo desde Siigo API.
+        
+        Con el almacén local de facturas (FreeGUISiigoAdapter) el período de
+        comparación se lee de SQLite tras la sincronización del período actual,
+        sin una segunda descarga completa.
+        """
         try:
             if hasattr(self._invoice_repository, 'download_invoices_dataframes'):
                 # Usar método existente si está disponible
@@ -469,124 +476,68 @@ class ReportService:
                                    periodo_anterior: Optional[PeriodoComparacion],
                                    datos_actual: Dict[str, List],
                                    datos_anterior: Optional[Dict[str, List]]) -> EstadoResultados:
-        """Construir objeto EstadoResultados con los datos obtenidos."""
-        
-        estado = EstadoResultados(periodo_actual, periodo_anterior)
-        
-        # Procesar ingresos
-        for item in datos_actual.get('ingresos', []):
-            valor_anterior = None
-            if datos_anterior:
-                # Buscar item equivalente en periodo anterior
-                item_anterior = next((x for x in datos_anterior.get('ingresos', []) 
-                                    if x['codigo'] == item['codigo']), None)
-                if item_anterior:
-                    valor_anterior = item_anterior['valor']
-            
-            estado.agregar_ingreso(item['codigo'], item['descripcion'], item['valor'], valor_anterior)
-        
-        # Procesar costos
-        for item in datos_actual.get('costos', []):
-            valor_anterior = None
-            if datos_anterior:
-                item_anterior = next((x for x in datos_anterior.get('costos', []) 
-                                    if x['codigo'] == item['codigo']), None)
-                if item_anterior:
-                    valor_anterior = item_anterior['valor']
-            
-            estado.agregar_costo_ventas(item['codigo'], item['descripcion'], item['valor'], valor_anterior)
-        
-        # Procesar gastos administrativos
-        for item in datos_actual.get('gastos_admin', []):
-            valor_anterior = None
-            if datos_anterior:
-                item_anterior = next((x for x in datos_anterior.get('gastos_admin', []) 
-                                    if x['codigo'] == item['codigo']), None)
-                if item_anterior:
-                    valor_anterior = item_anterior['valor']
-            
-            estado.agregar_gasto_administracion(item['codigo'], item['descripcion'], item['valor'], valor_anterior)
-        
-        # Procesar gastos de ventas
-        for item in datos_actual.get('gastos_ventas', []):
-            valor_anterior = None
-            if datos_anterior:
-                item_anterior = next((x for x in datos_anterior.get('gastos_ventas', []) 
-                                    if x['codigo'] == item['codigo']), None)
-                if item_anterior:
-                    valor_anterior = item_anterior['valor']
-            
-            estado.agregar_gasto_ventas(item['codigo'], item['descripcion'], item['valor'], valor_anterior)
+        """
+        Construir objeto EstadoResultados con los datos obtenidos.
         
-        # Procesar otros ingresos
-        for item in datos_actual.get('otros_ingresos', []):
-            valor_anterior = None
-            if datos_anterior:
-                item_anterior = next((x for x in datos_anterior.get('otros_ingresos', []) 
-                                    if x['codigo'] == item['codigo']), None)
-                if item_anterior:
-                    valor_anterior = item_anterior['valor']
-            
-            estado.agregar_otro_ingreso(item['codigo'], item['descripcion'], item['valor'], valor_anterior)
+        Cada línea del periodo actual se cruza con su equivalente del periodo
+        anterior mediante un índice por código construido una vez por sección.
+        """
         
-        # Procesar otros gastos
-        for item in datos_actual.get('otros_gastos', []):
-            valor_anterior = None
-            if datos_anterior:
-                item_anterior = next((x for x in datos_anterior.get('otros_gastos', []) 
-                                    if x['codigo'] == item['codigo']), None)
-                if item_anterior:
-                    valor_anterior = item_anterior['valor']
-            
-            estado.agregar_otro_gasto(item['codigo'], item['descripcion'], item['valor'], valor_anterior)
+        estado = EstadoResultados(periodo_actual, periodo_anterior)
         
-        # Procesar gastos financieros
-        for item in datos_actual.get('gastos_financieros', []):
-            valor_anterior = None
-            if datos_anterior:
-                item_anterior = next((x for x in datos_anterior.get('gastos_financieros', []) 
-                                    if x['codigo'] == item['codigo']), None)
-                if item_anterior:
-                    valor_anterior = item_anterior['valor']
-            
-            estado.agregar_gasto_financiero(item['codigo'], item['descripcion'], item['valor'], valor_anterior)
+        secciones = (
+            ('ingresos', estado.agregar_ingreso),
+            ('costos', estado.agregar_costo_ventas),
+            ('gastos_admin', estado.agregar_gasto_administracion),
+            ('gastos_ventas', estado.agregar_gasto_ventas),
+            ('otros_ingresos', estado.agregar_otro_ingreso),
+            ('otros_gastos', estado.agregar_otro_gasto),
+            ('gastos_financieros', estado.agregar_gasto_financiero),
+            ('impuestos', estado.agregar_impuesto)
+        )
         
-        # Procesar impuestos
-        for item in datos_actual.get('impuestos', []):
-            valor_anterior = None
-            if datos_anterior:
-                item_anterior = next((x for x in datos_anterior.get('impuestos', []) 
-                                    if x['codigo'] == item['codigo']), None)
-                if item_anterior:
-                    valor_anterior = item_anterior['valor']
+        for seccion, agregar in secciones:
+            valores_anteriores = self._indexar_valores_por_codigo(datos_anterior.get(seccion, [])) if datos_anterior else {}
             
-            estado.agregar_impuesto(item['codigo'], item['descripcion'], item['valor'], valor_anterior)
+            for item in datos_actual.get(seccion, []):
+                agregar(item['codigo'], item['descripcion'], item['valor'], valores_anteriores.get(item['codigo']))
         
         return estado
     
+    @staticmethod
+    def _indexar_valores_por_codigo(items: List[Dict]) -> Dict[str, Any]:
+        """Índice código -> valor; ante códigos repetidos se conserva la primera línea."""
+        indice = {}
+        for item in items:
+            indice.setdefault(item['codigo'], item['valor'])
+        return indice
+    
     def _generar_archivo_excel(self, estado_resultados: EstadoResultados) -> str:
-        """Generar archivo Excel profesional con el Estado de Resultados."""
+        """
+        Generar archivo Excel profesional con el Estado de Resultados.
+        
+        El libro se escribe en modo streaming: las filas van a disco a medida que
+        se agregan y el formato se aplica con estilos con nombre compartidos.
+        """
         try:
-            # Crear workbook y worksheet
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Estado de Resultados"
-            
-            # Configurar estilos
-            self._configurar_estilos_excel(ws)
-            
-            # Generar contenido del reporte
-            self._generar_contenido_excel(ws, estado_resultados)
-            
-            # Guardar archivo
+            # Crear archivo
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             nombre_archivo = f"estado_resultados_{timestamp}.xlsx"
             ruta_archivo = os.path.join("outputs", nombre_archivo)
             
-            # Crear directorio si no existe
-            os.makedirs("outputs", exist_ok=True)
+            # Crear libro con estilos y diseño de la hoja
+            writer = ExcelStreamWriter(ruta_archivo, self._estilos_excel())
+            writer.add_sheet(
+                self.HOJA_ESTADO_RESULTADOS,
+                column_widths={'A': 50, 'B': 20, 'C': 20, 'D': 20, 'E': 20},
+                merged_ranges=['A1:E1']
+            )
             
-            wb.save(ruta_archivo)
+            # Generar contenido del reporte
+            self._generar_contenido_excel(writer, estado_resultados)
+            
+            # Guardar archivo (crea el directorio si no existe)
+            writer.close()
             
             self._logger.info(f"📁 Archivo Excel guardado: {ruta_archivo}")
             return ruta_archivo
@@ -595,214 +546,183 @@ class ReportService:
             self._logger.error(f"❌ Error generando archivo Excel: {e}")
             raise
     
-    def _configurar_estilos_excel(self, ws):
-        """Configurar estilos profesionales para el archivo Excel."""
-        # Definir estilos
-        self.font_titulo = Font(name='Arial', size=16, bold=True, color='FFFFFF')
-        self.font_subtitulo = Font(name='Arial', size=12, bold=True, color='1F4E79')
-        self.font_seccion = Font(name='Arial', size=11, bold=True, color='2F5597')
-        self.font_normal = Font(name='Arial', size=10, color='000000')
-        self.font_total = Font(name='Arial', size=10, bold=True, color='000000')
-        
-        self.fill_titulo = PatternFill(start_color='1F4E79', end_color='1F4E79', fill_type='solid')
-        self.fill_seccion = PatternFill(start_color='E7EDF5', end_color='E7EDF5', fill_type='solid')
-        self.fill_total = PatternFill(start_color='D9E2F3', end_color='D9E2F3', fill_type='solid')
-        
-        self.border = Border(
+    def _estilos_excel(self) -> List[NamedStyle]:
+        """Estilos con nombre del Estado de Resultados, registrados una vez por libro."""
+        font_titulo = Font(name='Arial', size=16, bold=True, color='FFFFFF')
+        font_subtitulo = Font(name='Arial', size=12, bold=True, color='1F4E79')
+        font_seccion = Font(name='Arial', size=11, bold=True, color='2F5597')
+        font_normal = Font(name='Arial', size=10, color='000000')
+        font_total = Font(name='Arial', size=10, bold=True, color='000000')
+        font_final = Font(name='Arial', size=12, bold=True, color='FFFFFF')
+        
+        fill_titulo = PatternFill(start_color='1F4E79', end_color='1F4E79', fill_type='solid')
+        fill_seccion = PatternFill(start_color='E7EDF5', end_color='E7EDF5', fill_type='solid')
+        fill_total = PatternFill(start_color='D9E2F3', end_color='D9E2F3', fill_type='solid')
+        
+        border = Border(
             left=Side(style='thin'),
             right=Side(style='thin'),
             top=Side(style='thin'),
             bottom=Side(style='thin')
         )
         
-        self.alignment_center = Alignment(horizontal='center', vertical='center')
-        self.alignment_right = Alignment(horizontal='right', vertical='center')
-    
-    def _generar_contenido_excel(self, ws, estado_resultados: EstadoResultados):
-        """Generar el contenido del Estado de Resultados en Excel."""
+        alignment_center = Alignment(horizontal='center', vertical='center')
+        alignment_right = Alignment(horizontal='right', vertical='center')
+        
+        estilos = [
+            NamedStyle('er_titulo', font=font_titulo, fill=fill_titulo, alignment=alignment_center),
+            NamedStyle('er_subtitulo', font=font_subtitulo),
+            NamedStyle('er_encabezado', font=font_seccion, fill=fill_seccion, alignment=alignment_center, border=border),
+            NamedStyle('er_seccion', font=font_seccion),
+            NamedStyle('er_total_texto', font=font_total),
+        ]
         
-        # Configurar anchos de columna
-        ws.column_dimensions['A'].width = 50
-        ws.column_dimensions['B'].width = 20
-        ws.column_dimensions['C'].width = 20
-        ws.column_dimensions['D'].width = 20
-        ws.column_dimensions['E'].width = 20
+        # Líneas y totales: concepto en la columna A, valores alineados a la derecha
+        for nombre, font, fill in (('er_linea', font_normal, None),
+                                   ('er_total', font_total, None),
+                                   ('er_resultado', font_total, fill_total),
+                                   ('er_final', font_final, fill_titulo)):
+            estilos.append(NamedStyle(nombre, font=font, border=border, **({'fill': fill} if fill else {})))
+            estilos.append(NamedStyle(f'{nombre}_valor', font=font, alignment=alignment_right, border=border,
+                                      **({'fill': fill} if fill else {})))
         
-        fila = 1
+        return estilos
+    
+    def _generar_contenido_excel(self, writer: ExcelStreamWriter, estado_resultados: EstadoResultados):
+        """Generar el contenido del Estado de Resultados en Excel."""
+        hoja = self.HOJA_ESTADO_RESULTADOS
         
         # Título principal
-        ws.merge_cells(f'A{fila}:E{fila}')
-        celda_titulo = ws[f'A{fila}']
-        celda_titulo.value = "ESTADO DE RESULTADOS"
-        celda_titulo.font = self.font_titulo
-        celda_titulo.fill = self.fill_titulo
-        celda_titulo.alignment = self.alignment_center
-        fila += 2
+        writer.append(hoja, ["ESTADO DE RESULTADOS"], 'er_titulo')
+        writer.append(hoja)
         
         # Información del período
-        ws[f'A{fila}'] = f"Período: {estado_resultados.periodo_actual.nombre}"
-        ws[f'A{fila}'].font = self.font_subtitulo
-        fila += 1
+        writer.append(hoja, [f"Período: {estado_resultados.periodo_actual.nombre}"], 'er_subtitulo')
         
         if estado_resultados.periodo_anterior:
-            ws[f'A{fila}'] = f"Comparación: {estado_resultados.periodo_anterior.nombre}"
-            ws[f'A{fila}'].font = self.font_subtitulo
-        fila += 2
+            writer.append(hoja, [f"Comparación: {estado_resultados.periodo_anterior.nombre}"], 'er_subtitulo')
+        else:
+            writer.append(hoja)
+        writer.append(hoja)
         
         # Headers de columnas
         headers = ['CONCEPTO', 'PERÍODO ACTUAL', 'PERÍODO ANTERIOR', 'VARIACIÓN $', 'VARIACIÓN %']
-        for col, header in enumerate(headers, 1):
-            celda = ws.cell(row=fila, column=col, value=header)
-            celda.font = self.font_seccion
-            celda.fill = self.fill_seccion
-            celda.alignment = self.alignment_center
-            celda.border = self.border
-        fila += 1
+        writer.append(hoja, headers, 'er_encabezado')
         
         # Ingresos Operacionales
-        fila = self._agregar_seccion_excel(ws, fila, "INGRESOS OPERACIONALES", estado_resultados.get_ingresos())
+        self._agregar_seccion_excel(writer, "INGRESOS OPERACIONALES", estado_resultados.get_ingresos())
         
         # Total Ingresos
-        fila = self._agregar_total_excel(ws, fila, "TOTAL INGRESOS OPERACIONALES", 
-                                       estado_resultados.total_ingresos_operacionales,
-                                       None)  # TODO: Calcular total anterior
-        fila += 1
+        self._agregar_total_excel(writer, "TOTAL INGRESOS OPERACIONALES", 
+                                  estado_resultados.total_ingresos_operacionales,
+                                  None)  # TODO: Calcular total anterior
+        writer.append(hoja)
         
         # Costos de Ventas
-        fila = self._agregar_seccion_excel(ws, fila, "COSTOS DE VENTAS", estado_resultados.get_costos_ventas())
+        self._agregar_seccion_excel(writer, "COSTOS DE VENTAS", estado_resultados.get_costos_ventas())
         
         # Total Costos
-        fila = self._agregar_total_excel(ws, fila, "TOTAL COSTOS DE VENTAS", 
-                                       estado_resultados.total_costos_ventas,
-                                       None)
-        fila += 1
+        self._agregar_total_excel(writer, "TOTAL COSTOS DE VENTAS", 
+                                  estado_resultados.total_costos_ventas,
+                                  None)
+        writer.append(hoja)
         
         # Utilidad Bruta
-        fila = self._agregar_total_excel(ws, fila, "UTILIDAD BRUTA", 
-                                       estado_resultados.utilidad_bruta,
-                                       None, es_resultado=True)
+        self._agregar_total_excel(writer, "UTILIDAD BRUTA", 
+                                  estado_resultados.utilidad_bruta,
+                                  None, es_resultado=True)
         
         # Margen Bruto
         if estado_resultados.margen_bruto:
-            ws[f'A{fila}'] = "Margen Bruto %"
-            ws[f'B{fila}'] = f"{estado_resultados.margen_bruto:.2f}%"
-            fila += 2
+            writer.append(hoja, ["Margen Bruto %", f"{estado_resultados.margen_bruto:.2f}%"])
+            writer.append(hoja)
         
         # Gastos Operacionales
-        fila = self._agregar_seccion_excel(ws, fila, "GASTOS DE ADMINISTRACIÓN", estado_resultados.get_gastos_administracion())
-        fila = self._agregar_seccion_excel(ws, fila, "GASTOS DE VENTAS", estado_resultados.get_gastos_ventas())
+        self._agregar_seccion_excel(writer, "GASTOS DE ADMINISTRACIÓN", estado_resultados.get_gastos_administracion())
+        self._agregar_seccion_excel(writer, "GASTOS DE VENTAS", estado_resultados.get_gastos_ventas())
         
         # Total Gastos Operacionales
-        fila = self._agregar_total_excel(ws, fila, "TOTAL GASTOS OPERACIONALES", 
-                                       estado_resultados.total_gastos_operacionales,
-                                       None)
-        fila += 1
+        self._agregar_total_excel(writer, "TOTAL GASTOS OPERACIONALES", 
+                                  estado_resultados.total_gastos_operacionales,
+                                  None)
+        writer.append(hoja)
         
         # Utilidad Operacional
-        fila = self._agregar_total_excel(ws, fila, "UTILIDAD OPERACIONAL", 
-                                       estado_resultados.utilidad_operacional,
-                                       None, es_resultado=True)
+        self._agregar_total_excel(writer, "UTILIDAD OPERACIONAL", 
+                                  estado_resultados.utilidad_operacional,
+                                  None, es_resultado=True)
         
         # Margen Operacional
         if estado_resultados.margen_operacional:
-            ws[f'A{fila}'] = "Margen Operacional %"
-            ws[f'B{fila}'] = f"{estado_resultados.margen_operacional:.2f}%"
-            fila += 2
+            writer.append(hoja, ["Margen Operacional %", f"{estado_resultados.margen_operacional:.2f}%"])
+            writer.append(hoja)
         
         # Otros Ingresos y Gastos
-        fila = self._agregar_seccion_excel(ws, fila, "OTROS INGRESOS", estado_resultados.get_otros_ingresos())
-        fila = self._agregar_seccion_excel(ws, fila, "OTROS GASTOS", estado_resultados.get_otros_gastos())
-        fila = self._agregar_seccion_excel(ws, fila, "GASTOS FINANCIEROS", estado_resultados.get_gastos_financieros())
+        self._agregar_seccion_excel(writer, "OTROS INGRESOS", estado_resultados.get_otros_ingresos())
+        self._agregar_seccion_excel(writer, "OTROS GASTOS", estado_resultados.get_otros_gastos())
+        self._agregar_seccion_excel(writer, "GASTOS FINANCIEROS", estado_resultados.get_gastos_financieros())
         
         # Utilidad antes de Impuestos
-        fila = self._agregar_total_excel(ws, fila, "UTILIDAD ANTES DE IMPUESTOS", 
-                                       estado_resultados.utilidad_antes_impuestos,
-                                       None, es_resultado=True)
-        fila += 1
+        self._agregar_total_excel(writer, "UTILIDAD ANTES DE IMPUESTOS", 
+                                  estado_resultados.utilidad_antes_impuestos,
+                                  None, es_resultado=True)
+        writer.append(hoja)
         
         # Impuestos
-        fila = self._agregar_seccion_excel(ws, fila, "IMPUESTOS", estado_resultados.get_impuestos())
+        self._agregar_seccion_excel(writer, "IMPUESTOS", estado_resultados.get_impuestos())
         
         # Total Impuestos
-        fila = self._agregar_total_excel(ws, fila, "TOTAL IMPUESTOS", 
-                                       estado_resultados.total_impuestos,
-                                       None)
-        fila += 2
+        self._agregar_total_excel(writer, "TOTAL IMPUESTOS", 
+                                  estado_resultados.total_impuestos,
+                                  None)
+        writer.append(hoja)
+        writer.append(hoja)
         
         # Utilidad Neta - RESULTADO FINAL
-        fila = self._agregar_total_excel(ws, fila, "UTILIDAD NETA", 
-                                       estado_resultados.utilidad_neta,
-                                       None, es_resultado=True, es_final=True)
+        self._agregar_total_excel(writer, "UTILIDAD NETA", 
+                                  estado_resultados.utilidad_neta,
+                                  None, es_resultado=True, es_final=True)
         
         # Margen Neto
         if estado_resultados.margen_neto:
-            ws[f'A{fila}'] = "Margen Neto %"
-            ws[f'B{fila}'] = f"{estado_resultados.margen_neto:.2f}%"
-            ws[f'A{fila}'].font = self.font_total
-            ws[f'B{fila}'].font = self.font_total
+            writer.append(hoja, ["Margen Neto %", f"{estado_resultados.margen_neto:.2f}%"], 'er_total_texto')
     
-    def _agregar_seccion_excel(self, ws, fila_inicio: int, titulo_seccion: str, lineas: List) -> int:
+    def _agregar_seccion_excel(self, writer: ExcelStreamWriter, titulo_seccion: str, lineas: List) -> None:
         """Agregar una sección de líneas al Excel."""
+        hoja = self.HOJA_ESTADO_RESULTADOS
+        estilos_linea = ['er_linea'] + ['er_linea_valor'] * 4
         
         # Título de sección
-        ws[f'A{fila_inicio}'] = titulo_seccion
-        ws[f'A{fila_inicio}'].font = self.font_seccion
-        fila = fila_inicio + 1
+        writer.append(hoja, [titulo_seccion], 'er_seccion')
         
         # Líneas de la sección
         for linea in lineas:
-            ws[f'A{fila}'] = f"  {linea.descripcion}"
-            ws[f'B{fila}'] = f"${linea.valor_actual:,.0f}"
+            valores = [f"  {linea.descripcion}", f"${linea.valor_actual:,.0f}"]
             
             if linea.valor_anterior is not None:
-                ws[f'C{fila}'] = f"${linea.valor_anterior:,.0f}"
-                if linea.variacion_absoluta is not None:
-                    ws[f'D{fila}'] = f"${linea.variacion_absoluta:,.0f}"
-                if linea.variacion_porcentual is not None:
-                    ws[f'E{fila}'] = f"{linea.variacion_porcentual:.1f}%"
-            
-            # Aplicar formato
-            for col in range(1, 6):
-                celda = ws.cell(row=fila, column=col)
-                celda.font = self.font_normal
-                if col > 1:
-                    celda.alignment = self.alignment_right
-                celda.border = self.border
-            
-            fila += 1
-        
-        return fila
+                variacion_absoluta = linea.variacion_absoluta
+                variacion_porcentual = linea.variacion_porcentual
+                valores.append(f"${linea.valor_anterior:,.0f}")
+                valores.append(f"${variacion_absoluta:,.0f}" if variacion_absoluta is not None else None)
+                if variacion_porcentual is not None:
+                    valores.append(f"{variacion_porcentual:.1f}%")
+            
+            writer.append(hoja, valores, estilos_linea)
     
-    def _agregar_total_excel(self, ws, fila: int, concepto: str, valor_actual: Decimal, 
-                           valor_anterior: Optional[Decimal], es_resultado: bool = False, 
-                           es_final: bool = False) -> int:
+    def _agregar_total_excel(self, writer: ExcelStreamWriter, concepto: str, valor_actual: Decimal, 
+                             valor_anterior: Optional[Decimal], es_resultado: bool = False, 
+                             es_final: bool = False) -> None:
         """Agregar línea de total al Excel."""
-        
-        ws[f'A{fila}'] = concepto
-        ws[f'B{fila}'] = f"${valor_actual:,.0f}"
+        valores = [concepto, f"${valor_actual:,.0f}"]
         
         if valor_anterior is not None:
-            ws[f'C{fila}'] = f"${valor_anterior:,.0f}"
+            valores.append(f"${valor_anterior:,.0f}")
             variacion_abs = valor_actual - valor_anterior
-            ws[f'D{fila}'] = f"${variacion_abs:,.0f}"
+            valores.append(f"${variacion_abs:,.0f}")
             if valor_anterior != 0:
                 variacion_pct = (variacion_abs / abs(valor_anterior)) * 100
-                ws[f'E{fila}'] = f"{variacion_pct:.1f}%"
+                valores.append(f"{variacion_pct:.1f}%")
         
         # Aplicar formato según tipo
-        for col in range(1, 6):
-            celda = ws.cell(row=fila, column=col)
-            if es_final:
-                celda.font = Font(name='Arial', size=12, bold=True, color='FFFFFF')
-                celda.fill = PatternFill(start_color='1F4E79', end_color='1F4E79', fill_type='solid')
-            elif es_resultado:
-                celda.font = self.font_total
-                celda.fill = self.fill_total
-            else:
-                celda.font = self.font_total
-            
-            if col > 1:
-                celda.alignment = self.alignment_right
-            celda.border = self.border
-        
-        return fila + 1
\ No newline at end of file
+        estilo = 'er_final' if es_final else 'er_resultado' if es_resultado else 'er_total'
+        writer.append(self.HOJA_ESTADO_RESULTADOS, valores, [estilo] + [f'{estilo}_valor'] * 4)
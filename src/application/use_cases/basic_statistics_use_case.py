@@ -63,7 +63,7 @@ class BasicStatisticsUseCase:
         """Execute the basic statistics use case."""
         try:
             # Validate license first and set it in the manager
-            license_info = self._license_validator.validate_license(license_key)
+            license_info = self._license_manager.validate_license(license_key, self._license_validator)
             if not license_info or not license_info.is_valid():
                 self._logger.error("Invalid license for statistics calculation")
                 return BasicStatisticsResponse(
@@ -3,8 +3,8 @@ Use cases for invoice management.
 """
 
 import os
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Iterator
+from dataclasses import dataclass, replace
 from datetime import datetime
 
 from src.application.ports.interfaces import (
@@ -58,7 +58,7 @@ class GetInvoicesUseCase:
         """Execute the get invoices use case."""
         try:
             # Validate license first and set it in the manager
-            license_info = self._license_validator.validate_license(license_key)
+            license_info = self._license_manager.validate_license(license_key, self._license_validator)
             if not license_info or not license_info.is_valid():
                 self._logger.error("Invalid license for invoice retrieval")
                 return GetInvoicesResponse(
@@ -195,7 +195,7 @@ class CheckAPIStatusUseCase:
         """Execute the check API status use case."""
         try:
             # Validate license and get license info
-            license_info = self._license_validator.validate_license(license_key)
+            license_info = self._license_manager.validate_license(license_key, self._license_validator)
             license_valid = license_info is not None and license_info.is_valid()
             
             if not license_valid:
@@ -308,6 +308,10 @@ class ExportToBIRequest:
     end_date: Optional[str] = None
     max_records: int = 100
     validate_schema: bool = True
+    streaming: bool = False  # Write the CSV files page by page instead of loading all invoices
+    output_format: str = "csv"  # "csv" or "parquet" (typed columns, requires pyarrow; not streamed)
+    fact_layout: str = "cartesian"  # "cartesian" (fact_invoices) or "split" (headers, lines and payments facts)
+    max_workers: int = 1  # Worker processes for BI processing (non-streaming exports)
 
 
 @dataclass
@@ -374,7 +378,7 @@ class ExportInvoiceToCSVUseCase:
         """Execute the export invoice to CSV use case."""
         try:
             # Validate license first and set it in the manager
-            license_info = self._license_validator.validate_license(license_key)
+            license_info = self._license_manager.validate_license(license_key, self._license_validator)
             if not license_info or not license_info.is_valid():
                 self._logger.error("Invalid license for CSV export")
                 return ExportInvoiceToCSVResponse(
@@ -486,7 +490,7 @@ class ExportInvoicesFromAPIToCSVUseCase:
         """Execute the export invoices from API to CSV use case."""
         try:
             # Validate license first and set it in the manager
-            license_info = self._license_validator.validate_license(license_key)
+            license_info = self._license_manager.validate_license(license_key, self._license_validator)
             if not license_info or not license_info.is_valid():
                 self._logger.error("Invalid license for CSV export")
                 return ExportInvoiceToCSVResponse(
@@ -676,7 +680,7 @@ class ExportToBIUseCase:
     1. Validating license (requires Professional or Enterprise)
     2. Retrieving invoices from API
     3. Processing invoices through BIExportService
-    4. Generating star schema CSV files
+    4. Generating star schema CSV or Parquet files
     5. Validating the generated schema
     6. Returning export results
     """
@@ -700,7 +704,7 @@ class ExportToBIUseCase:
         """Execute the BI export use case."""
         try:
             # Validate license first and set it in the manager
-            license_info = self._license_validator.validate_license(license_key)
+            license_info = self._license_manager.validate_license(license_key, self._license_validator)
             if not license_info or not license_info.is_valid():
                 self._logger.error("Invalid license for BI export")
                 return ExportToBIResponse(
@@ -761,36 +765,57 @@ class ExportToBIUseCase:
                 page_size=request.max_records
             )
             
-            # Retrieve invoices from repository
-            invoices = self._invoice_repository.get_invoices(invoice_filter)
+            self._bi_export_service.set_fact_layout(request.fact_layout)
             
-            if not invoices:
-                return ExportToBIResponse(
-                    success=False,
-                    message="No invoices found for the specified criteria"
+            if request.streaming and request.output_format != "parquet":
+                # Pages are converted and written as they arrive; nothing is accumulated
+                processing_stats = self._bi_export_service.export_invoices_streaming(
+                    self._iter_invoice_dicts(invoice_filter, request.max_records)
                 )
-            
-            self._logger.info(f"Retrieved {len(invoices)} invoices for BI export")
-            
-            # Final validation - double check against BI limits
-            final_is_valid, final_error = self._license_manager.validate_bi_export_limit(len(invoices))
-            if not final_is_valid:
-                return ExportToBIResponse(
-                    success=False,
-                    message=f"{final_error}. {self._license_manager.get_upgrade_message()}"
+                
+                if not processing_stats.get("processed_invoices") and not processing_stats.get("error_invoices"):
+                    return ExportToBIResponse(
+                        success=False,
+                        message="No invoices found for the specified criteria"
+                    )
+                
+                export_results = processing_stats.pop("files_created", {})
+            else:
+                # Retrieve invoices from repository
+                invoices = self._invoice_repository.get_invoices(invoice_filter)
+                
+                if not invoices:
+                    return ExportToBIResponse(
+                        success=False,
+                        message="No invoices found for the specified criteria"
+                    )
+                
+                self._logger.info(f"Retrieved {len(invoices)} invoices for BI export")
+                
+                # Final validation - double check against BI limits
+                final_is_valid, final_error = self._license_manager.validate_bi_export_limit(len(invoices))
+                if not final_is_valid:
+                    return ExportToBIResponse(
+                        success=False,
+                        message=f"{final_error}. {self._license_manager.get_upgrade_message()}"
+                    )
+                
+                # Convert invoices to dictionary format for processing
+                invoices_data = []
+                for invoice in invoices:
+                    invoice_dict = self._invoice_to_dict(invoice)
+                    invoices_data.append(invoice_dict)
+                
+                # Process invoices through BI export service
+                processing_stats = self._bi_export_service.process_invoices_for_bi(
+                    invoices_data, max_workers=request.max_workers
                 )
-            
-            # Convert invoices to dictionary format for processing
-            invoices_data = []
-            for invoice in invoices:
-                invoice_dict = self._invoice_to_dict(invoice)
-                invoices_data.append(invoice_dict)
-            
-            # Process invoices through BI export service
-            processing_stats = self._bi_export_service.process_invoices_for_bi(invoices_data)
-            
-            # Export to CSV files
-            export_results = self._bi_export_service.export_to_csv_files()
+                
+                # Export to CSV or Parquet files
+                if request.output_format == "parquet":
+                    export_results = self._bi_export_service.export_to_parquet_files()
+                else:
+                    export_results = self._bi_export_service.export_to_csv_files()
             
             # Validate schema if requested
             validation_results = {}
@@ -812,8 +837,8 @@ class ExportToBIUseCase:
             
             if all_files_success:
                 success_files = len([r for r in export_results.values() if r])
-                success_message = f"Successfully exported {processing_stats.get('processed_invoices', 0)} invoices to {success_files} BI CSV files (License: {self._license_manager.get_license_display_name()})"
-                self._logger.info(f"BI export successful: {success_files} CSV files created")
+                success_message = f"Successfully exported {processing_stats.get('processed_invoices', 0)} invoices to {success_files} BI {request.output_format.upper()} files (License: {self._license_manager.get_license_display_name()})"
+                self._logger.info(f"BI export successful: {success_files} {request.output_format.upper()} files created")
                 
                 return ExportToBIResponse(
                     success=True,
@@ -841,6 +866,24 @@ class ExportToBIUseCase:
                 message=f"BI export error: {str(e)}"
             )
     
+    def _iter_invoice_dicts(self, invoice_filter: InvoiceFilter, max_records: Optional[int]) -> Iterator[Dict[str, Any]]:
+        """Yield invoices as BI dictionaries, requesting one repository page at a time."""
+        page_filter = replace(invoice_filter, page=1, page_size=min(max_records or 100, 100))
+        yielded = 0
+        
+        while True:
+            page = self._invoice_repository.get_invoices_page(page_filter)
+            
+            for invoice in page.invoices:
+                if max_records and yielded >= max_records:
+                    return
+                yield self._invoice_to_dict(invoice)
+                yielded += 1
+            
+            if not page.has_next or not page.invoices:
+                return
+            page_filter = replace(page_filter, page=page.next_page)
+    
     def _invoice_to_dict(self, invoice: Invoice) -> Dict[str, Any]:
         """Convert Invoice entity to dictionary for BI processing."""
         return {
@@ -889,8 +932,8 @@ class ExportToBIUseCase:
             },
             "status": "Open",
             "observations": invoice.observations or ""
-        } 
- 
+        }
+
 # ================================================================================================
 # EXPORT INVOICES TO JSON USE CASE (For FREE license)
 # ================================================================================================
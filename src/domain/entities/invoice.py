@@ -179,6 +179,119 @@ class FactInvoice:
         ]
 
 
+@dataclass
+class FactInvoiceHeader:
+    """
+    Tabla de hechos de encabezados (modelo estrella sin producto cartesiano).
+    Una fila por factura con sus totales, que ya no se repiten por cada item y pago.
+    """
+    factura_id: str
+    fecha: str
+    cliente_id: str
+    vendedor_id: str
+    subtotal: float
+    descuento_total: float
+    impuestos: float
+    total: float
+    estado: str
+    observaciones: str = ""
+    
+    _format_currency = FactInvoice._format_currency
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for CSV export with proper number formatting."""
+        return {
+            "factura_id": self.factura_id,
+            "fecha": self.fecha,
+            "cliente_id": self.cliente_id,
+            "vendedor_id": self.vendedor_id,
+            "subtotal": self._format_currency(self.subtotal),
+            "descuento_total": self._format_currency(self.descuento_total),
+            "impuestos": self._format_currency(self.impuestos),
+            "total": self._format_currency(self.total),
+            "estado": self.estado,
+            "observaciones": self.observaciones
+        }
+    
+    @staticmethod
+    def get_csv_headers() -> List[str]:
+        """Get CSV headers for invoice headers fact table."""
+        return [
+            "factura_id", "fecha", "cliente_id", "vendedor_id", "subtotal",
+            "descuento_total", "impuestos", "total", "estado", "observaciones"
+        ]
+
+
+@dataclass
+class FactInvoiceLine:
+    """
+    Tabla de hechos de líneas: una fila por item de cada factura.
+    """
+    factura_id: str
+    fecha: str
+    cliente_id: str
+    vendedor_id: str
+    producto_codigo: str
+    producto_cantidad: float
+    producto_precio: float
+    producto_descuento: float
+    producto_total: float
+    
+    _format_currency = FactInvoice._format_currency
+    _format_quantity = FactInvoice._format_quantity
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for CSV export with proper number formatting."""
+        return {
+            "factura_id": self.factura_id,
+            "fecha": self.fecha,
+            "cliente_id": self.cliente_id,
+            "vendedor_id": self.vendedor_id,
+            "producto_codigo": self.producto_codigo,
+            "producto_cantidad": self._format_quantity(self.producto_cantidad),
+            "producto_precio": self._format_currency(self.producto_precio),
+            "producto_descuento": self._format_currency(self.producto_descuento),
+            "producto_total": self._format_currency(self.producto_total)
+        }
+    
+    @staticmethod
+    def get_csv_headers() -> List[str]:
+        """Get CSV headers for invoice lines fact table."""
+        return [
+            "factura_id", "fecha", "cliente_id", "vendedor_id", "producto_codigo",
+            "producto_cantidad", "producto_precio", "producto_descuento", "producto_total"
+        ]
+
+
+@dataclass
+class FactInvoicePayment:
+    """
+    Tabla de hechos de pagos: una fila por pago de cada factura.
+    """
+    factura_id: str
+    fecha: str
+    cliente_id: str
+    pago_id: str
+    valor: float
+    
+    _format_currency = FactInvoice._format_currency
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for CSV export with proper number formatting."""
+        return {
+            "factura_id": self.factura_id,
+            "fecha": self.fecha,
+            "cliente_id": self.cliente_id,
+            "pago_id": self.pago_id,
+            "valor": self._format_currency(self.valor)
+        }
+    
+    @staticmethod
+    def get_csv_headers() -> List[str]:
+        """Get CSV headers for invoice payments fact table."""
+        return ["factura_id", "fecha", "cliente_id", "pago_id", "valor"]
+
+
 @dataclass
 class DimClient:
     """Dimensión de clientes."""
@@ -697,10 +810,39 @@ class InvoiceFilter:
             
         if self.status:
             result['status'] = self.status
-        
+
         return result
 
 
+@dataclass
+class InvoicePage:
+    """Single page of invoices with the pagination metadata returned by the API."""
+
+    invoices: List[Invoice]
+    page: int = 1
+    page_size: int = 100
+    total_results: Optional[int] = None  # None cuando la API no informa el total
+
+    @property
+    def total_pages(self) -> Optional[int]:
+        """Total pages for the query, if the API reported the result count."""
+        if self.total_results is None or self.page_size <= 0:
+            return None
+        return max(1, -(-self.total_results // self.page_size))
+
+    @property
+    def has_next(self) -> bool:
+        """Whether another page can be requested after this one."""
+        if self.total_results is not None:
+            return self.page * self.page_size < self.total_results
+        return len(self.invoices) >= self.page_size
+
+    @property
+    def next_page(self) -> Optional[int]:
+        """Number of the following page, or None on the last page."""
+        return self.page + 1 if self.has_next else None
+
+
 # ========================================================================================
 # NUEVAS ENTIDADES PARA EXPORTACIÓN DE FACTURAS (DataConta Export Service)
 # ========================================================================================
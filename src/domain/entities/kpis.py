@@ -6,7 +6,7 @@ Responsabilidad única: Modelar KPIs empresariales con reglas de negocio especí
 """
 
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal, ROUND_HALF_UP
 
@@ -65,6 +65,9 @@ class KPIsVentas:
     fecha_calculo: datetime
     estado_sistema: str
     
+    # Vista ordenada por ventas (caché), ligada a los clientes y totales con que se calculó
+    _orden_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validar y calcular valores derivados."""
         # Convertir a Decimal si es necesario
@@ -101,12 +104,27 @@ class KPIsVentas:
         if diferencia > Decimal('0.01'):
             raise ValueError(f"Inconsistencia en ventas: total={self.ventas_totales}, suma_clientes={total_por_clientes}")
     
+    @property
+    def ventas_ordenadas(self) -> List[VentaPorCliente]:
+        """
+        Ventas por cliente ordenadas por total descendente.
+        
+        El orden se reutiliza mientras la lista tenga los mismos clientes con los
+        mismos totales (comparar es lineal; reordenar no), así que agregar,
+        reemplazar o modificar un cliente en sitio invalida la caché.
+        """
+        clave = [(id(venta), venta.total_ventas) for venta in self.ventas_por_cliente]
+        if self._orden_cache is None or self._orden_cache[0] != clave:
+            ordenadas = sorted(self.ventas_por_cliente, key=lambda x: x.total_ventas, reverse=True)
+            self._orden_cache = (clave, ordenadas)
+        return self._orden_cache[1]
+    
     @property
     def cliente_top(self) -> Optional[VentaPorCliente]:
         """Cliente con mayores ventas en el período."""
         if not self.ventas_por_cliente:
             return None
-        return max(self.ventas_por_cliente, key=lambda x: x.total_ventas)
+        return self.ventas_ordenadas[0]
     
     @property
     def numero_clientes_activos(self) -> int:
@@ -123,11 +141,7 @@ class KPIsVentas:
     
     def obtener_top_clientes(self, limite: int = 10) -> List[VentaPorCliente]:
         """Obtener los N clientes con mayores ventas."""
-        return sorted(
-            self.ventas_por_cliente, 
-            key=lambda x: x.total_ventas, 
-            reverse=True
-        )[:limite]
+        return self.ventas_ordenadas[:limite]
     
     def calcular_estadisticas_avanzadas(self) -> Dict[str, Any]:
         """Calcular estadísticas avanzadas de los KPIs."""
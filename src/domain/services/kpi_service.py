@@ -95,43 +95,103 @@ class KPICalculationServiceImpl(KPICalculationService):
     
     def consolidar_ventas_por_cliente(self, facturas_df: pd.DataFrame) -> List[VentaPorCliente]:
         """Consolidar ventas agrupadas por cliente."""
+        consolidacion = self._consolidar_por_cliente(facturas_df)
+        return self._crear_ventas_por_cliente(consolidacion)
+    
+    def _consolidar_por_cliente(self, facturas_df: pd.DataFrame) -> pd.DataFrame:
+        """Un solo groupby por NIT con agregaciones nombradas (suma, nombre y conteo)."""
+        return facturas_df.groupby('cliente_nit').agg(
+            nombre=('cliente_nombre', 'first'),  # Tomar el primer nombre encontrado
+            total_ventas=('total', 'sum'),
+            numero_facturas=('total', 'size')
+        ).reset_index().rename(columns={'cliente_nit': 'nit'})
+    
+    def _crear_ventas_por_cliente(self, consolidacion: pd.DataFrame) -> List[VentaPorCliente]:
+        """Crear VentaPorCliente ordenados por ventas descendente a partir de una consolidación."""
+        # Ordenar por ventas totales descendente (estable: empates quedan por NIT)
+        consolidacion = consolidacion.sort_values('total_ventas', ascending=False, kind='mergesort')
         
-        # Agrupar por NIT de cliente y consolidar
-        consolidacion = facturas_df.groupby('cliente_nit').agg({
-            'total': 'sum',
-            'cliente_nombre': 'first'  # Tomar el primer nombre encontrado
-        }).reset_index()
+        # Calcular ticket promedio por cliente
+        tickets = (consolidacion['total_ventas'] / consolidacion['numero_facturas']).round(2)
+        
+        return [
+            VentaPorCliente(
+                nit=str(nit),
+                nombre=str(nombre),
+                total_ventas=Decimal(str(total_ventas)),
+                numero_facturas=int(numero_facturas),
+                ticket_promedio=Decimal(str(ticket))
+            )
+            for nit, nombre, total_ventas, numero_facturas, ticket in zip(
+                consolidacion['nit'].tolist(), consolidacion['nombre'].tolist(),
+                consolidacion['total_ventas'].tolist(), consolidacion['numero_facturas'].tolist(),
+                tickets.tolist()
+            )
+        ]
+    
+    def agregar_ventas_por_cliente(self, facturas_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Agregado parcial combinable: suma y número de facturas por cliente.
         
-        # Contar facturas por cliente
-        facturas_por_cliente = facturas_df.groupby('cliente_nit').size().reset_index(name='numero_facturas')
+        Los parciales de distintos períodos (p. ej. meses) se combinan con
+        calcular_kpis_desde_parciales sin volver a recorrer las facturas.
+        
+        Args:
+            facturas_df: DataFrame con datos de facturas
+            
+        Returns:
+            DataFrame con columnas cliente_nit, cliente_nombre, total y numero_facturas
+        """
+        return facturas_df.groupby('cliente_nit', dropna=False, sort=False).agg(
+            cliente_nombre=('cliente_nombre', 'first'),
+            total=('total', 'sum'),
+            numero_facturas=('total', 'size')
+        ).reset_index()
+    
+    def calcular_kpis_desde_parciales(self,
+                                      parciales: List[pd.DataFrame],
+                                      fecha_inicio: datetime,
+                                      fecha_fin: datetime) -> KPIsVentas:
+        """
+        Calcular KPIs de ventas combinando agregados parciales por cliente.
         
-        # Hacer merge para combinar información
-        consolidacion = consolidacion.merge(facturas_por_cliente, on='cliente_nit')
+        Args:
+            parciales: Lista de DataFrames generados por agregar_ventas_por_cliente
+            fecha_inicio: Fecha de inicio del período
+            fecha_fin: Fecha de fin del período
+            
+        Returns:
+            KPIsVentas equivalentes a calcular_kpis_ventas sobre todas las facturas
+        """
+        parciales = [parcial for parcial in parciales if parcial is not None and len(parcial) > 0]
+        if not parciales:
+            return self._crear_kpis_vacios(fecha_inicio, fecha_fin)
         
-        # Renombrar columnas para claridad
-        consolidacion.columns = ['nit', 'total_ventas', 'nombre', 'numero_facturas']
+        combinado = pd.concat(parciales, ignore_index=True)
         
-        # Calcular ticket promedio por cliente
-        consolidacion['ticket_promedio'] = (
-            consolidacion['total_ventas'] / consolidacion['numero_facturas']
-        ).round(2)
-        
-        # Crear objetos VentaPorCliente
-        ventas_por_cliente = []
-        for _, row in consolidacion.iterrows():
-            venta_cliente = VentaPorCliente(
-                nit=str(row['nit']),
-                nombre=str(row['nombre']),
-                total_ventas=Decimal(str(row['total_ventas'])),
-                numero_facturas=int(row['numero_facturas']),
-                ticket_promedio=Decimal(str(row['ticket_promedio']))
-            )
-            ventas_por_cliente.append(venta_cliente)
+        # Cálculos principales
+        ventas_totales = self._calcular_ventas_totales(combinado)
+        numero_facturas = int(combinado['numero_facturas'].sum())
+        ticket_promedio = self._calcular_ticket_promedio(ventas_totales, numero_facturas)
         
-        # Ordenar por ventas totales descendente
-        ventas_por_cliente.sort(key=lambda x: x.total_ventas, reverse=True)
+        # Consolidación por cliente (los NIT vacíos cuentan en totales, no como cliente)
+        consolidacion = combinado.groupby('cliente_nit').agg(
+            nombre=('cliente_nombre', 'first'),
+            total_ventas=('total', 'sum'),
+            numero_facturas=('numero_facturas', 'sum')
+        ).reset_index().rename(columns={'cliente_nit': 'nit'})
+        ventas_por_cliente = self._crear_ventas_por_cliente(consolidacion)
         
-        return ventas_por_cliente
+        return KPIsVentas(
+            fecha_inicio=fecha_inicio,
+            fecha_fin=fecha_fin,
+            ventas_totales=ventas_totales,
+            numero_facturas=numero_facturas,
+            ticket_promedio=ticket_promedio,
+            ventas_por_cliente=ventas_por_cliente,
+            fecha_calculo=datetime.now(),
+            estado_sistema='ACTIVO ✅' if numero_facturas > 0 else 'SIN DATOS ⚠️'
+        )
     
     def calcular_kpis_financieros(self, 
                                 kpis_ventas: KPIsVentas,
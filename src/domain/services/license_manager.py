@@ -4,7 +4,7 @@ License Manager - Centralized license validation and access control.
 
 from typing import Optional, Dict, Any
 from src.domain.entities.invoice import License, LicenseType, LicenseLimits
-from src.application.ports.interfaces import Logger
+from src.application.ports.interfaces import Logger, LicenseValidator, LicenseCache
 
 
 class LicenseManager:
@@ -15,11 +15,40 @@ class LicenseManager:
     functionality access throughout the application.
     """
     
-    def __init__(self, logger: Logger):
+    def __init__(self, logger: Logger, license_cache: Optional[LicenseCache] = None):
         self._logger = logger
+        self._license_cache = license_cache
         self._current_license: Optional[License] = None
         self._license_limits: Optional[LicenseLimits] = None
     
+    def validate_license(self, license_key: str, validator: LicenseValidator) -> License:
+        """
+        Validate a license key, reusing a cached validation while it is fresh.
+        
+        Only a cache miss reaches the validator (and the license server). A
+        validation error falls back to a cached license still within its grace
+        period; an explicitly invalid result drops the cached entry.
+        """
+        if self._license_cache is None:
+            return validator.validate_license(license_key)
+        
+        cached = self._license_cache.get(license_key)
+        if cached is not None:
+            return cached
+        
+        license_info = validator.validate_license(license_key)
+        if license_info.is_valid():
+            self._license_cache.put(license_info)
+        elif license_info.status == 'error':
+            stale = self._license_cache.get(license_key, include_grace=True)
+            if stale is not None:
+                self._logger.warning("License validation unavailable, using cached license within grace period")
+                return stale
+        else:
+            self._license_cache.invalidate(license_key)
+        
+        return license_info
+    
     def set_license(self, license_info: License) -> None:
         """Set the current license and update limits."""
         self._current_license = license_info
@@ -3,7 +3,9 @@ Financial Reports Repositories.
 Infrastructure repositories for Estado de Resultados and Estado de Situación Financiera.
 """
 
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Iterator, Callable
 from datetime import datetime
 from decimal import Decimal
 
@@ -22,17 +24,36 @@ from src.application.dtos.financial_reports_dtos import (
     SiigoInvoiceDTO, SiigoCreditNoteDTO, SiigoPurchaseDTO, 
     SiigoJournalEntryDTO, SiigoTrialBalanceDTO
 )
+from src.infrastructure.utils.date_range_cache import DateRangeCache
+from src.infrastructure.utils.structured_log import run_in_context
 
 
 class SiigoEstadoResultadosRepository(EstadoResultadosRepository):
     """
     Repositorio para Estado de Resultados usando API de Siigo.
+    
+    Durante una solicitud las consultas a la API pasan por una caché por rango
+    de fechas, así las ventas, compras y gastos del mismo período no vuelven a
+    descargar facturas o compras que ya se obtuvieron.
+    
+    Ventas, compras y gastos (y dentro de ventas, facturas y notas de crédito)
+    se descargan en paralelo; el adaptador de la API comparte el rate limiter
+    y el token entre hilos, así la latencia queda cerca del endpoint más lento.
     """
     
+    # Consultas de la API cacheadas por rango dentro de una solicitud
+    CONSULTAS_CACHEADAS = (
+        "obtener_facturas_periodo",
+        "obtener_notas_credito_periodo",
+        "obtener_compras_periodo",
+        "obtener_asientos_contables_periodo"
+    )
+    
     def __init__(
         self,
         siigo_api: SiigoFinancialAPIClient,
-        logger: Logger
+        logger: Logger,
+        max_workers: int = 3
     ):
         """
         Inicializar repositorio.
@@ -40,10 +61,60 @@ class SiigoEstadoResultadosRepository(EstadoResultadosRepository):
         Args:
             siigo_api: Cliente de API de Siigo para datos financieros
             logger: Logger para registrar operaciones
+            max_workers: Consultas independientes en paralelo (1 = secuencial)
         """
         self._siigo_api = siigo_api
         self._logger = logger
         self._service = EstadoResultadosServiceImpl()
+        self._max_workers = max(1, max_workers)
+        self._cache_rangos: Optional[Dict[str, DateRangeCache]] = None
+    
+    @contextmanager
+    def _alcance_solicitud(self) -> Iterator[None]:
+        """
+        Activar la caché por rango de fechas mientras dura una solicitud.
+        
+        Cada consulta de un mismo rango se descarga una sola vez; no se fusionan
+        rangos distintos. Un alcance anidado reutiliza el activo.
+        """
+        if self._cache_rangos is not None:
+            yield
+            return
+        
+        self._cache_rangos = {
+            consulta: DateRangeCache(self._descargador(consulta), logger=self._logger, merge_ranges=False)
+            for consulta in self.CONSULTAS_CACHEADAS
+        }
+        try:
+            yield
+        finally:
+            self._cache_rangos = None
+    
+    def _descargador(self, consulta: str):
+        """Función de descarga por rango para una consulta de la API."""
+        def descargar(fecha_inicio, fecha_fin) -> List[Dict[str, Any]]:
+            return getattr(self._siigo_api, consulta)(fecha_inicio.strftime("%Y-%m-%d"), fecha_fin.strftime("%Y-%m-%d"))
+        return descargar
+    
+    def _consultar_api(self, consulta: str, fecha_inicio: str, fecha_fin: str) -> List[Dict[str, Any]]:
+        """Consultar la API de Siigo para un rango, vía la caché de la solicitud si está activa."""
+        if self._cache_rangos is None:
+            return getattr(self._siigo_api, consulta)(fecha_inicio, fecha_fin)
+        return self._cache_rangos[consulta].get(fecha_inicio, fecha_fin)
+    
+    def _ejecutar_en_paralelo(self, *tareas: Callable[[], Any]) -> List[Any]:
+        """
+        Ejecutar tareas independientes en paralelo y devolver sus resultados en orden.
+        
+        Si alguna falla se relanza el error de la primera en orden, como lo
+        haría la ejecución secuencial.
+        """
+        if self._max_workers == 1 or len(tareas) == 1:
+            return [tarea() for tarea in tareas]
+        
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(tareas))) as executor:
+            futuros = [executor.submit(run_in_context(tarea)) for tarea in tareas]
+            return [futuro.result() for futuro in futuros]
     
     def obtener_estado_resultados(self, periodo: PeriodoFiscal) -> EstadoResultados:
         """
@@ -62,10 +133,13 @@ class SiigoEstadoResultadosRepository(EstadoResultadosRepository):
             fecha_inicio = periodo.fecha_inicio.strftime("%Y-%m-%d")
             fecha_fin = periodo.fecha_fin.strftime("%Y-%m-%d")
             
-            # Obtener datos desde la API
-            facturas = self.obtener_ventas_periodo(periodo)
-            compras = self.obtener_compras_periodo(periodo)  
-            gastos = self.obtener_gastos_periodo(periodo)
+            # Obtener datos desde la API en paralelo; cada rango se descarga una sola vez
+            with self._alcance_solicitud():
+                facturas, compras, gastos = self._ejecutar_en_paralelo(
+                    lambda: self.obtener_ventas_periodo(periodo),
+                    lambda: self.obtener_compras_periodo(periodo),
+                    lambda: self.obtener_gastos_periodo(periodo)
+                )
             
             # Usar el servicio de dominio para calcular
             estado_resultados = self._service.calcular_estado_resultados(
@@ -96,11 +170,11 @@ class SiigoEstadoResultadosRepository(EstadoResultadosRepository):
             fecha_inicio = periodo.fecha_inicio.strftime("%Y-%m-%d")
             fecha_fin = periodo.fecha_fin.strftime("%Y-%m-%d")
             
-            # Obtener facturas
-            facturas_raw = self._siigo_api.obtener_facturas_periodo(fecha_inicio, fecha_fin)
-            
-            # Obtener notas de crédito para restar
-            notas_credito_raw = self._siigo_api.obtener_notas_credito_periodo(fecha_inicio, fecha_fin)
+            # Obtener facturas y notas de crédito (para restar) en paralelo
+            facturas_raw, notas_credito_raw = self._ejecutar_en_paralelo(
+                lambda: self._consultar_api("obtener_facturas_periodo", fecha_inicio, fecha_fin),
+                lambda: self._consultar_api("obtener_notas_credito_periodo", fecha_inicio, fecha_fin)
+            )
             
             # Procesar facturas
             ventas = []
@@ -155,7 +229,7 @@ class SiigoEstadoResultadosRepository(EstadoResultadosRepository):
             fecha_inicio = periodo.fecha_inicio.strftime("%Y-%m-%d")
             fecha_fin = periodo.fecha_fin.strftime("%Y-%m-%d")
             
-            compras_raw = self._siigo_api.obtener_compras_periodo(fecha_inicio, fecha_fin)
+            compras_raw = self._consultar_api("obtener_compras_periodo", fecha_inicio, fecha_fin)
             
             compras = []
             for compra_raw in compras_raw:
@@ -199,7 +273,7 @@ class SiigoEstadoResultadosRepository(EstadoResultadosRepository):
             
             # Intentar primero con asientos contables
             try:
-                asientos_raw = self._siigo_api.obtener_asientos_contables_periodo(fecha_inicio, fecha_fin)
+                asientos_raw = self._consultar_api("obtener_asientos_contables_periodo", fecha_inicio, fecha_fin)
                 
                 if asientos_raw:  # Si se obtuvieron asientos contables
                     for asiento_raw in asientos_raw:
@@ -238,7 +312,7 @@ class SiigoEstadoResultadosRepository(EstadoResultadosRepository):
                 self._logger.warning(f"Asientos contables no disponibles ({str(e_asientos)}), intentando obtener compras")
                 
                 try:
-                    compras_raw = self._siigo_api.obtener_compras_periodo(fecha_inicio, fecha_fin)
+                    compras_raw = self._consultar_api("obtener_compras_periodo", fecha_inicio, fecha_fin)
                     
                     for compra_raw in compras_raw:
                         try:
@@ -264,7 +338,7 @@ class SiigoEstadoResultadosRepository(EstadoResultadosRepository):
                     
                     # Obtener ventas para calcular gastos estimados
                     try:
-                        ventas_raw = self._siigo_api.obtener_facturas_periodo(fecha_inicio, fecha_fin)
+                        ventas_raw = self._consultar_api("obtener_facturas_periodo", fecha_inicio, fecha_fin)
                         total_ventas = sum([factura.get('total', 0) for factura in ventas_raw])
                         
                         # Gastos estimados como 70% de las ventas (típico para muchos negocios)
@@ -4,26 +4,53 @@ Adapter para la GUI FREE que maneja la conexión con API Siigo específicamente
 para la funcionalidad limitada de la versión gratuita.
 """
 
+import hashlib
 import os
+import threading
+import time
 import requests
 import pandas as pd
-from datetime import datetime
+from collections import OrderedDict
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any, Tuple, Callable
 from dotenv import load_dotenv
 from functools import wraps
 
-from src.application.ports.interfaces import InvoiceRepository, APIClient, Logger
-from src.domain.entities.invoice import Invoice, InvoiceFilter, Customer, InvoiceItem, APICredentials
+from src.application.ports.interfaces import InvoiceRepository, InvoiceStore, APIClient, Logger
+from src.domain.entities.invoice import Invoice, InvoiceFilter, InvoicePage, Customer, InvoiceItem, APICredentials
+from src.infrastructure.utils.concurrent_pager import ConcurrentPager
+from src.infrastructure.utils.structured_log import add_records, mark_span_error, record_http_response, traced
 
 
 class FreeGUISiigoAdapter(InvoiceRepository, APIClient):
     """Adapter específico para GUI FREE - conexión con API Siigo limitada."""
     
-    def __init__(self, logger: Logger):
+    MAX_PAGE_SIZE = 100  # API Siigo máximo 100 por página
+    STORE_SYNC_INTERVAL = 60  # Segundos mínimos entre sincronizaciones del almacén local
+    INVOICE_INDEX_SIZE = 5000  # Facturas recientes indexadas en memoria por id (LRU)
+    
+    def __init__(self, logger: Logger, invoice_store: Optional[InvoiceStore] = None,
+                 invoice_store_factory: Optional[Callable[[str], Optional[InvoiceStore]]] = None):
+        """
+        Args:
+            logger: Logger de la aplicación
+            invoice_store: Almacén local fijo (p. ej. en tests)
+            invoice_store_factory: Crea el almacén de una cuenta Siigo a partir de
+                su clave; se usa al autenticar para no mezclar facturas de
+                distintas empresas en un mismo almacén
+        """
         self._logger = logger
+        self._invoice_store = invoice_store  # Copia local opcional con sincronización incremental
+        self._invoice_store_factory = invoice_store_factory
+        self._store_account: Optional[str] = None
+        self._last_store_sync: Optional[float] = None
+        # id -> Invoice de descargas previas, acotado a INVOICE_INDEX_SIZE (LRU)
+        self._invoice_index: 'OrderedDict[str, Invoice]' = OrderedDict()
+        self._invoice_index_lock = threading.Lock()
         self._access_token: Optional[str] = None
         self._is_authenticated = False
         self._safety_callback: Optional[Callable] = None  # Callback para confirmar operaciones peligrosas
+        self._pager = ConcurrentPager(logger)
         load_dotenv()
     
     def authenticate(self, credentials: Optional[APICredentials] = None) -> bool:
@@ -71,6 +98,7 @@ class FreeGUISiigoAdapter(InvoiceRepository, APIClient):
                 headers=auth_headers, 
                 timeout=15
             )
+            record_http_response(response)
             
             if response.status_code == 200:
                 auth_data = response.json()
@@ -78,6 +106,7 @@ class FreeGUISiigoAdapter(InvoiceRepository, APIClient):
                 
                 if self._access_token:
                     self._is_authenticated = True
+                    self._bind_invoice_store(credentials)
                     self._logger.info("✅ Autenticación Siigo exitosa")
                     return True
                 else:
@@ -91,6 +120,23 @@ class FreeGUISiigoAdapter(InvoiceRepository, APIClient):
             self._logger.error(f"❌ Error en autenticación: {e}")
             return False
     
+    @staticmethod
+    def account_key(credentials: APICredentials) -> str:
+        """Clave estable de la cuenta Siigo (URL de la API + usuario), sin datos en claro."""
+        account = f"{credentials.api_url}|{credentials.username}".lower()
+        return hashlib.sha256(account.encode('utf-8')).hexdigest()[:16]
+    
+    def _bind_invoice_store(self, credentials: APICredentials) -> None:
+        """Usar el almacén local de la cuenta autenticada (uno por cuenta)."""
+        if self._invoice_store_factory is None:
+            return
+        account = self.account_key(credentials)
+        if account != self._store_account:
+            self._invoice_store = self._invoice_store_factory(account)
+            self._store_account = account
+            self._last_store_sync = None
+            self._forget_indexed_invoices()
+    
     def is_connected(self) -> bool:
         """Verificar si hay conexión activa con API."""
         return self._is_authenticated and self._access_token is not None
@@ -104,14 +150,7 @@ class FreeGUISiigoAdapter(InvoiceRepository, APIClient):
                     return []
             
             # Convertir campos del filtro estándar a formato FREE GUI
-            fecha_inicio = None
-            fecha_fin = None
-            
-            if filters.created_start:
-                fecha_inicio = filters.created_start.strftime('%Y-%m-%d') if hasattr(filters.created_start, 'strftime') else str(filters.created_start)
-            
-            if filters.created_end:
-                fecha_fin = filters.created_end.strftime('%Y-%m-%d') if hasattr(filters.created_end, 'strftime') else str(filters.created_end)
+            fecha_inicio, fecha_fin = self._filter_dates(filters)
             
             encabezados_df, detalle_df = self.download_invoices_dataframes(
                 fecha_inicio=fecha_inicio,
@@ -124,64 +163,7 @@ class FreeGUISiigoAdapter(InvoiceRepository, APIClient):
             if encabezados_df is None or len(encabezados_df) == 0:
                 return []
             
-            # Convertir DataFrames a objetos Invoice
-            invoices = []
-            for _, row in encabezados_df.iterrows():
-                # Crear customer usando los campos correctos de la entidad
-                customer = Customer(
-                    identification=str(row.get('cliente_nit', '')),
-                    name=[str(row.get('cliente_nombre', 'Sin Nombre'))],  # Lista de nombres
-                    commercial_name=str(row.get('cliente_nombre', 'Sin Nombre'))
-                )
-                
-                # Obtener items de esta factura desde detalle_df
-                items = []
-                if detalle_df is not None and len(detalle_df) > 0:
-                    factura_items = detalle_df[detalle_df['factura_id'] == row['factura_id']]
-                    for _, item_row in factura_items.iterrows():
-                        # Usar Decimal para mantener consistencia de tipos
-                        from decimal import Decimal
-                        item = InvoiceItem(
-                            code=str(item_row.get('producto_codigo', '')),
-                            description=str(item_row.get('producto_nombre', '')),
-                            quantity=Decimal(str(item_row.get('cantidad', 0))),
-                            price=Decimal(str(item_row.get('precio_unitario', 0))),
-                            taxes=[]  # Simplificado para FREE
-                        )
-                        items.append(item)
-                
-                # Crear invoice con los campos correctos de la entidad
-                from datetime import datetime as dt
-                
-                # Parsear fecha
-                invoice_date = dt.now()  # Default
-                try:
-                    date_str = str(row.get('fecha', ''))
-                    if date_str:
-                        invoice_date = dt.strptime(date_str.split('T')[0], '%Y-%m-%d')
-                except:
-                    pass
-                
-                invoice = Invoice(
-                    id=str(row['factura_id']),
-                    document_id=str(row.get('numero', row['factura_id'])),
-                    number=int(row.get('numero', 0)) if row.get('numero', '').isdigit() else 0,
-                    name=f"Factura {row.get('numero', row['factura_id'])}",
-                    date=invoice_date,
-                    customer=customer,
-                    items=items,
-                    payments=[]  # Vacío por ahora en versión FREE
-                )
-                
-                # Agregar total como Decimal para mantener consistencia de tipos
-                try:
-                    from decimal import Decimal
-                    total_value = row.get('total', 0)
-                    invoice.total = Decimal(str(total_value)) if total_value else Decimal('0.00')
-                except:
-                    invoice.total = Decimal('0.00')
-                
-                invoices.append(invoice)
+            invoices = self._dataframes_to_invoices(encabezados_df, detalle_df)
             
             self._logger.info(f"✅ {len(invoices)} facturas convertidas a objetos Invoice")
             return invoices
@@ -190,6 +172,260 @@ class FreeGUISiigoAdapter(InvoiceRepository, APIClient):
             self._logger.error(f"❌ Error obteniendo facturas: {e}")
             return []
     
+    def get_invoices_page(self, filters: InvoiceFilter) -> InvoicePage:
+        """
+        Obtener solo la página indicada por filters.page/filters.page_size.
+        
+        Realiza una única petición a /v1/invoices, de modo que recorrer N
+        registros cuesta N/page_size llamadas HTTP en lugar de descargar
+        todo el histórico por cada página.
+        
+        Args:
+            filters: Filtros de búsqueda incluyendo page y page_size
+            
+        Returns:
+            InvoicePage con las facturas de la página y el total reportado por Siigo
+        """
+        empty_page = InvoicePage(invoices=[], page=filters.page, page_size=filters.page_size, total_results=0)
+        try:
+            if not self.is_connected():
+                if not self.authenticate():
+                    self._logger.error("❌ No se pudo autenticar con Siigo")
+                    return empty_page
+            
+            fecha_inicio, fecha_fin = self._filter_dates(filters)
+            base_params = self._build_invoice_params(
+                fecha_inicio=fecha_inicio,
+                fecha_fin=fecha_fin,
+                cliente_id=filters.customer_id,
+                nit=filters.document_id,
+                estado=filters.status
+            )
+            
+            page_size = min(max(filters.page_size, 1), self.MAX_PAGE_SIZE)
+            page_invoices, pagination = self._fetch_invoices_page(base_params, filters.page, page_size)
+            if page_invoices is None:
+                return empty_page
+            
+            total_results = pagination.get('total_results')
+            
+            encabezados_df, detalle_df = self._process_siigo_invoices(page_invoices)
+            invoices = self._dataframes_to_invoices(encabezados_df, detalle_df) if len(encabezados_df) > 0 else []
+            
+            return InvoicePage(
+                invoices=invoices,
+                page=filters.page,
+                page_size=page_size,
+                total_results=int(total_results) if total_results is not None else None
+            )
+            
+        except Exception as e:
+            self._logger.error(f"❌ Error obteniendo página {filters.page} de facturas: {e}")
+            return empty_page
+    
+    def _filter_dates(self, filters: InvoiceFilter) -> Tuple[Optional[str], Optional[str]]:
+        """Convertir fechas del InvoiceFilter al formato YYYY-MM-DD de la API."""
+        fecha_inicio = None
+        fecha_fin = None
+        
+        if filters.created_start:
+            fecha_inicio = filters.created_start.strftime('%Y-%m-%d') if hasattr(filters.created_start, 'strftime') else str(filters.created_start)
+        
+        if filters.created_end:
+            fecha_fin = filters.created_end.strftime('%Y-%m-%d') if hasattr(filters.created_end, 'strftime') else str(filters.created_end)
+        
+        return fecha_inicio, fecha_fin
+    
+    def _dataframes_to_invoices(self, encabezados_df: pd.DataFrame, detalle_df: Optional[pd.DataFrame]) -> List[Invoice]:
+        """
+        Convertir DataFrames de encabezados y detalle a objetos Invoice.
+        
+        El detalle se agrupa una sola vez por factura_id y los objetos se
+        construyen desde listas de columnas, sin iterrows ni filtros por
+        factura: el costo es lineal en facturas + items.
+        """
+        from decimal import Decimal
+        
+        if encabezados_df is None or len(encabezados_df) == 0:
+            return []
+        
+        def column(df: pd.DataFrame, name: str, default: Any) -> List[Any]:
+            return df[name].tolist() if name in df.columns else [default] * len(df)
+        
+        # Items agrupados por factura: factura_id -> posiciones en detalle_df
+        item_positions: Dict[Any, Any] = {}
+        if detalle_df is not None and len(detalle_df) > 0 and 'factura_id' in detalle_df.columns:
+            item_positions = detalle_df.groupby('factura_id', sort=False).indices
+            item_codes = [str(v) for v in column(detalle_df, 'producto_codigo', '')]
+            item_names = [str(v) for v in column(detalle_df, 'producto_nombre', '')]
+            item_quantities = [Decimal(str(v)) for v in column(detalle_df, 'cantidad', 0)]
+            item_prices = [Decimal(str(v)) for v in column(detalle_df, 'precio_unitario', 0)]
+        
+        factura_ids = column(encabezados_df, 'factura_id', '')
+        numeros = column(encabezados_df, 'numero', None)
+        nits = [str(v) for v in column(encabezados_df, 'cliente_nit', '')]
+        nombres = [str(v) for v in column(encabezados_df, 'cliente_nombre', 'Sin Nombre')]
+        totales = column(encabezados_df, 'total', 0)
+        
+        # Fechas en bloque (solo la parte de día); las inválidas o vacías toman la fecha actual
+        now = datetime.now()
+        if 'fecha' in encabezados_df.columns:
+            fechas = encabezados_df['fecha']
+            if not pd.api.types.is_datetime64_any_dtype(fechas):
+                fechas = pd.to_datetime(fechas.astype(str).str.split('T').str[0], format='%Y-%m-%d', errors='coerce')
+            fechas = [now if pd.isna(f) else f.normalize().to_pydatetime() for f in fechas.tolist()]
+        else:
+            fechas = [now] * len(encabezados_df)
+        
+        invoices = []
+        for factura_id, numero, nit, nombre, fecha, total_value in zip(
+                factura_ids, numeros, nits, nombres, fechas, totales):
+            customer = Customer(
+                identification=nit,
+                name=[nombre],  # Lista de nombres
+                commercial_name=nombre
+            )
+            
+            items = [
+                InvoiceItem(
+                    code=item_codes[i],
+                    description=item_names[i],
+                    quantity=item_quantities[i],
+                    price=item_prices[i],
+                    taxes=[]  # Simplificado para FREE
+                )
+                for i in item_positions.get(factura_id, ())
+            ]
+            
+            referencia = numero if numero is not None else factura_id
+            invoice = Invoice(
+                id=str(factura_id),
+                document_id=str(referencia),
+                number=int(numero) if numero is not None and str(numero).isdigit() else 0,
+                name=f"Factura {referencia}",
+                date=fecha,
+                customer=customer,
+                items=items,
+                payments=[]  # Vacío por ahora en versión FREE
+            )
+            
+            # Agregar total como Decimal para mantener consistencia de tipos
+            try:
+                invoice.total = Decimal(str(total_value)) if total_value else Decimal('0.00')
+            except Exception:
+                invoice.total = Decimal('0.00')
+            
+            invoices.append(invoice)
+        
+        # Indexar por id para búsquedas posteriores en O(1)
+        self._index_invoices(invoices)
+        return invoices
+    
+    def _index_invoices(self, invoices: List[Invoice]) -> None:
+        """Registrar facturas en el índice, descartando las menos usadas sobre el límite."""
+        with self._invoice_index_lock:
+            for invoice in invoices:
+                self._invoice_index[invoice.id] = invoice
+                self._invoice_index.move_to_end(invoice.id)
+            while len(self._invoice_index) > self.INVOICE_INDEX_SIZE:
+                self._invoice_index.popitem(last=False)
+    
+    def _indexed_invoice(self, invoice_id: str) -> Optional[Invoice]:
+        """Factura del índice, marcándola como usada recientemente."""
+        with self._invoice_index_lock:
+            invoice = self._invoice_index.get(invoice_id)
+            if invoice is not None:
+                self._invoice_index.move_to_end(invoice_id)
+            return invoice
+    
+    def _forget_indexed_invoices(self, invoice_ids: Optional[List[str]] = None) -> None:
+        """Quitar del índice las facturas indicadas (todas si no se indican)."""
+        with self._invoice_index_lock:
+            if invoice_ids is None:
+                self._invoice_index.clear()
+                return
+            for invoice_id in invoice_ids:
+                self._invoice_index.pop(invoice_id, None)
+    
+    def _get_headers(self) -> Dict[str, str]:
+        """Headers autenticados para peticiones a la API Siigo."""
+        return {
+            'Authorization': f'Bearer {self._access_token}',
+            'Partner-Id': os.getenv('PARTNER_ID', 'SandboxSiigoAPI'),
+            'Content-Type': 'application/json'
+        }
+    
+    def _build_invoice_params(self,
+                              fecha_inicio: Optional[str] = None,
+                              fecha_fin: Optional[str] = None,
+                              cliente_id: Optional[str] = None,
+                              cc: Optional[str] = None,
+                              nit: Optional[str] = None,
+                              estado: Optional[str] = None) -> Dict[str, Any]:
+        """Construir parámetros de consulta para /v1/invoices (sin paginación)."""
+        base_params = {}
+        if fecha_inicio:
+            base_params['created_start'] = fecha_inicio
+        if fecha_fin:
+            base_params['created_end'] = fecha_fin
+        if cliente_id:
+            base_params['customer_id'] = cliente_id
+        if cc:
+            base_params['customer_identification'] = cc
+        if nit:
+            base_params['customer_identification'] = nit
+        if estado:
+            estado_map = {
+                'abierta': 'open',
+                'cerrada': 'closed', 
+                'anulada': 'cancelled'
+            }
+            base_params['status'] = estado_map.get(estado.lower(), estado)
+        return base_params
+    
+    @traced('siigo.invoices_page')
+    def _fetch_invoices_page(self, base_params: Dict[str, Any], page: int,
+                             page_size: int) -> Tuple[Optional[List[Dict[str, Any]]], Dict[str, Any]]:
+        """
+        Descargar una página de /v1/invoices.
+        
+        Returns:
+            Tupla (facturas de la página, metadatos de paginación). Las facturas
+            son None si la petición falló.
+        """
+        api_url = os.getenv('SIIGO_API_URL', 'https://api.siigo.com')
+        url = f"{api_url}/v1/invoices"
+        
+        params = base_params.copy()
+        params['page'] = page
+        params['page_size'] = page_size
+        
+        self._logger.info(f"📡 GET {url} - Página {page}")
+        
+        try:
+            response = requests.get(url, headers=self._get_headers(), params=params, timeout=30)
+            record_http_response(response)
+        except requests.exceptions.RequestException as e:
+            self._logger.error(f"❌ Error conexión página {page}: {e}")
+            mark_span_error(str(e))
+            return None, {}
+        
+        if response.status_code != 200:
+            self._logger.error(f"❌ Error API página {page}: {response.status_code}")
+            mark_span_error(f"HTTP {response.status_code}")
+            return None, {}
+        
+        response_data = response.json()
+        if isinstance(response_data, dict) and 'results' in response_data:
+            pagination = response_data.get('pagination') or {}
+            add_records(len(response_data['results'] or []), page=page)
+            return response_data['results'] or [], pagination if isinstance(pagination, dict) else {}
+        if isinstance(response_data, list):
+            add_records(len(response_data), page=page)
+            return response_data, {}
+        return None, {}
+    
+    @traced('siigo.download_invoices')
     def download_invoices_dataframes(self, 
                                    fecha_inicio: Optional[str] = None, 
                                    fecha_fin: Optional[str] = None,
@@ -206,92 +442,30 @@ class FreeGUISiigoAdapter(InvoiceRepository, APIClient):
                 self._logger.error("❌ No hay conexión con API Siigo")
                 return None, None
             
-            api_url = os.getenv('SIIGO_API_URL', 'https://api.siigo.com')
-            partner_id = os.getenv('PARTNER_ID', 'SandboxSiigoAPI')
-            
-            # Headers para petición de facturas
-            headers = {
-                'Authorization': f'Bearer {self._access_token}',
-                'Partner-Id': partner_id,
-                'Content-Type': 'application/json'
-            }
-            
             # Construir parámetros
-            base_params = {}
-            if fecha_inicio:
-                base_params['created_start'] = fecha_inicio
-            if fecha_fin:
-                base_params['created_end'] = fecha_fin
-            if cliente_id:
-                base_params['customer_id'] = cliente_id
-            if cc:
-                base_params['customer_identification'] = cc
-            if nit:
-                base_params['customer_identification'] = nit
-            if estado:
-                estado_map = {
-                    'abierta': 'open',
-                    'cerrada': 'closed', 
-                    'anulada': 'cancelled'
-                }
-                base_params['status'] = estado_map.get(estado.lower(), estado)
-            
-            # Paginación completa
-            all_invoices_data = []
-            page = 1
-            page_size = 100
-            total_downloaded = 0
+            base_params = self._build_invoice_params(fecha_inicio, fecha_fin, cliente_id, cc, nit, estado)
             
             self._logger.info(f"🔍 Filtros: {base_params}")
             
-            while True:
-                params = base_params.copy()
-                params['page'] = page
-                params['page_size'] = page_size
-                
-                url = f"{api_url}/v1/invoices"
-                self._logger.info(f"📡 GET {url} - Página {page}")
-                
-                try:
-                    response = requests.get(url, headers=headers, params=params, timeout=30)
-                    
-                    if response.status_code != 200:
-                        self._logger.error(f"❌ Error API página {page}: {response.status_code}")
-                        break
-                    
-                    response_data = response.json()
-                    page_invoices = []
-                    
-                    if isinstance(response_data, dict) and 'results' in response_data:
-                        page_invoices = response_data['results']
-                    elif isinstance(response_data, list):
-                        page_invoices = response_data
-                    else:
-                        break
-                    
-                    if not page_invoices:
-                        break
-                    
-                    all_invoices_data.extend(page_invoices)
-                    total_downloaded += len(page_invoices)
-                    
-                    self._logger.info(f"✅ Página {page}: {len(page_invoices)} facturas (Total: {total_downloaded})")
-                    
-                    if len(page_invoices) < page_size:
-                        break
-                    
-                    page += 1
-                    
-                    # Rate limiting
-                    import time
-                    time.sleep(0.1)
-                    
-                except requests.exceptions.RequestException as e:
-                    self._logger.error(f"❌ Error conexión página {page}: {e}")
-                    break
-            
-            self._logger.info(f"✅ {total_downloaded} facturas descargadas")
+            # Paginación completa: primera página + resto en paralelo bajo rate limit
+            page_size = self.MAX_PAGE_SIZE
+            
+            def fetch_page(page: int):
+                page_invoices, pagination = self._fetch_invoices_page(base_params, page, page_size)
+                if page_invoices is None:
+                    raise Exception(f"No se pudo descargar la página {page} de facturas")
+                return page_invoices, pagination
+            
+            all_invoices_data = self._read_invoice_store(base_params)
+            if all_invoices_data is not None:
+                total_downloaded = len(all_invoices_data)
+                self._logger.info(f"💾 {total_downloaded} facturas leídas del almacén local")
+            else:
+                all_invoices_data = self._pager.fetch_all(fetch_page, page_size, label="facturas")
+                total_downloaded = len(all_invoices_data)
+                self._logger.info(f"✅ {total_downloaded} facturas descargadas")
             
+            add_records(total_downloaded)
             if total_downloaded == 0:
                 return pd.DataFrame(), pd.DataFrame()
             
@@ -300,16 +474,120 @@ class FreeGUISiigoAdapter(InvoiceRepository, APIClient):
             
         except Exception as e:
             self._logger.error(f"❌ Error descargando facturas: {e}")
+            mark_span_error(str(e))
             return None, None
     
+    def _read_invoice_store(self, base_params: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Facturas del rango desde el almacén local, sincronizándolo antes.
+        
+        None si no hay almacén o aún no tiene una sincronización completa (la
+        primera falló o está pendiente): el llamador descarga el rango directo.
+        """
+        if self._invoice_store is None:
+            return None
+        
+        try:
+            # Sincronizar solo lo modificado y leer el rango desde el almacén local
+            self.sync_invoice_store()
+        except Exception as e:
+            self._logger.warning(f"⚠️ Sincronización del almacén local fallida, descargando el rango: {e}")
+        
+        if self._invoice_store.get_watermark() is None:
+            return None
+        
+        return self._invoice_store.query_invoices(
+            fecha_inicio=base_params.get('created_start'),
+            fecha_fin=base_params.get('created_end'),
+            customer_id=base_params.get('customer_id'),
+            identification=base_params.get('customer_identification'),
+            status=base_params.get('status')
+        )
+    
+    @traced('siigo.sync_invoice_store')
+    def sync_invoice_store(self, force: bool = False) -> int:
+        """
+        Sincronizar el almacén local con Siigo de forma incremental.
+        
+        La primera vez descarga el histórico completo; después solo pide las
+        facturas con metadata.last_updated posterior a la marca de agua. Si
+        las facturas no traen last_updated se usa metadata.created y, sin
+        ninguna fecha, el inicio de la sincronización, así la marca de agua
+        siempre avanza y no se repite la descarga completa.
+        
+        Args:
+            force: Ignorar el intervalo mínimo entre sincronizaciones
+            
+        Returns:
+            Número de facturas nuevas o modificadas guardadas
+        """
+        if self._invoice_store is None:
+            return 0
+        
+        if (not force and self._last_store_sync is not None
+                and time.monotonic() - self._last_store_sync < self.STORE_SYNC_INTERVAL):
+            return 0
+        
+        watermark = self._invoice_store.get_watermark()
+        sync_started = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        
+        # Siigo filtra updated_start por día: se repite el día de la marca de agua
+        # y el upsert por id descarta lo ya conocido
+        base_params = {'updated_start': watermark[:10]} if watermark else {}
+        page_size = self.MAX_PAGE_SIZE
+        
+        def fetch_page(page: int):
+            page_invoices, pagination = self._fetch_invoices_page(base_params, page, page_size)
+            if page_invoices is None:
+                raise Exception(f"No se pudo descargar la página {page} de facturas modificadas")
+            return page_invoices, pagination
+        
+        try:
+            changed = self._pager.fetch_all(fetch_page, page_size, label="facturas modificadas")
+        except Exception as e:
+            if watermark is None:
+                raise
+            self._logger.warning(f"⚠️ Sincronización incremental fallida, usando datos locales: {e}")
+            return 0
+        
+        written = self._invoice_store.upsert_invoices(changed)
+        # Las versiones en memoria de las facturas modificadas quedan obsoletas
+        self._forget_indexed_invoices([str(inv['id']) for inv in changed if isinstance(inv, dict) and inv.get('id')])
+        
+        change_stamps = [
+            inv['metadata'].get('last_updated') or inv['metadata'].get('created') for inv in changed
+            if isinstance(inv, dict) and isinstance(inv.get('metadata'), dict)
+        ]
+        new_watermark = max([stamp for stamp in change_stamps if stamp] + ([watermark] if watermark else []),
+                            default=sync_started)
+        self._invoice_store.set_watermark(new_watermark)
+        
+        self._last_store_sync = time.monotonic()
+        add_records(written)
+        self._logger.info(f"🔄 Almacén local sincronizado: {written} facturas nuevas o modificadas")
+        return written
+    
+    # Columnas de los DataFrames de encabezados y detalle
+    HEADER_COLUMNS = ['factura_id', 'fecha', 'due_date', 'cliente_nombre', 'cliente_nit',
+                      'total', 'impuestos', 'estado', 'payment_status', 'seller_id']
+    ITEM_COLUMNS = ['factura_id', 'producto_codigo', 'producto_nombre', 'cantidad',
+                    'precio_unitario', 'subtotal', 'impuestos']
+    
     def _process_siigo_invoices(self, invoices_data: List[Dict[str, Any]]) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        """Procesar respuesta JSON de Siigo API y crear DataFrames."""
+        """
+        Procesar respuesta JSON de Siigo API y crear DataFrames.
+        
+        Recorre las facturas una sola vez agregando valores directamente a
+        listas por columna; fechas y payment_status se calculan después en
+        bloque contra una única fecha de referencia. Los DataFrames salen con
+        tipos nativos: fechas datetime64, importes float64 y estado como category.
+        """
         
         if not isinstance(invoices_data, list) or len(invoices_data) == 0:
             return pd.DataFrame(), pd.DataFrame()
         
-        encabezados = []
-        detalle_items = []
+        headers: Dict[str, List[Any]] = {name: [] for name in self.HEADER_COLUMNS if name != 'payment_status'}
+        items: Dict[str, List[Any]] = {name: [] for name in self.ITEM_COLUMNS}
         
         for i, invoice in enumerate(invoices_data):
             try:
@@ -317,7 +595,6 @@ class FreeGUISiigoAdapter(InvoiceRepository, APIClient):
                     continue
                 
                 factura_id = invoice.get('id', f'UNKNOWN_{i}')
-                fecha = invoice.get('date', '')
                 
                 # Datos del cliente
                 customer = invoice.get('customer', {})
@@ -330,31 +607,7 @@ class FreeGUISiigoAdapter(InvoiceRepository, APIClient):
                 
                 # Totales
                 total = float(invoice.get('total', 0))
-                impuestos = 0
-                
-                # Sumar impuestos
-                taxes = invoice.get('taxes', [])
-                if isinstance(taxes, list):
-                    for tax in taxes:
-                        if isinstance(tax, dict):
-                            impuestos += float(tax.get('value', 0))
-                
-                estado = invoice.get('status', 'unknown')
-                due_date = invoice.get('due_date', invoice.get('dueDate', ''))
-                
-                # Payment status
-                payment_status = 'pendiente'
-                if estado in ['closed', 'paid']:
-                    payment_status = 'pagada'
-                elif estado in ['cancelled', 'void']:
-                    payment_status = 'anulada'
-                elif due_date:
-                    try:
-                        due_date_obj = datetime.fromisoformat(due_date.replace('Z', ''))
-                        if due_date_obj < datetime.now():
-                            payment_status = 'vencida'
-                    except:
-                        pass
+                impuestos = self._sum_tax_values(invoice.get('taxes', []))
                 
                 # Seller ID
                 seller_id = ''
@@ -369,74 +622,156 @@ class FreeGUISiigoAdapter(InvoiceRepository, APIClient):
                     elif isinstance(seller, str):
                         seller_id = seller
                 
-                # Agregar encabezado
-                encabezados.append({
-                    'factura_id': factura_id,
-                    'fecha': fecha,
-                    'due_date': due_date,
-                    'cliente_nombre': cliente_nombre,
-                    'cliente_nit': cliente_nit,
-                    'total': total,
-                    'impuestos': impuestos,
-                    'estado': estado,
-                    'payment_status': payment_status,
-                    'seller_id': seller_id
-                })
-                
-                # Procesar items
-                items = invoice.get('items', [])
-                if isinstance(items, list):
-                    for j, item in enumerate(items):
+                # Items de la factura: se validan completos antes de agregarlos
+                # para que una factura con error no desalinee las columnas
+                invoice_items = []
+                raw_items = invoice.get('items', [])
+                if isinstance(raw_items, list):
+                    for j, item in enumerate(raw_items):
                         if not isinstance(item, dict):
                             continue
-                        
-                        producto_codigo = item.get('code', f'PROD_{j}')
-                        producto_nombre = item.get('description', item.get('name', 'Producto Sin Nombre'))
                         cantidad = float(item.get('quantity', 0))
                         precio_unitario = float(item.get('price', 0))
-                        subtotal = cantidad * precio_unitario
-                        
-                        # Impuestos del item
-                        item_impuestos = 0
-                        item_taxes = item.get('taxes', [])
-                        if isinstance(item_taxes, list):
-                            for tax in item_taxes:
-                                if isinstance(tax, dict):
-                                    item_impuestos += float(tax.get('value', 0))
-                        
-                        detalle_items.append({
-                            'factura_id': factura_id,
-                            'producto_codigo': producto_codigo,
-                            'producto_nombre': producto_nombre,
-                            'cantidad': cantidad,
-                            'precio_unitario': precio_unitario,
-                            'subtotal': subtotal,
-                            'impuestos': item_impuestos
-                        })
+                        invoice_items.append((
+                            factura_id,
+                            item.get('code', f'PROD_{j}'),
+                            item.get('description', item.get('name', 'Producto Sin Nombre')),
+                            cantidad,
+                            precio_unitario,
+                            cantidad * precio_unitario,
+                            self._sum_tax_values(item.get('taxes', []))
+                        ))
                 
             except Exception as e:
                 self._logger.warning(f"⚠️ Error procesando factura {i}: {e}")
                 continue
+            
+            headers['factura_id'].append(factura_id)
+            headers['fecha'].append(invoice.get('date', ''))
+            headers['due_date'].append(invoice.get('due_date', invoice.get('dueDate', '')))
+            headers['cliente_nombre'].append(cliente_nombre)
+            headers['cliente_nit'].append(cliente_nit)
+            headers['total'].append(total)
+            headers['impuestos'].append(impuestos)
+            headers['estado'].append(invoice.get('status', 'unknown'))
+            headers['seller_id'].append(seller_id)
+            
+            for row in invoice_items:
+                for name, value in zip(self.ITEM_COLUMNS, row):
+                    items[name].append(value)
         
-        # Crear DataFrames
-        encabezados_df = pd.DataFrame(encabezados)
-        detalle_df = pd.DataFrame(detalle_items)
+        encabezados_df = self._build_headers_frame(headers)
+        detalle_df = pd.DataFrame({
+            'factura_id': items['factura_id'],
+            'producto_codigo': items['producto_codigo'],
+            'producto_nombre': items['producto_nombre'],
+            'cantidad': pd.Series(items['cantidad'], dtype='float64'),
+            'precio_unitario': pd.Series(items['precio_unitario'], dtype='float64'),
+            'subtotal': pd.Series(items['subtotal'], dtype='float64'),
+            'impuestos': pd.Series(items['impuestos'], dtype='float64')
+        }, columns=self.ITEM_COLUMNS)
         
-        self._logger.info(f"📊 Procesados {len(encabezados)} encabezados y {len(detalle_items)} items")
+        self._logger.info(f"📊 Procesados {len(encabezados_df)} encabezados y {len(detalle_df)} items")
         
         return encabezados_df, detalle_df
     
+    def _build_headers_frame(self, headers: Dict[str, List[Any]]) -> pd.DataFrame:
+        """Construir el DataFrame de encabezados tipado y calcular payment_status en bloque."""
+        estado = pd.Series(headers['estado'], dtype='object')
+        due_date = self._to_naive_datetime(pd.Series(headers['due_date'], dtype='object'))
+        
+        # Una sola fecha de referencia para todo el lote
+        reference = pd.Timestamp(datetime.now())
+        payment_status = pd.Series('pendiente', index=estado.index, dtype='object')
+        payment_status[due_date < reference] = 'vencida'
+        payment_status[estado.isin(['cancelled', 'void'])] = 'anulada'
+        payment_status[estado.isin(['closed', 'paid'])] = 'pagada'
+        
+        return pd.DataFrame({
+            'factura_id': headers['factura_id'],
+            'fecha': self._to_naive_datetime(pd.Series(headers['fecha'], dtype='object')),
+            'due_date': due_date,
+            'cliente_nombre': headers['cliente_nombre'],
+            'cliente_nit': headers['cliente_nit'],
+            'total': pd.Series(headers['total'], dtype='float64'),
+            'impuestos': pd.Series(headers['impuestos'], dtype='float64'),
+            'estado': estado.astype('category'),
+            'payment_status': payment_status.astype('category'),
+            'seller_id': headers['seller_id']
+        }, columns=self.HEADER_COLUMNS)
+    
+    @staticmethod
+    def _to_naive_datetime(values: pd.Series) -> pd.Series:
+        """Parsear fechas ISO a datetime64 conservando la hora local (sin zona); inválidas quedan NaT."""
+        text = values.astype('string').str.replace(r'(Z|[+-]\d{2}:?\d{2})$', '', regex=True)
+        return pd.to_datetime(text, format='ISO8601', errors='coerce')
+    
+    @staticmethod
+    def _sum_tax_values(taxes: Any) -> float:
+        """Sumar el campo value de una lista de impuestos de Siigo."""
+        if not isinstance(taxes, list):
+            return 0.0
+        return float(sum(float(tax.get('value', 0)) for tax in taxes if isinstance(tax, dict)))
+    
     def get_invoice_by_id(self, invoice_id: str) -> Optional[Invoice]:
-        """Obtener factura específica por ID."""
-        # Implementación simplificada para FREE
-        filters = InvoiceFilter()
-        invoices = self.get_invoices(filters)
+        """
+        Obtener factura específica por ID.
+        
+        Busca primero en el índice en memoria (poblado por cualquier descarga
+        previa), luego en el almacén local y como último recurso hace una
+        única petición GET /v1/invoices/{id}.
+        """
+        invoice_id = str(invoice_id)
+        
+        cached = self._indexed_invoice(invoice_id)
+        if cached is not None:
+            return cached
+        
+        try:
+            raw_invoice = None
+            if self._invoice_store is not None:
+                raw_invoice = self._invoice_store.get_invoice(invoice_id)
+            
+            if raw_invoice is None:
+                raw_invoice = self._fetch_invoice_by_id(invoice_id)
+            
+            if raw_invoice is None:
+                return None
+            
+            encabezados_df, detalle_df = self._process_siigo_invoices([raw_invoice])
+            if len(encabezados_df) == 0:
+                return None
+            
+            # _dataframes_to_invoices registra la factura en el índice
+            return self._dataframes_to_invoices(encabezados_df, detalle_df)[0]
+            
+        except Exception as e:
+            self._logger.error(f"❌ Error obteniendo factura {invoice_id}: {e}")
+            return None
+    
+    def _fetch_invoice_by_id(self, invoice_id: str) -> Optional[Dict[str, Any]]:
+        """Descargar una factura con GET /v1/invoices/{id}."""
+        if not self.is_connected():
+            if not self.authenticate():
+                self._logger.error("❌ No se pudo autenticar con Siigo")
+                return None
+        
+        api_url = os.getenv('SIIGO_API_URL', 'https://api.siigo.com')
+        url = f"{api_url}/v1/invoices/{invoice_id}"
+        self._logger.info(f"📡 GET {url}")
+        
+        response = requests.get(url, headers=self._get_headers(), timeout=30)
+        record_http_response(response)
         
-        for invoice in invoices:
-            if invoice.id == invoice_id:
-                return invoice
+        if response.status_code == 404:
+            self._logger.warning(f"⚠️ Factura {invoice_id} no encontrada")
+            return None
+        if response.status_code != 200:
+            self._logger.error(f"❌ Error obteniendo factura {invoice_id}: {response.status_code}")
+            return None
         
-        return None
+        data = response.json()
+        return data if isinstance(data, dict) else None
     
     def get_customers(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -473,6 +808,7 @@ class FreeGUISiigoAdapter(InvoiceRepository, APIClient):
             self._logger.info(f"📡 GET {url} - Obteniendo clientes...")
             
             response = requests.get(url, headers=headers, params=params, timeout=30)
+            record_http_response(response)
             
             if response.status_code == 200:
                 data = response.json()
@@ -622,7 +958,7 @@ class FreeGUISiigoAdapter(InvoiceRepository, APIClient):
         if not request_func:
             raise ValueError(f"Método HTTP no soportado: {method}")
         
-        return request_func(url, **kwargs)
+        return record_http_response(request_func(url, **kwargs))
     
     # ==================== Métodos de API Seguros ====================
     
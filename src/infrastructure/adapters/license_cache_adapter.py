@@ -0,0 +1,167 @@
+"""
+License cache adapter - Implementation of LicenseCache port with signed on-disk tokens.
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import threading
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from src.application.ports.interfaces import LicenseCache, Logger
+from src.domain.entities.invoice import License, LicenseType
+
+
+class SignedLicenseCacheAdapter(LicenseCache):
+    """
+    Validated-license cache kept in memory and as an HMAC-signed token on disk.
+
+    Each token stores the validated license (never the key itself, only its
+    SHA-256) together with the time it stops being fresh and the end of the
+    grace period. Tokens are signed with a key derived from the secret and the
+    license key, so an edited or copied token is rejected and simply triggers
+    a new validation.
+    """
+
+    TOKEN_VERSION = 1
+
+    def __init__(
+        self,
+        cache_dir: str,
+        logger: Logger,
+        ttl: timedelta = timedelta(hours=12),
+        grace_period: timedelta = timedelta(days=3),
+        secret: Optional[str] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the signed tokens
+            logger: Logger
+            ttl: How long a validation is reused without contacting the server
+            grace_period: Extra time an expired token is accepted while the server is unreachable
+            secret: Signing secret; defaults to one derived from this machine
+        """
+        self._cache_dir = Path(cache_dir)
+        self._logger = logger
+        self._ttl = ttl
+        self._grace_period = grace_period
+        self._secret = secret if secret is not None else f"dataconta:{uuid.getnode():012x}"
+        self._memory: Dict[str, Tuple[License, datetime, datetime]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, license_key: str, include_grace: bool = False) -> Optional[License]:
+        """Return the cached license while fresh (or within the grace period if requested)."""
+        key_hash = self._hash_key(license_key)
+        now = datetime.now()
+
+        with self._lock:
+            entry = self._memory.get(key_hash)
+            if entry is None:
+                entry = self._load_token(license_key, key_hash)
+                if entry is None:
+                    return None
+                self._memory[key_hash] = entry
+
+        license_info, fresh_until, grace_until = entry
+        if not license_info.is_valid():
+            return None
+        if now < fresh_until or (include_grace and now < grace_until):
+            return license_info
+        return None
+
+    def put(self, license_info: License) -> None:
+        """Cache a validated license in memory and write its signed token."""
+        key_hash = self._hash_key(license_info.key)
+        validated_at = datetime.now()
+        fresh_until = validated_at + self._ttl
+        grace_until = fresh_until + self._grace_period
+
+        payload = {
+            'version': self.TOKEN_VERSION,
+            'key_sha256': key_hash,
+            'license_type': license_info.license_type.value,
+            'status': license_info.status,
+            'expires_at': license_info.expires_at.isoformat() if license_info.expires_at else None,
+            'features': list(license_info.features),
+            'validated_at': validated_at.isoformat(),
+            'fresh_until': fresh_until.isoformat(),
+            'grace_until': grace_until.isoformat(),
+        }
+        token = {'payload': payload, 'signature': self._sign(license_info.key, payload)}
+
+        with self._lock:
+            self._memory[key_hash] = (license_info, fresh_until, grace_until)
+            try:
+                self._write_token(self._token_path(key_hash), token)
+            except OSError as e:
+                self._logger.warning(f"Could not write license cache token: {e}")
+
+    def invalidate(self, license_key: str) -> None:
+        """Drop the cached entry and its token."""
+        key_hash = self._hash_key(license_key)
+        with self._lock:
+            self._memory.pop(key_hash, None)
+            try:
+                self._token_path(key_hash).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self._logger.warning(f"Could not remove license cache token: {e}")
+
+    def _load_token(self, license_key: str, key_hash: str) -> Optional[Tuple[License, datetime, datetime]]:
+        """Read and verify the token for the key; None if missing, tampered or unreadable."""
+        path = self._token_path(key_hash)
+        if not path.exists():
+            return None
+
+        try:
+            token = json.loads(path.read_text(encoding='utf-8'))
+            payload = token['payload']
+            if not hmac.compare_digest(str(token.get('signature', '')), self._sign(license_key, payload)):
+                self._logger.warning("License cache token signature mismatch, ignoring cached license")
+                return None
+            if payload.get('version') != self.TOKEN_VERSION or payload.get('key_sha256') != key_hash:
+                return None
+
+            license_info = License(
+                key=license_key,
+                license_type=LicenseType(payload['license_type']),
+                status=payload['status'],
+                expires_at=datetime.fromisoformat(payload['expires_at']) if payload['expires_at'] else None,
+                features=list(payload['features'])
+            )
+            return (
+                license_info,
+                datetime.fromisoformat(payload['fresh_until']),
+                datetime.fromisoformat(payload['grace_until'])
+            )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self._logger.warning(f"Could not read license cache token: {e}")
+            return None
+
+    def _sign(self, license_key: str, payload: Dict[str, Any]) -> str:
+        """HMAC-SHA256 of the canonical payload, keyed by the secret and the license key."""
+        signing_key = hashlib.sha256(f"{self._secret}:{license_key}".encode('utf-8')).digest()
+        message = json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        return hmac.new(signing_key, message, hashlib.sha256).hexdigest()
+
+    def _token_path(self, key_hash: str) -> Path:
+        return self._cache_dir / f"license_{key_hash[:16]}.token"
+
+    @staticmethod
+    def _hash_key(license_key: str) -> str:
+        return hashlib.sha256(license_key.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _write_token(path: Path, token: Dict[str, Any]) -> None:
+        """Write the token atomically (temporary file + replace)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(token, indent=2), encoding='utf-8')
+        os.replace(tmp_path, path)
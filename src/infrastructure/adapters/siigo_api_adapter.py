@@ -10,8 +10,9 @@ from decimal import Decimal
 from urllib.parse import urljoin
 
 from src.application.ports.interfaces import InvoiceRepository, APIClient, Logger
+from src.infrastructure.utils.structured_log import add_records, record_http_response, traced
 from src.domain.entities.invoice import (
-    Invoice, InvoiceFilter, Customer, InvoiceItem, Payment, APICredentials
+    Invoice, InvoiceFilter, InvoicePage, Customer, InvoiceItem, Payment, APICredentials
 )
 
 
@@ -27,6 +28,7 @@ class SiigoAPIAdapter(InvoiceRepository, APIClient):
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         })
+        self._session.hooks['response'].append(record_http_response)
     
     def authenticate(self, credentials: APICredentials) -> bool:
         """Authenticate with the Siigo API."""
@@ -58,6 +60,7 @@ class SiigoAPIAdapter(InvoiceRepository, APIClient):
                 auth_headers['Partner-Id'] = credentials.partner_id
             
             response = requests.post(auth_url, json=auth_data, headers=auth_headers, timeout=30)
+            record_http_response(response)
             
             if response.status_code == 200:
                 auth_response = response.json()
@@ -87,6 +90,11 @@ class SiigoAPIAdapter(InvoiceRepository, APIClient):
     
     def get_invoices(self, filters: InvoiceFilter) -> List[Invoice]:
         """Retrieve invoices from Siigo API."""
+        return self.get_invoices_page(filters).invoices
+    
+    @traced('siigo.invoices_page')
+    def get_invoices_page(self, filters: InvoiceFilter) -> InvoicePage:
+        """Retrieve the requested page of invoices along with its pagination metadata."""
         try:
             if not self._ensure_authenticated():
                 raise Exception("Authentication failed")
@@ -111,8 +119,15 @@ class SiigoAPIAdapter(InvoiceRepository, APIClient):
             if response.status_code == 200:
                 data = response.json()
                 invoices = self._parse_invoices(data.get('results', []))
+                pagination = data.get('pagination') or {}
+                add_records(len(invoices), page=filters.page)
                 self._logger.info(f"Successfully retrieved {len(invoices)} invoices")
-                return invoices
+                return InvoicePage(
+                    invoices=invoices,
+                    page=filters.page,
+                    page_size=filters.page_size,
+                    total_results=pagination.get('total_results')
+                )
             else:
                 self._logger.error(f"API request failed: {response.status_code} - {response.text}")
                 raise Exception(f"API request failed: {response.status_code}")
@@ -124,6 +139,7 @@ class SiigoAPIAdapter(InvoiceRepository, APIClient):
             self._logger.error(f"Error retrieving invoices: {e}")
             raise
     
+    @traced('siigo.invoices_raw')
     def get_invoices_raw(self, filters: InvoiceFilter) -> List[Dict[str, Any]]:
         """Get raw invoice data from API (implementation of APIClient)."""
         try:
@@ -4,13 +4,15 @@ Infrastructure adapter for consuming Siigo financial APIs.
 """
 
 import requests
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import time
 
 from src.application.ports.interfaces import (
     SiigoFinancialAPIClient, Logger, APIClient
 )
+from src.infrastructure.utils.concurrent_pager import ConcurrentPager, TokenBucketRateLimiter
+from src.infrastructure.utils.structured_log import record_http_response, span
 
 
 class SiigoFinancialAPIAdapter(SiigoFinancialAPIClient):
@@ -24,7 +26,9 @@ class SiigoFinancialAPIAdapter(SiigoFinancialAPIClient):
         base_url: str,
         api_client: APIClient,
         logger: Logger,
-        timeout: int = 30
+        timeout: int = 30,
+        max_workers: int = 4,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None
     ):
         """
         Inicializar adaptador de Siigo Financial API.
@@ -34,14 +38,18 @@ class SiigoFinancialAPIAdapter(SiigoFinancialAPIClient):
             api_client: Cliente API básico para autenticación
             logger: Logger para registrar operaciones
             timeout: Timeout para requests en segundos
+            max_workers: Máximo de páginas descargadas en paralelo
+            rate_limiter: Rate limiter compartido entre endpoints (opcional)
         """
         self._base_url = base_url.rstrip('/')
         self._api_client = api_client
         self._logger = logger
         self._timeout = timeout
         self._session = requests.Session()
+        self._session.hooks['response'].append(record_http_response)
         self._auth_token = None
         self._token_expiry = None
+        self._pager = ConcurrentPager(logger, max_workers=max_workers, rate_limiter=rate_limiter)
     
     def _ensure_authenticated(self) -> bool:
         """Asegurar que la autenticación esté activa."""
@@ -165,6 +173,68 @@ class SiigoFinancialAPIAdapter(SiigoFinancialAPIClient):
         # Si llegamos aquí, todos los reintentos fallaron
         raise Exception(f"Fallaron todos los reintentos para {url}")
     
+    @staticmethod
+    def _params_periodo(fecha_inicio: str, fecha_fin: str, page: int, page_size: int) -> Dict[str, Any]:
+        """Parámetros de consulta por período y página."""
+        return {
+            "date_start": fecha_inicio,
+            "date_end": fecha_fin,
+            "page": page,
+            "page_size": page_size
+        }
+    
+    @staticmethod
+    def _extraer_pagina(response: Any) -> Tuple[Optional[List[Dict[str, Any]]], Dict[str, Any]]:
+        """Separar resultados y metadatos de paginación de una respuesta de lista."""
+        if isinstance(response, dict) and "results" in response:
+            pagination = response.get("pagination")
+            return response["results"], pagination if isinstance(pagination, dict) else {}
+        if isinstance(response, list):
+            return response, {}
+        return None, {}
+    
+    def _obtener_paginado(
+        self,
+        endpoint: str,
+        fecha_inicio: str,
+        fecha_fin: str,
+        page_size: int,
+        label: str,
+        first_response: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Descargar todas las páginas de un endpoint de lista.
+        
+        La primera página indica el total de resultados y el resto se
+        descarga en paralelo bajo el rate limiter compartido del adaptador.
+        
+        Args:
+            endpoint: Endpoint de la API (sin base_url)
+            fecha_inicio: Fecha inicio en formato YYYY-MM-DD
+            fecha_fin: Fecha fin en formato YYYY-MM-DD
+            page_size: Tamaño de página
+            label: Nombre de los registros para los logs
+            first_response: Respuesta ya obtenida para la página 1, si existe
+            
+        Returns:
+            Lista con los registros de todas las páginas
+        """
+        def fetch_page(page: int):
+            if page == 1 and first_response is not None:
+                response = first_response
+            else:
+                response = self._make_request(endpoint, self._params_periodo(fecha_inicio, fecha_fin, page, page_size))
+            
+            results, pagination = self._extraer_pagina(response)
+            if results is None:
+                self._logger.warning(f"Estructura de respuesta inesperada para {label}")
+            return results, pagination
+        
+        with span(f"siigo.GET {endpoint}", fecha_inicio=fecha_inicio, fecha_fin=fecha_fin) as endpoint_span:
+            records = self._pager.fetch_all(fetch_page, page_size, label=label)
+            endpoint_span.add_records(len(records))
+            return records
+    
     def obtener_facturas_periodo(
         self, 
         fecha_inicio: str, 
@@ -184,40 +254,8 @@ class SiigoFinancialAPIAdapter(SiigoFinancialAPIClient):
         """
         self._logger.info(f"Obteniendo facturas del período {fecha_inicio} - {fecha_fin}")
         
-        all_invoices = []
-        page = 1
-        
         try:
-            while True:
-                params = {
-                    "date_start": fecha_inicio,
-                    "date_end": fecha_fin,
-                    "page": page,
-                    "page_size": page_size
-                }
-                
-                response = self._make_request("/v1/invoices", params)
-                
-                # Verificar estructura de respuesta
-                if "results" in response:
-                    invoices = response["results"]
-                elif isinstance(response, list):
-                    invoices = response
-                else:
-                    self._logger.warning("Estructura de respuesta inesperada para facturas")
-                    break
-                
-                if not invoices:
-                    break
-                
-                all_invoices.extend(invoices)
-                
-                # Verificar si hay más páginas
-                if len(invoices) < page_size:
-                    break
-                    
-                page += 1
-                time.sleep(0.1)  # Rate limiting básico
+            all_invoices = self._obtener_paginado("/v1/invoices", fecha_inicio, fecha_fin, page_size, "facturas")
             
             self._logger.info(f"Obtenidas {len(all_invoices)} facturas del período")
             return all_invoices
@@ -245,38 +283,8 @@ class SiigoFinancialAPIAdapter(SiigoFinancialAPIClient):
         """
         self._logger.info(f"Obteniendo notas de crédito del período {fecha_inicio} - {fecha_fin}")
         
-        all_credit_notes = []
-        page = 1
-        
         try:
-            while True:
-                params = {
-                    "date_start": fecha_inicio,
-                    "date_end": fecha_fin,
-                    "page": page,
-                    "page_size": page_size
-                }
-                
-                response = self._make_request("/v1/credit-notes", params)
-                
-                # Procesar respuesta similar a facturas
-                if "results" in response:
-                    credit_notes = response["results"]
-                elif isinstance(response, list):
-                    credit_notes = response
-                else:
-                    break
-                
-                if not credit_notes:
-                    break
-                
-                all_credit_notes.extend(credit_notes)
-                
-                if len(credit_notes) < page_size:
-                    break
-                    
-                page += 1
-                time.sleep(0.1)
+            all_credit_notes = self._obtener_paginado("/v1/credit-notes", fecha_inicio, fecha_fin, page_size, "notas de crédito")
             
             self._logger.info(f"Obtenidas {len(all_credit_notes)} notas de crédito del período")
             return all_credit_notes
@@ -304,39 +312,10 @@ class SiigoFinancialAPIAdapter(SiigoFinancialAPIClient):
         """
         self._logger.info(f"Obteniendo compras del período {fecha_inicio} - {fecha_fin}")
         
-        all_purchases = []
-        page = 1
-        
         try:
-            while True:
-                params = {
-                    "date_start": fecha_inicio,
-                    "date_end": fecha_fin,
-                    "page": page,
-                    "page_size": page_size
-                }
-                
-                response = self._make_request("/v1/purchases", params)
-                
-                # Procesar respuesta
-                if "results" in response:
-                    purchases = response["results"]
-                elif isinstance(response, list):
-                    purchases = response
-                else:
-                    break
-                
-                if not purchases:
-                    break
-                
-                all_purchases.extend(purchases)
-                
-                if len(purchases) < page_size:
-                    break
-                    
-                page += 1
-                # Aumentar el rate limiting para evitar errores 503
-                time.sleep(0.5)  # Esperar más tiempo entre páginas
+            # Los errores 503 por ráfagas se absorben con el rate limiter compartido
+            # y el reintento con backoff de _make_request_with_retry
+            all_purchases = self._obtener_paginado("/v1/purchases", fecha_inicio, fecha_fin, page_size, "compras")
             
             self._logger.info(f"Obtenidas {len(all_purchases)} compras del período")
             return all_purchases
@@ -364,58 +343,36 @@ class SiigoFinancialAPIAdapter(SiigoFinancialAPIClient):
         """
         self._logger.info(f"Obteniendo asientos contables del período {fecha_inicio} - {fecha_fin}")
         
-        all_journal_entries = []
-        page = 1
-        
         try:
-            while True:
-                params = {
-                    "date_start": fecha_inicio,
-                    "date_end": fecha_fin,
-                    "page": page,
-                    "page_size": page_size
-                }
-                
-                # Intentar con diferentes endpoints posibles para asientos contables
-                endpoints_to_try = ["/v1/journals", "/v1/journal", "/v1/accounting-entries", "/v1/journal-entries"]
-                
-                response = None
-                for endpoint in endpoints_to_try:
-                    try:
-                        response = self._make_request(endpoint, params)
-                        break  # Si funciona, salir del loop
-                    except Exception as e:
-                        if "404" in str(e) and endpoint != endpoints_to_try[-1]:
-                            self._logger.debug(f"Endpoint {endpoint} no disponible, probando siguiente...")
-                            continue  # Probar siguiente endpoint
-                        elif endpoint == endpoints_to_try[-1]:
-                            # Es el último endpoint, registrar error pero continuar con datos parciales
-                            self._logger.warning(f"Ningún endpoint de asientos contables disponible: {str(e)}")
-                            return []  # Retornar lista vacía en lugar de fallar
-                        else:
-                            raise e  # Re-lanzar error si no es 404
-                
-                # Procesar respuesta
-                if not response:
-                    break
-                    
-                if "results" in response:
-                    journal_entries = response["results"]
-                elif isinstance(response, list):
-                    journal_entries = response
-                else:
-                    break
-                
-                if not journal_entries:
-                    break
-                
-                all_journal_entries.extend(journal_entries)
-                
-                if len(journal_entries) < page_size:
-                    break
-                    
-                page += 1
-                time.sleep(0.1)
+            # Intentar con diferentes endpoints posibles para asientos contables;
+            # el primero que responda se usa para el resto de páginas
+            endpoints_to_try = ["/v1/journals", "/v1/journal", "/v1/accounting-entries", "/v1/journal-entries"]
+            
+            endpoint = None
+            first_response = None
+            for candidate in endpoints_to_try:
+                try:
+                    first_response = self._make_request(candidate, self._params_periodo(fecha_inicio, fecha_fin, 1, page_size))
+                    endpoint = candidate
+                    break  # Si funciona, salir del loop
+                except Exception as e:
+                    if "404" in str(e) and candidate != endpoints_to_try[-1]:
+                        self._logger.debug(f"Endpoint {candidate} no disponible, probando siguiente...")
+                        continue  # Probar siguiente endpoint
+                    elif candidate == endpoints_to_try[-1]:
+                        # Es el último endpoint, registrar error pero continuar con datos parciales
+                        self._logger.warning(f"Ningún endpoint de asientos contables disponible: {str(e)}")
+                        return []  # Retornar lista vacía en lugar de fallar
+                    else:
+                        raise e  # Re-lanzar error si no es 404
+            
+            if not first_response:
+                return []
+            
+            all_journal_entries = self._obtener_paginado(
+                endpoint, fecha_inicio, fecha_fin, page_size, "asientos contables",
+                first_response=first_response
+            )
             
             self._logger.info(f"Obtenidos {len(all_journal_entries)} asientos contables del período")
             return all_journal_entries
@@ -0,0 +1,288 @@
+"""
+Siigo Invoice Export Adapter - Infrastructure Layer
+Descarga facturas de la API Siigo (/v1/invoices) como DataFrames de encabezados y
+detalle para las exportaciones. No depende de Qt: se usa desde la GUI, la CLI,
+addons e hilos de trabajo.
+"""
+
+import os
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from src.application.ports.interfaces import Logger
+from src.infrastructure.utils.structured_log import record_http_response
+
+
+class InvoiceDownloadError(Exception):
+    """Error de la API de Siigo al descargar facturas, con el título y detalle a mostrar."""
+    
+    def __init__(self, title: str, detail: str, warning: bool = False):
+        super().__init__(detail)
+        self.title = title
+        self.detail = detail
+        self.warning = warning
+
+
+class SiigoInvoiceExportAdapter:
+    """Descarga de facturas Siigo como DataFrames (encabezados, detalle)."""
+    
+    def __init__(self, logger: Optional[Logger] = None):
+        self._logger = logger
+    
+    def fetch_invoice_frames(self, fecha_inicio=None, fecha_fin=None, cliente_id=None,
+                             cc=None, nit=None, estado=None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Descargar facturas desde la API de Siigo /v1/invoices con filtros opcionales.
+        
+        Args:
+            fecha_inicio (str): Fecha de inicio en formato YYYY-MM-DD
+            fecha_fin (str): Fecha fin en formato YYYY-MM-DD  
+            cliente_id (str): ID del cliente
+            cc (str): Cédula del cliente
+            nit (str): NIT del cliente
+            estado (str): Estado de la factura (abierta, cerrada, anulada)
+        
+        Returns:
+            tuple: (encabezados_df, detalle_df) DataFrames de pandas con los datos
+            
+        Raises:
+            InvoiceDownloadError: Si la API responde con error
+        """
+        import requests
+        from dotenv import load_dotenv
+        
+        try:
+            # Cargar variables de entorno
+            load_dotenv()
+            
+            # Configuración de API Siigo
+            api_url = os.getenv('SIIGO_API_URL', 'https://api.siigo.com')
+            access_key = os.getenv('SIIGO_ACCESS_KEY')
+            partner_id = os.getenv('PARTNER_ID', 'SandboxSiigoAPI')
+            user = os.getenv('SIIGO_USER')
+            
+            if not access_key:
+                raise ValueError("SIIGO_ACCESS_KEY no encontrado en archivo .env")
+            
+            if not user:
+                raise ValueError("SIIGO_USER no encontrado en archivo .env")
+            
+            self._log("🔐 Iniciando autenticación con Siigo API...")
+            
+            # PASO 1: Obtener access_token mediante OAuth
+            auth_url = f"{api_url}/auth"
+            
+            # Headers para autenticación
+            auth_headers = {
+                'Content-Type': 'application/json',
+                'Partner-Id': partner_id
+            }
+            
+            # Payload para obtener token - CORREGIDO: usar access_key directamente
+            auth_payload = {
+                'username': user,  # Email del usuario
+                'access_key': access_key  # Usar access_key directamente (NO decodificar)
+            }
+            
+            self._log(f"📡 POST {auth_url} - Obteniendo access_token...")
+            
+            # Realizar petición de autenticación
+            auth_response = requests.post(
+                auth_url, 
+                json=auth_payload, 
+                headers=auth_headers, 
+                timeout=30  # Aumentar timeout a 30 segundos para auth
+            )
+            record_http_response(auth_response)
+            
+            if auth_response.status_code == 200:
+                auth_data = auth_response.json()
+                access_token = auth_data.get('access_token')
+                
+                if not access_token:
+                    raise ValueError("No se recibió access_token en la respuesta de autenticación")
+                
+                self._log(f"✅ Access token obtenido exitosamente")
+                
+                # PASO 2: Descargar facturas usando el token
+                invoices_url = f"{api_url}/v1/invoices"
+                
+                # Headers para consulta de facturas
+                invoice_headers = {
+                    'Authorization': access_token,
+                    'Content-Type': 'application/json',
+                    'Partner-Id': partner_id
+                }
+                
+                # Construcción de parámetros de consulta
+                params = {}
+                
+                if fecha_inicio:
+                    params['created_start'] = fecha_inicio
+                    
+                if fecha_fin:
+                    params['created_end'] = fecha_fin
+                    
+                if cliente_id:
+                    params['customer_id'] = cliente_id
+                    
+                if cc:
+                    params['customer_identification'] = cc
+                    
+                if nit:
+                    params['customer_identification'] = nit  # NIT también va en customer_identification
+                    
+                if estado:
+                    params['status'] = estado
+                
+                self._log(f"📡 GET {invoices_url} - Descargando facturas...")
+                self._log(f"📋 Parámetros: {params}")
+                
+                # Realizar consulta de facturas
+                invoices_response = requests.get(
+                    invoices_url,
+                    headers=invoice_headers,
+                    params=params,
+                    timeout=120  # Aumentar timeout a 2 minutos para rangos grandes
+                )
+                record_http_response(invoices_response)
+                
+                if invoices_response.status_code == 200:
+                    response_data = invoices_response.json()
+                    
+                    # La respuesta puede ser una lista directa o un objeto con 'results'
+                    if isinstance(response_data, dict):
+                        facturas_data = response_data.get('results', [])
+                    else:
+                        facturas_data = response_data
+                    
+                    if not facturas_data or len(facturas_data) == 0:
+                        self._log("⚠️ No se encontraron facturas con los filtros especificados")
+                        return pd.DataFrame(), pd.DataFrame()
+                    
+                    self._log(f"📊 Procesando {len(facturas_data)} facturas encontradas...")
+                    
+                    # Procesar datos en DataFrames
+                    encabezados_list = []
+                    detalle_list = []
+                    
+                    for factura in facturas_data:
+                        try:
+                            # Validar que cada factura sea un diccionario
+                            if not isinstance(factura, dict):
+                                self._log(f"⚠️ Factura no es diccionario: {type(factura)}")
+                                continue
+                                
+                            # Datos del encabezado con validación
+                            customer_data = factura.get('customer', {})
+                            if not isinstance(customer_data, dict):
+                                customer_data = {}
+                                
+                            # Función auxiliar para convertir valores de API
+                            def safe_float(value, default=0.0):
+                                """Convertir valor a float de forma segura."""
+                                if isinstance(value, (list, dict)):
+                                    if isinstance(value, list) and len(value) > 0:
+                                        return float(value[0]) if str(value[0]).replace('.','').replace('-','').isdigit() else default
+                                    return default
+                                try:
+                                    return float(value) if value is not None else default
+                                except (ValueError, TypeError):
+                                    return default
+                            
+                            def safe_str(value, default=''):
+                                """Convertir valor a string de forma segura."""
+                                if isinstance(value, list):
+                                    return str(value[0]) if len(value) > 0 else default
+                                return str(value) if value is not None else default
+                                
+                            encabezado = {
+                                'factura_id': safe_str(factura.get('id', '')),
+                                'numero': safe_str(factura.get('number', '')),
+                                'fecha': safe_str(factura.get('date', '')),
+                                'fecha_vencimiento': safe_str(factura.get('due_date', '')),
+                                'cliente_id': safe_str(customer_data.get('id', '')),
+                                'cliente_nombre': safe_str(customer_data.get('name', 'Cliente Sin Nombre')),
+                                'cliente_nit': safe_str(customer_data.get('identification', '')),
+                                'subtotal': safe_float(factura.get('subtotal', 0)),
+                                'impuestos': safe_float(factura.get('taxes', 0)),
+                                'total': safe_float(factura.get('total', 0)),
+                                'estado': safe_str(factura.get('status', '')),
+                                'moneda': safe_str(factura.get('currency', 'COP')),
+                                'observaciones': safe_str(factura.get('observations', ''))
+                            }
+                            encabezados_list.append(encabezado)
+                            
+                            # Datos del detalle (items) con validación
+                            items = factura.get('items', [])
+                            if not isinstance(items, list):
+                                items = []
+                                
+                            for item in items:
+                                if not isinstance(item, dict):
+                                    continue
+                                    
+                                detalle_item = {
+                                    'factura_id': safe_str(factura.get('id', '')),
+                                    'numero_factura': safe_str(factura.get('number', '')),
+                                    'item_id': safe_str(item.get('id', '')),
+                                    'codigo': safe_str(item.get('code', '')),
+                                    'descripcion': safe_str(item.get('description', '')),
+                                    'cantidad': safe_float(item.get('quantity', 0)),
+                                    'precio_unitario': safe_float(item.get('price', 0)),
+                                    'subtotal_item': safe_float(item.get('subtotal', 0)),
+                                    'impuestos_item': safe_float(item.get('taxes', 0)),
+                                    'total_item': safe_float(item.get('total', 0))
+                                }
+                                detalle_list.append(detalle_item)
+                                
+                        except Exception as e:
+                            self._log(f"⚠️ Error procesando factura {factura.get('id', 'N/A')}: {e}")
+                            continue
+                    
+                    # Crear DataFrames
+                    encabezados_df = pd.DataFrame(encabezados_list)
+                    detalle_df = pd.DataFrame(detalle_list)
+                    
+                    self._log(f"✅ Descarga exitosa: {len(encabezados_df)} facturas, {len(detalle_df)} items")
+                    
+                    return encabezados_df, detalle_df
+                    
+                else:
+                    error_msg = f"Error {invoices_response.status_code}: {invoices_response.text}"
+                    self._log(f"❌ Error consultando facturas: {error_msg}")
+                    raise InvoiceDownloadError("Error API", f"Error consultando facturas:\n{error_msg}")
+                    
+            elif auth_response.status_code == 429:
+                error_data = auth_response.json()
+                error_msg = error_data.get('Errors', [{}])[0].get('Message', 'Rate limit exceeded')
+                self._log(f"⏰ Rate limit excedido: {error_msg}")
+                raise InvoiceDownloadError("Rate Limit", f"Rate limit excedido:\n{error_msg}", warning=True)
+                
+            else:
+                error_msg = f"Error {auth_response.status_code}: {auth_response.text}"
+                self._log(f"❌ Error autenticación: {error_msg}")
+                raise InvoiceDownloadError("Error Autenticación", f"Error de autenticación:\n{error_msg}")
+                
+        except InvoiceDownloadError:
+            raise
+            
+        except Exception as e:
+            self._log(f"❌ Error descargando facturas: {e}")
+            raise
+    
+    def chunk_fetcher(self, cliente_id=None, cc=None, nit=None,
+                      estado=None) -> Callable[[str, str], Dict[str, pd.DataFrame]]:
+        """Función de descarga por período para ExportService.export_invoices_chunked."""
+        def fetch_chunk(fecha_inicio: str, fecha_fin: str) -> Dict[str, pd.DataFrame]:
+            encabezados_df, detalle_df = self.fetch_invoice_frames(
+                fecha_inicio, fecha_fin, cliente_id, cc, nit, estado
+            )
+            return {'encabezados': encabezados_df, 'detalle': detalle_df}
+        
+        return fetch_chunk
+    
+    def _log(self, message: str) -> None:
+        if self._logger:
+            self._logger.info(message)
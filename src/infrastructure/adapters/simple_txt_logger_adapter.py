@@ -4,13 +4,18 @@ Sistema de logging simple a archivos de texto para usuarios de licencia gratuita
 Implementa logging básico sin dependencias externas complejas.
 """
 
+import io
 import os
+import threading
+import time
 from datetime import datetime
 from typing import Optional, Dict, Any
 from pathlib import Path
 from enum import Enum
 
 from src.domain.services.license_manager import LicenseManager
+from src.infrastructure.utils.buffered_log_writer import BufferedLogWriter
+from src.infrastructure.utils.structured_log import emit_event
 
 
 class LogLevel(Enum):
@@ -25,19 +30,37 @@ class SimpleTxtLogger:
     """
     Logger simple para licencia FREE que escribe a archivos de texto.
     Diseñado para ser liviano y fácil de usar sin dependencias complejas.
+    
+    Las líneas se escriben en segundo plano con BufferedLogWriter: registrar
+    un mensaje no abre archivos ni espera al disco.
     """
     
-    def __init__(self, license_manager: LicenseManager, log_directory: str = "logs"):
+    def __init__(self, license_manager: LicenseManager, log_directory: str = "logs",
+                 flush_interval: float = 1.0):
         """
         Inicializar el logger simple.
         
         Args:
             license_manager: Gestor de licencias para validaciones
             log_directory: Directorio donde guardar los logs
+            flush_interval: Segundos máximos que un mensaje espera antes de llegar al archivo
         """
         self._license_manager = license_manager
         self._log_directory = Path(log_directory)
         self._current_session_id = None
+        self._session_log_file: Optional[Path] = None
+        self._daily_log_file: Optional[Path] = None
+        self._daily_log_date = None
+        self._timestamp_second = None
+        self._timestamp = ""
+        self._writer = BufferedLogWriter(flush_interval=flush_interval)
+        
+        # Contadores de la sesión, actualizados al escribir cada línea
+        self._counters_lock = threading.Lock()
+        self._session_lines = 0
+        self._level_counts = {level.value: 0 for level in LogLevel}
+        self._operations_count = 0
+        self._exports_count = 0
         
         # Crear directorio de logs si no existe
         self._ensure_log_directory()
@@ -56,6 +79,7 @@ class SimpleTxtLogger:
     def _start_session(self):
         """Iniciar una nueva sesión de logging."""
         self._current_session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._session_log_file = self._log_directory / f"session_{self._current_session_id}.txt"
         self._log_session_start()
     
     def _log_session_start(self):
@@ -73,24 +97,33 @@ Versión: DATACONTA v3.0.0 FREE
         
         self._write_to_daily_log(session_info, LogLevel.INFO)
     
+    def _now(self) -> str:
+        """Fecha y hora actual 'YYYY-MM-DD HH:MM:SS', formateada una sola vez por segundo."""
+        second = int(time.time())
+        if second != self._timestamp_second:
+            self._timestamp_second = second
+            self._timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        return self._timestamp
+    
     def _get_daily_log_filename(self) -> Path:
-        """Obtener el nombre del archivo de log diario."""
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        return self._log_directory / f"dataconta_free_{date_str}.txt"
+        """Obtener el nombre del archivo de log diario (cambia al pasar la medianoche)."""
+        date_str = self._now()[:10]
+        if date_str != self._daily_log_date:
+            self._daily_log_date = date_str
+            self._daily_log_file = self._log_directory / f"dataconta_free_{date_str}.txt"
+        return self._daily_log_file
     
     def _get_session_log_filename(self) -> Path:
         """Obtener el nombre del archivo de log de sesión."""
-        return self._log_directory / f"session_{self._current_session_id}.txt"
+        return self._session_log_file
     
     def _write_to_daily_log(self, message: str, level: LogLevel):
         """Escribir mensaje al log diario."""
         try:
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            timestamp = self._now()[11:]
             log_entry = f"[{timestamp}] [{level.value}] {message}\n"
             
-            daily_log_file = self._get_daily_log_filename()
-            with open(daily_log_file, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
+            self._writer.write('daily', self._get_daily_log_filename(), log_entry)
                 
         except Exception:
             # Si no se puede escribir al archivo, continuar silenciosamente
@@ -100,7 +133,7 @@ Versión: DATACONTA v3.0.0 FREE
     def _write_to_session_log(self, message: str, level: LogLevel, context: Dict[str, Any] = None):
         """Escribir mensaje al log de sesión con contexto adicional."""
         try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = self._now()
             log_entry = f"[{timestamp}] [{level.value}] {message}"
             
             if context:
@@ -110,14 +143,28 @@ Versión: DATACONTA v3.0.0 FREE
             
             log_entry += "\n"
             
-            session_log_file = self._get_session_log_filename()
-            with open(session_log_file, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
+            self._writer.write('session', self._get_session_log_filename(), log_entry)
+            self._count_session_lines(log_entry)
                 
         except Exception:
             # Si no se puede escribir al archivo, continuar silenciosamente
             pass
     
+    def _count_session_lines(self, log_entry: str):
+        """Actualizar los contadores del resumen de sesión con las líneas escritas."""
+        with self._counters_lock:
+            for line in log_entry.splitlines():
+                self._session_lines += 1
+                for level in LogLevel:
+                    if f"[{level.value}]" in line:
+                        self._level_counts[level.value] += 1
+                        break
+                
+                if "Operación:" in line:
+                    self._operations_count += 1
+                if "Exportación" in line:
+                    self._exports_count += 1
+    
     def info(self, message: str, context: Dict[str, Any] = None):
         """Registrar mensaje informativo."""
         self._write_to_daily_log(message, LogLevel.INFO)
@@ -166,6 +213,7 @@ Versión: DATACONTA v3.0.0 FREE
         
         self._write_to_daily_log(message, level)
         self._write_to_session_log(message, level, context)
+        emit_event('operation', session_id=self._current_session_id, details=details or None, **context)
     
     def log_license_validation(self, action: str, allowed: bool, limit: int = None):
         """
@@ -215,6 +263,7 @@ Versión: DATACONTA v3.0.0 FREE
         
         self._write_to_daily_log(message, LogLevel.SUCCESS)
         self._write_to_session_log(message, LogLevel.SUCCESS, context)
+        emit_event('export', session_id=self._current_session_id, **context)
     
     def log_user_action(self, action: str, details: str = ""):
         """
@@ -247,22 +296,47 @@ Versión: DATACONTA v3.0.0 FREE
             String con las líneas recientes del log
         """
         try:
+            self._writer.flush()
             daily_log_file = self._get_daily_log_filename()
             
             if not daily_log_file.exists():
                 return "No hay logs disponibles para hoy."
             
-            with open(daily_log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
             # Devolver las últimas max_lines líneas
-            recent_lines = lines[-max_lines:] if len(lines) > max_lines else lines
+            recent_lines = self._read_last_lines(daily_log_file, max_lines)
             
             return ''.join(recent_lines).strip()
             
         except Exception as e:
             return f"Error leyendo logs: {str(e)}"
     
+    @staticmethod
+    def _read_last_lines(path: Path, max_lines: int, block_size: int = 8192) -> list:
+        """
+        Leer las últimas max_lines líneas recorriendo el archivo desde el final por bloques.
+        
+        Solo se leen los bloques finales necesarios, sin importar el tamaño del log.
+        """
+        if max_lines <= 0:
+            return []
+        
+        with open(path, 'rb') as f:
+            position = f.seek(0, os.SEEK_END)
+            data = b''
+            # max_lines líneas completas requieren max_lines + 1 saltos de línea
+            while position > 0 and data.count(b'\n') <= max_lines:
+                step = min(block_size, position)
+                position -= step
+                f.seek(position)
+                data = f.read(step) + data
+        
+        if position > 0:
+            # Descartar la línea cortada por el inicio del bloque
+            data = data[data.index(b'\n') + 1:]
+        
+        lines = io.StringIO(data.decode('utf-8'), newline=None).readlines()
+        return lines[-max_lines:]
+    
     def get_session_summary(self) -> Dict[str, Any]:
         """
         Obtener resumen de la sesión actual.
@@ -273,36 +347,19 @@ Versión: DATACONTA v3.0.0 FREE
         try:
             session_log_file = self._get_session_log_filename()
             
-            if not session_log_file.exists():
-                return {"error": "No hay log de sesión disponible"}
-            
-            with open(session_log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Contar eventos por nivel
-            level_counts = {level.value: 0 for level in LogLevel}
-            operations_count = 0
-            export_count = 0
-            
-            for line in lines:
-                for level in LogLevel:
-                    if f"[{level.value}]" in line:
-                        level_counts[level.value] += 1
-                        break
+            # Los contadores se mantienen al escribir: no se relee el archivo de sesión
+            with self._counters_lock:
+                if self._session_lines == 0:
+                    return {"error": "No hay log de sesión disponible"}
                 
-                if "Operación:" in line:
-                    operations_count += 1
-                if "Exportación" in line:
-                    export_count += 1
-            
-            return {
-                "session_id": self._current_session_id,
-                "total_events": len(lines),
-                "level_counts": level_counts,
-                "operations_count": operations_count,
-                "exports_count": export_count,
-                "log_file": str(session_log_file)
-            }
+                return {
+                    "session_id": self._current_session_id,
+                    "total_events": self._session_lines,
+                    "level_counts": dict(self._level_counts),
+                    "operations_count": self._operations_count,
+                    "exports_count": self._exports_count,
+                    "log_file": str(session_log_file)
+                }
             
         except Exception as e:
             return {"error": f"Error generando resumen: {str(e)}"}
@@ -325,6 +382,11 @@ Exportaciones: {session_summary.get('exports_count', 0)}
         
         self._write_to_daily_log(closing_info, LogLevel.INFO)
         self._write_to_session_log(closing_info, LogLevel.INFO)
+        self._writer.flush()
+    
+    def shutdown(self):
+        """Escribir los mensajes pendientes y detener el escritor en segundo plano."""
+        self._writer.close()
     
     def cleanup_old_logs(self, days_to_keep: int = 7):
         """
@@ -0,0 +1,172 @@
+"""
+SQLite invoice store - Implementation of InvoiceStore port.
+Copia local de las facturas Siigo para servir lecturas sin volver a descargarlas.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator
+from contextlib import contextmanager
+
+from src.application.ports.interfaces import InvoiceStore, Logger
+
+
+class SQLiteInvoiceStore(InvoiceStore):
+    """
+    Almacén de facturas en SQLite, indexado por id de factura.
+
+    Guarda el JSON original de Siigo junto con las columnas usadas para
+    filtrar (fecha de creación, cliente, estado) y ``metadata.last_updated``,
+    que sirve de marca de agua para la sincronización incremental.
+    """
+
+    WATERMARK_KEY = 'invoices_last_updated'
+
+    def __init__(self, db_path: str, logger: Logger):
+        self._db_path = Path(db_path)
+        self._logger = logger
+        self._lock = threading.Lock()
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._create_schema()
+
+    @property
+    def db_path(self) -> Path:
+        """Ruta del archivo SQLite."""
+        return self._db_path
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Conexión serializada entre hilos; confirma la transacción al salir."""
+        with self._lock:
+            conn = sqlite3.connect(str(self._db_path))
+            try:
+                yield conn
+                conn.commit()
+            finally:
+                conn.close()
+
+    def _create_schema(self) -> None:
+        with self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS invoices (
+                    id TEXT PRIMARY KEY,
+                    created_date TEXT,
+                    invoice_date TEXT,
+                    last_updated TEXT,
+                    customer_id TEXT,
+                    customer_identification TEXT,
+                    status TEXT,
+                    payload TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_invoices_created_date ON invoices (created_date);
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+
+    def upsert_invoices(self, invoices: List[Dict[str, Any]]) -> int:
+        """Insertar o actualizar facturas; una versión más antigua nunca pisa a una más reciente."""
+        rows = [self._to_row(invoice) for invoice in invoices if isinstance(invoice, dict) and invoice.get('id')]
+        if not rows:
+            return 0
+
+        with self._connect() as conn:
+            conn.executemany("""
+                INSERT INTO invoices (id, created_date, invoice_date, last_updated,
+                                      customer_id, customer_identification, status, payload)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    created_date = excluded.created_date,
+                    invoice_date = excluded.invoice_date,
+                    last_updated = excluded.last_updated,
+                    customer_id = excluded.customer_id,
+                    customer_identification = excluded.customer_identification,
+                    status = excluded.status,
+                    payload = excluded.payload
+                WHERE invoices.last_updated IS NULL
+                   OR excluded.last_updated IS NULL
+                   OR excluded.last_updated >= invoices.last_updated
+            """, rows)
+
+        self._logger.debug(f"💾 {len(rows)} facturas guardadas en {self._db_path.name}")
+        return len(rows)
+
+    def query_invoices(self,
+                       fecha_inicio: Optional[str] = None,
+                       fecha_fin: Optional[str] = None,
+                       customer_id: Optional[str] = None,
+                       identification: Optional[str] = None,
+                       status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Facturas creadas en el rango [fecha_inicio, fecha_fin] que cumplen los filtros."""
+        conditions = []
+        params: List[Any] = []
+
+        if fecha_inicio:
+            conditions.append("created_date >= ?")
+            params.append(fecha_inicio[:10])
+        if fecha_fin:
+            conditions.append("created_date <= ?")
+            params.append(fecha_fin[:10])
+        if customer_id:
+            conditions.append("customer_id = ?")
+            params.append(str(customer_id))
+        if identification:
+            conditions.append("customer_identification = ?")
+            params.append(str(identification))
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+
+        sql = "SELECT payload FROM invoices"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY created_date, id"
+
+        with self._connect() as conn:
+            return [json.loads(payload) for (payload,) in conn.execute(sql, params)]
+
+    def get_invoice(self, invoice_id: str) -> Optional[Dict[str, Any]]:
+        """Factura almacenada con el id indicado, si existe."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT payload FROM invoices WHERE id = ?", (str(invoice_id),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def count(self) -> int:
+        """Número de facturas almacenadas."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM invoices").fetchone()[0]
+
+    def get_watermark(self) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM sync_state WHERE key = ?", (self.WATERMARK_KEY,)).fetchone()
+        return row[0] if row else None
+
+    def set_watermark(self, watermark: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO sync_state (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (self.WATERMARK_KEY, watermark)
+            )
+
+    @staticmethod
+    def _to_row(invoice: Dict[str, Any]) -> tuple:
+        """Columnas indexables a partir del JSON de Siigo."""
+        metadata = invoice.get('metadata') if isinstance(invoice.get('metadata'), dict) else {}
+        customer = invoice.get('customer') if isinstance(invoice.get('customer'), dict) else {}
+        invoice_date = str(invoice.get('date') or '')[:10] or None
+        created = str(metadata.get('created') or '')[:10] or invoice_date
+
+        return (
+            str(invoice['id']),
+            created,
+            invoice_date,
+            metadata.get('last_updated'),
+            str(customer.get('id', '')) or None,
+            str(customer.get('identification', customer.get('nit', ''))) or None,
+            invoice.get('status'),
+            json.dumps(invoice, ensure_ascii=False, default=str)
+        )
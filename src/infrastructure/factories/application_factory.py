@@ -5,22 +5,23 @@ Implementa el patrón Factory siguiendo principios de arquitectura hexagonal.
 """
 
 import logging
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-# Domain Services
-from src.domain.services.kpi_service import KPICalculationServiceImpl, KPIAnalysisService
-
-# Application Services
-from src.application.services.kpi_service import KPIApplicationService
-from src.application.services.export_service import ExportService
-
-# Infrastructure Adapters
-from src.infrastructure.adapters.free_gui_siigo_adapter import FreeGUISiigoAdapter
+# Infrastructure Adapters (livianos: no importan pandas)
 from src.infrastructure.adapters.file_storage_adapter import FileStorageAdapter
 from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+from src.infrastructure.utils.lazy_loading import LazyService
 
-# Presentation Layer
-from src.presentation.controllers.free_gui_controller import FreeGUIController
+# Servicios y adaptadores pesados (pandas/openpyxl/requests): se importan dentro de
+# los métodos _create_* para no pagar su carga antes de mostrar la ventana
+if TYPE_CHECKING:
+    from src.domain.services.kpi_service import KPICalculationServiceImpl, KPIAnalysisService
+    from src.application.services.kpi_service import KPIApplicationService
+    from src.application.services.export_service import ExportService
+    from src.infrastructure.adapters.free_gui_siigo_adapter import FreeGUISiigoAdapter
+    from src.infrastructure.adapters.sqlite_invoice_store import SQLiteInvoiceStore
+    from src.domain.services.license_manager import LicenseManager
+    from src.presentation.controllers.free_gui_controller import FreeGUIController
 
 # Note: DataContaMainWindow will be injected as parameter to avoid circular imports
 
@@ -42,19 +43,19 @@ class DataContaApplicationFactory:
         # 1. Crear adaptadores de infraestructura (Outside -> Inside)
         logger = cls._create_logger()
         file_storage = cls._create_file_storage(logger)
-        invoice_repository = cls._create_invoice_repository(logger)
-        
-        # 2. Crear servicios de dominio (Core)
-        kpi_calculation_service = cls._create_kpi_calculation_service()
-        kpi_analysis_service = cls._create_kpi_analysis_service(kpi_calculation_service)
         
-        # 3. Crear servicios de aplicación (Application Layer)
-        kpi_service = cls._create_kpi_application_service(
-            invoice_repository, file_storage, kpi_calculation_service, kpi_analysis_service, logger
+        # 2. Repositorio y servicios se construyen en su primer uso (arranque rápido de la GUI)
+        invoice_repository = LazyService(
+            lambda: cls._create_invoice_repository(logger), "FreeGUISiigoAdapter"
+        )
+        kpi_service = LazyService(
+            lambda: cls._create_kpi_service(invoice_repository, file_storage, logger), "KPIApplicationService"
+        )
+        export_service = LazyService(
+            lambda: cls._create_export_service(invoice_repository, file_storage, logger), "ExportService"
         )
-        export_service = cls._create_export_service(invoice_repository, file_storage, logger)
         
-        # 4. Crear controlador (Presentation Layer)
+        # 3. Crear controlador (Presentation Layer)
         controller = cls._create_controller(
             kpi_service, export_service, invoice_repository, logger, file_storage
         )
@@ -75,42 +76,73 @@ class DataContaApplicationFactory:
         return FileStorageAdapter(output_directory="./outputs", logger=logger)
     
     @classmethod
-    def _create_invoice_repository(cls, logger: LoggerAdapter) -> FreeGUISiigoAdapter:
-        """Crear repositorio de facturas."""
-        return FreeGUISiigoAdapter(logger=logger)
+    def _create_invoice_repository(cls, logger: LoggerAdapter) -> 'FreeGUISiigoAdapter':
+        """Crear repositorio de facturas con almacén local incremental por cuenta Siigo."""
+        from src.infrastructure.adapters.free_gui_siigo_adapter import FreeGUISiigoAdapter
+        return FreeGUISiigoAdapter(
+            logger=logger,
+            invoice_store_factory=lambda account: cls._create_invoice_store(logger, account)
+        )
+    
+    @classmethod
+    def _create_invoice_store(cls, logger: LoggerAdapter, account: str) -> Optional['SQLiteInvoiceStore']:
+        """Crear el almacén local de facturas de una cuenta; sin él se descarga siempre desde Siigo."""
+        try:
+            from src.infrastructure.adapters.sqlite_invoice_store import SQLiteInvoiceStore
+            return SQLiteInvoiceStore(db_path=f"./outputs/cache/invoices_{account}.sqlite3", logger=logger)
+        except Exception as e:
+            logger.warning(f"⚠️ Almacén local de facturas no disponible: {e}")
+            return None
+    
+    @classmethod
+    def _create_kpi_service(cls,
+                            invoice_repository: 'FreeGUISiigoAdapter',
+                            file_storage: FileStorageAdapter,
+                            logger: LoggerAdapter) -> 'KPIApplicationService':
+        """Crear servicio de aplicación para KPIs con sus servicios de dominio."""
+        kpi_calculation_service = cls._create_kpi_calculation_service()
+        kpi_analysis_service = cls._create_kpi_analysis_service(kpi_calculation_service)
+        return cls._create_kpi_application_service(
+            invoice_repository, file_storage, kpi_calculation_service, kpi_analysis_service, logger
+        )
     
     @classmethod
-    def _create_kpi_calculation_service(cls) -> KPICalculationServiceImpl:
+    def _create_kpi_calculation_service(cls) -> 'KPICalculationServiceImpl':
         """Crear servicio de dominio para cálculo de KPIs."""
+        from src.domain.services.kpi_service import KPICalculationServiceImpl
         return KPICalculationServiceImpl()
     
     @classmethod
-    def _create_kpi_analysis_service(cls, kpi_calculation_service: KPICalculationServiceImpl) -> KPIAnalysisService:
+    def _create_kpi_analysis_service(cls, kpi_calculation_service: 'KPICalculationServiceImpl') -> 'KPIAnalysisService':
         """Crear servicio de dominio para análisis de KPIs."""
+        from src.domain.services.kpi_service import KPIAnalysisService
         return KPIAnalysisService(kpi_calculation_service)
     
     @classmethod
     def _create_kpi_application_service(cls, 
-                                       invoice_repository: FreeGUISiigoAdapter,
+                                       invoice_repository: 'FreeGUISiigoAdapter',
                                        file_storage: FileStorageAdapter,
-                                       kpi_calculation_service: KPICalculationServiceImpl,
-                                       kpi_analysis_service: KPIAnalysisService,
-                                       logger: LoggerAdapter) -> KPIApplicationService:
+                                       kpi_calculation_service: 'KPICalculationServiceImpl',
+                                       kpi_analysis_service: 'KPIAnalysisService',
+                                       logger: LoggerAdapter) -> 'KPIApplicationService':
         """Crear servicio de aplicación para KPIs."""
+        from src.application.services.kpi_service import KPIApplicationService
         return KPIApplicationService(
             invoice_repository=invoice_repository,
             file_storage=file_storage,
             kpi_calculation_service=kpi_calculation_service,
             kpi_analysis_service=kpi_analysis_service,
-            logger=logger
+            logger=logger,
+            partials_path="./outputs/kpis/cache/parciales_mensuales.json"
         )
     
     @classmethod
     def _create_export_service(cls, 
-                              invoice_repository: FreeGUISiigoAdapter,
+                              invoice_repository: 'FreeGUISiigoAdapter',
                               file_storage: FileStorageAdapter,
-                              logger: LoggerAdapter) -> ExportService:
+                              logger: LoggerAdapter) -> 'ExportService':
         """Crear servicio de exportación."""
+        from src.application.services.export_service import ExportService
         return ExportService(
             invoice_repository=invoice_repository,
             file_storage=file_storage,
@@ -119,12 +151,13 @@ class DataContaApplicationFactory:
     
     @classmethod
     def _create_controller(cls,
-                          kpi_service: KPIApplicationService,
-                          export_service: ExportService,
-                          invoice_repository: FreeGUISiigoAdapter,
+                          kpi_service: 'KPIApplicationService',
+                          export_service: 'ExportService',
+                          invoice_repository: 'FreeGUISiigoAdapter',
                           logger: LoggerAdapter,
-                          file_storage: FileStorageAdapter) -> FreeGUIController:
+                          file_storage: FileStorageAdapter) -> 'FreeGUIController':
         """Crear controlador de presentación."""
+        from src.presentation.controllers.free_gui_controller import FreeGUIController
         return FreeGUIController(
             kpi_service=kpi_service,
             export_service=export_service,
@@ -133,6 +166,34 @@ class DataContaApplicationFactory:
             file_storage=file_storage
         )
     
+    @classmethod
+    def create_license_manager(cls,
+                               logger: Optional[LoggerAdapter] = None,
+                               cache_dir: str = "./outputs/cache/licenses") -> 'LicenseManager':
+        """
+        Crear el gestor de licencias para componer los casos de uso.
+        
+        Las validaciones exitosas se guardan como tokens firmados en cache_dir,
+        así solo la primera validación por TTL llega al servidor de licencias.
+        
+        Args:
+            logger: Logger opcional para el gestor y la caché
+            cache_dir: Directorio de los tokens de licencia validada
+            
+        Returns:
+            LicenseManager con caché firmada de validaciones
+        """
+        from src.domain.services.license_manager import LicenseManager
+        from src.infrastructure.adapters.license_cache_adapter import SignedLicenseCacheAdapter
+        
+        if logger is None:
+            logger = cls._create_logger()
+        
+        return LicenseManager(
+            logger=logger,
+            license_cache=SignedLicenseCacheAdapter(cache_dir=cache_dir, logger=logger)
+        )
+    
     @classmethod
     def create_addon_system(cls, logger: Optional[LoggerAdapter] = None) -> Optional[object]:
         """
@@ -0,0 +1,161 @@
+"""
+DataConta - Buffered Log Writer Utility
+Escritura de logs en segundo plano con archivos abiertos y escritura por lotes.
+"""
+
+import atexit
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, TextIO, Tuple
+
+
+class BufferedLogWriter:
+    """
+    Escritor de líneas de log en un hilo de fondo.
+
+    Cada canal (por ejemplo 'daily' o 'session') mantiene su archivo abierto
+    en modo append. Las líneas se encolan sin tocar disco y el hilo las
+    escribe por lotes: a más tardar ``flush_interval`` segundos después de
+    encolar la primera línea del lote (aunque sigan llegando otras), cuando
+    el lote supera ``max_buffer_bytes``, al llamar ``flush`` o al cerrar. Si la ruta de un
+    canal cambia (el archivo diario al pasar la medianoche), se cierra el
+    archivo anterior y se abre el nuevo.
+
+    Los errores de disco se ignoran para no interrumpir la funcionalidad
+    principal. Tras ``close`` las líneas se escriben de forma síncrona.
+    """
+
+    def __init__(self, flush_interval: float = 1.0, max_buffer_bytes: int = 64 * 1024):
+        """
+        Inicializar el escritor e iniciar el hilo de fondo.
+
+        Args:
+            flush_interval: Segundos máximos que una línea espera en memoria
+            max_buffer_bytes: Tamaño del lote que fuerza una escritura inmediata
+        """
+        self._flush_interval = flush_interval
+        self._max_buffer_bytes = max_buffer_bytes
+        self._queue: "queue.SimpleQueue[Tuple[str, object, object]]" = queue.SimpleQueue()
+        self._handles: Dict[str, Tuple[Path, TextIO]] = {}
+        self._closed = False
+        self._close_lock = threading.Lock()
+
+        self._thread = threading.Thread(target=self._run, name="BufferedLogWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, channel: str, path: Path, line: str) -> None:
+        """Encolar una línea (con su salto de línea) para el archivo del canal."""
+        if self._closed:
+            self._write_sync(path, line)
+        else:
+            self._queue.put((channel, path, line))
+
+    def flush(self, timeout: Optional[float] = 5.0) -> None:
+        """Esperar a que todo lo encolado hasta ahora quede escrito en disco."""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(('', None, done))
+        done.wait(timeout)
+
+    def close(self) -> None:
+        """Escribir lo pendiente, cerrar los archivos y detener el hilo."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(('', None, None))
+        self._thread.join()
+        atexit.unregister(self.close)
+
+        # Líneas encoladas mientras se cerraba
+        while not self._queue.empty():
+            _, path, item = self._queue.get_nowait()
+            if path is not None:
+                self._write_sync(path, item)
+            elif item is not None:
+                item.set()
+
+    def _run(self) -> None:
+        """Bucle del hilo: acumular lotes por canal y escribirlos."""
+        pending: Dict[str, List[str]] = {}
+        paths: Dict[str, Path] = {}
+        pending_bytes = 0
+        # Momento (time.monotonic) en que el lote pendiente debe llegar a disco;
+        # None sin líneas pendientes. No se reinicia con cada línea nueva, así
+        # que un log constante también se escribe cada flush_interval.
+        deadline: Optional[float] = None
+
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                channel, path, item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._write_batches(pending, paths)
+                pending_bytes, deadline = 0, None
+                continue
+
+            if path is None:
+                self._write_batches(pending, paths)
+                pending_bytes, deadline = 0, None
+                if item is None:
+                    self._close_handles()
+                    return
+                item.set()
+                continue
+
+            if paths.get(channel, path) != path:
+                # Cambió el archivo del canal (rotación): escribir el lote del archivo anterior
+                self._write_batches(pending, paths)
+                pending_bytes, deadline = 0, None
+            paths[channel] = path
+            pending.setdefault(channel, []).append(item)
+            pending_bytes += len(item)
+            if deadline is None:
+                deadline = time.monotonic() + self._flush_interval
+
+            if pending_bytes >= self._max_buffer_bytes or time.monotonic() >= deadline:
+                self._write_batches(pending, paths)
+                pending_bytes, deadline = 0, None
+
+    def _write_batches(self, pending: Dict[str, List[str]], paths: Dict[str, Path]) -> None:
+        for channel, lines in pending.items():
+            if not lines:
+                continue
+            try:
+                handle = self._handle_for(channel, paths[channel])
+                handle.write(''.join(lines))
+                handle.flush()
+            except Exception:
+                pass
+            lines.clear()
+
+    def _handle_for(self, channel: str, path: Path) -> TextIO:
+        """Archivo abierto del canal, rotándolo si la ruta cambió."""
+        current = self._handles.get(channel)
+        if current is not None and current[0] == path:
+            return current[1]
+        if current is not None:
+            current[1].close()
+        handle = open(path, 'a', encoding='utf-8')
+        self._handles[channel] = (path, handle)
+        return handle
+
+    def _close_handles(self) -> None:
+        for _, handle in self._handles.values():
+            try:
+                handle.close()
+            except Exception:
+                pass
+        self._handles.clear()
+
+    @staticmethod
+    def _write_sync(path: Path, line: str) -> None:
+        try:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(line)
+        except Exception:
+            pass
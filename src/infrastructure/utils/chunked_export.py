@@ -0,0 +1,407 @@
+"""
+DataConta - Chunked Export Utility
+Exportación por períodos mensuales con escritura incremental, checkpoint y reanudación.
+"""
+
+import calendar
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from src.application.ports.interfaces import Logger
+from src.infrastructure.utils.concurrent_pager import TokenBucketRateLimiter
+from src.infrastructure.utils.excel_writer import ExcelStreamWriter
+from src.infrastructure.utils.structured_log import run_in_context, span
+
+
+# fetch_chunk(fecha_inicio, fecha_fin) -> DataFrame por salida ('encabezados', 'detalle', ...)
+ChunkFetcher = Callable[[str, str], Dict[str, pd.DataFrame]]
+
+# progress(periodos_completados, periodos_totales, mensaje)
+ProgressCallback = Callable[[int, int, str], None]
+
+
+class ChunkedExportCancelled(Exception):
+    """La exportación fue cancelada antes de descargar el período."""
+
+
+def monthly_chunks(fecha_inicio: str, fecha_fin: str) -> List[Tuple[str, str]]:
+    """Dividir un rango YYYY-MM-DD en períodos mensuales (el primero y el último pueden ser parciales)."""
+    start_date = datetime.strptime(fecha_inicio, "%Y-%m-%d")
+    end_date = datetime.strptime(fecha_fin, "%Y-%m-%d")
+
+    chunks = []
+    current_date = start_date
+
+    while current_date < end_date:
+        year, month = current_date.year, current_date.month
+        month_end = datetime(year, month, calendar.monthrange(year, month)[1])
+        chunk_end = min(month_end, end_date)
+
+        chunks.append((current_date.strftime("%Y-%m-%d"), chunk_end.strftime("%Y-%m-%d")))
+
+        current_date = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+
+    return chunks
+
+
+@dataclass
+class ChunkedExportResult:
+    """Resultado de una exportación por períodos."""
+    completed: bool
+    output_files: Dict[str, str]
+    rows: Dict[str, int]
+    dtypes: Dict[str, Dict[str, str]]
+    chunks_total: int
+    chunks_completed: int
+    resumed: bool = False
+    cancelled: bool = False
+    errors: List[str] = field(default_factory=list)
+    manifest_path: str = ""
+
+
+class ChunkedExportPipeline:
+    """
+    Exporta un rango de fechas período a período hacia archivos CSV.
+
+    Los períodos se descargan en paralelo (``max_workers`` hilos bajo un
+    token bucket compartido) y cada uno se agrega a los CSV de salida en
+    cuanto él y todos los anteriores están listos, de modo que los archivos
+    conservan el orden cronológico y en memoria solo quedan los períodos
+    terminados fuera de orden.
+
+    Tras cada período escrito se actualiza un manifiesto JSON con los
+    períodos completados y el tamaño de cada archivo. Si un período falla,
+    la exportación se detiene y el manifiesto queda como checkpoint: volver a
+    ejecutar la misma exportación (mismos parámetros) trunca los archivos al
+    último período confirmado y continúa desde ahí. Cancelar la exportación
+    deja el mismo checkpoint.
+    """
+
+    MANIFEST_VERSION = 1
+
+    def __init__(
+        self,
+        fetch_chunk: Optional[ChunkFetcher],
+        checkpoint_dir: str = "outputs/checkpoints",
+        max_workers: int = 3,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        logger: Optional[Logger] = None
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            fetch_chunk: Función que descarga un período y retorna un DataFrame por salida
+                         (no se necesita solo para consultar o descartar checkpoints)
+            checkpoint_dir: Directorio de los manifiestos de exportaciones en curso
+            max_workers: Máximo de períodos descargándose a la vez
+            rate_limiter: Limitador compartido (por defecto ráfaga de max_workers y 1 período/segundo)
+            logger: Logger opcional para progreso
+        """
+        self._fetch_chunk = fetch_chunk
+        self._checkpoint_dir = Path(checkpoint_dir)
+        self._max_workers = max(1, max_workers)
+        self._rate_limiter = rate_limiter or TokenBucketRateLimiter(rate=1.0, capacity=self._max_workers)
+        self._logger = logger
+
+    def manifest_path(self, params: Dict[str, Any]) -> Path:
+        """Ruta del manifiesto de una exportación, derivada de sus parámetros."""
+        normalized = json.dumps(self._normalize_params(params), sort_keys=True)
+        digest = hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:16]
+        return self._checkpoint_dir / f"export_{digest}.json"
+
+    def find_checkpoint(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Manifiesto de una exportación interrumpida con los mismos parámetros, si existe."""
+        path = self.manifest_path(params)
+        if not path.exists():
+            return None
+        try:
+            manifest = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if manifest.get('version') != self.MANIFEST_VERSION or manifest.get('params') != self._normalize_params(params):
+            return None
+        return manifest
+
+    def discard_checkpoint(self, params: Dict[str, Any]) -> None:
+        """Eliminar el checkpoint de una exportación (para empezarla de cero)."""
+        self.manifest_path(params).unlink(missing_ok=True)
+
+    def run(
+        self,
+        fecha_inicio: str,
+        fecha_fin: str,
+        output_files: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        progress: Optional[ProgressCallback] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> ChunkedExportResult:
+        """
+        Exportar el rango, reanudando un checkpoint previo con los mismos parámetros.
+
+        Args:
+            fecha_inicio: Fecha inicio YYYY-MM-DD
+            fecha_fin: Fecha fin YYYY-MM-DD
+            output_files: Nombre de salida -> ruta CSV (ignorado al reanudar: se usan las del checkpoint)
+            params: Filtros y demás parámetros que identifican la exportación
+            progress: Callback opcional invocado al iniciar y tras cada período confirmado
+            cancel_event: Evento opcional; al activarlo no se descargan más períodos
+
+        Returns:
+            ChunkedExportResult con los archivos, filas y períodos completados
+        """
+        params = dict(params or {}, fecha_inicio=fecha_inicio, fecha_fin=fecha_fin)
+        manifest_path = self.manifest_path(params)
+        manifest = self.find_checkpoint(params)
+        resumed = manifest is not None
+
+        if resumed:
+            self._restore_outputs(manifest)
+            self._log(f"♻️ Reanudando exportación: {len(manifest['completed'])}/{len(manifest['chunks'])} períodos ya completados")
+        else:
+            manifest = self._new_manifest(params, monthly_chunks(fecha_inicio, fecha_fin), output_files)
+            for path in manifest['outputs'].values():
+                Path(path['file']).parent.mkdir(parents=True, exist_ok=True)
+                Path(path['file']).unlink(missing_ok=True)
+            self._save_manifest(manifest_path, manifest)
+
+        chunks = [tuple(chunk) for chunk in manifest['chunks']]
+        completed = {tuple(chunk) for chunk in manifest['completed']}
+        pending = [chunk for chunk in chunks if chunk not in completed]
+        self._log(f"📊 Se procesarán {len(pending)} de {len(chunks)} períodos mensuales con {self._max_workers} hilos")
+
+        if progress:
+            progress(len(completed), len(chunks), f"{len(completed)}/{len(chunks)} períodos completados")
+
+        errors, cancelled = self._process(pending, manifest, manifest_path, progress, cancel_event)
+
+        result = ChunkedExportResult(
+            completed=not errors and not cancelled,
+            output_files={name: output['file'] for name, output in manifest['outputs'].items()},
+            rows={name: output['rows'] for name, output in manifest['outputs'].items()},
+            dtypes={name: output['dtypes'] for name, output in manifest['outputs'].items()},
+            chunks_total=len(chunks),
+            chunks_completed=len(manifest['completed']),
+            resumed=resumed,
+            cancelled=cancelled,
+            errors=errors,
+            manifest_path=str(manifest_path)
+        )
+
+        if cancelled and not errors:
+            self._log(f"⏹️ Exportación cancelada en {result.chunks_completed}/{result.chunks_total} períodos; "
+                      f"se puede reanudar desde el checkpoint {manifest_path.name}")
+        elif errors:
+            self._log(f"⏸️ Exportación detenida en {result.chunks_completed}/{result.chunks_total} períodos; "
+                      f"se puede reanudar desde el checkpoint {manifest_path.name}")
+        else:
+            manifest_path.unlink(missing_ok=True)
+            self._log(f"✅ Exportación completa: {result.chunks_total} períodos, {result.rows}")
+
+        return result
+
+    @classmethod
+    def read_output(cls, result: ChunkedExportResult, name: str, chunksize: Optional[int] = None):
+        """
+        Leer un CSV de salida restaurando los tipos que tenían los DataFrames exportados.
+
+        Las columnas numéricas vuelven a número y las de texto se conservan
+        como texto (sin convertir '' ni códigos como '0012' a NaN o enteros).
+        Con ``chunksize`` retorna un iterador de DataFrames.
+        """
+        dtypes = result.dtypes[name]
+        reader = pd.read_csv(result.output_files[name], dtype=str, keep_default_na=False,
+                             chunksize=chunksize, encoding='utf-8')
+        if chunksize is None:
+            return cls._restore_dtypes(reader, dtypes)
+        return (cls._restore_dtypes(df, dtypes) for df in reader)
+
+    def _process(
+        self,
+        pending: List[Tuple[str, str]],
+        manifest: Dict[str, Any],
+        manifest_path: Path,
+        progress: Optional[ProgressCallback],
+        cancel_event: Optional[threading.Event]
+    ) -> Tuple[List[str], bool]:
+        """
+        Descargar los períodos pendientes en paralelo y confirmarlos en orden hasta
+        el primer fallo o la cancelación.
+
+        Returns:
+            (errores, cancelada)
+        """
+        if not pending:
+            return [], False
+
+        order = {chunk: index for index, chunk in enumerate(pending)}
+        ready: Dict[int, Dict[str, pd.DataFrame]] = {}
+        next_index = 0
+        stop_index = len(pending)
+        errors: List[str] = []
+        cancelled = False
+
+        executor = ThreadPoolExecutor(max_workers=min(self._max_workers, len(pending)))
+        try:
+            futures = {executor.submit(run_in_context(self._fetch), chunk, cancel_event): chunk for chunk in pending}
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+
+                chunk = futures[future]
+                try:
+                    frames = future.result()
+                except Exception as e:
+                    # No lanzar más períodos; los que ya corren terminan y se confirman si van antes del fallo
+                    for other in futures:
+                        other.cancel()
+                    stop_index = min(stop_index, order[chunk])
+                    if isinstance(e, ChunkedExportCancelled):
+                        cancelled = True
+                    else:
+                        errors.append(f"{chunk[0]} - {chunk[1]}: {e}")
+                        self._log(f"❌ Error en período {chunk[0]} - {chunk[1]}: {e}")
+                    continue
+
+                ready[order[chunk]] = frames
+                while next_index < stop_index and next_index in ready:
+                    committed = pending[next_index]
+                    self._commit(committed, ready.pop(next_index), manifest, manifest_path)
+                    next_index += 1
+                    if progress:
+                        progress(len(manifest['completed']), len(manifest['chunks']),
+                                 f"Período {committed[0]} a {committed[1]} completado")
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return errors, cancelled
+
+    def _fetch(self, chunk: Tuple[str, str], cancel_event: Optional[threading.Event]) -> Dict[str, pd.DataFrame]:
+        """Descargar un período respetando el rate limiter (salvo que la exportación se haya cancelado)."""
+        if cancel_event is not None and cancel_event.is_set():
+            raise ChunkedExportCancelled()
+        self._rate_limiter.acquire()
+        if cancel_event is not None and cancel_event.is_set():
+            raise ChunkedExportCancelled()
+        self._log(f"🔄 Descargando período {chunk[0]} a {chunk[1]}")
+        with span('export.chunk', fecha_inicio=chunk[0], fecha_fin=chunk[1]) as chunk_span:
+            frames = self._fetch_chunk(*chunk)
+            chunk_span.add_records(sum(len(df) for df in frames.values() if df is not None))
+            return frames
+
+    def _commit(self, chunk: Tuple[str, str], frames: Dict[str, pd.DataFrame], manifest: Dict[str, Any],
+                manifest_path: Path) -> None:
+        """Agregar un período a los CSV y registrarlo en el manifiesto."""
+        counts = []
+        for name, output in manifest['outputs'].items():
+            df = frames.get(name)
+            if df is None or df.empty:
+                continue
+
+            if output['columns'] is None:
+                output['columns'] = [str(column) for column in df.columns]
+                output['dtypes'] = {str(column): str(dtype) for column, dtype in df.dtypes.items()}
+                df.to_csv(output['file'], index=False, encoding='utf-8')
+            else:
+                df.reindex(columns=output['columns']).to_csv(
+                    output['file'], mode='a', header=False, index=False, encoding='utf-8'
+                )
+
+            output['rows'] += len(df)
+            counts.append(f"{len(df)} {name}")
+
+        for output in manifest['outputs'].values():
+            output['size'] = os.path.getsize(output['file']) if os.path.exists(output['file']) else 0
+
+        manifest['completed'].append(list(chunk))
+        self._save_manifest(manifest_path, manifest)
+        self._log(f"✅ Período {chunk[0]} a {chunk[1]}: {', '.join(counts) or 'sin registros'}")
+
+    def _restore_outputs(self, manifest: Dict[str, Any]) -> None:
+        """Truncar cada CSV al tamaño del último período confirmado (descarta escrituras a medias)."""
+        for output in manifest['outputs'].values():
+            path = output['file']
+            if output['size'] == 0:
+                Path(path).unlink(missing_ok=True)
+            elif not os.path.exists(path) or os.path.getsize(path) < output['size']:
+                raise FileNotFoundError(f"El archivo {path} del checkpoint no existe o está incompleto")
+            else:
+                os.truncate(path, output['size'])
+
+    def _new_manifest(self, params: Dict[str, Any], chunks: List[Tuple[str, str]],
+                      output_files: Dict[str, str]) -> Dict[str, Any]:
+        """Manifiesto inicial de una exportación."""
+        return {
+            'version': self.MANIFEST_VERSION,
+            'params': self._normalize_params(params),
+            'created_at': datetime.now().isoformat(),
+            'chunks': [list(chunk) for chunk in chunks],
+            'completed': [],
+            'outputs': {
+                name: {'file': str(path), 'columns': None, 'dtypes': {}, 'rows': 0, 'size': 0}
+                for name, path in output_files.items()
+            }
+        }
+
+    def _save_manifest(self, path: Path, manifest: Dict[str, Any]) -> None:
+        """Escribir el manifiesto de forma atómica (archivo temporal + reemplazo)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        manifest['updated_at'] = datetime.now().isoformat()
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _restore_dtypes(df: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+        """Convertir a número las columnas que eran numéricas al exportar."""
+        for column, dtype in dtypes.items():
+            if column in df.columns and dtype.startswith(('int', 'uint', 'float')):
+                df[column] = pd.to_numeric(df[column], errors='coerce')
+        return df
+
+    @staticmethod
+    def _normalize_params(params: Dict[str, Any]) -> Dict[str, Any]:
+        """Parámetros tal como quedan guardados en JSON (para compararlos con el manifiesto)."""
+        return json.loads(json.dumps(params, sort_keys=True, default=str))
+
+    def _log(self, message: str) -> None:
+        if self._logger:
+            self._logger.info(message)
+
+
+def chunked_outputs_to_excel(result: ChunkedExportResult, excel_path: str, sheet_names: Dict[str, str]) -> str:
+    """
+    Volcar las salidas CSV de una exportación por períodos a un libro Excel, por lotes.
+
+    Los archivos xlsx no admiten agregar filas ni reanudarse, por eso la
+    exportación escribe CSV y el libro se arma en streaming al terminar.
+
+    Args:
+        result: Resultado de una exportación completada
+        excel_path: Archivo .xlsx de destino
+        sheet_names: Nombre de salida -> nombre de hoja, en orden de hojas
+
+    Returns:
+        Ruta del archivo generado
+    """
+    writer = ExcelStreamWriter(excel_path)
+    for name, sheet_name in sheet_names.items():
+        writer.add_sheet(sheet_name)
+        if not result.rows.get(name):
+            continue
+        batches = ChunkedExportPipeline.read_output(result, name, chunksize=ExcelStreamWriter.BATCH_SIZE)
+        for index, df in enumerate(batches):
+            if index == 0:
+                writer.write_dataframe(sheet_name, df)
+            else:
+                writer.append_dataframe(sheet_name, df)
+    return writer.close()
@@ -0,0 +1,213 @@
+"""
+DataConta - Concurrent Pager Utility
+Descarga concurrente de endpoints paginados de Siigo con límite de tasa compartido.
+"""
+
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.application.ports.interfaces import Logger
+from src.infrastructure.utils.structured_log import run_in_context
+
+
+# fetch_page(page) -> (resultados de la página, bloque 'pagination' de la respuesta)
+PageFetcher = Callable[[int], Tuple[Optional[List[Dict[str, Any]]], Dict[str, Any]]]
+
+
+class PageFetchError(Exception):
+    """Una página intermedia no se pudo descargar: el resultado estaría incompleto."""
+
+    def __init__(self, page: int, attempts: int):
+        super().__init__(f"La página {page} no devolvió resultados válidos tras {attempts} intentos")
+        self.page = page
+        self.attempts = attempts
+
+
+class TokenBucketRateLimiter:
+    """
+    Rate limiter de tipo token bucket seguro entre hilos.
+
+    Permite ráfagas de hasta ``capacity`` peticiones y luego limita a
+    ``rate`` peticiones por segundo.
+    """
+
+    def __init__(
+        self,
+        rate: float = 4.0,
+        capacity: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Tokens repuestos por segundo
+            capacity: Tamaño máximo de ráfaga (por defecto igual a rate)
+            clock: Reloj monotónico (inyectable para tests)
+            sleep: Función de espera (inyectable para tests)
+        """
+        if rate <= 0:
+            raise ValueError("rate debe ser mayor que 0")
+        self._rate = float(rate)
+        self._capacity = float(capacity if capacity is not None else max(1, int(rate)))
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._last_refill = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1) -> None:
+        """Bloquear hasta disponer de ``tokens`` tokens y consumirlos."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                elapsed = now - self._last_refill
+                self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+                self._last_refill = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                wait_time = (tokens - self._tokens) / self._rate
+
+            self._sleep(wait_time)
+
+
+class ConcurrentPager:
+    """
+    Descarga todas las páginas de un endpoint de lista de Siigo.
+
+    Lee la primera página para conocer ``pagination.total_results`` y
+    descarga el resto en paralelo con un número acotado de hilos. Si la API
+    no informa el total, recorre las páginas secuencialmente (siempre bajo
+    el rate limiter, sin esperas fijas).
+
+    Una página posterior a la primera que llega como None (petición fallida o
+    respuesta malformada) se reintenta y, si sigue fallando, se lanza
+    ``PageFetchError``: nunca se devuelve un conjunto incompleto como completo.
+    """
+
+    def __init__(
+        self,
+        logger: Optional[Logger] = None,
+        max_workers: int = 4,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        page_retries: int = 1
+    ):
+        """
+        Initialize the pager.
+
+        Args:
+            logger: Logger opcional para progreso
+            max_workers: Máximo de peticiones simultáneas
+            rate_limiter: Limitador compartido (por defecto 4 peticiones/segundo)
+            page_retries: Reintentos de una página que llega como None
+        """
+        self._logger = logger
+        self._max_workers = max(1, max_workers)
+        self._rate_limiter = rate_limiter or TokenBucketRateLimiter()
+        self._page_retries = max(0, page_retries)
+
+    @property
+    def rate_limiter(self) -> TokenBucketRateLimiter:
+        """Limitador de tasa usado por este pager."""
+        return self._rate_limiter
+
+    def fetch_all(self, fetch_page: PageFetcher, page_size: int, label: str = "registros") -> List[Dict[str, Any]]:
+        """
+        Descargar todas las páginas y devolverlas concatenadas en orden de página.
+
+        Args:
+            fetch_page: Función que descarga una página y retorna (resultados, pagination)
+            page_size: Tamaño de página usado en las peticiones
+            label: Nombre de los registros para los mensajes de log
+
+        Returns:
+            Lista con los resultados de todas las páginas
+
+        Raises:
+            PageFetchError: Si una página posterior a la primera sigue sin resultados
+            Exception: La primera excepción lanzada por ``fetch_page``
+        """
+        first_results, pagination = self._fetch(fetch_page, 1)
+        if not first_results:
+            return []
+
+        total_results = (pagination or {}).get('total_results')
+        if total_results is None:
+            return self._fetch_sequential(fetch_page, page_size, first_results, label)
+
+        total_pages = math.ceil(int(total_results) / page_size) if page_size > 0 else 1
+        if total_pages <= 1 or len(first_results) < page_size:
+            return list(first_results)
+
+        self._log(f"📄 {total_results} {label} en {total_pages} páginas, descargando con {self._max_workers} hilos")
+
+        pages: Dict[int, List[Dict[str, Any]]] = {1: first_results}
+        executor = ThreadPoolExecutor(max_workers=min(self._max_workers, total_pages - 1))
+        try:
+            futures = {
+                executor.submit(run_in_context(self._fetch_required), fetch_page, page): page
+                for page in range(2, total_pages + 1)
+            }
+            for future in as_completed(futures):
+                results, _ = future.result()
+                pages[futures[future]] = results
+        except Exception:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+
+        all_results = []
+        for page in sorted(pages):
+            all_results.extend(pages[page])
+
+        self._log(f"✅ {len(all_results)} {label} descargados en {total_pages} páginas")
+        return all_results
+
+    def _fetch_sequential(
+        self,
+        fetch_page: PageFetcher,
+        page_size: int,
+        first_results: List[Dict[str, Any]],
+        label: str
+    ) -> List[Dict[str, Any]]:
+        """Recorrer páginas una a una cuando la API no informa el total."""
+        all_results = list(first_results)
+        results = first_results
+        page = 1
+
+        while len(results) >= page_size:
+            page += 1
+            results, _ = self._fetch_required(fetch_page, page)
+            if not results:
+                break
+            all_results.extend(results)
+
+        self._log(f"✅ {len(all_results)} {label} descargados en {page} páginas")
+        return all_results
+
+    def _fetch(self, fetch_page: PageFetcher, page: int) -> Tuple[Optional[List[Dict[str, Any]]], Dict[str, Any]]:
+        """Descargar una página respetando el rate limiter."""
+        self._rate_limiter.acquire()
+        return fetch_page(page)
+
+    def _fetch_required(self, fetch_page: PageFetcher, page: int) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Descargar una página que debe existir, reintentando si llega como None."""
+        attempts = self._page_retries + 1
+        for attempt in range(1, attempts + 1):
+            results, pagination = self._fetch(fetch_page, page)
+            if results is not None:
+                return results, pagination
+            if attempt < attempts:
+                self._log(f"⚠️ Página {page} sin resultados válidos, reintento {attempt} de {self._page_retries}")
+        raise PageFetchError(page, attempts)
+
+    def _log(self, message: str) -> None:
+        if self._logger:
+            self._logger.info(message)
@@ -6,12 +6,52 @@ Utility class for efficient CSV writing operations for Business Intelligence exp
 import csv
 import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TextIO
 from datetime import datetime
 
 from src.application.ports.interfaces import Logger
 
 
+class CSVStreamWriter:
+    """
+    Incremental CSV writer: the file stays open and rows are written as they arrive.
+    Used by streaming BI exports so rows never accumulate in memory.
+    """
+    
+    def __init__(self, file_path: Path, headers: List[str], logger: Logger):
+        """Open the file and write the header row."""
+        self._file_path = file_path
+        self._headers = headers
+        self._logger = logger
+        self._file: Optional[TextIO] = open(file_path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=headers, quoting=csv.QUOTE_MINIMAL, extrasaction='ignore')
+        self._writer.writeheader()
+        self.rows_written = 0
+    
+    @property
+    def file_path(self) -> Path:
+        """Path of the file being written."""
+        return self._file_path
+    
+    def write_row(self, row: Dict[str, Any]) -> None:
+        """Write one row, keeping only the configured headers."""
+        self._writer.writerow({k: row.get(k, '') for k in self._headers})
+        self.rows_written += 1
+    
+    def close(self) -> None:
+        """Flush and close the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._logger.info(f"BI CSV file written successfully: {self._file_path.name} ({self.rows_written} rows)")
+    
+    def __enter__(self) -> 'CSVStreamWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
 class CSVWriter:
     """
     Utility class for writing CSV files efficiently for BI exports.
@@ -122,6 +162,21 @@ class CSVWriter:
             self._logger.error(f"Error validating row headers: {e}")
             return False
     
+    def open_csv_stream(self, filename: str, headers: List[str]) -> CSVStreamWriter:
+        """
+        Open a CSV file in the BI output directory for incremental writing.
+        
+        Args:
+            filename: Name of the CSV file
+            headers: List of column headers
+            
+        Returns:
+            CSVStreamWriter positioned after the header row
+        """
+        if not self.ensure_output_directory():
+            raise IOError(f"Cannot create BI output directory {self._full_output_dir}")
+        return CSVStreamWriter(self._full_output_dir / filename, headers, self._logger)
+    
     def write_multiple_csvs(self, csv_data: Dict[str, Dict[str, Any]]) -> Dict[str, bool]:
         """
         Write multiple CSV files in a single operation.
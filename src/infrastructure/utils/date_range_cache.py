@@ -0,0 +1,135 @@
+"""
+DataConta - Date Range Cache Utility
+Caché de consultas por rango de fechas con alcance de una solicitud.
+"""
+
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.application.ports.interfaces import Logger
+
+
+# fetch(fecha_inicio, fecha_fin) -> registros del rango, ambos extremos incluidos
+RangeFetcher = Callable[[date, date], List[Dict[str, Any]]]
+
+
+class DateRangeCache:
+    """
+    Caché de descargas por rango de fechas para una sola solicitud.
+
+    Los rangos que la solicitud va a necesitar se registran con ``plan``; los
+    que se solapan o son contiguos se fusionan y cada rango fusionado se
+    descarga una sola vez, la primera vez que se pide alguno de sus períodos.
+    ``get`` devuelve los registros del período recortando por la fecha de cada
+    registro. Un período que coincide exactamente con un rango descargado se
+    devuelve sin recortar, igual que lo entregaría la API.
+
+    ``date_field`` debe ser el mismo campo por el que filtra ``fetch``; si los
+    registros no lo traen (p. ej. la API filtra por fecha de creación y el
+    registro solo tiene la fecha del documento), usar ``merge_ranges=False``:
+    entonces solo se reutilizan descargas del mismo rango exacto.
+
+    Seguro entre hilos: consultas concurrentes del mismo rango esperan a una
+    única descarga.
+    """
+
+    def __init__(
+        self,
+        fetch: RangeFetcher,
+        date_field: str = 'date',
+        logger: Optional[Logger] = None,
+        merge_ranges: bool = True
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            fetch: Función que descarga los registros de un rango de fechas
+            date_field: Campo de cada registro con su fecha (ISO, date o datetime)
+            logger: Logger opcional para registrar las descargas
+            merge_ranges: Fusionar rangos y recortar por date_field; en False
+                cada rango distinto se descarga por separado y sin recortar
+        """
+        self._fetch = fetch
+        self._date_field = date_field
+        self._logger = logger
+        self._merge_ranges = merge_ranges
+        self._planned: List[Tuple[date, date]] = []
+        self._fetched: Dict[Tuple[date, date], List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.fetch_count = 0
+
+    def plan(self, ranges: Iterable[Tuple[Any, Any]]) -> None:
+        """Registrar los rangos que se van a consultar, fusionando solapados y contiguos."""
+        pending = sorted(self._planned + [self._normalize(start, end) for start, end in ranges])
+
+        merged: List[Tuple[date, date]] = []
+        for start, end in pending:
+            if merged and start <= merged[-1][1] + timedelta(days=1):
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+
+        self._planned = merged
+
+    def get(self, start: Any, end: Any) -> List[Dict[str, Any]]:
+        """Registros del rango [start, end], descargando a lo sumo una vez su rango fusionado."""
+        requested = self._normalize(start, end)
+
+        with self._lock:
+            covering = self._covering_range(requested)
+            if covering not in self._fetched:
+                if self._logger and covering != requested:
+                    self._logger.info(
+                        f"📥 Descargando rango combinado {covering[0]} - {covering[1]} para {requested[0]} - {requested[1]}"
+                    )
+                self._fetched[covering] = list(self._fetch(*covering))
+                self.fetch_count += 1
+            records = self._fetched[covering]
+
+        if covering == requested:
+            return list(records)
+
+        return [record for record in records if self._in_range(record, requested)]
+
+    def clear(self) -> None:
+        """Descartar rangos planeados y descargados."""
+        with self._lock:
+            self._planned = []
+            self._fetched = {}
+
+    def _covering_range(self, requested: Tuple[date, date]) -> Tuple[date, date]:
+        """Rango descargado o planeado que contiene al solicitado; si no hay, el propio rango."""
+        if not self._merge_ranges:
+            return requested
+        for candidate in list(self._fetched) + self._planned:
+            if candidate[0] <= requested[0] and requested[1] <= candidate[1]:
+                return candidate
+        return requested
+
+    def _in_range(self, record: Dict[str, Any], requested: Tuple[date, date]) -> bool:
+        """Si la fecha del registro cae en el rango; sin fecha válida queda fuera."""
+        record_date = self._record_date(record.get(self._date_field))
+        return record_date is not None and requested[0] <= record_date <= requested[1]
+
+    @staticmethod
+    def _record_date(value: Any) -> Optional[date]:
+        """Fecha de un valor ISO, date o datetime (incluido pandas.Timestamp); inválidos son None."""
+        if isinstance(value, date) and not isinstance(value, datetime):
+            return value
+        try:
+            return date.fromisoformat(str(value)[:10])
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _normalize(start: Any, end: Any) -> Tuple[date, date]:
+        """Rango como fechas sin hora."""
+        start = start.date() if isinstance(start, datetime) else start
+        end = end.date() if isinstance(end, datetime) else end
+        if isinstance(start, str):
+            start = date.fromisoformat(start[:10])
+        if isinstance(end, str):
+            end = date.fromisoformat(end[:10])
+        return start, end
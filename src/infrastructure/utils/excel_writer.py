@@ -0,0 +1,224 @@
+"""
+DataConta - Excel Writer Utility
+Streaming (write-only) Excel writer with named shared styles and batched rows.
+"""
+
+import numbers
+from datetime import date, timedelta
+from itertools import zip_longest
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import pandas as pd
+
+# openpyxl is optional: only needed for Excel outputs
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, NamedStyle, Side
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+
+# Named style applied to DataFrame header rows (same look as pandas' to_excel headers)
+HEADER_STYLE = "dataconta_header"
+
+# Values openpyxl writes natively; anything else is written as text
+_NATIVE_TYPES = (str, numbers.Number, date, timedelta)
+
+
+def to_excel_value(value: Any) -> Any:
+    """Value as openpyxl can write it: native types and None as-is, anything else as text."""
+    if value is None or isinstance(value, _NATIVE_TYPES):
+        return value
+    return str(value)
+
+
+class ExcelStreamWriter:
+    """
+    Write-only Excel workbook.
+
+    Rows are serialized to a temporary file per sheet as they are appended, so
+    memory stays flat regardless of the number of rows. Formatting goes through
+    named styles registered once in the workbook: a styled cell only references
+    its style by name instead of carrying its own font, fill and border objects.
+
+    Sheet layout (column widths, merged ranges) must be set in ``add_sheet``,
+    before the first row is appended. Rows cannot be revisited once written.
+    """
+
+    BATCH_SIZE = 10000
+
+    def __init__(self, file_path: Union[str, Path], styles: Iterable['NamedStyle'] = ()):
+        """
+        Create the workbook.
+
+        Args:
+            file_path: Destination .xlsx file
+            styles: Named styles to register in addition to the header style
+        """
+        if not OPENPYXL_AVAILABLE:
+            raise ImportError("openpyxl is required for Excel export (pip install openpyxl)")
+
+        self._file_path = Path(file_path)
+        self._workbook = Workbook(write_only=True)
+        self._sheets: Dict[str, Any] = {}
+        self.rows_written: Dict[str, int] = {}
+
+        self.add_style(self._header_style())
+        for style in styles:
+            self.add_style(style)
+
+    def __enter__(self) -> 'ExcelStreamWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+
+    def add_style(self, style: 'NamedStyle') -> None:
+        """Register a named style once in the workbook."""
+        if style.name not in self._workbook.named_styles:
+            self._workbook.add_named_style(style)
+
+    def add_sheet(
+        self,
+        name: str,
+        column_widths: Optional[Dict[str, float]] = None,
+        merged_ranges: Sequence[str] = ()
+    ) -> None:
+        """
+        Create a sheet with its layout.
+
+        Args:
+            name: Sheet title
+            column_widths: Column letter -> width
+            merged_ranges: Ranges such as "A1:E1" to merge
+        """
+        sheet = self._workbook.create_sheet(title=name)
+        for column, width in (column_widths or {}).items():
+            sheet.column_dimensions[column].width = width
+        for cell_range in merged_ranges:
+            sheet.merged_cells.add(cell_range)
+        self._sheets[name] = sheet
+        self.rows_written[name] = 0
+
+    def append(
+        self,
+        sheet_name: str,
+        values: Sequence[Any] = (),
+        style: Union[None, str, Sequence[Optional[str]]] = None
+    ) -> None:
+        """
+        Append one row.
+
+        Args:
+            sheet_name: Target sheet
+            values: Cell values; an empty row leaves a blank line
+            style: Named style for every cell, or one style name (or None) per column.
+                   Columns with a style but no value are written as empty styled cells.
+        """
+        sheet = self._sheets[sheet_name]
+
+        if style is None:
+            sheet.append(list(values))
+        else:
+            styles = [style] * len(values) if isinstance(style, str) else style
+            sheet.append([
+                self._cell(sheet, value, style_name)
+                for value, style_name in zip_longest(values, styles)
+            ])
+
+        self.rows_written[sheet_name] += 1
+
+    def append_rows(self, sheet_name: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Append unstyled rows (fast path for bulk data)."""
+        sheet = self._sheets[sheet_name]
+        count = 0
+        for row in rows:
+            sheet.append(row)
+            count += 1
+        self.rows_written[sheet_name] += count
+
+    def write_dataframe(self, sheet_name: str, df: pd.DataFrame, header_style: Optional[str] = HEADER_STYLE) -> None:
+        """
+        Write a DataFrame as a sheet: styled header row, then the data in row batches.
+
+        Missing values become empty cells and values Excel cannot hold natively
+        (lists, dicts...) are written as text, as pandas' to_excel does.
+        """
+        if sheet_name not in self._sheets:
+            self.add_sheet(sheet_name)
+
+        self.append(sheet_name, [str(column) for column in df.columns], header_style)
+        self.append_dataframe(sheet_name, df)
+
+    def append_dataframe(self, sheet_name: str, df: pd.DataFrame) -> None:
+        """Append the rows of a DataFrame (no header), e.g. successive batches of one table."""
+        self.append_rows(sheet_name, self._frame_rows(df))
+
+    def close(self) -> str:
+        """Save the workbook and return its path."""
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._workbook.save(str(self._file_path))
+        return str(self._file_path)
+
+    @staticmethod
+    def _cell(sheet, value: Any, style_name: Optional[str]):
+        """Cell referencing a named style; unstyled values are written as-is."""
+        if style_name is None:
+            return value
+        cell = WriteOnlyCell(sheet, value)
+        cell.style = style_name
+        return cell
+
+    @classmethod
+    def _frame_rows(cls, df: pd.DataFrame) -> Iterator[tuple]:
+        """DataFrame rows as tuples of Python values, converted column-wise per batch."""
+        for start in range(0, len(df), cls.BATCH_SIZE):
+            batch = df.iloc[start:start + cls.BATCH_SIZE]
+            columns = [cls._column_values(batch.iloc[:, index]) for index in range(batch.shape[1])]
+            yield from zip(*columns)
+
+    @staticmethod
+    def _column_values(series: pd.Series) -> List[Any]:
+        """Python values of a column with missing values as None."""
+        values = series.tolist()
+
+        missing = series.isna().to_numpy()
+        if missing.any():
+            values = [None if is_missing else value for value, is_missing in zip(values, missing)]
+
+        if series.dtype == object:
+            values = [to_excel_value(value) for value in values]
+
+        return values
+
+    @staticmethod
+    def _header_style() -> 'NamedStyle':
+        """Bold, centered, bordered header cells."""
+        thin = Side(style='thin')
+        return NamedStyle(
+            name=HEADER_STYLE,
+            font=Font(bold=True),
+            border=Border(left=thin, right=thin, top=thin, bottom=thin),
+            alignment=Alignment(horizontal='center', vertical='top')
+        )
+
+
+def write_dataframes_to_excel(file_path: Union[str, Path], frames: Dict[str, pd.DataFrame]) -> str:
+    """
+    Write several DataFrames to one workbook, one sheet each, in streaming mode.
+
+    Args:
+        file_path: Destination .xlsx file
+        frames: Sheet name -> DataFrame, in sheet order
+
+    Returns:
+        Path of the written file
+    """
+    writer = ExcelStreamWriter(file_path)
+    for sheet_name, df in frames.items():
+        writer.write_dataframe(sheet_name, df)
+    return writer.close()
@@ -0,0 +1,65 @@
+"""
+DataConta - Lazy Loading Utility
+Construcción diferida de servicios para acelerar el arranque de la GUI.
+
+Los servicios que importan pandas/openpyxl (KPIs, exportaciones, repositorio
+Siigo) se inyectan como ``LazyService``: el proxy se pasa al controlador igual
+que el servicio real y el módulo pesado solo se importa y construye cuando se
+usa por primera vez, normalmente después de que la ventana ya es visible.
+"""
+
+import threading
+from typing import Any, Callable, Optional
+
+
+class LazyService:
+    """
+    Proxy que construye el servicio en el primer acceso a un atributo.
+
+    La construcción ocurre una sola vez aunque el primer acceso llegue desde
+    varios hilos a la vez (p. ej. exportaciones en segundo plano).
+    """
+
+    def __init__(self, factory: Callable[[], Any], name: Optional[str] = None):
+        """
+        Inicializar el proxy.
+
+        Args:
+            factory: Función sin argumentos que importa y construye el servicio
+            name: Nombre para logs y repr; por defecto el de la factory
+        """
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_name', name or getattr(factory, '__name__', 'servicio'))
+        object.__setattr__(self, '_instance', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def _get_instance(self) -> Any:
+        """Servicio real, construyéndolo si aún no existe."""
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    instance = self._factory()
+                    object.__setattr__(self, '_instance', instance)
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_instance(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._get_instance(), name, value)
+
+    def __repr__(self) -> str:
+        state = 'creado' if self._instance is not None else 'pendiente'
+        return f"<LazyService {self._name} ({state})>"
+
+
+def is_created(service: Any) -> bool:
+    """True si el servicio ya fue construido (o no es un LazyService)."""
+    return not isinstance(service, LazyService) or service._instance is not None
+
+
+def resolve(service: Any) -> Any:
+    """Servicio real detrás de un LazyService (lo construye si hace falta)."""
+    return service._get_instance() if isinstance(service, LazyService) else service
@@ -4,7 +4,8 @@ Utility for extracting business information from invoice observations.
 """
 
 import re
-from typing import Tuple, Dict, Any, List
+from functools import lru_cache
+from typing import Tuple, Dict, Any, List, Pattern
 from src.application.ports.interfaces import Logger
 
 
@@ -14,8 +15,38 @@ class ObservationExtractor:
     
     Extracts client type (Persona Natural/Jurídica) and tax regime information
     from observation strings in Spanish.
+    
+    Each category's patterns are compiled once into a single alternation and
+    checked in priority order; results are memoized by normalized text, so
+    repeated boilerplate observations cost one cache lookup.
     """
     
+    CACHE_SIZE = 4096
+    
+    _SPECIAL_CHARS = re.compile(r'[^\w\s\.\-]')
+    _WHITESPACE = re.compile(r'\s+')
+    
+    # Payment category patterns
+    PAYMENT_CATEGORIES = {
+        "Efectivo": ["efectivo", "cash", "contado"],
+        "Tarjeta de Crédito": ["tarjeta", "credito", "credit", "visa", "mastercard"],
+        "Tarjeta de Débito": ["debito", "debit"],
+        "Transferencia": ["transferencia", "transfer", "bancaria", "pse"],
+        "Cheque": ["cheque", "check"],
+        "Consignación": ["consignacion", "deposito"]
+    }
+    
+    # Product category patterns
+    PRODUCT_CATEGORIES = {
+        "Servicios": ["servicio", "service", "cuidado", "alojamiento", "consultoria"],
+        "Productos": ["producto", "articulo", "item", "mercancia"],
+        "Software": ["software", "licencia", "aplicacion", "sistema"],
+        "Salud": ["medico", "medicina", "salud", "hospital", "clinica"],
+        "Educación": ["educacion", "curso", "capacitacion", "entrenamiento"],
+        "Transporte": ["transporte", "flete", "envio", "logistica"],
+        "Alimentación": ["alimento", "comida", "restaurante", "catering"]
+    }
+    
     def __init__(self, logger: Logger):
         """Initialize the extractor with logger."""
         self._logger = logger
@@ -59,6 +90,51 @@ class ObservationExtractor:
                 r"g\.?\s*contribuyente"
             ]
         }
+        
+        # Compiled classifiers: (label, alternation of all its patterns), in priority order
+        self._client_type_matchers = [
+            ("Persona Jurídica", self._compile_alternation(self._persona_juridica_patterns)),
+            ("Persona Natural", self._compile_alternation(self._persona_natural_patterns))
+        ]
+        self._regimen_matchers = [
+            (regime, self._compile_alternation(patterns))
+            for regime, patterns in self._regimen_patterns.items()
+        ]
+        
+        # Memoized classification: raw observation first, then normalized text
+        self._client_info_for_text = lru_cache(maxsize=self.CACHE_SIZE)(self._client_info_for_text)
+        self._classify_client_text = lru_cache(maxsize=self.CACHE_SIZE)(self._classify_client_text)
+        self._classify_payment = lru_cache(maxsize=self.CACHE_SIZE)(self._classify_payment)
+        self._classify_product = lru_cache(maxsize=self.CACHE_SIZE)(self._classify_product)
+    
+    @staticmethod
+    def _compile_alternation(patterns: List[str]) -> Pattern:
+        """Compile a pattern list into one case-insensitive alternation."""
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+    
+    @staticmethod
+    def _first_match(matchers: List[Tuple[str, Pattern]], text: str, default: str) -> str:
+        """Label of the first matcher (by priority) that finds a match in text."""
+        for label, matcher in matchers:
+            if matcher.search(text):
+                return label
+        return default
+    
+    @staticmethod
+    def _first_substring(categories: Dict[str, List[str]], text: str, default: str) -> str:
+        """Category of the first keyword (by priority) contained in text."""
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                if keyword in text:
+                    return category
+        return default
+    
+    def clear_cache(self) -> None:
+        """Discard memoized classifications."""
+        self._client_info_for_text.cache_clear()
+        self._classify_client_text.cache_clear()
+        self._classify_payment.cache_clear()
+        self._classify_product.cache_clear()
     
     def extract_client_info(self, observations: str) -> Tuple[str, str]:
         """
@@ -74,14 +150,7 @@ class ObservationExtractor:
             if not observations or not isinstance(observations, str):
                 return "No Especificado", "No Especificado"
             
-            # Clean and normalize text
-            clean_text = self._clean_text(observations)
-            
-            # Extract client type
-            tipo_cliente = self._extract_client_type(clean_text)
-            
-            # Extract tax regime
-            regimen = self._extract_tax_regime(clean_text)
+            tipo_cliente, regimen = self._client_info_for_text(observations)
             
             self._logger.debug(f"Extracted - Type: {tipo_cliente}, Regime: {regimen}")
             
@@ -93,39 +162,34 @@ class ObservationExtractor:
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text for pattern matching."""
-        # Convert to lowercase and remove extra whitespace
-        clean = re.sub(r'\s+', ' ', text.lower().strip())
-        
-        # Remove special characters but keep spaces, letters, and numbers
-        clean = re.sub(r'[^\w\s\.\-]', ' ', clean)
-        
-        # Remove extra spaces again
-        clean = re.sub(r'\s+', ' ', clean).strip()
-        
-        return clean
+        # Lowercase, replace special characters (keep letters, numbers, '.', '-')
+        # and collapse whitespace
+        clean = self._SPECIAL_CHARS.sub(' ', text.lower())
+        return self._WHITESPACE.sub(' ', clean).strip()
+    
+    def _client_info_for_text(self, observations: str) -> Tuple[str, str]:
+        """Clean and normalize text, then classify it."""
+        return self._classify_client_text(self._clean_text(observations))
+    
+    def _classify_client_text(self, clean_text: str) -> Tuple[str, str]:
+        """Client type and tax regime for normalized text."""
+        return self._extract_client_type(clean_text), self._extract_tax_regime(clean_text)
     
     def _extract_client_type(self, text: str) -> str:
         """Extract client type from cleaned text."""
-        # Check for Persona Jurídica patterns
-        for pattern in self._persona_juridica_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "Persona Jurídica"
-        
-        # Check for Persona Natural patterns
-        for pattern in self._persona_natural_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "Persona Natural"
-        
-        return "No Especificado"
+        return self._first_match(self._client_type_matchers, text, "No Especificado")
     
     def _extract_tax_regime(self, text: str) -> str:
         """Extract tax regime from cleaned text."""
-        for regime, patterns in self._regimen_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return regime
-        
-        return "No Especificado"
+        return self._first_match(self._regimen_matchers, text, "No Especificado")
+    
+    def _classify_payment(self, clean_name: str) -> str:
+        """Payment category for a normalized payment name."""
+        return self._first_substring(self.PAYMENT_CATEGORIES, clean_name, "Otros")
+    
+    def _classify_product(self, clean_desc: str) -> str:
+        """Product category for a normalized description."""
+        return self._first_substring(self.PRODUCT_CATEGORIES, clean_desc, "General")
     
     def extract_payment_category(self, payment_name: str) -> str:
         """
@@ -141,24 +205,7 @@ class ObservationExtractor:
             if not payment_name or not isinstance(payment_name, str):
                 return "No Especificado"
             
-            clean_name = payment_name.lower().strip()
-            
-            # Payment category patterns
-            categories = {
-                "Efectivo": ["efectivo", "cash", "contado"],
-                "Tarjeta de Crédito": ["tarjeta", "credito", "credit", "visa", "mastercard"],
-                "Tarjeta de Débito": ["debito", "debit"],
-                "Transferencia": ["transferencia", "transfer", "bancaria", "pse"],
-                "Cheque": ["cheque", "check"],
-                "Consignación": ["consignacion", "deposito"]
-            }
-            
-            for category, patterns in categories.items():
-                for pattern in patterns:
-                    if pattern in clean_name:
-                        return category
-            
-            return "Otros"
+            return self._classify_payment(payment_name.lower().strip())
         
         except Exception as e:
             self._logger.error(f"Error extracting payment category: {e}")
@@ -178,25 +225,7 @@ class ObservationExtractor:
             if not description or not isinstance(description, str):
                 return "General"
             
-            clean_desc = description.lower().strip()
-            
-            # Product category patterns
-            categories = {
-                "Servicios": ["servicio", "service", "cuidado", "alojamiento", "consultoria"],
-                "Productos": ["producto", "articulo", "item", "mercancia"],
-                "Software": ["software", "licencia", "aplicacion", "sistema"],
-                "Salud": ["medico", "medicina", "salud", "hospital", "clinica"],
-                "Educación": ["educacion", "curso", "capacitacion", "entrenamiento"],
-                "Transporte": ["transporte", "flete", "envio", "logistica"],
-                "Alimentación": ["alimento", "comida", "restaurante", "catering"]
-            }
-            
-            for category, patterns in categories.items():
-                for pattern in patterns:
-                    if pattern in clean_desc:
-                        return category
-            
-            return "General"
+            return self._classify_product(description.lower().strip())
         
         except Exception as e:
             self._logger.error(f"Error extracting product category: {e}")
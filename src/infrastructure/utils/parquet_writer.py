@@ -0,0 +1,160 @@
+"""
+DataConta - Parquet Writer Utility
+Utility class for writing typed Parquet files for Business Intelligence exports.
+"""
+
+from datetime import date
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from src.application.ports.interfaces import Logger
+
+# pyarrow is optional: only needed when the BI export is requested in Parquet format
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+class ParquetWriter:
+    """
+    Utility class for writing star schema tables as Parquet files.
+
+    Unlike the CSV export, values keep their native types: amounts as float64,
+    dates as date32 and low-cardinality text as dictionary-encoded columns.
+    A table can be partitioned into one row group per month of a date column,
+    so readers filtering by period skip the rest of the file.
+
+    Column kinds: "string", "category", "float", "int", "date".
+    """
+
+    def __init__(self, logger: Logger, base_output_dir: str = "outputs/bi"):
+        """Initialize ParquetWriter with logger and base output directory."""
+        self._logger = logger
+        self._base_output_dir = Path(base_output_dir)
+        self._project_root = Path(__file__).parent.parent.parent.parent
+        self._full_output_dir = self._project_root / self._base_output_dir
+
+    @staticmethod
+    def is_available() -> bool:
+        """Whether pyarrow is installed."""
+        return PYARROW_AVAILABLE
+
+    def write_parquet_file(
+        self,
+        filename: str,
+        columns: Dict[str, str],
+        rows: List[Dict[str, Any]],
+        partition_by_month: Optional[str] = None
+    ) -> bool:
+        """
+        Write rows to a Parquet file in the BI output directory.
+
+        Args:
+            filename: Name of the Parquet file
+            columns: Ordered mapping of column name to column kind
+            rows: List of row data as dictionaries with raw (unformatted) values
+            partition_by_month: Optional date column used to write one row group per month
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not PYARROW_AVAILABLE:
+            self._logger.error(f"Cannot write {filename}: pyarrow is not installed (pip install pyarrow)")
+            return False
+
+        try:
+            self._full_output_dir.mkdir(parents=True, exist_ok=True)
+            file_path = self._full_output_dir / filename
+
+            if partition_by_month:
+                rows = sorted(rows, key=lambda row: str(row.get(partition_by_month) or ''))
+
+            table = pa.table({
+                name: self._build_array([row.get(name) for row in rows], kind)
+                for name, kind in columns.items()
+            })
+
+            with pq.ParquetWriter(str(file_path), table.schema, compression='snappy') as writer:
+                for offset, length in self._row_groups(rows, partition_by_month):
+                    writer.write_table(table.slice(offset, length), row_group_size=max(length, 1))
+
+            self._logger.info(f"BI Parquet file written successfully: {filename} ({len(rows)} rows)")
+            return True
+
+        except Exception as e:
+            self._logger.error(f"Error writing BI Parquet file {filename}: {e}")
+            return False
+
+    def write_multiple_parquets(self, parquet_data: Dict[str, Dict[str, Any]]) -> Dict[str, bool]:
+        """
+        Write multiple Parquet files in a single operation.
+
+        Args:
+            parquet_data: Dictionary where key is filename and value contains 'columns',
+                          'rows' and optionally 'partition_by_month'
+
+        Returns:
+            Dictionary with filename as key and success status as value
+        """
+        results = {}
+
+        for filename, data in parquet_data.items():
+            columns = data.get('columns', {})
+
+            if not columns:
+                self._logger.error(f"No columns provided for {filename}")
+                results[filename] = False
+                continue
+
+            results[filename] = self.write_parquet_file(
+                filename, columns, data.get('rows', []), data.get('partition_by_month')
+            )
+
+        return results
+
+    def get_output_directory(self) -> str:
+        """Get the full path to the BI output directory."""
+        return str(self._full_output_dir)
+
+    @staticmethod
+    def _row_groups(rows: List[Dict[str, Any]], partition_column: Optional[str]) -> List[tuple]:
+        """(offset, length) of each row group; rows must already be sorted by the partition column."""
+        if not partition_column or not rows:
+            return [(0, len(rows))]
+
+        groups = []
+        start = 0
+        current = str(rows[0].get(partition_column) or '')[:7]
+        for index in range(1, len(rows)):
+            month = str(rows[index].get(partition_column) or '')[:7]
+            if month != current:
+                groups.append((start, index - start))
+                start, current = index, month
+        groups.append((start, len(rows) - start))
+        return groups
+
+    @staticmethod
+    def _build_array(values: List[Any], kind: str):
+        """Typed Arrow array for a column kind."""
+        if kind == 'float':
+            return pa.array([float(v) if v is not None else None for v in values], type=pa.float64())
+        if kind == 'int':
+            return pa.array([int(v) if v is not None else None for v in values], type=pa.int32())
+        if kind == 'date':
+            return pa.array([ParquetWriter._parse_date(v) for v in values], type=pa.date32())
+        if kind == 'category':
+            return pa.array([str(v) if v is not None else None for v in values], type=pa.string()).dictionary_encode()
+        return pa.array([str(v) if v is not None else None for v in values], type=pa.string())
+
+    @staticmethod
+    def _parse_date(value: Any) -> Optional[date]:
+        """ISO date prefix as a date; invalid values become null."""
+        if isinstance(value, date):
+            return value
+        try:
+            return date.fromisoformat(str(value)[:10])
+        except (TypeError, ValueError):
+            return None
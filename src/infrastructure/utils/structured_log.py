@@ -0,0 +1,351 @@
+"""
+DataConta - Structured Log Utility
+Log estructurado en JSON lines con spans por operación y resumen de latencias.
+
+Cada operación instrumentada con ``span`` escribe al terminar un evento con
+id de operación, inicio, fin, duración, registros procesados y llamadas HTTP
+realizadas dentro de ella (incluidas las de spans hijos). Sin un sink
+configurado los spans solo miden y no escriben nada.
+
+Resumen de latencias p50/p95 por operación:
+    python -m src.infrastructure.utils.structured_log logs/
+"""
+
+import argparse
+import contextvars
+import functools
+import glob
+import json
+import math
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from src.infrastructure.utils.buffered_log_writer import BufferedLogWriter
+
+
+class JsonlSink:
+    """
+    Destino de eventos estructurados: un archivo JSONL por día.
+
+    Las líneas se escriben en segundo plano con BufferedLogWriter.
+    """
+
+    def __init__(self, log_directory: str = "logs", prefix: str = "dataconta_events",
+                 writer: Optional[BufferedLogWriter] = None):
+        """
+        Inicializar el sink.
+
+        Args:
+            log_directory: Directorio de los archivos JSONL
+            prefix: Prefijo del nombre de archivo (se agrega la fecha)
+            writer: Escritor compartido; por defecto uno propio
+        """
+        self._log_directory = Path(log_directory)
+        self._log_directory.mkdir(parents=True, exist_ok=True)
+        self._prefix = prefix
+        self._writer = writer or BufferedLogWriter()
+
+    def path_for(self, day: str) -> Path:
+        """Archivo JSONL del día 'YYYY-MM-DD'."""
+        return self._log_directory / f"{self._prefix}_{day}.jsonl"
+
+    def emit(self, event: Dict[str, Any]) -> None:
+        """Escribir un evento como una línea JSON."""
+        line = json.dumps(event, ensure_ascii=False, default=str) + "\n"
+        self._writer.write(f'jsonl:{self._prefix}', self.path_for(event['ts'][:10]), line)
+
+    def flush(self) -> None:
+        self._writer.flush()
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+_sink: Optional[JsonlSink] = None
+_current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar('dataconta_span', default=None)
+
+
+def configure_structured_log(log_directory: str = "logs", sink: Optional[JsonlSink] = None) -> JsonlSink:
+    """Activar el log estructurado para todo el proceso y devolver el sink."""
+    global _sink
+    _sink = sink or JsonlSink(log_directory)
+    return _sink
+
+
+def disable_structured_log() -> None:
+    """Desactivar el log estructurado (los spans siguen midiendo sin escribir)."""
+    global _sink
+    _sink = None
+
+
+def emit_event(event: str, **fields: Any) -> None:
+    """Escribir un evento suelto con la operación actual como contexto."""
+    if _sink is None:
+        return
+    parent = _current_span.get()
+    record = {'ts': datetime.now().isoformat(timespec='milliseconds'), 'event': event}
+    if parent is not None:
+        record['span_id'] = parent.span_id
+        record['trace_id'] = parent.trace_id
+    record.update(fields)
+    _sink.emit(record)
+
+
+class Span:
+    """Medición de una operación: duración, registros, llamadas HTTP y atributos."""
+
+    def __init__(self, operation: str, parent: Optional['Span'], attributes: Dict[str, Any]):
+        self.operation = operation
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent = parent
+        self.trace_id = parent.trace_id if parent is not None else self.span_id
+        self.attributes = attributes
+        self.records: Optional[int] = None
+        self.http_calls = 0
+        self.http_ms = 0.0
+        self.http_errors = 0
+        self.error: Optional[str] = None
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def set(self, **attributes: Any) -> None:
+        """Agregar o actualizar atributos del span."""
+        self.attributes.update(attributes)
+
+    def fail(self, error: str) -> None:
+        """Marcar la operación como fallida aunque no propague una excepción."""
+        self.error = error
+
+    def add_records(self, count: int) -> None:
+        """Sumar registros procesados por la operación."""
+        with self._lock:
+            self.records = (self.records or 0) + int(count)
+
+    def record_http_call(self, duration_s: float, status_code: Optional[int] = None) -> None:
+        """Contabilizar una llamada HTTP en este span y en sus ancestros."""
+        span = self
+        while span is not None:
+            with span._lock:
+                span.http_calls += 1
+                span.http_ms += duration_s * 1000
+                if status_code is None or status_code >= 400:
+                    span.http_errors += 1
+            span = span.parent
+
+    def to_event(self, status: str, error: Optional[str]) -> Dict[str, Any]:
+        if error is None and self.error is not None:
+            status, error = 'error', self.error
+        ended_at = datetime.now()
+        event = {
+            'ts': ended_at.isoformat(timespec='milliseconds'),
+            'event': 'span',
+            'operation': self.operation,
+            'span_id': self.span_id,
+            'parent_id': self.parent.span_id if self.parent is not None else None,
+            'trace_id': self.trace_id,
+            'start': self.started_at.isoformat(timespec='milliseconds'),
+            'end': ended_at.isoformat(timespec='milliseconds'),
+            'duration_ms': round((time.perf_counter() - self._start) * 1000, 3),
+            'status': status,
+            'records': self.records,
+            'http_calls': self.http_calls,
+            'http_ms': round(self.http_ms, 3),
+            'http_errors': self.http_errors,
+        }
+        if error is not None:
+            event['error'] = error
+        if self.attributes:
+            event['attributes'] = self.attributes
+        return event
+
+
+@contextmanager
+def span(operation: str, **attributes: Any) -> Iterator[Span]:
+    """
+    Medir una operación y escribir su evento al terminar.
+
+    Los spans abiertos dentro (en el mismo hilo, o en hilos lanzados con
+    ``run_in_context``) quedan como hijos.
+    """
+    current = Span(operation, _current_span.get(), attributes)
+    token = _current_span.set(current)
+    status, error = 'ok', None
+    try:
+        yield current
+    except BaseException as e:
+        status, error = 'error', f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current_span.reset(token)
+        if _sink is not None:
+            _sink.emit(current.to_event(status, error))
+
+
+def traced(operation: str, on_result: Optional[Callable[[Span, Any], None]] = None):
+    """
+    Decorador: ejecutar la función dentro de ``span(operation)``.
+
+    ``on_result(span, resultado)`` permite anotar el span con el valor
+    devuelto (registros, éxito) sin modificar la función.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(operation) as current:
+                result = fn(*args, **kwargs)
+                if on_result is not None:
+                    on_result(current, result)
+                return result
+        return wrapper
+    return decorator
+
+
+def current_span() -> Optional[Span]:
+    """Span de la operación en curso, si hay uno."""
+    return _current_span.get()
+
+
+def add_records(count: int, **attributes: Any) -> None:
+    """Sumar registros (y atributos) al span actual; sin span no hace nada."""
+    current = _current_span.get()
+    if current is not None:
+        current.add_records(count)
+        if attributes:
+            current.set(**attributes)
+
+
+def mark_span_error(error: str) -> None:
+    """Marcar como fallido el span actual cuando el error se maneja sin excepción."""
+    current = _current_span.get()
+    if current is not None:
+        current.fail(error)
+
+
+def run_in_context(fn):
+    """Envolver fn para que se ejecute en otro hilo con el span actual como padre."""
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.run(fn, *args, **kwargs)
+
+
+def record_http_response(response: Any, *args: Any, **kwargs: Any) -> Any:
+    """
+    Contabilizar una respuesta HTTP en el span actual.
+
+    Sirve también como hook de respuesta de requests
+    (``session.hooks['response'].append(record_http_response)``).
+    """
+    current = _current_span.get()
+    if current is not None:
+        # La medición nunca debe interrumpir la petición
+        try:
+            duration_s = float(response.elapsed.total_seconds())
+        except Exception:
+            duration_s = 0.0
+        status_code = getattr(response, 'status_code', None)
+        current.record_http_call(duration_s, status_code if isinstance(status_code, int) else None)
+    return response
+
+
+# ================================================================================================
+# RESUMEN DE LATENCIAS
+# ================================================================================================
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Percentil por rango más cercano sobre valores ordenados."""
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def read_events(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Eventos de los archivos JSONL (líneas inválidas se ignoran)."""
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def summarize_events(events: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Latencia p50/p95 por operación, con errores, registros y llamadas HTTP.
+
+    Usa los eventos 'span' y los eventos 'operation' que traen execution_time_s.
+    """
+    durations: Dict[str, List[float]] = {}
+    totals: Dict[str, Dict[str, Any]] = {}
+
+    for event in events:
+        if event.get('event') == 'span':
+            duration_ms = event.get('duration_ms')
+        elif event.get('event') == 'operation' and event.get('execution_time_s') is not None:
+            duration_ms = event['execution_time_s'] * 1000
+        else:
+            continue
+        if duration_ms is None or not event.get('operation'):
+            continue
+
+        operation = event['operation']
+        durations.setdefault(operation, []).append(float(duration_ms))
+        total = totals.setdefault(operation, {'errors': 0, 'records': 0, 'http_calls': 0})
+        if event.get('status') == 'error' or event.get('success') is False:
+            total['errors'] += 1
+        total['records'] += event.get('records') or event.get('records_count') or 0
+        total['http_calls'] += event.get('http_calls') or 0
+
+    summary = {}
+    for operation, values in durations.items():
+        values.sort()
+        summary[operation] = {
+            'count': len(values),
+            'p50_ms': _percentile(values, 0.50),
+            'p95_ms': _percentile(values, 0.95),
+            'max_ms': values[-1],
+            'total_ms': sum(values),
+            **totals[operation],
+        }
+    return summary
+
+
+def format_summary(summary: Dict[str, Dict[str, Any]]) -> str:
+    """Tabla de texto ordenada por tiempo total."""
+    header = (f"{'operación':<40} {'n':>6} {'p50 (ms)':>10} {'p95 (ms)':>10} {'máx (ms)':>10} "
+              f"{'errores':>8} {'registros':>10} {'HTTP':>6}")
+    rows = [header, '-' * len(header)]
+    for operation, stats in sorted(summary.items(), key=lambda item: -item[1]['total_ms']):
+        rows.append(
+            f"{operation:<40} {stats['count']:>6} {stats['p50_ms']:>10.1f} {stats['p95_ms']:>10.1f} "
+            f"{stats['max_ms']:>10.1f} {stats['errors']:>8} {stats['records']:>10} {stats['http_calls']:>6}"
+        )
+    return '\n'.join(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Resumen de latencias por operación desde los logs JSONL")
+    parser.add_argument('paths', nargs='*', default=['logs'],
+                        help='Archivos .jsonl o directorios que los contienen')
+    args = parser.parse_args()
+
+    files = []
+    for path in args.paths:
+        if os.path.isdir(path):
+            files += sorted(glob.glob(os.path.join(path, '*.jsonl')))
+        else:
+            files += sorted(glob.glob(path))
+
+    if not files:
+        print("No se encontraron archivos .jsonl")
+        return
+    print(format_summary(summarize_events(read_events(files))))
+
+
+if __name__ == '__main__':
+    main()
@@ -4,17 +4,22 @@ Controlador principal para DataConta FREE GUI siguiendo arquitectura hexagonal.
 Implementa interfaces del dominio y coordina la vista con los servicios.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
 from PySide6.QtWidgets import QMessageBox, QTableWidget
-from PySide6.QtCore import QObject, Signal as pyqtSignal, QDate
+from PySide6.QtCore import QObject, Signal as pyqtSignal, QDate, QTimer
 
 from src.domain.interfaces.ui_interfaces import UIMenuController, UIUserInteraction
 from src.domain.interfaces.ui_interfaces import UIFileOperations, UIDataPresentation
 from src.domain.entities.invoice import InvoiceFilter
-from src.application.services.kpi_service import KPIService, KPIData
-from src.application.services.export_service import ExportService, ExportResult
 from src.application.ports.interfaces import InvoiceRepository, Logger, FileStorage
+from src.infrastructure.utils.lazy_loading import resolve
+
+# Los servicios llegan inyectados (posiblemente como LazyService); importarlos
+# aquí cargaría pandas/openpyxl antes de mostrar la ventana
+if TYPE_CHECKING:
+    from src.application.services.kpi_service import KPIService, KPIData
+    from src.application.services.export_service import ExportService, ExportResult
 
 # Debug Tools - Agregado automáticamente
 try:
@@ -82,8 +87,8 @@ class FreeGUIController(QObject):
     estado_resultados_generated = pyqtSignal(str, str)  # file_path, summary
     
     def __init__(self, 
-                 kpi_service: KPIService, 
-                 export_service: ExportService,
+                 kpi_service: 'KPIService', 
+                 export_service: 'ExportService',
                  invoice_repository: InvoiceRepository,
                  logger: Logger,
                  file_storage: FileStorage):
@@ -98,18 +103,22 @@ class FreeGUIController(QObject):
         
         # Estado interno
         self._invoices_data = []
-        self._current_kpis: Optional[KPIData] = None
+        self._current_kpis: Optional['KPIData'] = None
         self._gui_reference = None  # Referencia a la ventana principal
         
+        # El repositorio Siigo (pandas, autenticación HTTP) se prepara con
+        # initialize_repository() cuando la ventana ya es visible
+        
+        self._logger.info("🎮 FreeGUIController inicializado")
+    
+    def initialize_repository(self) -> None:
+        """Configurar seguridad API y autenticar el repositorio (diferido al arrancar)."""
         # Configurar sistema de seguridad API
         self._setup_api_security()
         
-        # Cargar KPIs existentes automáticamente al inicializar
-        self._auto_load_existing_kpis()
-        
         # 🔧 DEBUG: Autenticar al inicializar
         print("🔌 ===== INICIALIZANDO CONTROLADOR =====")
-        print(f"📱 Invoice Repository: {type(self._invoice_repository).__name__}")
+        print(f"📱 Invoice Repository: {type(resolve(self._invoice_repository)).__name__}")
         
         # Intentar autenticación inmediata
         if hasattr(self._invoice_repository, 'authenticate'):
@@ -124,14 +133,16 @@ class FreeGUIController(QObject):
             
         print("✅ ===== CONTROLADOR INICIALIZADO =====")
         print()
-        
-        self._logger.info("🎮 FreeGUIController inicializado")
     
     def set_gui_reference(self, gui_instance):
         """Establecer referencia a la instancia de GUI para callbacks."""
         self._gui_reference = gui_instance
         self._logger.info("🖼️ Referencia GUI establecida")
     
+    def get_export_service(self) -> 'ExportService':
+        """Servicio de exportación compartido (p. ej. para exportaciones por períodos en widgets)."""
+        return self._export_service
+    
     # ==================== UIMenuController Implementation ====================
     
     def setup_menu_options(self, menu_sections: Dict[str, List]) -> None:
@@ -947,14 +958,18 @@ class FreeGUIController(QObject):
             self._logger.error(f"❌ Error refrescando KPIs: {e}")
             self.show_error_message(f"❌ Error calculando KPIs reales:\n{str(e)}")
     
-    def _auto_load_existing_kpis(self) -> None:
-        """Cargar KPIs existentes automáticamente al inicializar (sin mostrar mensajes)."""
+    def auto_load_existing_kpis(self) -> None:
+        """
+        Cargar KPIs existentes sin mostrar mensajes.
+        
+        La ventana lo solicita al construir el dashboard (que se crea después de
+        mostrarse), así kpis_calculated siempre tiene la señal ya conectada.
+        """
         try:
-            self._logger.info("🔄 Carga automática de KPIs existentes al inicializar")
+            self._logger.info("🔄 Carga automática de KPIs existentes")
             
-            # Usar QTimer para retrasar ligeramente y permitir que la UI se conecte
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(1000, self._perform_auto_kpi_load)
+            # Diferir al event loop para no bloquear la construcción del dashboard
+            QTimer.singleShot(0, self._perform_auto_kpi_load)
                 
         except Exception as e:
             self._logger.error(f"❌ Error en carga automática de KPIs: {e}")
@@ -1545,13 +1560,15 @@ class FreeGUIController(QObject):
             
             while len(facturas_encontradas) < max_facturas:
                 # Configurar filtro de página
+                # page_size fijo: cambiarlo entre páginas desplazaría los offsets del servidor
                 filtro.page = pagina_actual
-                filtro.page_size = min(facturas_por_pagina, max_facturas - len(facturas_encontradas))
+                filtro.page_size = facturas_por_pagina
                 
                 self._logger.info(f"📡 Consultando página {pagina_actual}, {filtro.page_size} registros")
                 
-                # Obtener facturas de esta página
-                facturas_pagina = self._invoice_repository.get_invoices(filtro)
+                # Obtener solo esta página (una petición HTTP por página)
+                resultado_pagina = self._invoice_repository.get_invoices_page(filtro)
+                facturas_pagina = resultado_pagina.invoices
                 
                 if not facturas_pagina:
                     self._logger.info(f"📄 Página {pagina_actual} vacía, finalizando búsqueda")
@@ -1568,8 +1585,8 @@ class FreeGUIController(QObject):
                 facturas_encontradas.extend(facturas_pagina)
                 self._logger.info(f"✅ Página {pagina_actual}: {len(facturas_pagina)} facturas, total: {len(facturas_encontradas)}")
                 
-                # Si obtuvimos menos facturas de las esperadas, no hay más páginas
-                if len(facturas_pagina) < filtro.page_size:
+                # Sin más páginas según los metadatos de paginación
+                if not resultado_pagina.has_next:
                     break
                     
                 pagina_actual += 1
@@ -1578,6 +1595,8 @@ class FreeGUIController(QObject):
                 if pagina_actual > 5:
                     break
             
+            facturas_encontradas = facturas_encontradas[:max_facturas]
+            
             # Convertir entidades Invoice a diccionarios para el widget
             facturas_formateadas = []
             for factura in facturas_encontradas:
@@ -1,16 +1,33 @@
 """
 Archivo __init__.py para el paquete de widgets especializados.
 Permite importaciones centralizadas de todos los widgets NO monolíticos.
+
+Los widgets se importan al pedirlos (``from src.presentation.widgets import
+DashboardWidget``): importar un submódulo liviano como tabs_widget no carga
+matplotlib/pandas del dashboard.
 """
 
-from .dashboard_widget import DashboardWidget
-from .export_widget import ExportWidget
-from .query_widget import QueryWidget
-from .demo_handler_widget import DemoHandlerWidget
+import importlib
+
+_WIDGET_MODULES = {
+    'DashboardWidget': '.dashboard_widget',
+    'ExportWidget': '.export_widget',
+    'QueryWidget': '.query_widget',
+    'DemoHandlerWidget': '.demo_handler_widget',
+}
+
+
+def __getattr__(name):
+    if name in _WIDGET_MODULES:
+        widget = getattr(importlib.import_module(_WIDGET_MODULES[name], __name__), name)
+        globals()[name] = widget
+        return widget
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'DashboardWidget',
-    'ExportWidget', 
+    'ExportWidget',
     'QueryWidget',
     'DemoHandlerWidget'
-]
\ No newline at end of file
+]
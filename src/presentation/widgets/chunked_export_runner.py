@@ -0,0 +1,204 @@
+"""
+Runner de exportaciones por períodos para los widgets de exportación.
+
+Ejecuta ExportService.start_chunked_export en un hilo de trabajo y reenvía
+progreso y resultado al hilo de la GUI mediante signals, con un diálogo de
+progreso cancelable. La UI nunca se bloquea mientras se descargan los meses.
+
+Principios SOLID aplicados:
+- SRP: Solo maneja la interacción de la exportación por períodos
+- DIP: Depende de ExportService y de una función de descarga inyectada
+"""
+
+import os
+from typing import Any, Callable, Dict, Optional
+
+from PySide6.QtCore import QObject, Qt, Signal
+from PySide6.QtWidgets import QMessageBox, QProgressDialog, QWidget
+
+from src.application.services.export_service import ChunkedExportJob, ExportService
+from src.infrastructure.utils.chunked_export import ChunkedExportResult, ChunkFetcher
+
+
+class ChunkedExportRunner(QObject):
+    """
+    Puente Qt para las exportaciones por períodos de ExportService.
+
+    Los callbacks del servicio llegan desde el hilo de trabajo y se emiten
+    como signals, que Qt entrega en el hilo de la GUI.
+    """
+
+    progress_changed = Signal(int, int, str)
+    export_finished = Signal(object)
+    export_failed = Signal(str)
+
+    def __init__(self, parent: QWidget, export_service: ExportService, log: Callable[[str], None]):
+        super().__init__(parent)
+        self._parent = parent
+        self._export_service = export_service
+        self._log = log
+        self._job: Optional[ChunkedExportJob] = None
+        self._dialog: Optional[QProgressDialog] = None
+        self._formato = 'csv'
+
+        self.progress_changed.connect(self._on_progress)
+        self.export_finished.connect(self._on_finished)
+        self.export_failed.connect(self._on_failed)
+
+    @property
+    def is_running(self) -> bool:
+        return self._job is not None and self._job.is_running
+
+    def start(self, fetch_chunk: ChunkFetcher, formato: str, fecha_inicio: str, fecha_fin: str,
+              filters: Dict[str, Any]) -> None:
+        """
+        Iniciar la exportación, ofreciendo reanudar una interrumpida con los mismos parámetros.
+
+        Args:
+            fetch_chunk: Descarga de un período (sin Qt: corre en hilos de trabajo)
+            formato: 'csv' o 'xlsx'
+            fecha_inicio: Fecha inicio YYYY-MM-DD
+            fecha_fin: Fecha fin YYYY-MM-DD
+            filters: Filtros de la descarga (identifican la exportación)
+        """
+        if self.is_running:
+            QMessageBox.information(self._parent, "Exportación en Curso",
+                                    "Ya hay una exportación por períodos en curso.")
+            return
+
+        resume = True
+        checkpoint = self._export_service.find_chunked_checkpoint(fecha_inicio, fecha_fin, formato, filters)
+        if checkpoint is not None:
+            reply = QMessageBox.question(
+                self._parent,
+                "Reanudar Exportación",
+                f"Hay una exportación interrumpida de este mismo rango "
+                f"({len(checkpoint['completed'])}/{len(checkpoint['chunks'])} períodos completados).\n\n"
+                f"¿Desea reanudarla desde el último período completado?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.Yes
+            )
+            resume = reply == QMessageBox.Yes
+
+        self._formato = formato
+        self._log(f"🚀 Iniciando exportación {formato.upper()} por chunks para rango amplio...")
+
+        self._dialog = QProgressDialog("Preparando períodos mensuales...", "Cancelar", 0, 0, self._parent)
+        self._dialog.setWindowTitle("Exportación por Períodos")
+        self._dialog.setWindowModality(Qt.NonModal)
+        self._dialog.setMinimumDuration(0)
+        self._dialog.canceled.connect(self.cancel)
+        self._dialog.show()
+
+        self._job = self._export_service.start_chunked_export(
+            fetch_chunk, fecha_inicio, fecha_fin, formato, filters, resume,
+            progress=self.progress_changed.emit,
+            on_finished=self._on_job_finished
+        )
+
+    def cancel(self) -> None:
+        """Cancelar la exportación en curso (los períodos completados quedan como checkpoint)."""
+        if self.is_running:
+            self._log("⏹️ Cancelando exportación: se terminan los períodos en descarga...")
+            self._job.cancel()
+            if self._dialog is not None:
+                self._dialog.setLabelText("Cancelando: terminando los períodos en descarga...")
+
+    def _on_job_finished(self, job: ChunkedExportJob) -> None:
+        """Fin del trabajo (hilo de trabajo): reenviar a la GUI."""
+        if job.error is not None:
+            self.export_failed.emit(str(job.error))
+        else:
+            self.export_finished.emit(job.result)
+
+    def _on_progress(self, completed: int, total: int, message: str) -> None:
+        self._log(f"🔄 {completed}/{total} - {message}")
+        if self._dialog is not None:
+            self._dialog.setMaximum(total)
+            self._dialog.setValue(completed)
+            self._dialog.setLabelText(f"{message}\n{completed} de {total} períodos")
+
+    def _close_dialog(self) -> None:
+        if self._dialog is not None:
+            self._dialog.canceled.disconnect(self.cancel)
+            self._dialog.close()
+            self._dialog = None
+
+    def _on_failed(self, error: str) -> None:
+        self._close_dialog()
+        label = "Excel" if self._formato == 'xlsx' else "CSV"
+        self._log(f"❌ Error en exportación {label} por chunks: {error}")
+        QMessageBox.critical(self._parent, "Error", f"Error en exportación {label} por chunks:\n{error}")
+
+    def _on_finished(self, result: ChunkedExportResult) -> None:
+        self._close_dialog()
+
+        if not result.completed:
+            self._show_interrupted(result)
+        elif not result.rows.get('encabezados'):
+            QMessageBox.information(
+                self._parent,
+                "Sin Resultados",
+                "No se encontraron facturas en ningún período del rango especificado."
+            )
+        elif self._formato == 'xlsx':
+            self._show_excel_success(result)
+        else:
+            self._show_csv_success(result)
+
+    def _show_interrupted(self, result: ChunkedExportResult) -> None:
+        """Informar una exportación cancelada o detenida por errores (queda checkpoint para reanudar)."""
+        avance = f"{result.chunks_completed} de {result.chunks_total} períodos"
+        if result.errors:
+            errores = "\n".join(f"• {error}" for error in result.errors[:5])
+            title, detail = "Exportación Interrumpida", f"La exportación se detuvo tras {avance}:\n\n{errores}"
+        else:
+            title, detail = "Exportación Cancelada", f"La exportación se canceló tras {avance}."
+        QMessageBox.warning(
+            self._parent,
+            title,
+            f"{detail}\n\n"
+            f"Los períodos completados quedaron guardados. Ejecute de nuevo la misma exportación "
+            f"para reanudarla desde el último período completado."
+        )
+
+    def _show_csv_success(self, result: ChunkedExportResult) -> None:
+        encabezados_file = result.output_files['encabezados']
+        detalle_file = result.output_files['detalle']
+        enc_size = os.path.getsize(encabezados_file) / 1024
+        det_size = os.path.getsize(detalle_file) / 1024 if os.path.exists(detalle_file) else 0
+
+        self._log(f"✅ CSVs generados: {os.path.basename(encabezados_file)} ({enc_size:.1f} KB), {os.path.basename(detalle_file)} ({det_size:.1f} KB)")
+
+        QMessageBox.information(
+            self._parent,
+            "✅ Exportación CSV Exitosa (Procesamiento por Chunks)",
+            f"Facturas de Siigo API exportadas a CSV:\n\n"
+            f"📊 Total encabezados: {result.rows['encabezados']} facturas\n"
+            f"📋 Total detalle: {result.rows['detalle']} items\n"
+            f"⏱️ Períodos procesados: {result.chunks_total}\n\n"
+            f"📁 Archivos generados:\n"
+            f"• {os.path.basename(encabezados_file)} ({enc_size:.1f} KB)\n"
+            f"• {os.path.basename(detalle_file)} ({det_size:.1f} KB)\n\n"
+            f"✅ Datos reales desde API Siigo\n"
+            f"🚀 Procesamiento optimizado para rangos amplios"
+        )
+
+    def _show_excel_success(self, result: ChunkedExportResult) -> None:
+        excel_file = result.output_files['excel']
+        excel_size = os.path.getsize(excel_file) / 1024
+
+        self._log(f"✅ Excel generado: {os.path.basename(excel_file)} ({excel_size:.1f} KB)")
+
+        QMessageBox.information(
+            self._parent,
+            "✅ Exportación Excel Exitosa (Procesamiento por Chunks)",
+            f"Facturas de Siigo API exportadas a Excel:\n\n"
+            f"📊 Total encabezados: {result.rows['encabezados']} facturas\n"
+            f"📋 Total detalle: {result.rows['detalle']} items\n"
+            f"⏱️ Períodos procesados: {result.chunks_total}\n\n"
+            f"📁 Archivo generado:\n"
+            f"• {os.path.basename(excel_file)} ({excel_size:.1f} KB)\n\n"
+            f"✅ Datos reales desde API Siigo\n"
+            f"🚀 Procesamiento optimizado para rangos amplios"
+        )
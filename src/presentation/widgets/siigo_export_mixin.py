@@ -0,0 +1,102 @@
+"""
+Mixin de exportación de facturas Siigo para los widgets de exportación.
+
+Concentra la descarga de facturas como DataFrames y el arranque de las
+exportaciones por períodos (ChunkedExportRunner + ExportService), que
+ExportarWidget y SiigoApiWidget comparten.
+
+Principios SOLID aplicados:
+- SRP: Solo conecta la UI con la descarga y la exportación por períodos
+- DIP: El ExportService se inyecta; el widget nunca construye uno propio
+"""
+
+from PySide6.QtWidgets import QMessageBox
+
+
+class SiigoExportMixin:
+    """
+    Mixin para widgets Qt que exportan facturas de Siigo.
+
+    El widget anfitrión debe definir log_message(str) e inyectar el
+    ExportService de la aplicación con set_export_service antes de una
+    exportación por períodos.
+    """
+
+    _export_service = None
+    _chunked_runner = None
+
+    def set_export_service(self, export_service):
+        """Inyectar el ExportService de la aplicación (motor de exportaciones por períodos)."""
+        self._export_service = export_service
+
+    def _get_export_service(self):
+        """ExportService inyectado; sin él la exportación por períodos no puede continuar."""
+        if self._export_service is None:
+            raise RuntimeError(
+                f"{type(self).__name__} no tiene ExportService; inyéctelo con set_export_service()"
+            )
+        return self._export_service
+
+    def _invoice_export_adapter(self):
+        """Adaptador de descarga de facturas Siigo como DataFrames (sin Qt)."""
+        from src.infrastructure.adapters.siigo_invoice_export_adapter import SiigoInvoiceExportAdapter
+        from src.infrastructure.adapters.console_logger import ConsoleLogger
+        return SiigoInvoiceExportAdapter(ConsoleLogger())
+
+    def download_invoices(self, fecha_inicio=None, fecha_fin=None, cliente_id=None,
+                          cc=None, nit=None, estado=None):
+        """
+        Descargar facturas desde la API de Siigo /v1/invoices con filtros opcionales.
+
+        Args:
+            fecha_inicio (str): Fecha de inicio en formato YYYY-MM-DD
+            fecha_fin (str): Fecha fin en formato YYYY-MM-DD
+            cliente_id (str): ID del cliente
+            cc (str): Cédula del cliente
+            nit (str): NIT del cliente
+            estado (str): Estado de la factura (abierta, cerrada, anulada)
+
+        Returns:
+            tuple: (encabezados_df, detalle_df) DataFrames de pandas con los datos,
+                   o (None, None) si hubo un error (ya informado al usuario)
+        """
+        from src.infrastructure.adapters.siigo_invoice_export_adapter import InvoiceDownloadError
+
+        try:
+            return self._invoice_export_adapter().fetch_invoice_frames(
+                fecha_inicio, fecha_fin, cliente_id, cc, nit, estado
+            )
+
+        except InvoiceDownloadError as e:
+            show = QMessageBox.warning if e.warning else QMessageBox.critical
+            show(self, e.title, e.detail)
+            return None, None
+
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error descargando facturas:\n{e}")
+            return None, None
+
+    def _start_chunked_export(self, formato, fecha_inicio, fecha_fin, cliente_id=None, cc=None, nit=None, estado=None):
+        """Exportar por períodos mensuales en segundo plano con ExportService (la UI no se bloquea)."""
+        try:
+            if self._chunked_runner is None:
+                from src.presentation.widgets.chunked_export_runner import ChunkedExportRunner
+                self._chunked_runner = ChunkedExportRunner(self, self._get_export_service(), self.log_message)
+
+            fetch_chunk = self._invoice_export_adapter().chunk_fetcher(cliente_id, cc, nit, estado)
+            filters = {'cliente_id': cliente_id, 'cc': cc, 'nit': nit, 'estado': estado}
+            self._chunked_runner.start(fetch_chunk, formato, fecha_inicio, fecha_fin, filters)
+
+        except Exception as e:
+            self.log_message(f"❌ Error iniciando exportación por chunks: {e}")
+            QMessageBox.critical(self, "Error", f"Error iniciando exportación por chunks:\n{e}")
+
+    def export_siigo_invoices_to_csv_chunked(self, fecha_inicio=None, fecha_fin=None,
+                                             cliente_id=None, cc=None, nit=None, estado=None):
+        """Exportar facturas a CSV procesando en chunks para rangos grandes."""
+        self._start_chunked_export('csv', fecha_inicio, fecha_fin, cliente_id, cc, nit, estado)
+
+    def export_siigo_invoices_to_excel_chunked(self, fecha_inicio=None, fecha_fin=None,
+                                               cliente_id=None, cc=None, nit=None, estado=None):
+        """Exportar facturas a Excel procesando en chunks para rangos grandes."""
+        self._start_chunked_export('xlsx', fecha_inicio, fecha_fin, cliente_id, cc, nit, estado)
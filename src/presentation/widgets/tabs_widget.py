@@ -3,22 +3,30 @@ Tabs Widget - Componente UI especializado para navegación con tabs
 Parte de la refactorización del monolito dataconta_free_gui_refactored.py
 
 Responsabilidad única: UI de navegación con tabs y estilo FREE
+
+Las tabs pesadas (Dashboard con matplotlib/pandas, Exportar y Reportes) se
+importan y construyen en su primer uso: al seleccionarlas o, la tab inicial,
+con build_current_tab() una vez visible la ventana. Cada widget creado se
+anuncia con la señal tab_widget_created para conectar sus señales.
 """
 
-from typing import Optional
+from typing import Callable, Dict, Optional, TYPE_CHECKING
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QTabWidget, QScrollArea, QFrame
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal
 
-# Imports de widgets especializados
-from src.presentation.widgets.dashboard_widget import DashboardWidget
+# Widgets livianos (solo PySide6): se construyen al crear las tabs
 from src.presentation.widgets.query_widget import QueryWidget
-from src.presentation.widgets.exportar_widget import ExportarWidget
-from src.presentation.widgets.reportes_widget import ReportesWidget
 from src.presentation.widgets.ayuda_widget import AyudaWidget
 from src.presentation.widgets.upgrade_widget import UpgradeWidget
 
+# Widgets pesados: se importan en los métodos _create_* al abrir su tab
+if TYPE_CHECKING:
+    from src.presentation.widgets.dashboard_widget import DashboardWidget
+    from src.presentation.widgets.exportar_widget import ExportarWidget
+    from src.presentation.widgets.reportes_widget import ReportesWidget
+
 
 class TabsWidget(QWidget):
     """
@@ -32,16 +40,23 @@ class TabsWidget(QWidget):
     - DIP: Depende de abstracciones (widgets especializados)
     """
     
+    # Emitida al construir una tab diferida: (clave, widget)
+    tab_widget_created = Signal(str, QWidget)
+    
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
         # Referencias a widgets especializados
-        self.dashboard_widget: Optional[DashboardWidget] = None
+        self.dashboard_widget: Optional['DashboardWidget'] = None
         self.query_widget: Optional[QueryWidget] = None
-        self.exportar_widget: Optional[ExportarWidget] = None
-        self.reportes_widget: Optional[ReportesWidget] = None
+        self.exportar_widget: Optional['ExportarWidget'] = None
+        self.reportes_widget: Optional['ReportesWidget'] = None
         self.upgrade_widget: Optional[UpgradeWidget] = None
         
+        # Tabs diferidas pendientes de construir: índice -> (clave, creador del widget)
+        self._tab_widget: Optional[QTabWidget] = None
+        self._lazy_tabs: Dict[int, tuple] = {}
+        
         self.init_ui()
     
     def init_ui(self):
@@ -75,22 +90,20 @@ class TabsWidget(QWidget):
                 color: white;
             }
         """)
+        self._tab_widget = tab_widget
         
-        # Tab 1: Dashboard FREE con KPIs básicos
-        dashboard_tab = self._create_dashboard_free()
-        tab_widget.addTab(dashboard_tab, "📊 Dashboard FREE")
+        # Tab 1: Dashboard FREE con KPIs básicos (diferida)
+        self._add_lazy_tab(tab_widget, "dashboard", "📊 Dashboard FREE", self._create_dashboard_free)
         
         # Tab 2: Consulta de facturas
         queries_tab = self._create_queries_free()
         tab_widget.addTab(queries_tab, "🔍 Consultar Facturas")
         
-        # Tab 3: Exportar facturas desde API Siigo  
-        exportar_tab = self._create_exportar_tab()
-        tab_widget.addTab(exportar_tab, "📤 Exportar")
+        # Tab 3: Exportar facturas desde API Siigo (diferida)
+        self._add_lazy_tab(tab_widget, "exportar", "📤 Exportar", self._create_exportar_tab)
         
-        # Tab 4: Reportes financieros
-        reportes_tab = self._create_reportes_tab()
-        tab_widget.addTab(reportes_tab, "📊 Reportes")
+        # Tab 4: Reportes financieros (diferida)
+        self._add_lazy_tab(tab_widget, "reportes", "📊 Reportes", self._create_reportes_tab)
         
         # Tab 5: Ayuda y soporte
         ayuda_tab = self._create_ayuda_tab()
@@ -100,72 +113,84 @@ class TabsWidget(QWidget):
         pro_tab = self._create_pro_preview_tab()
         tab_widget.addTab(pro_tab, "⭐ Funciones PRO")
         
+        tab_widget.currentChanged.connect(self._build_tab)
         return tab_widget
     
+    # ==================== Construcción diferida de tabs ====================
+    
+    def _add_lazy_tab(self, tab_widget: QTabWidget, key: str, title: str,
+                      create: Callable[[], QWidget]) -> None:
+        """Agregar una tab vacía cuyo widget se crea la primera vez que se muestra."""
+        index = tab_widget.addTab(self._create_scroll_area(), title)
+        self._lazy_tabs[index] = (key, create)
+    
+    def _build_tab(self, index: int) -> None:
+        """Construir el widget de una tab diferida (sin efecto si ya existe)."""
+        if index not in self._lazy_tabs:
+            return
+        key, create = self._lazy_tabs.pop(index)
+        widget = create()
+        self._tab_widget.widget(index).setWidget(widget)
+        self.tab_widget_created.emit(key, widget)
+    
+    def build_current_tab(self) -> None:
+        """Construir la tab visible; llamar una vez mostrada la ventana."""
+        if self._tab_widget is not None:
+            self._build_tab(self._tab_widget.currentIndex())
+    
+    def _create_scroll_area(self, widget: Optional[QWidget] = None) -> QScrollArea:
+        """Scroll area sin marco que contiene el widget de una tab."""
+        scroll_area = QScrollArea()
+        if widget is not None:
+            scroll_area.setWidget(widget)
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setFrameShape(QFrame.NoFrame)
+        return scroll_area
+    
     def _create_dashboard_free(self) -> QWidget:
-        """Crear tab de dashboard FREE."""
+        """Crear widget de dashboard FREE."""
+        from src.presentation.widgets.dashboard_widget import DashboardWidget
         self.dashboard_widget = DashboardWidget()
-        dashboard_scroll = QScrollArea()
-        dashboard_scroll.setWidget(self.dashboard_widget)
-        dashboard_scroll.setWidgetResizable(True)
-        dashboard_scroll.setFrameShape(QFrame.NoFrame)
-        return dashboard_scroll
+        return self.dashboard_widget
     
     def _create_queries_free(self) -> QWidget:
         """Crear tab de consultas FREE."""
         self.query_widget = QueryWidget()
-        query_scroll = QScrollArea()
-        query_scroll.setWidget(self.query_widget)
-        query_scroll.setWidgetResizable(True)
-        query_scroll.setFrameShape(QFrame.NoFrame)
-        return query_scroll
+        return self._create_scroll_area(self.query_widget)
     
     def _create_exportar_tab(self) -> QWidget:
-        """Crear tab de exportar facturas."""
+        """Crear widget de exportar facturas."""
+        from src.presentation.widgets.exportar_widget import ExportarWidget
         self.exportar_widget = ExportarWidget()
-        exportar_scroll = QScrollArea()
-        exportar_scroll.setWidget(self.exportar_widget)
-        exportar_scroll.setWidgetResizable(True)
-        exportar_scroll.setFrameShape(QFrame.NoFrame)
-        return exportar_scroll
+        return self.exportar_widget
     
     def _create_reportes_tab(self) -> QWidget:
-        """Crear tab de reportes financieros."""
+        """Crear widget de reportes financieros."""
+        from src.presentation.widgets.reportes_widget import ReportesWidget
         self.reportes_widget = ReportesWidget()
-        reportes_scroll = QScrollArea()
-        reportes_scroll.setWidget(self.reportes_widget)
-        reportes_scroll.setWidgetResizable(True)
-        reportes_scroll.setFrameShape(QFrame.NoFrame)
-        return reportes_scroll
+        return self.reportes_widget
     
     def _create_ayuda_tab(self) -> QWidget:
         """Crear tab de ayuda con submenús usando AyudaWidget especializado."""
         self.ayuda_widget = AyudaWidget()
-        
-        # Crear scroll area
-        scroll_area = QScrollArea()
-        scroll_area.setWidget(self.ayuda_widget)
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameShape(QFrame.NoFrame)
-        
-        return scroll_area
+        return self._create_scroll_area(self.ayuda_widget)
     
     # ==================== Getters para acceder a widgets especializados ====================
     
-    def get_dashboard_widget(self) -> Optional[DashboardWidget]:
-        """Obtener referencia al dashboard widget."""
+    def get_dashboard_widget(self) -> Optional['DashboardWidget']:
+        """Obtener referencia al dashboard widget (None hasta abrir su tab)."""
         return self.dashboard_widget
     
     def get_query_widget(self) -> Optional[QueryWidget]:
         """Obtener referencia al query widget."""
         return self.query_widget
     
-    def get_exportar_widget(self) -> Optional[ExportarWidget]:
-        """Obtener referencia al exportar widget."""
+    def get_exportar_widget(self) -> Optional['ExportarWidget']:
+        """Obtener referencia al exportar widget (None hasta abrir su tab)."""
         return self.exportar_widget
     
-    def get_reportes_widget(self) -> Optional[ReportesWidget]:
-        """Obtener referencia al reportes widget."""
+    def get_reportes_widget(self) -> Optional['ReportesWidget']:
+        """Obtener referencia al reportes widget (None hasta abrir su tab)."""
         return self.reportes_widget
     
     def get_ayuda_widget(self) -> Optional[AyudaWidget]:
@@ -181,12 +206,5 @@ class TabsWidget(QWidget):
     def _create_pro_preview_tab(self) -> QWidget:
         """Crear tab de funciones PRO usando UpgradeWidget especializado."""
         self.upgrade_widget = UpgradeWidget()
-        
-        # Crear scroll area para el widget de upgrade
-        scroll_area = QScrollArea()
-        scroll_area.setWidget(self.upgrade_widget)
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameShape(QFrame.NoFrame)
-        
-        return scroll_area
+        return self._create_scroll_area(self.upgrade_widget)
     
@@ -0,0 +1,73 @@
+"""
+Test unitario para BasicStatisticsService.
+Valida las estadísticas calculadas sobre la representación columnar de las facturas.
+"""
+
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+
+from src.application.services.BasicStatisticsService import BasicStatisticsService
+from src.domain.entities.invoice import Invoice, Customer, InvoiceItem, Payment
+
+
+def _invoice(number: int, date=None, customer=None, total=None, items=(), payment_ids=(), seller=None) -> Invoice:
+    """Factura mínima para el cálculo de estadísticas."""
+    return Invoice(
+        id=str(number),
+        document_id="FV",
+        number=number,
+        name=f"FV-{number}",
+        date=date,
+        customer=Customer(identification=customer) if customer else None,
+        items=[InvoiceItem(code="P1", description="Producto", quantity=Decimal("1"), price=Decimal(price))
+               for price in items],
+        payments=[Payment(id=payment_id, value=Decimal("1"), due_date=None) for payment_id in payment_ids],
+        seller=seller,
+        total=Decimal(total) if total is not None else None
+    )
+
+
+class TestBasicStatisticsService(unittest.TestCase):
+    """Test suite for BasicStatisticsService."""
+
+    def setUp(self):
+        self.service = BasicStatisticsService(Mock(), Mock())
+
+    def test_statistics_from_columns(self):
+        """Totales, únicos, distribución mensual y rangos en una sola representación columnar."""
+        invoices = [
+            _invoice(1, datetime(2024, 3, 5), "900", total="100.50", payment_ids=[5], seller=7),
+            _invoice(2, datetime(2024, 1, 9), "901", items=["40", "60"], payment_ids=[6, 0], seller=7),
+            _invoice(3, datetime(2024, 3, 20), "900", total="300", payment_ids=[6], seller=8),
+            _invoice(4, None, None, payment_ids=[5, 6]),
+        ]
+
+        statistics = self.service._calculate_statistics(invoices)
+
+        self.assertEqual(statistics["total_invoices"], 4)
+        self.assertEqual(statistics["total_amount"], 500.5)
+        self.assertEqual(statistics["unique_customers"], 2)
+        self.assertEqual(statistics["unique_sellers"], 2)
+        self.assertEqual(statistics["total_items"], 2)
+        self.assertEqual(statistics["average_invoice_amount"], 125.12)
+        self.assertEqual(statistics["top_payment_methods"], {6: 3, 5: 2, "Unknown": 1})
+        self.assertEqual(list(statistics["top_payment_methods"]), [6, 5, "Unknown"])
+        self.assertEqual(statistics["monthly_distribution"], {
+            "2024-03": {"count": 2, "amount": 400.5},
+            "2024-01": {"count": 1, "amount": 100.0}
+        })
+        self.assertEqual(statistics["amount_range"], {"min": 0.0, "max": 300.0})
+
+    def test_monthly_distribution_limited_to_six_months(self):
+        """La distribución mensual conserva los primeros seis meses encontrados."""
+        invoices = [_invoice(month, datetime(2024, month, 1), "900", total="10") for month in range(12, 0, -1)]
+
+        monthly = self.service._calculate_statistics(invoices)["monthly_distribution"]
+
+        self.assertEqual(list(monthly), ["2024-12", "2024-11", "2024-10", "2024-09", "2024-08", "2024-07"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+"""
+Test unitario para BIExportService.
+Valida que la exportación en streaming genere el mismo esquema estrella que la exportación en memoria.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.application.services.BIExportService import BIExportService
+from src.infrastructure.utils.csv_writer import CSVWriter
+from src.infrastructure.utils.parquet_writer import ParquetWriter, PYARROW_AVAILABLE
+
+
+def _invoice(invoice_id: int, customer_id: int, product_codes) -> dict:
+    """Factura en el formato de diccionario que produce ExportToBIUseCase."""
+    return {
+        "id": f"inv-{invoice_id}",
+        "date": "2024-03-%02d" % (invoice_id % 28 + 1),
+        "customer": {"id": customer_id, "identification": f"900{customer_id}", "name": f"Cliente {customer_id}"},
+        "seller": {"id": 1, "name": "Vendedor"},
+        "items": [
+            {"code": code, "description": f"Producto {code}", "quantity": 2, "price": 100, "discount": 0, "total": 200}
+            for code in product_codes
+        ],
+        "payments": [{"id": 5, "name": "Efectivo", "value": 200 * len(product_codes)}],
+        "totals": {"subtotal": 200 * len(product_codes), "discount": 0, "taxes": 0, "total": 200 * len(product_codes)},
+        "status": "Open",
+        "observations": ""
+    }
+
+
+class TestBIExportServiceStreaming(unittest.TestCase):
+    """Test suite for the streaming BI export."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.invoices = [_invoice(i, i % 3, ["P1", f"P{i % 4}"]) for i in range(10)]
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _service(self, subdir: str, license_manager=None) -> BIExportService:
+        service = BIExportService(Mock(), license_manager)
+        service._csv_writer = CSVWriter(Mock(), str(Path(self._tmp.name) / subdir))
+        return service
+
+    def _read(self, subdir: str, filename: str) -> str:
+        return (Path(self._tmp.name) / subdir / filename).read_text(encoding="utf-8")
+
+    def test_streaming_matches_in_memory_export(self):
+        """Ambos modos escriben los mismos archivos con el mismo contenido."""
+        memory = self._service("memory")
+        memory.process_invoices_for_bi(self.invoices)
+        memory.export_to_csv_files()
+
+        streaming = self._service("stream")
+        stats = streaming.export_invoices_streaming(iter(self.invoices))
+
+        self.assertEqual(stats["processed_invoices"], 10)
+        self.assertEqual(stats["total_facts"], 20)
+        self.assertEqual(stats["unique_clients"], 3)
+        self.assertTrue(all(stats["files_created"].values()))
+        self.assertEqual(len(stats["files_created"]), 6)
+        for filename in stats["files_created"]:
+            self.assertEqual(self._read("stream", filename), self._read("memory", filename), filename)
+
+        self.assertEqual(streaming._facts, [])
+        self.assertEqual(streaming.get_export_statistics()["facts_count"], 20)
+        self.assertTrue(streaming.validate_star_schema()["valid"])
+
+    def test_streaming_stops_at_license_limit(self):
+        """El límite BI de la licencia se aplica sobre el conteo acumulado."""
+        license_manager = Mock()
+        license_manager.can_export_bi.return_value = True
+        license_manager.get_max_invoices_for_bi.return_value = 4
+
+        consumed = []
+
+        def invoices():
+            for invoice in self.invoices:
+                consumed.append(invoice["id"])
+                yield invoice
+
+        stats = self._service("limited", license_manager).export_invoices_streaming(invoices())
+
+        self.assertEqual(stats["processed_invoices"], 4)
+        self.assertTrue(stats["limit_reached"])
+        self.assertEqual(len(consumed), 5)
+        fact_lines = self._read("limited", "fact_invoices.csv").strip().splitlines()
+        self.assertEqual(len(fact_lines), 1 + 8)
+
+
+class TestBIExportServiceParallel(unittest.TestCase):
+    """Test suite for process-pool BI processing."""
+
+    def test_parallel_processing_matches_sequential(self):
+        """Los fragmentos de cada proceso se combinan en el mismo orden que el recorrido secuencial."""
+        invoices = [_invoice(i, i % 5, [f"P{i % 7}", "P1"]) for i in range(40)]
+        invoices[7]["totals"] = {"total": "no-numérico"}
+
+        sequential = BIExportService(Mock())
+        sequential_stats = sequential.process_invoices_for_bi(invoices)
+
+        logger = Mock()
+        parallel = BIExportService(logger)
+        parallel_stats = parallel.process_invoices_for_bi(invoices, max_workers=2, chunk_size=6)
+
+        self.assertEqual(parallel_stats, sequential_stats)
+        self.assertEqual(parallel_stats["error_invoices"], 1)
+        self.assertEqual(parallel._facts, sequential._facts)
+        for name in BIExportService.DIMENSION_FILES:
+            self.assertEqual(list(parallel._dimensions[name].items()), list(sequential._dimensions[name].items()))
+        self.assertTrue(any("inv-7" in call.args[0] for call in logger.error.call_args_list))
+
+
+class TestBIExportServiceSplitLayout(unittest.TestCase):
+    """Test suite for the split fact layout."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.service = BIExportService(Mock(), fact_layout=BIExportService.FACT_LAYOUT_SPLIT)
+        self.service._csv_writer = CSVWriter(Mock(), self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_split_layout_avoids_item_payment_product(self):
+        """Una factura con 3 items y 2 pagos genera 1 encabezado, 3 líneas y 2 pagos en lugar de 6 hechos."""
+        invoice = _invoice(1, 1, ["P1", "P2", "P3"])
+        invoice["payments"] = [{"id": 5, "name": "Efectivo", "value": 400}, {"id": 6, "name": "Tarjeta", "value": 200}]
+
+        stats = self.service.process_invoices_for_bi([invoice])
+        results = self.service.export_to_csv_files()
+
+        self.assertEqual(stats["total_facts"], 6)
+        self.assertEqual(stats["fact_rows"], {
+            "fact_invoice_headers.csv": 1, "fact_invoice_lines.csv": 3, "fact_invoice_payments.csv": 2
+        })
+        self.assertNotIn("fact_invoices.csv", results)
+        self.assertTrue(all(results.values()))
+        payments = (Path(self._tmp.name) / "fact_invoice_payments.csv").read_text(encoding="utf-8").splitlines()
+        self.assertEqual(payments[1], "inv-1,2024-03-02,1,5,\"400,00\"")
+        self.assertTrue(self.service.validate_star_schema()["valid"])
+
+    def test_unknown_layout_rejected(self):
+        """Un layout desconocido se rechaza."""
+        with self.assertRaises(ValueError):
+            BIExportService(Mock(), fact_layout="bridge")
+
+
+@unittest.skipUnless(PYARROW_AVAILABLE, "pyarrow no instalado")
+class TestBIExportServiceParquet(unittest.TestCase):
+    """Test suite for the Parquet BI export."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.service = BIExportService(Mock())
+        self.service._parquet_writer = ParquetWriter(Mock(), self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_parquet_keeps_native_types_and_month_row_groups(self):
+        """Montos numéricos, fechas tipadas, categorías codificadas y un row group por mes."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        invoices = [_invoice(i, i % 3, ["P1"]) for i in range(3)]
+        invoices.append(dict(_invoice(9, 1, ["P2"]), date="2024-01-20"))
+        self.service.process_invoices_for_bi(invoices)
+
+        results = self.service.export_to_parquet_files()
+
+        self.assertEqual(len(results), 6)
+        self.assertTrue(all(results.values()))
+        facts_file = pq.ParquetFile(str(Path(self._tmp.name) / "fact_invoices.parquet"))
+        self.assertEqual(facts_file.metadata.num_row_groups, 2)
+
+        facts = facts_file.read()
+        self.assertEqual(facts.schema.field("total").type, pa.float64())
+        self.assertEqual(facts.schema.field("fecha").type, pa.date32())
+        self.assertTrue(pa.types.is_dictionary(facts.schema.field("estado").type))
+        self.assertEqual(facts.column("fecha")[0].as_py().month, 1)
+        self.assertEqual(facts.column("producto_total").to_pylist(), [200.0] * 4)
+
+        dates = pq.read_table(str(Path(self._tmp.name) / "dim_dates.parquet"))
+        self.assertEqual(dates.schema.field("año").type, pa.int32())
+
+
+if __name__ == '__main__':
+    unittest.main()
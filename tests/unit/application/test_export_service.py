@@ -0,0 +1,99 @@
+"""
+Test unitario para ExportService.
+Valida la exportación por períodos en segundo plano: progreso, cancelación y Excel.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock
+
+import pandas as pd
+
+from src.application.services.export_service import ExportService
+
+
+def fetch_month(fecha_inicio, fecha_fin):
+    """Dos facturas con un item cada una por período."""
+    ids = [f"{fecha_inicio[:7]}-1", f"{fecha_inicio[:7]}-2"]
+    return {
+        'encabezados': pd.DataFrame({'factura_id': ids, 'total': [10.0, 20.0]}),
+        'detalle': pd.DataFrame({'factura_id': ids, 'cantidad': [1.0, 2.0]}),
+    }
+
+
+class TestExportServiceChunked(unittest.TestCase):
+    """Test suite for ExportService chunked exports."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.service = ExportService(Mock(), Mock(), Mock())
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_is_date_range_too_large(self):
+        """Más de 90 días se exporta por períodos; fechas inválidas no."""
+        self.assertTrue(ExportService.is_date_range_too_large("2024-01-01", "2024-06-30"))
+        self.assertFalse(ExportService.is_date_range_too_large("2024-01-01", "2024-03-01"))
+        self.assertFalse(ExportService.is_date_range_too_large("", "2024-03-01"))
+
+    def test_background_excel_export_reports_progress(self):
+        """El trabajo corre en otro hilo, informa progreso y deja un Excel con ambas hojas."""
+        progress = []
+        job = self.service.start_chunked_export(
+            fetch_month, "2024-01-01", "2024-04-30", formato='xlsx',
+            progress=lambda completed, total, message: progress.append((completed, total)),
+            output_dir=self.tmp.name
+        )
+        result = job.wait(timeout=30)
+
+        self.assertIsNone(job.error)
+        self.assertTrue(result.completed)
+        self.assertEqual(progress[0], (0, 4))
+        self.assertEqual(progress[-1], (4, 4))
+        excel_file = result.output_files['excel']
+        self.assertEqual(len(pd.read_excel(excel_file, sheet_name='Encabezados')), 8)
+        self.assertEqual(len(pd.read_excel(excel_file, sheet_name='Detalle')), 8)
+        self.assertEqual(os.listdir(os.path.join(self.tmp.name, "checkpoints")), [])
+
+    def test_cancelled_export_can_be_resumed(self):
+        """Cancelar deja checkpoint; la misma exportación continúa desde ahí."""
+        first_month_done = threading.Event()
+        filters = {'nit': '900123456'}
+
+        def fetch_then_cancel(fecha_inicio, fecha_fin):
+            if fecha_inicio != "2024-01-01":
+                self.assertTrue(first_month_done.wait(timeout=5))
+            return fetch_month(fecha_inicio, fecha_fin)
+
+        def progress(completed, total, message):
+            if completed == 1:
+                job.cancel()
+                first_month_done.set()
+
+        job = self.service.start_chunked_export(
+            fetch_then_cancel, "2024-01-01", "2024-06-30", filters=filters,
+            progress=progress, output_dir=self.tmp.name
+        )
+        cancelled = job.wait(timeout=30)
+
+        self.assertTrue(cancelled.cancelled)
+        self.assertFalse(cancelled.completed)
+        self.assertLess(cancelled.chunks_completed, 6)
+        checkpoint = self.service.find_chunked_checkpoint("2024-01-01", "2024-06-30", 'csv', filters, self.tmp.name)
+        self.assertEqual(len(checkpoint['completed']), cancelled.chunks_completed)
+
+        result = self.service.export_invoices_chunked(
+            fetch_month, "2024-01-01", "2024-06-30", filters=filters, output_dir=self.tmp.name
+        )
+
+        self.assertTrue(result.completed and result.resumed)
+        encabezados = pd.read_csv(result.output_files['encabezados'])
+        self.assertEqual(len(encabezados), 12)
+        self.assertEqual(encabezados['factura_id'].iloc[-1], "2024-06-2")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,8 @@ Test unitario para KPIApplicationService.
 Valida la orquestación correcta sin lógica de negocio propia.
 """
 
+import os
+import tempfile
 import unittest
 import pandas as pd
 from datetime import datetime
@@ -10,6 +12,7 @@ from decimal import Decimal
 from unittest.mock import Mock, patch
 
 from src.application.services.kpi_service import KPIApplicationService
+from src.domain.services.kpi_service import KPICalculationServiceImpl
 from src.domain.entities.kpis import KPIsVentas, VentaPorCliente
 
 
@@ -143,5 +146,66 @@ class TestKPIApplicationService(unittest.TestCase):
             KPIApplicationService()
 
 
+class TestKPIApplicationServiceParcialesMensuales(unittest.TestCase):
+    """Tests del recálculo incremental con parciales por mes."""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.partials_path = os.path.join(self._tmp.name, 'parciales.json')
+        self.calculation_service = KPICalculationServiceImpl()
+        self.facturas = pd.DataFrame([
+            {'factura_id': 'A', 'fecha': '2024-01-10', 'total': 100.0, 'cliente_nit': '1', 'cliente_nombre': 'Uno'},
+            {'factura_id': 'B', 'fecha': '2024-02-10', 'total': 200.0, 'cliente_nit': '2', 'cliente_nombre': 'Dos'},
+            {'factura_id': 'C', 'fecha': '2024-03-10', 'total': 300.0, 'cliente_nit': '1', 'cliente_nombre': 'Uno'},
+        ])
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def _service(self, logger):
+        return KPIApplicationService(
+            invoice_repository=Mock(),
+            file_storage=Mock(),
+            kpi_calculation_service=self.calculation_service,
+            kpi_analysis_service=Mock(),
+            logger=logger,
+            partials_path=self.partials_path
+        )
+    
+    def test_solo_se_recalculan_meses_modificados(self):
+        """Una factura nueva en marzo recalcula solo marzo; los parciales persisten entre instancias."""
+        logger = Mock()
+        service = self._service(logger)
+        service._calcular_kpis_ventas(self.facturas, datetime(2024, 1, 1), datetime(2024, 12, 31))
+        logger.info.assert_called_with("📊 Parciales KPI: 3 de 3 meses recalculados")
+        
+        nuevas = pd.concat([self.facturas, pd.DataFrame([
+            {'factura_id': 'D', 'fecha': '2024-03-20', 'total': 50.0, 'cliente_nit': '2', 'cliente_nombre': 'Dos'}
+        ])], ignore_index=True)
+        
+        with patch.object(self.calculation_service, 'agregar_ventas_por_cliente',
+                          wraps=self.calculation_service.agregar_ventas_por_cliente) as agregar:
+            kpis = self._service(Mock())._calcular_kpis_ventas(nuevas, datetime(2024, 1, 1), datetime(2024, 12, 31))
+        
+        self.assertEqual(agregar.call_count, 1)
+        self.assertEqual(list(agregar.call_args.args[0]['factura_id']), ['C', 'D'])
+        self.assertEqual(kpis.ventas_totales, Decimal('650.0'))
+        self.assertEqual(kpis.numero_facturas, 4)
+        self.assertEqual([(v.nit, v.numero_facturas) for v in kpis.ventas_por_cliente], [('1', 2), ('2', 2)])
+
+    def test_cambio_de_cliente_con_mismo_total_recalcula_el_mes(self):
+        """Reasignar una factura a otro cliente sin cambiar el total invalida su mes (también tras persistir)."""
+        self._service(Mock())._calcular_kpis_ventas(self.facturas, datetime(2024, 1, 1), datetime(2024, 12, 31))
+
+        reasignadas = self.facturas.copy()
+        reasignadas.loc[reasignadas['factura_id'] == 'B', ['cliente_nit', 'cliente_nombre']] = ['1', 'Uno']
+
+        logger = Mock()
+        kpis = self._service(logger)._calcular_kpis_ventas(reasignadas, datetime(2024, 1, 1), datetime(2024, 12, 31))
+
+        logger.info.assert_called_with("📊 Parciales KPI: 1 de 3 meses recalculados")
+        self.assertEqual([(v.nit, v.numero_facturas) for v in kpis.ventas_por_cliente], [('1', 3)])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
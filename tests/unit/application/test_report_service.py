@@ -0,0 +1,55 @@
+"""
+Test unitario para ReportService.
+Valida el cruce de líneas del Estado de Resultados con el periodo anterior.
+"""
+
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+
+from src.application.services.report_service import ReportService
+from src.domain.entities.estado_resultados import PeriodoComparacion
+
+
+class TestReportServiceEstadoResultados(unittest.TestCase):
+    """Test suite for ReportService._construir_estado_resultados."""
+
+    def setUp(self):
+        self.service = ReportService(Mock(), Mock(), Mock())
+        self.actual = PeriodoComparacion(datetime(2024, 1, 1), datetime(2024, 1, 31), "Enero 2024")
+        self.anterior = PeriodoComparacion(datetime(2023, 12, 1), datetime(2023, 12, 31), "Diciembre 2023")
+
+    def test_lineas_cruzadas_por_codigo(self):
+        """Cada línea toma el valor anterior de su código; con códigos repetidos gana la primera línea."""
+        datos_actual = {
+            'ingresos': [
+                {'codigo': '4135', 'descripcion': 'Ventas - Factura 1', 'valor': Decimal('100')},
+                {'codigo': '4135', 'descripcion': 'Ventas - Factura 2', 'valor': Decimal('50')},
+            ],
+            'costos': [{'codigo': '6135', 'descripcion': 'Costo', 'valor': Decimal('40')}],
+        }
+        datos_anterior = {
+            'ingresos': [
+                {'codigo': '4135', 'descripcion': 'Ventas - Factura 9', 'valor': Decimal('80')},
+                {'codigo': '4135', 'descripcion': 'Ventas - Factura 8', 'valor': Decimal('70')},
+            ],
+        }
+
+        estado = self.service._construir_estado_resultados(self.actual, self.anterior, datos_actual, datos_anterior)
+
+        self.assertEqual([linea.valor_anterior for linea in estado._ingresos], [Decimal('80'), Decimal('80')])
+        self.assertIsNone(estado._costos_ventas[0].valor_anterior)
+
+    def test_sin_periodo_anterior(self):
+        """Sin datos del periodo anterior las líneas quedan sin valor de comparación."""
+        datos_actual = {'impuestos': [{'codigo': '2408', 'descripcion': 'IVA', 'valor': Decimal('19')}]}
+
+        estado = self.service._construir_estado_resultados(self.actual, None, datos_actual, None)
+
+        self.assertEqual(len(estado._impuestos), 1)
+        self.assertIsNone(estado._impuestos[0].valor_anterior)
+
+
+if __name__ == '__main__':
+    unittest.main()
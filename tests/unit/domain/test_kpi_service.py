@@ -9,7 +9,7 @@ from datetime import datetime
 from decimal import Decimal
 
 from src.domain.services.kpi_service import KPICalculationServiceImpl, KPIAnalysisService
-from src.domain.entities.kpis import KPIsVentas
+from src.domain.entities.kpis import KPIsVentas, VentaPorCliente
 
 
 class TestKPICalculationService(unittest.TestCase):
@@ -127,6 +127,48 @@ class TestKPICalculationService(unittest.TestCase):
             )
         
         self.assertIn("DataFrame debe contener columnas", str(context.exception))
+    
+    def test_kpis_desde_parciales_equivalen_al_calculo_completo(self):
+        """Combinar parciales de subconjuntos da los mismos KPIs que el DataFrame completo."""
+        parciales = [
+            self.service.agregar_ventas_por_cliente(self.facturas_data.iloc[:1]),
+            self.service.agregar_ventas_por_cliente(self.facturas_data.iloc[1:])
+        ]
+        
+        desde_parciales = self.service.calcular_kpis_desde_parciales(parciales, self.fecha_inicio, self.fecha_fin)
+        completo = self.service.calcular_kpis_ventas(self.facturas_data, self.fecha_inicio, self.fecha_fin)
+        
+        self.assertEqual(desde_parciales.ventas_totales, completo.ventas_totales)
+        self.assertEqual(desde_parciales.numero_facturas, completo.numero_facturas)
+        self.assertEqual(desde_parciales.ticket_promedio, completo.ticket_promedio)
+        self.assertEqual(
+            [(v.nit, v.total_ventas, v.numero_facturas, v.ticket_promedio) for v in desde_parciales.ventas_por_cliente],
+            [(v.nit, v.total_ventas, v.numero_facturas, v.ticket_promedio) for v in completo.ventas_por_cliente]
+        )
+        self.assertEqual(
+            self.service.calcular_kpis_desde_parciales([], self.fecha_inicio, self.fecha_fin).numero_facturas, 0
+        )
+
+    def test_orden_de_clientes_se_reutiliza(self):
+        """cliente_top y obtener_top_clientes reutilizan el orden hasta que cambian los clientes o sus totales."""
+        kpis = self.service.calcular_kpis_ventas(self.facturas_data, self.fecha_inicio, self.fecha_fin)
+
+        ordenadas = kpis.ventas_ordenadas
+        self.assertIs(kpis.ventas_ordenadas, ordenadas)
+        self.assertEqual(kpis.obtener_top_clientes(1), [kpis.cliente_top])
+
+        ultimo = kpis.ventas_por_cliente[-1]
+        kpis.ventas_por_cliente[-1] = VentaPorCliente(
+            nit=ultimo.nit, nombre=ultimo.nombre, total_ventas=Decimal("9000000.00"),
+            numero_facturas=ultimo.numero_facturas, ticket_promedio=ultimo.ticket_promedio
+        )
+        self.assertEqual(kpis.cliente_top.total_ventas, Decimal("9000000.00"))
+
+        kpis.cliente_top.total_ventas = Decimal("1.00")
+        self.assertEqual(kpis.ventas_ordenadas[-1].total_ventas, Decimal("1.00"))
+
+        kpis.ventas_por_cliente.append(self.service.consolidar_ventas_por_cliente(self.facturas_data)[0])
+        self.assertEqual(len(kpis.ventas_ordenadas), 3)
 
 
 class TestKPIAnalysisService(unittest.TestCase):
@@ -0,0 +1,78 @@
+"""
+Test para BufferedLogWriter
+Tests unitarios de la escritura de logs en segundo plano
+"""
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from src.infrastructure.adapters.simple_txt_logger_adapter import SimpleTxtLogger
+from src.infrastructure.utils.buffered_log_writer import BufferedLogWriter
+
+
+class TestBufferedLogWriter(unittest.TestCase):
+    """Tests del escritor de logs por lotes."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_lines_reach_disk_in_order_and_rotate_with_the_path(self):
+        """Las líneas llegan en orden al hacer flush; una nueva ruta del canal abre otro archivo."""
+        writer = BufferedLogWriter(flush_interval=60)
+        before, after = self.dir / "dia1.txt", self.dir / "dia2.txt"
+
+        for i in range(100):
+            writer.write('daily', before, f"linea {i}\n")
+        writer.write('daily', after, "despues de medianoche\n")
+        writer.flush()
+
+        self.assertEqual(before.read_text(encoding='utf-8').splitlines(), [f"linea {i}" for i in range(100)])
+        self.assertEqual(after.read_text(encoding='utf-8'), "despues de medianoche\n")
+
+        writer.write('daily', after, "pendiente\n")
+        writer.close()
+        writer.write('daily', after, "tras cerrar\n")
+
+        self.assertEqual(after.read_text(encoding='utf-8').splitlines(),
+                         ["despues de medianoche", "pendiente", "tras cerrar"])
+
+    def test_steady_logging_is_flushed_every_interval(self):
+        """Con líneas llegando sin pausa el archivo crece cada flush_interval, sin esperar a quedar inactivo."""
+        writer = BufferedLogWriter(flush_interval=0.2)
+        path = self.dir / "continuo.txt"
+        try:
+            sizes = []
+            for i in range(30):
+                writer.write('daily', path, f"linea {i}\n")
+                time.sleep(0.03)
+                sizes.append(path.stat().st_size if path.exists() else 0)
+
+            # ~0.9 s escribiendo sin pausas mayores al intervalo: varios lotes ya en disco
+            self.assertGreater(sizes[-1], 0)
+            self.assertGreaterEqual(len(set(sizes)), 3)
+        finally:
+            writer.close()
+
+    def test_txt_logger_reads_see_buffered_messages(self):
+        """Los resúmenes del logger incluyen mensajes aún no escritos por el hilo."""
+        logger = SimpleTxtLogger(None, str(self.dir), flush_interval=60)
+        try:
+            logger.info("Consulta iniciada")
+            logger.log_operation("Descarga", True, records_count=10)
+
+            self.assertIn("Operación: Descarga - ÉXITO", logger.get_recent_logs())
+            summary = logger.get_session_summary()
+            self.assertEqual(summary["operations_count"], 1)
+            self.assertEqual(summary["level_counts"]["SUCCESS"], 1)
+        finally:
+            logger.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Test para ChunkedExportPipeline
+Tests unitarios de la exportación por períodos con checkpoint y reanudación
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+
+import pandas as pd
+
+from src.infrastructure.utils.chunked_export import ChunkedExportPipeline, monthly_chunks
+from src.infrastructure.utils.concurrent_pager import TokenBucketRateLimiter
+
+
+def frames_for(fecha_inicio, fecha_fin):
+    """Una factura con dos items por período."""
+    factura = f"FV-{fecha_inicio[:7]}"
+    return {
+        'encabezados': pd.DataFrame({'factura_id': [factura], 'numero': ['0012'], 'total': [100.5]}),
+        'detalle': pd.DataFrame({'factura_id': [factura, factura], 'cantidad': [1.0, 2.0]}),
+    }
+
+
+class TestChunkedExportPipeline(unittest.TestCase):
+    """Tests de la exportación mensual incremental."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.outputs = {
+            'encabezados': os.path.join(self.tmp.name, 'encabezados.csv'),
+            'detalle': os.path.join(self.tmp.name, 'detalle.csv'),
+        }
+        self.params = {'nit': '900123456'}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def pipeline(self, fetch, max_workers=3):
+        return ChunkedExportPipeline(
+            fetch,
+            checkpoint_dir=os.path.join(self.tmp.name, 'checkpoints'),
+            max_workers=max_workers,
+            rate_limiter=TokenBucketRateLimiter(rate=1000)
+        )
+
+    def test_monthly_chunks(self):
+        """Los períodos cortan en fin de mes y el último termina en la fecha final."""
+        self.assertEqual(monthly_chunks("2023-11-15", "2024-01-10"), [
+            ("2023-11-15", "2023-11-30"), ("2023-12-01", "2023-12-31"), ("2024-01-01", "2024-01-10")
+        ])
+
+    def test_months_fetched_concurrently_are_written_in_order(self):
+        """Aunque el primer mes termine último, los CSV quedan en orden cronológico."""
+        first_month_may_finish = threading.Event()
+
+        def fetch(fecha_inicio, fecha_fin):
+            if fecha_inicio == "2024-01-01":
+                self.assertTrue(first_month_may_finish.wait(timeout=5))
+            elif fecha_inicio == "2024-03-01":
+                first_month_may_finish.set()
+            return frames_for(fecha_inicio, fecha_fin)
+
+        pipeline = self.pipeline(fetch)
+        result = pipeline.run("2024-01-01", "2024-03-31", self.outputs, self.params)
+
+        self.assertTrue(result.completed)
+        self.assertEqual(result.rows, {'encabezados': 3, 'detalle': 6})
+        encabezados = pd.read_csv(self.outputs['encabezados'])
+        self.assertEqual(list(encabezados['factura_id']), ['FV-2024-01', 'FV-2024-02', 'FV-2024-03'])
+        self.assertFalse(os.path.exists(result.manifest_path))
+
+    def test_failed_export_resumes_from_last_completed_month(self):
+        """Un mes fallido deja checkpoint; la reanudación solo descarga los meses pendientes."""
+        def failing_fetch(fecha_inicio, fecha_fin):
+            if fecha_inicio == "2024-03-01":
+                raise ConnectionError("timeout")
+            return frames_for(fecha_inicio, fecha_fin)
+
+        result = self.pipeline(failing_fetch, max_workers=1).run("2024-01-01", "2024-05-31", self.outputs, self.params)
+
+        self.assertFalse(result.completed)
+        self.assertEqual(result.chunks_completed, 2)
+        self.assertIn("timeout", result.errors[0])
+        self.assertTrue(os.path.exists(result.manifest_path))
+
+        # Una escritura a medias tras el último checkpoint se descarta al reanudar
+        with open(self.outputs['detalle'], 'a', encoding='utf-8') as f:
+            f.write("FV-parcial,")
+
+        fetched = []
+
+        def fetch(fecha_inicio, fecha_fin):
+            fetched.append(fecha_inicio)
+            return frames_for(fecha_inicio, fecha_fin)
+
+        pipeline = self.pipeline(fetch)
+        resumed = pipeline.run("2024-01-01", "2024-05-31", {}, self.params)
+
+        self.assertTrue(resumed.completed and resumed.resumed)
+        self.assertEqual(sorted(fetched), ["2024-03-01", "2024-04-01", "2024-05-01"])
+        detalle = pd.read_csv(self.outputs['detalle'])
+        self.assertEqual(len(detalle), 10)
+        self.assertEqual(list(detalle['factura_id'].unique()), [f"FV-2024-0{m}" for m in range(1, 6)])
+
+    def test_read_output_restores_types(self):
+        """Las columnas de texto siguen siendo texto y las numéricas vuelven a número."""
+        result = self.pipeline(frames_for).run("2024-01-01", "2024-01-31", self.outputs, self.params)
+
+        df = ChunkedExportPipeline.read_output(result, 'encabezados')
+
+        self.assertEqual(df['numero'].tolist(), ['0012'])
+        self.assertEqual(df['total'].tolist(), [100.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
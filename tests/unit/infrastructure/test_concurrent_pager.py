@@ -0,0 +1,137 @@
+"""
+Test para ConcurrentPager y TokenBucketRateLimiter
+Tests unitarios de la descarga concurrente de endpoints paginados
+"""
+
+import threading
+import unittest
+
+from src.infrastructure.utils.concurrent_pager import ConcurrentPager, PageFetchError, TokenBucketRateLimiter
+
+
+class _FakeClock:
+    """Reloj manual: sleep() avanza el tiempo en lugar de bloquear."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucketRateLimiter(unittest.TestCase):
+    """Tests del rate limiter."""
+
+    def test_burst_then_throttle(self):
+        """Tras agotar la ráfaga cada petición espera 1/rate segundos."""
+        clock = _FakeClock()
+        limiter = TokenBucketRateLimiter(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+        for _ in range(4):
+            limiter.acquire()
+
+        self.assertEqual(len(clock.sleeps), 2)
+        self.assertAlmostEqual(clock.now, 1.0)
+
+    def test_invalid_rate(self):
+        """Una tasa no positiva es un error de configuración."""
+        with self.assertRaises(ValueError):
+            TokenBucketRateLimiter(rate=0)
+
+
+class TestConcurrentPager(unittest.TestCase):
+    """Tests del pager concurrente."""
+
+    def setUp(self):
+        clock = _FakeClock()
+        self.pager = ConcurrentPager(
+            max_workers=4,
+            rate_limiter=TokenBucketRateLimiter(rate=1000, clock=clock, sleep=clock.sleep)
+        )
+
+    def _fetcher(self, total: int, page_size: int, report_total: bool = True):
+        requested = []
+        lock = threading.Lock()
+
+        def fetch_page(page: int):
+            with lock:
+                requested.append(page)
+            start = (page - 1) * page_size
+            results = [{'id': i} for i in range(start, min(start + page_size, total))]
+            pagination = {'total_results': total} if report_total else {}
+            return results, pagination
+
+        return fetch_page, requested
+
+    def test_fan_out_preserves_page_order(self):
+        """Con total conocido se pide cada página una vez y el orden se conserva."""
+        fetch_page, requested = self._fetcher(total=1050, page_size=100)
+
+        results = self.pager.fetch_all(fetch_page, page_size=100)
+
+        self.assertEqual([r['id'] for r in results], list(range(1050)))
+        self.assertEqual(sorted(requested), list(range(1, 12)))
+
+    def test_sequential_fallback_without_total(self):
+        """Sin total reportado se recorre hasta la primera página incompleta."""
+        fetch_page, requested = self._fetcher(total=250, page_size=100, report_total=False)
+
+        results = self.pager.fetch_all(fetch_page, page_size=100)
+
+        self.assertEqual(len(results), 250)
+        self.assertEqual(requested, [1, 2, 3])
+
+    def test_empty_first_page(self):
+        """Una primera página vacía no dispara más peticiones."""
+        fetch_page, requested = self._fetcher(total=0, page_size=100)
+
+        self.assertEqual(self.pager.fetch_all(fetch_page, page_size=100), [])
+        self.assertEqual(requested, [1])
+
+    def test_page_error_propagates(self):
+        """Un fallo en una página se propaga al llamador."""
+        def fetch_page(page: int):
+            if page == 3:
+                raise RuntimeError("503")
+            return [{'id': page}] * 10, {'total_results': 50}
+
+        with self.assertRaises(RuntimeError):
+            self.pager.fetch_all(fetch_page, page_size=10)
+
+    def test_none_page_is_retried_then_raises(self):
+        """Una página None se reintenta; si sigue fallando no se devuelve un resultado incompleto."""
+        attempts = {}
+        lock = threading.Lock()
+
+        def fetch_page(page: int, failures: int):
+            with lock:
+                attempts[page] = attempts.get(page, 0) + 1
+                if page == 3 and attempts[page] <= failures:
+                    return None, {}
+            return [{'id': page}] * 10, {'total_results': 50}
+
+        results = self.pager.fetch_all(lambda page: fetch_page(page, failures=1), page_size=10)
+        self.assertEqual([r['id'] for r in results][::10], [1, 2, 3, 4, 5])
+        self.assertEqual(attempts[3], 2)
+
+        attempts.clear()
+        with self.assertRaises(PageFetchError) as ctx:
+            self.pager.fetch_all(lambda page: fetch_page(page, failures=2), page_size=10)
+        self.assertEqual(ctx.exception.page, 3)
+
+    def test_none_page_without_total_raises(self):
+        """Sin total reportado, una página intermedia None tampoco trunca el resultado."""
+        def fetch_page(page: int):
+            return (None, {}) if page == 2 else ([{'id': page}] * 10, {})
+
+        with self.assertRaises(PageFetchError):
+            self.pager.fetch_all(fetch_page, page_size=10)
+
+
+if __name__ == '__main__':
+    unittest.main()
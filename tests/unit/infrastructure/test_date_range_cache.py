@@ -0,0 +1,75 @@
+"""
+Test para DateRangeCache
+Tests unitarios de la caché por rango de fechas
+"""
+
+import unittest
+from datetime import date, datetime
+
+from src.infrastructure.utils.date_range_cache import DateRangeCache
+
+
+class TestDateRangeCache(unittest.TestCase):
+    """Tests de la caché por rango de fechas."""
+
+    def setUp(self):
+        self.calls = []
+
+        def fetch(start, end):
+            self.calls.append((start, end))
+            return [{"id": day, "date": f"2024-03-{day:02d}"} for day in range(start.day, end.day + 1)] + [{"id": "x"}]
+
+        self.cache = DateRangeCache(fetch)
+
+    def test_contiguous_ranges_are_fetched_once_and_sliced(self):
+        """Períodos contiguos comparten una descarga y cada uno recibe solo sus fechas."""
+        self.cache.plan([("2024-03-11", "2024-03-20"), (datetime(2024, 3, 1), datetime(2024, 3, 10))])
+
+        actual = self.cache.get("2024-03-11", "2024-03-20")
+        anterior = self.cache.get(date(2024, 3, 1), date(2024, 3, 10))
+
+        self.assertEqual(self.calls, [(date(2024, 3, 1), date(2024, 3, 20))])
+        self.assertEqual([r["id"] for r in actual], list(range(11, 21)))
+        self.assertEqual([r["id"] for r in anterior], list(range(1, 11)))
+
+    def test_disjoint_ranges_are_fetched_separately_and_unsliced(self):
+        """Rangos separados no se fusionan; un rango exacto se devuelve tal como lo entrega la descarga."""
+        self.cache.plan([("2024-03-01", "2024-03-05"), ("2024-03-20", "2024-03-25")])
+
+        primero = self.cache.get("2024-03-01", "2024-03-05")
+        self.cache.get("2024-03-01", "2024-03-05")
+        self.cache.get("2024-03-20", "2024-03-25")
+
+        self.assertEqual(self.cache.fetch_count, 2)
+        self.assertEqual(primero[-1], {"id": "x"})
+
+    def test_unplanned_range_is_fetched_on_demand(self):
+        """Un rango sin planear se descarga al pedirlo y se reutiliza para subrangos."""
+        self.cache.get("2024-03-01", "2024-03-31")
+        subrango = self.cache.get("2024-03-30", "2024-03-31")
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual([r["id"] for r in subrango], [30, 31])
+
+    def test_document_date_differs_from_filtered_creation_date(self):
+        """Si la API filtra por creación y el registro trae otra fecha, los períodos coinciden con la descarga directa."""
+        invoices = [
+            {"id": "A", "created": "2024-03-09", "fecha": "2024-03-12"},
+            {"id": "B", "created": "2024-03-12", "fecha": "2024-03-08"},
+            {"id": "C", "created": "2024-03-15", "fecha": "2024-03-15"},
+        ]
+
+        def fetch(start, end):
+            return [inv for inv in invoices if start <= date.fromisoformat(inv["created"]) <= end]
+
+        periods = [(date(2024, 3, 1), date(2024, 3, 10)), (date(2024, 3, 11), date(2024, 3, 20))]
+        direct = [[inv["id"] for inv in fetch(*period)] for period in periods]
+
+        for cache in (DateRangeCache(fetch, date_field="created"),
+                      DateRangeCache(fetch, date_field="fecha", merge_ranges=False)):
+            cache.plan(periods)
+            self.assertEqual([[inv["id"] for inv in cache.get(*period)] for period in periods], direct)
+
+
+if __name__ == '__main__':
+    unittest.main()
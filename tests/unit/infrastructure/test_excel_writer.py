@@ -0,0 +1,70 @@
+"""
+Test para ExcelStreamWriter
+Tests unitarios de la escritura de Excel en modo streaming
+"""
+
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from src.infrastructure.utils.excel_writer import HEADER_STYLE, ExcelStreamWriter, write_dataframes_to_excel
+
+
+class TestExcelStreamWriter(unittest.TestCase):
+    """Tests de la escritura de hojas en modo write-only."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "salida", "reporte.xlsx")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_dataframes_round_trip_like_pandas(self):
+        """Las hojas se leen igual que las escritas con pandas.to_excel."""
+        encabezados = pd.DataFrame({
+            'factura_id': ['FV-1', 'FV-2', 'FV-3'],
+            'cliente_nombre': [['ACME'], None, 'Beta'],
+            'total': [Decimal('10.50'), 20.0, float('nan')],
+        })
+        detalle = pd.DataFrame({'factura_id': ['FV-1'] * 4, 'cantidad': [1, 2, 3, 4]})
+        ExcelStreamWriter.BATCH_SIZE, batch_size = 3, ExcelStreamWriter.BATCH_SIZE
+        try:
+            write_dataframes_to_excel(self.path, {'Encabezados': encabezados, 'Detalle': detalle})
+        finally:
+            ExcelStreamWriter.BATCH_SIZE = batch_size
+
+        expected_path = os.path.join(self.tmp.name, "pandas.xlsx")
+        with pd.ExcelWriter(expected_path, engine='openpyxl') as writer:
+            encabezados.to_excel(writer, sheet_name='Encabezados', index=False)
+            detalle.to_excel(writer, sheet_name='Detalle', index=False)
+
+        for sheet in ('Encabezados', 'Detalle'):
+            pd.testing.assert_frame_equal(
+                pd.read_excel(self.path, sheet_name=sheet),
+                pd.read_excel(expected_path, sheet_name=sheet)
+            )
+
+    def test_layout_and_named_styles(self):
+        """Anchos, celdas combinadas y estilos con nombre se aplican a las filas escritas."""
+        with ExcelStreamWriter(self.path) as writer:
+            writer.add_sheet('Reporte', column_widths={'A': 40}, merged_ranges=['A1:B1'])
+            writer.append('Reporte', ['Título'], [HEADER_STYLE, HEADER_STYLE])
+            writer.append('Reporte')
+            writer.append_rows('Reporte', [['a', 1], ['b', 2]])
+
+        self.assertEqual(writer.rows_written, {'Reporte': 4})
+        sheet = load_workbook(self.path)['Reporte']
+        self.assertEqual(sheet.column_dimensions['A'].width, 40)
+        self.assertIn('A1:B1', [str(rango) for rango in sheet.merged_cells.ranges])
+        self.assertEqual(sheet['A1'].style, HEADER_STYLE)
+        self.assertTrue(sheet['A1'].font.b)
+        self.assertEqual([[c.value for c in row] for row in sheet.iter_rows(min_row=3)], [['a', 1], ['b', 2]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Test para SiigoEstadoResultadosRepository
+Tests unitarios de la caché por solicitud y de la descarga en paralelo de los endpoints
+"""
+
+import threading
+import unittest
+from datetime import datetime
+from unittest.mock import Mock
+
+from src.domain.entities.financial_reports import PeriodoFiscal
+from src.infrastructure.adapters.financial_reports_repository import SiigoEstadoResultadosRepository
+
+
+class TestSiigoEstadoResultadosRepository(unittest.TestCase):
+    """Tests de la descarga de datos del Estado de Resultados."""
+
+    def test_gastos_fallback_reuses_purchases(self):
+        """Sin asientos contables, los gastos reutilizan las compras ya descargadas del período."""
+        api = Mock()
+        api.obtener_facturas_periodo.return_value = []
+        api.obtener_notas_credito_periodo.return_value = []
+        api.obtener_compras_periodo.return_value = []
+        api.obtener_asientos_contables_periodo.return_value = []
+        repository = SiigoEstadoResultadosRepository(api, Mock())
+        periodo = PeriodoFiscal(datetime(2024, 1, 1), datetime(2024, 1, 31), "2024-Enero", "mensual")
+
+        repository.obtener_estado_resultados(periodo)
+
+        api.obtener_facturas_periodo.assert_called_once_with("2024-01-01", "2024-01-31")
+        api.obtener_compras_periodo.assert_called_once_with("2024-01-01", "2024-01-31")
+        self.assertIsNone(repository._cache_rangos)
+
+    def test_independent_endpoints_are_fetched_concurrently(self):
+        """Facturas, notas de crédito, compras y asientos se descargan a la vez."""
+        barrier = threading.Barrier(4, timeout=5)
+
+        def endpoint(fecha_inicio, fecha_fin):
+            barrier.wait()
+            return []
+
+        api = Mock()
+        for consulta in SiigoEstadoResultadosRepository.CONSULTAS_CACHEADAS:
+            getattr(api, consulta).side_effect = endpoint
+        repository = SiigoEstadoResultadosRepository(api, Mock())
+        periodo = PeriodoFiscal(datetime(2024, 1, 1), datetime(2024, 1, 31), "2024-Enero", "mensual")
+
+        repository.obtener_estado_resultados(periodo)
+
+        self.assertFalse(barrier.broken)
+        api.obtener_compras_periodo.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
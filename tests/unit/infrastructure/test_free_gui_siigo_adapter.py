@@ -0,0 +1,172 @@
+"""
+Test para FreeGUISiigoAdapter
+Tests unitarios de la paginación del adapter FREE contra la API Siigo (mockeada)
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+from datetime import datetime
+
+from src.infrastructure.adapters.free_gui_siigo_adapter import FreeGUISiigoAdapter
+from src.domain.entities.invoice import InvoiceFilter, InvoicePage
+
+
+def _siigo_invoice(invoice_id: str) -> dict:
+    """Factura mínima con la forma de la respuesta de /v1/invoices."""
+    return {
+        'id': invoice_id,
+        'date': '2024-03-15',
+        'customer': {'identification': '900123456', 'name': 'Cliente Test'},
+        'total': 119000,
+        'status': 'open',
+        'items': [{'code': 'P1', 'description': 'Producto', 'quantity': 1, 'price': 100000}]
+    }
+
+
+class TestFreeGUISiigoAdapterPagination(unittest.TestCase):
+    """Tests de get_invoices_page."""
+
+    def setUp(self):
+        """Adapter autenticado con logger mock."""
+        self.adapter = FreeGUISiigoAdapter(Mock())
+        self.adapter._access_token = 'token'
+        self.adapter._is_authenticated = True
+
+    def _response(self, results, total_results=None):
+        response = Mock(status_code=200)
+        body = {'results': results}
+        if total_results is not None:
+            body['pagination'] = {'page': 1, 'page_size': 100, 'total_results': total_results}
+        response.json.return_value = body
+        return response
+
+    @patch('src.infrastructure.adapters.free_gui_siigo_adapter.requests.get')
+    def test_get_invoices_page_requests_single_page(self, mock_get):
+        """Una página solicitada equivale a una sola petición HTTP con page/page_size."""
+        mock_get.return_value = self._response([_siigo_invoice('A'), _siigo_invoice('B')], total_results=250)
+
+        filters = InvoiceFilter(created_start=datetime(2024, 1, 1), page=2, page_size=100)
+        page = self.adapter.get_invoices_page(filters)
+
+        self.assertEqual(mock_get.call_count, 1)
+        params = mock_get.call_args.kwargs['params']
+        self.assertEqual(params['page'], 2)
+        self.assertEqual(params['page_size'], 100)
+        self.assertEqual(params['created_start'], '2024-01-01')
+        self.assertEqual([inv.id for inv in page.invoices], ['A', 'B'])
+        self.assertEqual(page.total_results, 250)
+        self.assertEqual(page.total_pages, 3)
+        self.assertTrue(page.has_next)
+
+    @patch('src.infrastructure.adapters.free_gui_siigo_adapter.requests.get')
+    def test_get_invoices_page_without_pagination_metadata(self, mock_get):
+        """Sin total reportado, una página incompleta se considera la última."""
+        mock_get.return_value = self._response([_siigo_invoice('A')])
+
+        page = self.adapter.get_invoices_page(InvoiceFilter(page=1, page_size=100))
+
+        self.assertIsNone(page.total_results)
+        self.assertFalse(page.has_next)
+        self.assertIsNone(page.next_page)
+
+    @patch('src.infrastructure.adapters.free_gui_siigo_adapter.requests.get')
+    def test_get_invoices_page_api_error_returns_empty_page(self, mock_get):
+        """Un error HTTP devuelve una página vacía sin siguiente página."""
+        mock_get.return_value = Mock(status_code=500)
+
+        page = self.adapter.get_invoices_page(InvoiceFilter(page=3))
+
+        self.assertIsInstance(page, InvoicePage)
+        self.assertEqual(page.invoices, [])
+        self.assertFalse(page.has_next)
+
+
+class TestFreeGUISiigoAdapterInvoiceLookup(unittest.TestCase):
+    """Tests de get_invoice_by_id."""
+
+    def setUp(self):
+        self.adapter = FreeGUISiigoAdapter(Mock())
+        self.adapter._access_token = 'token'
+        self.adapter._is_authenticated = True
+
+    @patch('src.infrastructure.adapters.free_gui_siigo_adapter.requests.get')
+    def test_lookup_served_from_index_after_bulk_download(self, mock_get):
+        """Una factura ya descargada se resuelve sin peticiones HTTP."""
+        response = Mock(status_code=200)
+        response.json.return_value = {'results': [_siigo_invoice('A'), _siigo_invoice('B')]}
+        mock_get.return_value = response
+        self.adapter.get_invoices_page(InvoiceFilter())
+        mock_get.reset_mock()
+
+        invoice = self.adapter.get_invoice_by_id('B')
+
+        self.assertEqual(invoice.id, 'B')
+        mock_get.assert_not_called()
+
+    @patch('src.infrastructure.adapters.free_gui_siigo_adapter.requests.get')
+    def test_lookup_miss_uses_single_direct_request(self, mock_get):
+        """Sin índice se hace una sola petición a /v1/invoices/{id}."""
+        response = Mock(status_code=200)
+        response.json.return_value = _siigo_invoice('XYZ')
+        mock_get.return_value = response
+
+        invoice = self.adapter.get_invoice_by_id('XYZ')
+        again = self.adapter.get_invoice_by_id('XYZ')
+
+        self.assertEqual(invoice.id, 'XYZ')
+        self.assertIs(again, invoice)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertTrue(mock_get.call_args.args[0].endswith('/v1/invoices/XYZ'))
+
+    @patch('src.infrastructure.adapters.free_gui_siigo_adapter.requests.get')
+    def test_index_keeps_only_most_recently_used(self, mock_get):
+        """El índice se limita a INVOICE_INDEX_SIZE y descarta la factura usada hace más tiempo."""
+        self.adapter.INVOICE_INDEX_SIZE = 2
+        response = Mock(status_code=200)
+        response.json.return_value = {'results': [_siigo_invoice('A'), _siigo_invoice('B')]}
+        mock_get.return_value = response
+        self.adapter.get_invoices_page(InvoiceFilter())
+
+        self.adapter.get_invoice_by_id('A')  # A pasa a ser la más reciente
+        response.json.return_value = {'results': [_siigo_invoice('C')]}
+        self.adapter.get_invoices_page(InvoiceFilter())
+
+        self.assertEqual(list(self.adapter._invoice_index), ['A', 'C'])
+
+    @patch('src.infrastructure.adapters.free_gui_siigo_adapter.requests.get')
+    def test_lookup_not_found(self, mock_get):
+        """Un 404 retorna None."""
+        mock_get.return_value = Mock(status_code=404)
+
+        self.assertIsNone(self.adapter.get_invoice_by_id('NOPE'))
+
+
+class TestFreeGUISiigoAdapterParsing(unittest.TestCase):
+    """Tests de _process_siigo_invoices."""
+
+    def setUp(self):
+        self.adapter = FreeGUISiigoAdapter(Mock())
+
+    def test_typed_columns_and_payment_status(self):
+        """Las columnas salen tipadas y payment_status se deriva de estado y vencimiento."""
+        raw = [
+            dict(_siigo_invoice('A'), status='closed'),
+            dict(_siigo_invoice('B'), due_date='2000-01-01'),
+            dict(_siigo_invoice('C'), due_date='2999-01-01T00:00:00Z'),
+            dict(_siigo_invoice('D'), status='void', due_date='2000-01-01'),
+            'no-es-factura',
+        ]
+
+        encabezados_df, detalle_df = self.adapter._process_siigo_invoices(raw)
+
+        self.assertEqual(list(encabezados_df['factura_id']), ['A', 'B', 'C', 'D'])
+        self.assertEqual(list(encabezados_df['payment_status']), ['pagada', 'vencida', 'pendiente', 'anulada'])
+        self.assertEqual(str(encabezados_df['estado'].dtype), 'category')
+        self.assertTrue(str(encabezados_df['fecha'].dtype).startswith('datetime64'))
+        self.assertEqual(encabezados_df['total'].dtype, 'float64')
+        self.assertEqual(len(detalle_df), 4)
+        self.assertEqual(detalle_df['subtotal'].tolist(), [100000.0] * 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
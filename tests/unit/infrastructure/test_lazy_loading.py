@@ -0,0 +1,85 @@
+"""
+Test para lazy_loading
+Tests unitarios de la construcción diferida de servicios al arrancar la GUI
+"""
+
+import subprocess
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+from src.infrastructure.utils.lazy_loading import LazyService, is_created, resolve
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+class FakeExportService:
+    """Servicio de prueba que cuenta sus construcciones."""
+
+    created = 0
+
+    def __init__(self):
+        type(self).created += 1
+        self.exports = []
+
+    def export_csv(self, name):
+        self.exports.append(name)
+        return f"outputs/{name}.csv"
+
+
+class TestLazyService(unittest.TestCase):
+    """Tests del proxy LazyService."""
+
+    def setUp(self):
+        FakeExportService.created = 0
+
+    def test_service_is_built_on_first_use_only(self):
+        """El servicio no se construye al inyectarlo sino al primer acceso, y solo una vez."""
+        service = LazyService(FakeExportService, "ExportService")
+
+        self.assertFalse(is_created(service))
+        self.assertEqual(FakeExportService.created, 0)
+        self.assertIn("pendiente", repr(service))
+
+        self.assertEqual(service.export_csv("facturas"), "outputs/facturas.csv")
+        service.export_csv("clientes")
+        service.timeout = 30
+
+        self.assertTrue(is_created(service))
+        self.assertEqual(FakeExportService.created, 1)
+        real = resolve(service)
+        self.assertIsInstance(real, FakeExportService)
+        self.assertEqual(real.exports, ["facturas", "clientes"])
+        self.assertEqual(real.timeout, 30)
+
+    def test_concurrent_first_use_builds_once(self):
+        """Varios hilos que usan el servicio a la vez comparten una sola instancia."""
+        barrier = threading.Barrier(8)
+        service = LazyService(FakeExportService)
+        instances = []
+
+        def use():
+            barrier.wait()
+            instances.append(resolve(service))
+
+        threads = [threading.Thread(target=use) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(FakeExportService.created, 1)
+        self.assertTrue(all(instance is instances[0] for instance in instances))
+
+    def test_application_factory_import_does_not_load_pandas(self):
+        """Importar el factory de la aplicación no carga pandas ni openpyxl."""
+        code = ("import sys; import src.infrastructure.factories.application_factory; "
+                "print(sorted(m for m in ('pandas', 'openpyxl') if m in sys.modules))")
+        result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Test para SignedLicenseCacheAdapter
+Tests unitarios de la caché de licencias validadas con token firmado
+"""
+
+import json
+import tempfile
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.domain.entities.invoice import License, LicenseType
+from src.domain.services.license_manager import LicenseManager
+from src.infrastructure.adapters.license_cache_adapter import SignedLicenseCacheAdapter
+from src.infrastructure.factories.application_factory import DataContaApplicationFactory
+
+LICENSE_KEY = "PROF-2024-TEST-ABCD-001A"
+
+
+def license_with_status(status):
+    return License(key=LICENSE_KEY, license_type=LicenseType.PROFESSIONAL, status=status,
+                   features=['gui_access', 'financial_reports'])
+
+
+class TestSignedLicenseCacheAdapter(unittest.TestCase):
+    """Tests de la validación de licencia con caché en memoria y en disco."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.validator = Mock()
+        self.validator.validate_license.return_value = license_with_status('active')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def manager(self, ttl=timedelta(hours=12), grace_period=timedelta(days=3)):
+        cache = SignedLicenseCacheAdapter(self.tmp.name, Mock(), ttl=ttl, grace_period=grace_period, secret="test")
+        return LicenseManager(Mock(), cache)
+
+    def test_only_first_validation_per_ttl_reaches_validator(self):
+        """Las operaciones siguientes y una nueva sesión reutilizan la validación cacheada."""
+        manager = self.manager()
+        for _ in range(3):
+            self.assertTrue(manager.validate_license(LICENSE_KEY, self.validator).is_valid())
+
+        restarted = self.manager().validate_license(LICENSE_KEY, self.validator)
+
+        self.assertEqual(self.validator.validate_license.call_count, 1)
+        self.assertEqual(restarted.license_type, LicenseType.PROFESSIONAL)
+        self.assertEqual(restarted.features, ['gui_access', 'financial_reports'])
+        token_text = next(Path(self.tmp.name).glob("*.token")).read_text(encoding='utf-8')
+        self.assertNotIn(LICENSE_KEY, token_text)
+
+    def test_tampered_token_is_ignored(self):
+        """Un token editado no pasa la firma y obliga a validar de nuevo."""
+        self.manager().validate_license(LICENSE_KEY, self.validator)
+        token_path = next(Path(self.tmp.name).glob("*.token"))
+        token = json.loads(token_path.read_text(encoding='utf-8'))
+        token['payload']['license_type'] = LicenseType.ENTERPRISE.value
+        token_path.write_text(json.dumps(token), encoding='utf-8')
+
+        license_info = self.manager().validate_license(LICENSE_KEY, self.validator)
+
+        self.assertEqual(self.validator.validate_license.call_count, 2)
+        self.assertEqual(license_info.license_type, LicenseType.PROFESSIONAL)
+
+    def test_expired_entry_is_used_only_within_grace_on_error(self):
+        """Vencido el TTL se revalida; un error usa la licencia en gracia y un rechazo la descarta."""
+        manager = self.manager(ttl=timedelta(0))
+        manager.validate_license(LICENSE_KEY, self.validator)
+
+        self.validator.validate_license.return_value = license_with_status('error')
+        self.assertTrue(manager.validate_license(LICENSE_KEY, self.validator).is_valid())
+
+        self.validator.validate_license.return_value = license_with_status('invalid')
+        self.assertFalse(manager.validate_license(LICENSE_KEY, self.validator).is_valid())
+
+        self.validator.validate_license.return_value = license_with_status('error')
+        self.assertFalse(manager.validate_license(LICENSE_KEY, self.validator).is_valid())
+        self.assertEqual(self.validator.validate_license.call_count, 4)
+        self.assertEqual(list(Path(self.tmp.name).glob("*.token")), [])
+
+    def test_factory_composes_manager_with_signed_cache(self):
+        """El gestor que arma el factory de la aplicación reutiliza la validación entre sesiones."""
+        for _ in range(2):
+            manager = DataContaApplicationFactory.create_license_manager(Mock(), cache_dir=self.tmp.name)
+            self.assertTrue(manager.validate_license(LICENSE_KEY, self.validator).is_valid())
+
+        self.assertEqual(self.validator.validate_license.call_count, 1)
+        self.assertEqual(len(list(Path(self.tmp.name).glob("*.token"))), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
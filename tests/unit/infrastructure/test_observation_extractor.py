@@ -0,0 +1,51 @@
+"""
+Test para ObservationExtractor
+Tests unitarios de los clasificadores compilados y de la memoización
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from src.infrastructure.utils.observation_extractor import ObservationExtractor
+
+
+class TestObservationExtractor(unittest.TestCase):
+    """Tests de clasificación de observaciones."""
+
+    def setUp(self):
+        self.extractor = ObservationExtractor(Mock())
+
+    def test_category_priority_is_preserved(self):
+        """La categoría de mayor prioridad gana aunque aparezca más adelante en el texto."""
+        self.assertEqual(
+            self.extractor.extract_client_info("Persona natural, trabaja para EMPRESA XYZ"),
+            ("Persona Jurídica", "No Especificado")
+        )
+        self.assertEqual(
+            self.extractor.extract_client_info("Régimen simplificado; responsable IVA"),
+            ("No Especificado", "Responsable del IVA")
+        )
+        self.assertEqual(self.extractor.extract_client_info(""), ("No Especificado", "No Especificado"))
+
+    def test_repeated_observations_are_memoized(self):
+        """Observaciones repetidas o que normalizan igual no se vuelven a clasificar."""
+        for text in ["Persona  Natural!", "Persona  Natural!", "persona natural"]:
+            self.assertEqual(self.extractor.extract_client_info(text), ("Persona Natural", "No Especificado"))
+
+        self.assertEqual(self.extractor._client_info_for_text.cache_info().hits, 1)
+        self.assertEqual(self.extractor._classify_client_text.cache_info().hits, 1)
+
+        self.extractor.clear_cache()
+        self.assertEqual(self.extractor._classify_client_text.cache_info().currsize, 0)
+
+    def test_payment_and_product_categories(self):
+        """Las categorías de pago y producto usan las tablas de palabras clave."""
+        self.assertEqual(self.extractor.extract_payment_category("Visa"), "Tarjeta de Crédito")
+        self.assertEqual(self.extractor.extract_payment_category("PSE"), "Transferencia")
+        self.assertEqual(self.extractor.extract_payment_category("Bitcoin"), "Otros")
+        self.assertEqual(self.extractor.extract_product_category("Curso de Excel"), "Educación")
+        self.assertEqual(self.extractor.extract_product_category(None), "General")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Test para SimpleTxtLogger
+Tests unitarios de las lecturas de logs recientes y del resumen de sesión
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.infrastructure.adapters.simple_txt_logger_adapter import LogLevel, SimpleTxtLogger
+
+
+class TestSimpleTxtLogger(unittest.TestCase):
+    """Tests de get_recent_logs y get_session_summary."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.logger = SimpleTxtLogger(None, self.tmp.name, flush_interval=60)
+
+    def tearDown(self):
+        self.logger.shutdown()
+        self.tmp.cleanup()
+
+    def test_recent_logs_match_full_read(self):
+        """Las últimas líneas leídas desde el final coinciden con leer el archivo completo."""
+        for i in range(3000):
+            self.logger.info(f"Página {i}: facturación electrónica ✅")
+        self.logger.close_session()
+        daily_log = next(Path(self.tmp.name).glob("dataconta_free_*.txt"))
+        lines = daily_log.read_text(encoding='utf-8').splitlines(keepends=True)
+
+        for max_lines in (1, 20, 500, 10000):
+            self.assertEqual(self.logger.get_recent_logs(max_lines), ''.join(lines[-max_lines:]).strip())
+
+    def test_session_summary_counts_match_session_file(self):
+        """Los contadores mantenidos al escribir equivalen a recorrer el log de sesión."""
+        self.assertIn("error", self.logger.get_session_summary())
+
+        self.logger.info("Inicio de consulta")
+        self.logger.warning("Página lenta")
+        self.logger.log_operation("Descarga", False, "timeout")
+        self.logger.log_export_operation("CSV", "facturas.csv", 120)
+        self.logger.close_session()
+
+        summary = self.logger.get_session_summary()
+        lines = Path(summary["log_file"]).read_text(encoding='utf-8').splitlines()
+
+        self.assertEqual(summary["total_events"], len(lines))
+        for level in LogLevel:
+            self.assertEqual(summary["level_counts"][level.value],
+                             sum(1 for line in lines if f"[{level.value}]" in line))
+        self.assertEqual(summary["operations_count"], 1)
+        self.assertEqual(summary["exports_count"], 1)
+        self.assertEqual(summary["level_counts"]["ERROR"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+"""
+Test para SQLiteInvoiceStore
+Tests unitarios del almacén local de facturas y de la sincronización incremental
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from src.infrastructure.adapters.sqlite_invoice_store import SQLiteInvoiceStore
+from src.infrastructure.adapters.free_gui_siigo_adapter import FreeGUISiigoAdapter
+from src.domain.entities.invoice import APICredentials
+
+
+def _siigo_invoice(invoice_id: str, created: str, last_updated: str, total: float = 1000) -> dict:
+    """Factura mínima con metadata como la retorna /v1/invoices."""
+    return {
+        'id': invoice_id,
+        'date': created,
+        'customer': {'id': 'c-1', 'identification': '900123456', 'name': 'Cliente Test'},
+        'total': total,
+        'status': 'open',
+        'items': [],
+        'metadata': {'created': f'{created}T10:00:00Z', 'last_updated': last_updated}
+    }
+
+
+class TestSQLiteInvoiceStore(unittest.TestCase):
+    """Tests del almacén SQLite."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = SQLiteInvoiceStore(str(Path(self._tmp.name) / 'invoices.sqlite3'), Mock())
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_query_by_created_range(self):
+        """Las consultas filtran por fecha de creación inclusiva."""
+        self.store.upsert_invoices([
+            _siigo_invoice('A', '2024-01-10', '2024-01-10T10:00:00Z'),
+            _siigo_invoice('B', '2024-02-10', '2024-02-10T10:00:00Z'),
+            _siigo_invoice('C', '2024-03-10', '2024-03-10T10:00:00Z'),
+        ])
+
+        result = self.store.query_invoices('2024-02-01', '2024-03-10')
+
+        self.assertEqual([inv['id'] for inv in result], ['B', 'C'])
+        self.assertEqual(self.store.query_invoices(identification='900123456', status='closed'), [])
+
+    def test_upsert_keeps_newest_version(self):
+        """Una versión con last_updated anterior no sobrescribe la almacenada."""
+        self.store.upsert_invoices([_siigo_invoice('A', '2024-01-10', '2024-05-01T00:00:00Z', total=2000)])
+        self.store.upsert_invoices([_siigo_invoice('A', '2024-01-10', '2024-04-01T00:00:00Z', total=1000)])
+
+        self.assertEqual(self.store.count(), 1)
+        self.assertEqual(self.store.get_invoice('A')['total'], 2000)
+
+    def test_watermark_roundtrip(self):
+        """La marca de agua persiste entre instancias."""
+        self.assertIsNone(self.store.get_watermark())
+        self.store.set_watermark('2024-05-01T00:00:00Z')
+
+        reopened = SQLiteInvoiceStore(str(self.store.db_path), Mock())
+        self.assertEqual(reopened.get_watermark(), '2024-05-01T00:00:00Z')
+
+
+class TestFreeGUISiigoAdapterIncrementalSync(unittest.TestCase):
+    """Tests de la sincronización incremental del adapter con almacén local."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = SQLiteInvoiceStore(str(Path(self._tmp.name) / 'invoices.sqlite3'), Mock())
+        self.adapter = FreeGUISiigoAdapter(Mock(), invoice_store=self.store)
+        self.adapter._access_token = 'token'
+        self.adapter._is_authenticated = True
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_second_sync_requests_only_changes(self):
+        """Tras la carga inicial solo se piden facturas modificadas desde la marca de agua."""
+        initial = [
+            _siigo_invoice('A', '2024-01-10', '2024-01-10T10:00:00Z'),
+            _siigo_invoice('B', '2024-02-10', '2024-02-12T08:00:00Z'),
+        ]
+        changed = [_siigo_invoice('B', '2024-02-10', '2024-03-01T09:00:00Z', total=5000)]
+
+        with patch.object(self.adapter, '_fetch_invoices_page', return_value=(initial, {})) as fetch:
+            self.assertEqual(self.adapter.sync_invoice_store(force=True), 2)
+            self.assertNotIn('updated_start', fetch.call_args.args[0])
+
+        with patch.object(self.adapter, '_fetch_invoices_page', return_value=(changed, {})) as fetch:
+            encabezados_df, _ = self.adapter.download_invoices_dataframes('2024-02-01', '2024-02-28')
+            self.assertEqual(fetch.call_count, 0)  # dentro del intervalo mínimo: sin HTTP
+
+            self.adapter.sync_invoice_store(force=True)
+            self.assertEqual(fetch.call_args.args[0], {'updated_start': '2024-02-12'})
+
+        self.assertEqual(list(encabezados_df['factura_id']), ['B'])
+        self.assertEqual(self.store.get_invoice('B')['total'], 5000)
+        self.assertEqual(self.store.get_watermark(), '2024-03-01T09:00:00Z')
+
+    def test_sync_refreshes_indexed_invoice(self):
+        """Tras sincronizar una versión nueva, get_invoice_by_id no devuelve la versión indexada anterior."""
+        initial = [_siigo_invoice('A', '2024-01-10', '2024-01-10T10:00:00Z', total=1000)]
+        changed = [_siigo_invoice('A', '2024-01-10', '2024-02-01T09:00:00Z', total=7000)]
+
+        with patch.object(self.adapter, '_fetch_invoices_page', return_value=(initial, {})):
+            self.adapter.sync_invoice_store(force=True)
+            self.adapter.download_invoices_dataframes('2024-01-01', '2024-01-31')
+            self.assertEqual(self.adapter.get_invoice_by_id('A').total, 1000)
+
+        with patch.object(self.adapter, '_fetch_invoices_page', return_value=(changed, {})):
+            self.adapter.sync_invoice_store(force=True)
+
+        self.assertEqual(self.adapter.get_invoice_by_id('A').total, 7000)
+
+    def test_watermark_without_last_updated(self):
+        """Sin metadata.last_updated la marca de agua usa created o el inicio de la sincronización."""
+        sin_last_updated = _siigo_invoice('A', '2024-01-10', None)
+        del sin_last_updated['metadata']['last_updated']
+        sin_metadata = dict(_siigo_invoice('B', '2024-02-10', None))
+        del sin_metadata['metadata']
+
+        with patch.object(self.adapter, '_fetch_invoices_page', return_value=([sin_last_updated], {})):
+            self.adapter.sync_invoice_store(force=True)
+        self.assertEqual(self.store.get_watermark(), '2024-01-10T10:00:00Z')
+
+        other = SQLiteInvoiceStore(str(Path(self._tmp.name) / 'otra.sqlite3'), Mock())
+        adapter = FreeGUISiigoAdapter(Mock(), invoice_store=other)
+        adapter._access_token = 'token'
+        adapter._is_authenticated = True
+        with patch.object(adapter, '_fetch_invoices_page', return_value=([sin_metadata], {})) as fetch:
+            adapter.sync_invoice_store(force=True)
+            self.assertIsNotNone(other.get_watermark())
+
+            # Las lecturas siguientes usan el almacén: sin repetir el histórico ni descargar el rango
+            fetch.reset_mock()
+            encabezados_df, _ = adapter.download_invoices_dataframes('2024-02-01', '2024-02-28')
+            self.assertEqual(fetch.call_count, 0)
+        self.assertEqual(list(encabezados_df['factura_id']), ['B'])
+
+    def test_failed_first_sync_falls_back_to_range_download(self):
+        """Si la carga inicial falla se descarga directo el rango pedido, como sin almacén."""
+        in_range = [_siigo_invoice('B', '2024-02-10', '2024-02-10T10:00:00Z')]
+
+        def fetch_page(params, page, page_size):
+            if 'created_start' not in params:
+                return None, {}  # la descarga del histórico completo falla
+            return in_range, {}
+
+        with patch.object(self.adapter, '_fetch_invoices_page', side_effect=fetch_page) as fetch:
+            encabezados_df, _ = self.adapter.download_invoices_dataframes('2024-02-01', '2024-02-28')
+
+        self.assertEqual(list(encabezados_df['factura_id']), ['B'])
+        self.assertEqual(fetch.call_args.args[0], {'created_start': '2024-02-01', 'created_end': '2024-02-28'})
+        self.assertIsNone(self.store.get_watermark())
+
+    @patch('src.infrastructure.adapters.free_gui_siigo_adapter.requests.post')
+    def test_each_siigo_account_gets_its_own_store(self, mock_post):
+        """Autenticar con otra cuenta cambia de almacén; volver a la primera lo reutiliza."""
+        mock_post.return_value = Mock(status_code=200, json=Mock(return_value={'access_token': 't'}))
+        stores = {}
+
+        def store_for(account):
+            return stores.setdefault(account, SQLiteInvoiceStore(str(Path(self._tmp.name) / f'{account}.sqlite3'), Mock()))
+
+        adapter = FreeGUISiigoAdapter(Mock(), invoice_store_factory=store_for)
+        empresa_a = APICredentials(username='a@empresa.co', access_key='k', api_url='https://api.siigo.com')
+        empresa_b = APICredentials(username='b@empresa.co', access_key='k', api_url='https://api.siigo.com')
+
+        adapter.authenticate(empresa_a)
+        store_a = adapter._invoice_store
+        adapter.authenticate(empresa_b)
+        store_b = adapter._invoice_store
+        adapter.authenticate(empresa_a)
+
+        self.assertIsNot(store_a, store_b)
+        self.assertIs(adapter._invoice_store, store_a)
+        self.assertEqual(len(stores), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
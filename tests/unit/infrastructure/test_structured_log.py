@@ -0,0 +1,113 @@
+"""
+Test para structured_log
+Tests unitarios del log estructurado JSONL con spans y del resumen de latencias
+"""
+
+import json
+import tempfile
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from src.infrastructure.adapters.siigo_invoice_export_adapter import SiigoInvoiceExportAdapter
+from src.infrastructure.utils.concurrent_pager import ConcurrentPager, TokenBucketRateLimiter
+from src.infrastructure.utils.structured_log import (
+    JsonlSink, configure_structured_log, disable_structured_log, emit_event, read_events,
+    record_http_response, span, summarize_events, traced
+)
+
+
+class TestStructuredLog(unittest.TestCase):
+    """Tests de spans, eventos y resumen."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.sink = configure_structured_log(sink=JsonlSink(self.tmp.name))
+
+    def tearDown(self):
+        disable_structured_log()
+        self.sink.close()
+        self.tmp.cleanup()
+
+    def events(self):
+        self.sink.flush()
+        return list(read_events(str(path) for path in Path(self.tmp.name).glob("*.jsonl")))
+
+    def test_pages_fetched_in_threads_are_child_spans_with_http_calls(self):
+        """Las páginas descargadas en hilos cuelgan del span de la descarga y suman sus llamadas HTTP."""
+        @traced('siigo.invoices_page')
+        def fetch_page(page):
+            record_http_response(Mock(status_code=200, elapsed=timedelta(milliseconds=50)))
+            return [{'id': f"{page}-{i}"} for i in range(10)], {'total_results': 30}
+
+        pager = ConcurrentPager(Mock(), max_workers=2, rate_limiter=TokenBucketRateLimiter(rate=1000))
+        with span('siigo.download_invoices', nit='900123456') as download:
+            download.add_records(len(pager.fetch_all(fetch_page, 10)))
+
+        events = self.events()
+        parent = next(e for e in events if e['operation'] == 'siigo.download_invoices')
+        pages = [e for e in events if e['operation'] == 'siigo.invoices_page']
+
+        self.assertEqual(len(pages), 3)
+        self.assertTrue(all(e['parent_id'] == parent['span_id'] for e in pages))
+        self.assertTrue(all(e['trace_id'] == parent['trace_id'] for e in pages))
+        self.assertEqual(parent['http_calls'], 3)
+        self.assertAlmostEqual(parent['http_ms'], 150.0)
+        self.assertEqual(parent['records'], 30)
+        self.assertEqual(parent['attributes'], {'nit': '900123456'})
+        self.assertGreaterEqual(parent['duration_ms'], 0)
+
+    @patch.dict('os.environ', {'SIIGO_ACCESS_KEY': 'key', 'SIIGO_USER': 'user@empresa.co'})
+    @patch('requests.get')
+    @patch('requests.post')
+    def test_export_chunk_counts_invoice_adapter_requests(self, mock_post, mock_get):
+        """La autenticación y la descarga del adaptador de exportación cuentan en el span del chunk."""
+        mock_post.return_value = Mock(status_code=200, elapsed=timedelta(milliseconds=20),
+                                      json=Mock(return_value={'access_token': 't'}))
+        mock_get.return_value = Mock(status_code=200, elapsed=timedelta(milliseconds=80),
+                                     json=Mock(return_value={'results': []}))
+
+        with span('export.chunk', fecha_inicio='2024-01-01', fecha_fin='2024-01-31'):
+            SiigoInvoiceExportAdapter(Mock()).fetch_invoice_frames('2024-01-01', '2024-01-31')
+
+        chunk = self.events()[0]
+        self.assertEqual(chunk['http_calls'], 2)
+        self.assertAlmostEqual(chunk['http_ms'], 100.0)
+
+    def test_failed_operation_is_recorded_as_error(self):
+        """Una excepción se propaga y el span queda con estado error."""
+        with self.assertRaises(ValueError):
+            with span('kpi.calculate_period'):
+                raise ValueError("Datos inválidos")
+        emit_event('operation', operation='Exportación CSV', success=True, execution_time_s=1.5)
+
+        span_event, operation_event = self.events()
+        self.assertEqual(span_event['status'], 'error')
+        self.assertEqual(span_event['error'], "ValueError: Datos inválidos")
+        self.assertEqual(operation_event['execution_time_s'], 1.5)
+
+    def test_summary_reports_percentiles_per_operation(self):
+        """El resumen agrupa por operación con p50/p95 por rango más cercano."""
+        events = [{'event': 'span', 'operation': 'export.csv', 'duration_ms': float(ms), 'records': 10,
+                   'http_calls': 1, 'status': 'ok'} for ms in range(1, 101)]
+        events.append({'event': 'span', 'operation': 'export.csv', 'duration_ms': 500.0, 'status': 'error'})
+        events.append({'event': 'operation', 'operation': 'Descarga', 'execution_time_s': 2.0, 'success': False})
+        events.append({'event': 'export', 'export_type': 'CSV'})
+
+        summary = summarize_events(events)
+
+        self.assertEqual(summary['export.csv']['count'], 101)
+        self.assertEqual(summary['export.csv']['p50_ms'], 51.0)
+        self.assertEqual(summary['export.csv']['p95_ms'], 96.0)
+        self.assertEqual(summary['export.csv']['max_ms'], 500.0)
+        self.assertEqual(summary['export.csv']['errors'], 1)
+        self.assertEqual(summary['export.csv']['records'], 1000)
+        self.assertEqual(summary['Descarga'], {
+            'count': 1, 'p50_ms': 2000.0, 'p95_ms': 2000.0, 'max_ms': 2000.0, 'total_ms': 2000.0,
+            'errors': 1, 'records': 0, 'http_calls': 0
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()